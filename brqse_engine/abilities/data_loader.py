@@ -1,6 +1,12 @@
-import csv
 import os
 
+try:
+    from brqse_engine.core.data_registry import game_data
+except ImportError:
+    import sys
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../.."))
+    from brqse_engine.core.data_registry import game_data
+
 class DataLoader:
     def __init__(self, data_dir=None):
         if data_dir:
@@ -27,32 +33,16 @@ class DataLoader:
         self.general_skill_unlocks = {}  # Category -> [Rank -> Unlock]
         self.generic_species_traits = {}  # Species -> [Tier -> Trait]
         
+        # Name indexes: (kind, species, exact) -> (rows, {name: [(pos, row)]})
+        self._indexes = {}
+        
         self.reload_all()
 
     def _load_csv(self, filename):
+        # Parsed once per process by the shared registry; we keep a private list copy
+        # so callers (and tests) can still append to e.g. loader.talents.
         path = os.path.join(self.data_dir, filename)
-        if not os.path.exists(path):
-            print(f"[DataLoader] Warning: File not found {path}")
-            return []
-        
-        data = []
-        encodings = ['utf-8-sig', 'cp1252', 'latin-1']
-        for encoding in encodings:
-            try:
-                with open(path, 'r', encoding=encoding) as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Clean keys/values and normalize spaces to underscores
-                        clean_row = {k.strip().replace(" ", "_"): v.strip() for k, v in row.items() if k}
-                        data.append(clean_row)
-                break # Success
-            except UnicodeDecodeError:
-                continue # Try next encoding
-            except Exception as e:
-                print(f"[DataLoader] Error loading {filename} with {encoding}: {e}")
-                break
-            
-        return data
+        return list(game_data.csv_rows(path, normalize=True))
 
     def reload_all(self):
         self.talents = self._load_csv("Talents.csv")
@@ -122,6 +112,54 @@ class DataLoader:
                 "effect": row.get("Effect", "")
             }
 
+    # === LOOKUP INDEXES ===
+    # kind -> (table attribute, name columns tried in order)
+    INDEXED_TABLES = {
+        "talent": ("talents", ("Talent_Name",)),
+        "school": ("schools", ("Name",)),
+        "skill": ("skills", ("Skill_Name",)),
+        "species_skill": ("species_skills", ("Skill_Name", "Skill")),
+    }
+
+    def name_index(self, kind, exact=False, species=None):
+        """
+        Returns {name: [(row_position, row), ...]} for a table.
+        exact=False keys are case-folded. Rebuilt automatically if the table list
+        is replaced or appended to (tests inject mock talents that way).
+        """
+        attr, columns = self.INDEXED_TABLES[kind]
+        rows = getattr(self, attr)
+        if kind == "species_skill":
+            rows = rows.get(species, [])
+
+        key = (kind, species, exact)
+        cached = self._indexes.get(key)
+        if cached and cached[0] is rows and cached[1] == len(rows):
+            return cached[2]
+
+        index = {}
+        for pos, row in enumerate(rows):
+            name = next((row.get(c) for c in columns if row.get(c)), None)
+            if not name:
+                continue
+            index.setdefault(name if exact else name.casefold(), []).append((pos, row))
+        self._indexes[key] = (rows, len(rows), index)
+        return index
+
+    def lookup(self, name, kinds=("talent", "school", "skill")):
+        """
+        Case-insensitive ability lookup. Tables are searched in `kinds` order
+        and the first matching row wins (same result as the old linear scans).
+        """
+        if not name:
+            return None
+        folded = name.casefold()
+        for kind in kinds:
+            hits = self.name_index(kind).get(folded)
+            if hits:
+                return hits[0][1]
+        return None
+
     def _load_mastery(self, filename, target_dict):
         """Load a mastery CSV into skill_name -> tier -> unlock dict."""
         for row in self._load_csv(filename):
@@ -1,16 +1,205 @@
 import re
 import random
+import threading
+from collections import OrderedDict
+try:
+    from re import _parser as sre_parse, _constants as sre_constants  # Python 3.11+
+except ImportError:
+    import sre_parse, sre_constants
 # Import mechanics modules
 from .mechanics import damage, status, healing, movement, defense, utility, summoning, meta
 
+# === PREFILTER ===
+# Each pattern gets a set of lowercase "anchor" literals: if the regex matches a
+# text, at least one anchor is a substring of it. One combined scan finds the
+# anchors present, and only those patterns run their real regex.
+
+_REPEATS = tuple(op for op in (getattr(sre_constants, n, None) for n in
+                 ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")) if op is not None)
+
+def _pick_anchors(current, candidate):
+    # Prefer the set whose shortest literal is longest (most selective)
+    if not candidate:
+        return current
+    if current is None:
+        return candidate
+    score = (min(map(len, candidate)), -len(candidate))
+    return candidate if score > (min(map(len, current)), -len(current)) else current
+
+def _required_literals(items):
+    """Anchor set for a parsed regex (sre_parse items), or None if unknown."""
+    best = None
+    run = []
+
+    for op, av in list(items) + [(None, None)]:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            lit = "".join(run).lower()
+            if lit.isascii():
+                best = _pick_anchors(best, {lit})
+            run = []
+
+        cands = None
+        if op is sre_constants.SUBPATTERN:
+            cands = _required_literals(av[-1])
+        elif op is sre_constants.BRANCH:
+            branches = [_required_literals(b) for b in av[1]]
+            if all(branches):
+                cands = set().union(*branches)
+        elif op in _REPEATS and av[0] >= 1:
+            cands = _required_literals(av[2])
+        best = _pick_anchors(best, cands)
+    return best
+
+def _anchors_for(regex):
+    try:
+        return _required_literals(sre_parse.parse(regex, re.IGNORECASE))
+    except Exception:
+        return None  # Unknown syntax: always run this pattern
+
+def _trie_regex(words):
+    """Regex matching the longest of `words` at a position, as a factored trie (fast in `re`)."""
+    trie = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def render(node):
+        end = "" in node
+        alts = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 and not end else "(?:" + "|".join(alts) + ")"
+        return body + "?" if end else body
+
+    return render(trie)
+
+class _Prefilter:
+    """One-pass candidate finder over all registered patterns."""
+    def __init__(self, patterns):
+        self.always = []            # Pattern indexes with no usable anchor
+        by_anchor = {}              # anchor -> [pattern indexes]
+        for i, (pattern, _) in enumerate(patterns):
+            anchors = _anchors_for(pattern.pattern)
+            if not anchors:
+                self.always.append(i)
+                continue
+            for a in anchors:
+                by_anchor.setdefault(a, []).append(i)
+
+        # A scan reports one (longest) anchor per position; every other anchor
+        # starting there is a prefix of it, so expand hits to all their prefixes.
+        self.hits = {}
+        for a in by_anchor:
+            idx = set()
+            for k in range(1, len(a) + 1):
+                idx.update(by_anchor.get(a[:k], ()))
+            self.hits[a] = frozenset(idx)
+
+        self.scanner = re.compile(f"(?=({_trie_regex(by_anchor)}))") if by_anchor else None
+        self.count = len(patterns)
+
+    def candidates(self, text):
+        """Sorted pattern indexes that could match text (registration order)."""
+        if self.scanner is None or not text.isascii():
+            return range(self.count)  # Non-ASCII case folding is subtle; scan everything
+        found = set(self.always)
+        for anchor in set(self.scanner.findall(text.lower())):
+            found |= self.hits[anchor]
+        return sorted(found)
+
 class EffectRegistry:
+    # Max distinct descriptions kept compiled (the data has a few hundred)
+    PLAN_CACHE_SIZE = 2048
+
     def __init__(self):
         # List of (regex_pattern, handler_function)
         self.patterns = []
+        # Effect plan cache: description -> ((handler, match), ...)
+        self._plans = OrderedDict()
+        self._plans_lock = threading.Lock()
+        self._plans_pattern_count = 0
+        self._prefilter = None
+        self.plan_generation = 0  # Bumped on invalidation; lets holders of plans detect staleness
+        self.plan_hits = 0
+        self.plan_misses = 0
         self._register_defaults()
 
     def register_pattern(self, regex, handler):
         self.patterns.append((re.compile(regex, re.IGNORECASE), handler))
+        self.invalidate_plans()
+
+    # === EFFECT PLANS ===
+
+    def invalidate_plans(self):
+        """Drops every compiled plan. Called automatically by register_pattern."""
+        with self._plans_lock:
+            self._plans.clear()
+            self._plans_pattern_count = len(self.patterns)
+            self._prefilter = None
+            self.plan_generation += 1
+
+    def compile_plan(self, effect_desc):
+        """
+        Returns the ordered (handler, match) pairs for a description.
+        Regexes only run the first time a description is seen.
+        """
+        with self._plans_lock:
+            if self._plans_pattern_count != len(self.patterns):
+                # Someone edited self.patterns directly
+                self._plans.clear()
+                self._plans_pattern_count = len(self.patterns)
+                self._prefilter = None
+                self.plan_generation += 1
+            plan = self._plans.get(effect_desc)
+            if plan is not None:
+                self._plans.move_to_end(effect_desc)
+                self.plan_hits += 1
+                return plan
+            self.plan_misses += 1
+            if self._prefilter is None:
+                self._prefilter = _Prefilter(self.patterns)
+            prefilter = self._prefilter
+
+        plan = []
+        for i in prefilter.candidates(effect_desc):
+            pattern, handler = self.patterns[i]
+            match = pattern.search(effect_desc)
+            if match:
+                plan.append((handler, match))
+        plan = tuple(plan)
+
+        with self._plans_lock:
+            self._plans[effect_desc] = plan
+            if len(self._plans) > self.PLAN_CACHE_SIZE:
+                self._plans.popitem(last=False)  # Evict least recently used
+        return plan
+
+    def scan_all(self, effect_desc):
+        """Reference path: every regex, no prefilter, no cache (benchmarks / tests)."""
+        return tuple((handler, m) for pattern, handler in self.patterns
+                     for m in (pattern.search(effect_desc),) if m)
+
+    def plan_cache_stats(self):
+        return {"hits": self.plan_hits, "misses": self.plan_misses,
+                "size": len(self._plans), "max_size": self.PLAN_CACHE_SIZE}
+
+    def run_plan(self, effect_desc, plan, context):
+        """Runs a compiled plan's handlers. Returns True if any handler succeeded."""
+        handled = False
+        # Multiple patterns may match (e.g. Damage + Status); run them all in registration order
+        for handler, match in plan:
+            # Pass match groups + context to handler
+            try:
+                handler(match, context)
+                handled = True
+            except Exception as e:
+                print(f"[EffectRegistry] Error handling '{effect_desc}': {e}")
+        return handled
 
     def resolve(self, effect_desc, context):
         """
@@ -19,18 +208,7 @@ class EffectRegistry:
         """
         if not effect_desc: return False
         
-        handled = False
-        for pattern, handler in self.patterns:
-            match = pattern.search(effect_desc)
-            if match:
-                # Pass match groups + context to handler
-                try:
-                    handler(match, context)
-                    handled = True
-                    # Don't break immediately, allow multiple patterns to match (e.g. Damage + Status)
-                    # break 
-                except Exception as e:
-                    print(f"[EffectRegistry] Error handling '{effect_desc}': {e}")
+        handled = self.run_plan(effect_desc, self.compile_plan(effect_desc), context)
         
         if not handled:
             # Fallback for logging
@@ -5,84 +5,113 @@ from .data_loader import DataLoader
 # Global loader to keep data in memory
 loader = DataLoader()
 
+def _table_order_effects(index, names, column):
+    """Effects of every row whose name is in `names`, in table order, each row once."""
+    hits = []
+    for name in set(names):
+        hits.extend(index.get(name, ()))
+    hits.sort(key=lambda h: h[0])
+    return [row.get(column) for _, row in hits if row.get(column)]
+
 def get_entity_effects(combatant):
     """
     Collects all effect strings from a combatant's species, skills, and talents.
+    All lookups go through the loader's prebuilt name indexes.
     """
     if not combatant: return []
     effects = []
     
-    # Species Skills
     species = getattr(combatant, "species", "Unknown")
-    sp_skills = loader.species_skills.get(species, [])
-    
     skills = getattr(combatant, "skills", []) or []
     powers = getattr(combatant, "powers", []) or []
     traits = getattr(combatant, "traits", []) or []
 
+    # Species Skills
+    sp_index = loader.name_index("species_skill", exact=True, species=species)
     for skill_name in skills:
-        # Check species skills
-        for s in sp_skills:
-             name = s.get("Skill_Name") or s.get("Skill")
-             if name == skill_name:
-                 eff = s.get("Effect Description") or s.get("Effect")
-                 if eff: effects.append(eff)
+        for _, s in sp_index.get(skill_name, ()):
+            eff = s.get("Effect Description") or s.get("Effect")
+            if eff: effects.append(eff)
                  
     # Generic Skills
-    for s_row in loader.skills:
-        if s_row.get("Skill_Name") in skills:
-            if s_row.get("Description"): effects.append(s_row.get("Description"))
+    effects.extend(_table_order_effects(loader.name_index("skill", exact=True), skills, "Description"))
             
     # Talents (Stored in combatant.traits)
-    traits = getattr(combatant, "traits", [])
-    for t_row in loader.talents:
-        if t_row.get("Talent_Name") in traits:
-            if t_row.get("Effect"): effects.append(t_row.get("Effect"))
+    effects.extend(_table_order_effects(loader.name_index("talent", exact=True), traits, "Effect"))
 
     # Schools (Powers) - match by Name column
-    powers = getattr(combatant, "powers", [])
+    school_index = loader.name_index("school", exact=True)
     for p_name in powers:
-        for sch in loader.schools:
-            if sch.get("Name") == p_name:
-                if sch.get("Description"): effects.append(sch.get("Description"))
+        for _, sch in school_index.get(p_name, ()):
+            if sch.get("Description"): effects.append(sch.get("Description"))
 
     return effects
 
+# === HOOK TABLES ===
+# Each combatant caches its effects pre-compiled and bucketed by trigger.
+# Triggers listed here only fire effects mentioning one of the keywords;
+# every other trigger fires all effects.
+HOOK_FILTERS = {
+    "ON_ATTACK": ("attack", "heal", "regain", "damage", "push", "teleport", "stun", "poison", "fear", "charm", "grapple"),
+}
+HOOK_TYPES = ("ON_ATTACK", "ON_HIT", "ON_CRIT", "ON_DEFEND")
+
+def build_hook_table(combatant):
+    """
+    Returns {hook_type: ((effect, plan), ...)} for a combatant.
+    The None bucket is used for triggers not in HOOK_TYPES.
+    """
+    compiled = []
+    for eff in get_entity_effects(combatant):
+        if not eff: continue
+        plan = registry.compile_plan(eff)
+        if plan:  # Effects no pattern understands would do nothing anyway
+            compiled.append((eff, plan))
+    everything = tuple(compiled)
+
+    table = {None: everything}
+    for hook_type in HOOK_TYPES:
+        keywords = HOOK_FILTERS.get(hook_type)
+        if keywords:
+            table[hook_type] = tuple(e for e in everything if any(k in e[0].lower() for k in keywords))
+        else:
+            table[hook_type] = everything
+    return table
+
+def get_hook_table(combatant):
+    """Cached hook table; rebuilt after invalidate_hooks() or when effect patterns change."""
+    # get_entity_effects is part of the stamp: tests monkeypatch it
+    stamp = (registry.plan_generation, get_entity_effects)
+    cached = getattr(combatant, "_hook_table", None)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    table = build_hook_table(combatant)
+    try:
+        combatant._hook_table = (stamp, table)
+    except AttributeError:
+        pass  # Can't cache on this object; still works, just slower
+    return table
+
+def invalidate_hooks(combatant):
+    """Call after changing a combatant's species, skills, traits or powers in place."""
+    try:
+        combatant._hook_table = None
+    except AttributeError:
+        pass
+
 def apply_hooks(combatant, hook_type, context):
     """
     Run registry resolution for an entity's effects on a specific trigger.
     hook_type: 'ON_ATTACK', 'ON_HIT', 'ON_DEFEND', etc.
     context: dict
     """
-    all_effs = get_entity_effects(combatant)
-    
-    for eff in all_effs:
-        low = eff.lower()
-        if hook_type == "ON_ATTACK":
-            if not any(k in low for k in ["attack", "heal", "regain", "damage", "push", "teleport", "stun", "poison", "fear", "charm", "grapple"]): 
-                continue
-        print(f"[DEBUG] resolving effect: {eff}")
-        res = registry.resolve(eff, context)
-        print(f"[DEBUG] resolve result: {res}")
+    table = get_hook_table(combatant)
+    for eff, plan in table.get(hook_type, table[None]):
+        registry.run_plan(eff, plan, context)
 
 def get_ability_data(ability_name):
     """
-    Search schools, talents, and skills for a data dictionary matching the name.
-    Returns the dict or None.
+    Search talents, schools, and skills (in that order) for a data dictionary
+    matching the name, case-insensitively. Returns the dict or None.
     """
-    # Check Talents
-    for t in loader.talents:
-        if t.get("Talent_Name", "").lower() == ability_name.lower():
-             return t
-    
-    # Check Schools/Powers
-    for s in loader.schools: 
-        if s.get("Name", "").lower() == ability_name.lower(): 
-            return s
-                
-    # Check Generic Skills
-    for sk in loader.skills:
-        if sk.get("Skill_Name", "").lower() == ability_name.lower():
-            return sk
-            
-    return None
+    return loader.lookup(ability_name)
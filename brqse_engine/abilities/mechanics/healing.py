@@ -1,4 +1,5 @@
-import random
+from brqse_engine.core.rng import stream_for
+from brqse_engine.core.dice import compile_dice
 
 def handle_heal(match, ctx):
     """
@@ -18,7 +19,7 @@ def handle_heal(match, ctx):
     if die_str:
         num = int(amt_str)
         sides = int(die_str)
-        heal = sum(random.randint(1, sides) for _ in range(num))
+        heal = compile_dice(f"{num}d{sides}").roll(stream_for(ctx, "effects"))
     else:
         heal = int(amt_str) if amt_str else 0
         
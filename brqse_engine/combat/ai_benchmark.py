@@ -0,0 +1,185 @@
+"""
+AI decision benchmark over real CombatEngine + AIDecisionEngine fights.
+
+Each scenario is a seeded battle played AI vs AI with console output
+suppressed. Only execute_ai_turn is timed (end_turn bookkeeping isn't AI
+cost). While a scenario runs, CombatEngine.activate_ability / move_char /
+has_line_of_sight are wrapped at class level, so calls made on planner forks
+are counted too.
+
+Reported per scenario: decisions (AI turns), decisions per second, p50 / p99
+turn latency in ms, and engine calls (totals and per decision). Call counts
+are deterministic for a seed (except under time-budgeted templates such as
+Tactician, which search as deep as the clock allows); timings are not, so
+compare() only flags a timing regression beyond a tolerance.
+"""
+import contextlib
+import os
+import platform
+import time
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+
+COUNTED = ("activate_ability", "move_char", "has_line_of_sight")
+CASTER_POWERS = ["Push", "Slam", "Trip", "Halt"]
+
+
+# === SCENARIOS ===
+
+def _unit(name, weapon="Greatsword", ai="Aggressive", might=14, reflexes=12, powers=()):
+    return {"Name": name, "Stats": {"Might": might, "Reflexes": reflexes, "Endurance": 12},
+            "AI": ai, "Inventory": [weapon] if weapon else [], "Powers": list(powers)}
+
+SCENARIOS = {
+    "duel_melee": {
+        "size": 10, "max_turns": 60,
+        "A": [_unit("Duelist A")],
+        "B": [_unit("Duelist B", "Rapier")],
+    },
+    "kiting_ranged": {
+        "size": 14, "max_turns": 80,
+        "A": [_unit("Archer", "Warbow", reflexes=14), _unit("Slinger", "Sling", reflexes=14)],
+        "B": [_unit("Brute", might=16), _unit("Brute", might=16)],
+    },
+    "skirmish_10v10": {
+        "size": 20, "max_turns": 300,
+        "A": [_unit(f"Red {i}", ("Greatsword", "Rapier", "Warbow")[i % 3]) for i in range(10)],
+        "B": [_unit(f"Blue {i}", ("Maul", "Hand Axe", "Sling")[i % 3]) for i in range(10)],
+    },
+    "horde_vs_party": {
+        "size": 20, "max_turns": 300,
+        "A": [_unit(f"Hero {i}", ("Greatsword", "Warbow")[i % 2], might=16, reflexes=14) for i in range(4)],
+        "B": [_unit(f"Goblin {i}", "Shiv", might=10, reflexes=10) for i in range(20)],
+    },
+    "caster_teams": {
+        "size": 14, "max_turns": 200,
+        "A": [_unit(f"Adept {i}", "Rapier", powers=CASTER_POWERS) for i in range(4)],
+        "B": [_unit(f"Mystic {i}", "Sling", powers=CASTER_POWERS) for i in range(4)],
+    },
+}
+
+
+def build(name, seed, template=None):
+    """Fresh engine for a scenario: side A on the left edge, B on the right, combat started."""
+    spec = SCENARIOS[name]
+    size = spec["size"]
+    engine = CombatEngine(size, size, seed=seed)
+    for team, x, step in (("A", 1, 1), ("B", size - 2, -1)):
+        units = spec[team]
+        for i, data in enumerate(units):
+            if template:
+                data = dict(data, AI=template)
+            c = Combatant(data=data)
+            c.team = team
+            col = x + step * (i // size)
+            engine.add_combatant(c, col, i % size)
+    engine.start_combat()
+    return engine
+
+
+# === RUN ===
+
+@contextlib.contextmanager
+def count_calls(counts, names=COUNTED):
+    """Counts calls to CombatEngine methods (every engine, forks included) into `counts`."""
+    originals = {n: getattr(CombatEngine, n) for n in names}
+
+    def wrap(name, fn):
+        def counted(self, *args, **kwargs):
+            counts[name] += 1
+            return fn(self, *args, **kwargs)
+        return counted
+
+    for n, fn in originals.items():
+        counts.setdefault(n, 0)
+        setattr(CombatEngine, n, wrap(n, fn))
+    try:
+        yield counts
+    finally:
+        for n, fn in originals.items():
+            setattr(CombatEngine, n, fn)
+
+
+def _percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_scenario(name, seeds=(0, 1, 2), template=None):
+    """Plays a scenario once per seed; returns its metrics dict."""
+    latencies, counts, errors = [], {}, 0
+    clock = time.perf_counter
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull), count_calls(counts):
+        for seed in seeds:
+            engine = build(name, seed, template)
+            for _ in range(SCENARIOS[name]["max_turns"]):
+                teams = {c.team for c in engine.combatants if c.is_alive()}
+                if len(teams) < 2:
+                    break
+                actor = engine.get_active_char()
+                if actor is None:
+                    break
+                if actor.is_alive():
+                    start = clock()
+                    try:
+                        engine.execute_ai_turn(actor)
+                    except Exception:
+                        errors += 1
+                    latencies.append(clock() - start)
+                engine.end_turn()
+
+    latencies.sort()
+    total = sum(latencies)
+    n = len(latencies)
+    return {
+        "decisions": n,
+        "errors": errors,
+        "seconds": round(total, 4),
+        "decisions_per_second": round(n / total, 1) if total else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.5) * 1000, 3),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 3),
+        "calls": dict(counts),
+        "calls_per_decision": {k: round(v / n, 2) if n else 0.0 for k, v in counts.items()},
+    }
+
+
+def run_all(names=None, seeds=(0, 1, 2), template=None):
+    names, seeds = list(names or SCENARIOS), list(seeds)
+    return {
+        "meta": {"python": platform.python_version(), "seeds": list(seeds), "template": template},
+        "scenarios": {n: run_scenario(n, seeds, template) for n in names},
+    }
+
+
+# === BASELINE ===
+
+def compare(report, baseline, tolerance=0.25):
+    """
+    Lines describing what moved vs a baseline report, and whether anything regressed:
+    p50/p99 slower, or throughput lower, by more than `tolerance`; or new errors.
+    Call-count changes are listed but not failures (AI changes move them on purpose).
+    """
+    lines, regressed = [], False
+    old_all = baseline.get("scenarios", {})
+    for name, new in report["scenarios"].items():
+        old = old_all.get(name)
+        if old is None:
+            lines.append(f"{name}: new scenario (no baseline)")
+            continue
+        for key, worse_if_higher in (("p50_ms", True), ("p99_ms", True), ("decisions_per_second", False)):
+            a, b = old[key], new[key]
+            if not a:
+                continue
+            change = (b - a) / a
+            bad = change > tolerance if worse_if_higher else change < -tolerance
+            regressed |= bad
+            lines.append(f"{name}: {key} {a} -> {b} ({change:+.0%}){'  REGRESSION' if bad else ''}")
+        if new["errors"] > old.get("errors", 0):
+            regressed = True
+            lines.append(f"{name}: errors {old.get('errors', 0)} -> {new['errors']}  REGRESSION")
+        for call, count in new["calls"].items():
+            before = old.get("calls", {}).get(call)
+            if before is not None and before != count:
+                lines.append(f"{name}: {call} calls {before} -> {count}")
+    return lines, regressed
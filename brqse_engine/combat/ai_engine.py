@@ -2,14 +2,26 @@
 import random
 import math
 
+from brqse_engine.combat.battlefield import BattlefieldPicture
+
 class AIDecisionEngine:
     """
     Handles tactical decision making for AI combatants.
     Enhanced with ranged attacks, skill/ability usage, and resource management.
     """
-    def __init__(self):
+    def __init__(self, planner_budget_ms=None):
         # Track which abilities we've already tried this combat to avoid spam
         self.tried_abilities = {}
+        # Lookahead planner for the "Tactician" template (built on first use)
+        self.planner_budget_ms = planner_budget_ms
+        self._planner = None
+
+    @property
+    def planner(self):
+        if self._planner is None:
+            from brqse_engine.combat.planner import LookaheadPlanner, DEFAULT_BUDGET_MS
+            self._planner = LookaheadPlanner(self.planner_budget_ms or DEFAULT_BUDGET_MS)
+        return self._planner
 
     def evaluate_turn(self, combatant, engine):
         """
@@ -33,43 +45,31 @@ class AIDecisionEngine:
     def analyze_battlefield(self, me, engine):
         """
         Gathers context: visible enemies, allies, health states, clusters.
+        Team rosters, clusters, threat and focus targets come from the engine's
+        round-shared BattlefieldPicture (see battlefield.py); only the
+        distances / HP ordering are specific to this unit.
         """
-        enemies = []
-        allies = []
+        picture = getattr(engine, "battlefield", None)
+        if picture is None:
+            picture = BattlefieldPicture(engine)  # Engines without one (mocks): throwaway picture
+        picture.refresh()
         
         my_team = getattr(me, "team", "Enemy") 
+        mx, my = me.x, me.y
         
-        for c in engine.combatants:
-            if not c.is_alive(): continue
-            if c == me: continue
-            
-            c_team = getattr(c, "team", "Player")
-            dist = max(abs(me.x - c.x), abs(me.y - c.y))
-            
-            info = {"obj": c, "dist": dist, "hp_pct": c.hp / c.max_hp}
-            
-            if c_team == my_team:
-                allies.append(info)
-            else:
-                enemies.append(info)
-                
-        # Find Clusters
-        clusters = []
-        for e in enemies:
-            count = 0
-            start_x, start_y = e["obj"].x, e["obj"].y
-            for other in enemies:
-                if max(abs(start_x - other["obj"].x), abs(start_y - other["obj"].y)) <= 2:
-                    count += 1
-            if count > 1:
-                clusters.append({"center": e["obj"], "count": count})
-        
-        clusters.sort(key=lambda x: x["count"], reverse=True)
+        enemies = [{"obj": c, "dist": max(abs(mx - c.x), abs(my - c.y)), "hp_pct": c.hp / c.max_hp}
+                   for c in picture.enemies_of(my_team)]
+        allies = [{"obj": c, "dist": max(abs(mx - c.x), abs(my - c.y)), "hp_pct": c.hp / c.max_hp}
+                  for c in picture.allies_of(my_team) if c is not me]
+        enemies.sort(key=lambda x: x["dist"])
+        allies.sort(key=lambda x: x["hp_pct"])
         
         return {
-            "enemies": sorted(enemies, key=lambda x: x["dist"]),
-            "allies": sorted(allies, key=lambda x: x["hp_pct"]),
-            "clusters": clusters,
+            "enemies": enemies,
+            "allies": allies,
+            "clusters": picture.clusters(my_team),
+            "focus": picture.focus_targets(my_team),
+            "threat": picture.threat_near(mx, my, my_team),
             "my_hp_pct": me.hp / me.max_hp
         }
 
@@ -185,6 +185,16 @@ class AIDecisionEngine:
             log.append(f"[AI] Kiting: {msg}")
         return success
 
+    def _step_toward(self, me, target, engine):
+        """Next tile toward target: shared distance field if the engine has one, else a straight step."""
+        pathfinder = getattr(engine, "pathfinder", None)
+        if pathfinder:
+            return pathfinder.next_step_toward(me, target)
+        dx, dy = target.x - me.x, target.y - me.y
+        step_x = 1 if dx > 0 else -1 if dx < 0 else 0
+        step_y = 1 if dy > 0 else -1 if dy < 0 else 0
+        return (me.x + step_x, me.y + step_y)
+
     # ==================== ATTACK ROUTINES ====================
     
     def _ranged_attack_routine(self, me, target, engine, log, max_range, has_melee):
@@ -204,12 +214,11 @@ class AIDecisionEngine:
             log.append(f"[AI] Ranged attack from {dist * 5}ft!")
             log.extend(engine.attack_target(me, target))
         else:
-            dx, dy = target.x - me.x, target.y - me.y
-            step_x = 1 if dx > 0 else -1 if dx < 0 else 0
-            step_y = 1 if dy > 0 else -1 if dy < 0 else 0
-            
-            new_x, new_y = me.x + step_x, me.y + step_y
-            success, msg = engine.move_char(me, new_x, new_y)
+            step = self._step_toward(me, target, engine)
+            if step:
+                success, msg = engine.move_char(me, *step)
+            else:
+                success, msg = False, "No path!"
             log.append(f"[AI] Closing range: {msg}")
             
             dist = max(abs(me.x - target.x), abs(me.y - target.y))
@@ -220,12 +229,10 @@ class AIDecisionEngine:
         dist = max(abs(me.x - target.x), abs(me.y - target.y))
         
         while dist > 1 and me.movement_remaining >= 5:
-            dx, dy = target.x - me.x, target.y - me.y
-            step_x = 1 if dx > 0 else -1 if dx < 0 else 0
-            step_y = 1 if dy > 0 else -1 if dy < 0 else 0
-            
-            new_x, new_y = me.x + step_x, me.y + step_y
-            success, msg = engine.move_char(me, new_x, new_y)
+            step = self._step_toward(me, target, engine)
+            if not step:
+                break
+            success, msg = engine.move_char(me, *step)
             if not success:
                 break
             log.append(f"[AI] Move: {msg}")
@@ -257,6 +264,9 @@ class AIDecisionEngine:
             log.append("[AI] No targets visible.")
             return log
             
+        if template == "Tactician":
+            return self._planned_action(me, engine, log)
+        
         target = ctx["enemies"][0]["obj"]
         
         # Step 1: Try ONE offensive ability (but don't return - keep going)
@@ -268,3 +278,15 @@ class AIDecisionEngine:
         self._basic_attack_routine(me, target, engine, log)
             
         return log
+
+    def _planned_action(self, me, engine, log):
+        """Tactician: expected-value lookahead (see planner.py). Budget per unit via data "AI_Budget_ms"."""
+        planner = self.planner
+        plan = planner.plan(me, engine, me.data.get("AI_Budget_ms"))
+        if plan is None:
+            log.append("[AI] Nothing worth doing.")
+            return log
+        log.append(f"[AI] Plan: {plan} (depth {planner.last_depth}, "
+                   f"{planner.last_candidates} options, {planner.last_ms:.1f}ms)")
+        planner.execute(me, engine, plan, log)
+        return log
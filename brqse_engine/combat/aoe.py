@@ -0,0 +1,200 @@
+"""
+Area-of-effect templates and the per-tile hazard index.
+
+Every template is a tuple of (dx, dy) offsets from its origin, built once per
+(shape, size, facing) and reused for every cast:
+    burst  Chebyshev square of radius `size` around the origin (facing ignored)
+    cone   90 degree wedge out to `size` tiles, origin excluded
+    line   `size` tiles straight out from the origin, origin excluded
+    wall   `size` tiles across the facing, centred on the origin
+
+Sizes are in tiles (5 ft each), facings are the 8 compass points with y growing
+south, same as the map. Sizes up to PRECOMPUTED_SIZE are built at import; larger
+ones are built on first use and cached like the rest.
+"""
+import math
+import re
+from functools import lru_cache
+
+from brqse_engine.core.data_registry import game_data
+
+SHAPES = ("burst", "cone", "line", "wall")
+FACINGS = {
+    "N": (0, -1), "NE": (1, -1), "E": (1, 0), "SE": (1, 1),
+    "S": (0, 1), "SW": (-1, 1), "W": (-1, 0), "NW": (-1, -1),
+}
+FEET_PER_TILE = 5
+PRECOMPUTED_SIZE = 12
+
+# Power_Shapes.csv Shape_Name -> template shape (Bolt/Touch hit one tile, Aura rides on the caster)
+POWER_SHAPE_KINDS = {"Touch": "burst", "Bolt": "burst", "Blast": "burst", "Aura": "burst",
+                     "Cone": "cone", "Line": "line", "Wall": "wall"}
+
+
+# === TEMPLATES ===
+
+@lru_cache(maxsize=None)
+def offsets(shape, size, facing=None):
+    """(dx, dy) offsets covered by a template. Cached: treat the result as read-only."""
+    size = max(0, int(size))
+    if shape == "burst":
+        return tuple((dx, dy) for dy in range(-size, size + 1) for dx in range(-size, size + 1))
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown AoE shape: {shape}")
+    fx, fy = FACINGS[facing or "N"]
+    if shape == "line":
+        return tuple((fx * i, fy * i) for i in range(1, size + 1))
+    if shape == "wall":
+        px, py = -fy, fx  # Perpendicular to the facing
+        half = size // 2
+        return tuple((px * i, py * i) for i in range(-half, size - half))
+    # Cone: inside the 90 degree wedge around the facing (edges included)
+    f2 = fx * fx + fy * fy
+    found = []
+    for dy in range(-size, size + 1):
+        for dx in range(-size, size + 1):
+            dot = dx * fx + dy * fy
+            if dot > 0 and 2 * dot * dot >= (dx * dx + dy * dy) * f2:
+                found.append((dx, dy))
+    return tuple(found)
+
+
+@lru_cache(maxsize=None)
+def offset_set(shape, size, facing=None):
+    """Same offsets as a frozenset, for membership tests."""
+    return frozenset(offsets(shape, size, facing))
+
+
+def _warm():
+    for size in range(PRECOMPUTED_SIZE + 1):
+        offset_set("burst", size)
+        for facing in FACINGS:
+            for shape in ("cone", "line", "wall"):
+                offset_set(shape, size, facing)
+
+_warm()
+
+
+def facing_toward(x0, y0, x1, y1):
+    """Nearest of the 8 facings pointing from (x0, y0) at (x1, y1)."""
+    if (x0, y0) == (x1, y1):
+        return "N"
+    angle = math.degrees(math.atan2(y1 - y0, x1 - x0))  # 0 = East, 90 = South
+    return ("E", "SE", "S", "SW", "W", "NW", "N", "NE")[int(round(angle / 45.0)) % 8]
+
+
+def tiles_in_template(shape, size, x, y, facing=None, cols=None, rows=None):
+    """Absolute tiles covered by a template placed at (x, y), clipped to the map if cols/rows given."""
+    tiles = [(x + dx, y + dy) for dx, dy in offsets(shape, size, facing)]
+    if cols is not None and rows is not None:
+        tiles = [(tx, ty) for tx, ty in tiles if 0 <= tx < cols and 0 <= ty < rows]
+    return tiles
+
+
+def combatants_in_template(engine, shape, size, x, y, facing=None, alive=True):
+    """Combatants standing inside a template (reads engine.occupancy, no roster scan)."""
+    occ = engine.occupancy
+    found = []
+    shape_offsets = offsets(shape, size, facing)
+    if len(shape_offsets) <= len(occ.cells):
+        # Small template: probe its tiles
+        for dx, dy in shape_offsets:
+            found.extend(occ.cells.get((x + dx, y + dy), ()))
+    else:
+        # Big template, few bodies: test each occupied tile against the mask
+        mask = offset_set(shape, size, facing)
+        for (tx, ty), cell in occ.cells.items():
+            if (tx - x, ty - y) in mask:
+                found.extend(cell)
+    if occ.loose:
+        mask = offset_set(shape, size, facing)
+        found += [c for c in occ.loose if (c.x - x, c.y - y) in mask]
+    if alive:
+        found = [c for c in found if c.is_alive()]
+    return found
+
+
+def power_shape_template(name):
+    """
+    (shape, size) for a Power_Shapes.csv Shape_Name, size in tiles from its Range_Area.
+    Returns None for shapes that aren't areas on the grid (Chain, Storm, World).
+    """
+    return game_data.derived("aoe_power_shapes", _build_power_shapes).get(name)
+
+
+def _build_power_shapes():
+    table = {}
+    for row in game_data.csv_rows("Power_Shapes.csv"):
+        name = (row.get("Shape_Name") or "").strip()
+        kind = POWER_SHAPE_KINDS.get(name)
+        if not kind:
+            continue
+        feet = re.search(r"(\d+)\s*ft", row.get("Range_Area") or "")
+        # Touch/Bolt land on a single tile; areas use their listed size
+        size = 0 if name in ("Touch", "Bolt") or not feet else int(feet.group(1)) // FEET_PER_TILE
+        table[name] = (kind, size)
+    return table
+
+
+# === HAZARDS ===
+
+class HazardIndex:
+    """
+    Active hazard zones, indexed by tile.
+
+    Iterates / len() like the old engine.hazards list. Each hazard is a dict
+    ({"name", "duration", "damage_type", "damage_dice", "tiles", ...});
+    at(x, y) is a single dict lookup, and tick() only touches tiles of zones
+    that actually expire.
+    """
+
+    def __init__(self):
+        self.active = []
+        self.by_tile = {}  # (x, y) -> [hazard, ...]
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def __len__(self):
+        return len(self.active)
+
+    def add(self, hazard):
+        self.active.append(hazard)
+        for pos in hazard["tiles"]:
+            cell = self.by_tile.get(pos)
+            if cell is None:
+                self.by_tile[pos] = [hazard]
+            else:
+                cell.append(hazard)
+        return hazard
+
+    def remove(self, hazard):
+        if hazard not in self.active:
+            return
+        self.active.remove(hazard)
+        for pos in hazard["tiles"]:
+            cell = self.by_tile.get(pos)
+            if cell and hazard in cell:
+                cell.remove(hazard)
+                if not cell:
+                    del self.by_tile[pos]
+
+    def at(self, x, y):
+        return self.by_tile.get((x, y), ())
+
+    def clear(self):
+        self.active = []
+        self.by_tile.clear()
+
+    def tick(self):
+        """Decrements durations (-1 = permanent). Returns the hazards that expired."""
+        expired = []
+        for h in self.active:
+            if h.get("duration", -1) == -1:
+                continue
+            h["duration"] -= 1
+            if h["duration"] <= 0:
+                expired.append(h)
+        for h in expired:
+            self.remove(h)
+        return expired
@@ -0,0 +1,192 @@
+"""
+Round-shared tactical picture for AI turns.
+
+Every AI turn used to rescan the roster and pair up every enemy to find
+clusters. Most of that is identical for all allies within a round, so one
+BattlefieldPicture per engine holds it:
+
+- teams:      team -> alive combatants
+- buckets:    BUCKET x BUCKET tile cells -> alive combatants (cluster search
+              and threat map only look at neighbouring cells, never the roster)
+- clusters:   per unit, allies of its own team within CLUSTER_RADIUS
+- threat_map: team -> {cell: summed expected damage per attack}
+- focus:      per team, enemies ordered by threat per remaining HP
+
+It is rebuilt on a new round or roster change; otherwise refresh() diffs each
+unit's (x, y, hp, dead) and patches only the cells around whatever moved,
+got hurt or died. Consumers call refresh() first (AIDecisionEngine does).
+"""
+from brqse_engine.core import probability
+
+BUCKET = 4
+CLUSTER_RADIUS = 2
+
+
+def _threat_of(c):
+    """Expected damage of one of c's basic attacks if it lands."""
+    dice = "1d4"
+    if c.inventory:
+        dice = c.inventory.get_weapon_stats()[0] or "1d4"
+    try:
+        return probability.expected(dice)
+    except ValueError:
+        return 0.0
+
+
+class BattlefieldPicture:
+    def __init__(self, engine):
+        self.engine = engine
+        self.round = None
+        self.version = 0     # Bumped on every build / patch (per-version caches below)
+        self.builds = 0      # For tests / benchmarks
+        self.patches = 0
+        self._roster = ()
+        self._seen = {}      # id(c) -> (x, y, hp, is_dead)
+        self.teams = {}
+        self.buckets = {}
+        self.cluster_count = {}
+        self.threat = {}     # id(c) -> expected damage per attack
+        self.threat_map = {}
+        self._cache = {}     # (kind, team) -> (version, value)
+
+    @staticmethod
+    def cell(x, y):
+        return x // BUCKET, y // BUCKET
+
+    # === BUILD / PATCH ===
+
+    def refresh(self):
+        """Brings the picture up to date with the engine. Returns self."""
+        eng = self.engine
+        roster = eng.combatants
+        if self.round != eng.round_counter or len(roster) != len(self._roster) or \
+                any(a is not b for a, b in zip(roster, self._roster)):
+            self._build()
+            return self
+        seen = self._seen
+        for c in roster:
+            state = (c.x, c.y, c.hp, c.is_dead)
+            if seen[id(c)] != state:
+                self._patch(c, seen[id(c)], state)
+        return self
+
+    def _build(self):
+        eng = self.engine
+        self.round = eng.round_counter
+        self._roster = tuple(eng.combatants)
+        self._seen = {}
+        self.teams, self.buckets, self.cluster_count, self.threat_map = {}, {}, {}, {}
+        self.threat = {id(c): _threat_of(c) for c in self._roster}
+        for c in self._roster:
+            self._seen[id(c)] = (c.x, c.y, c.hp, c.is_dead)
+            if c.is_alive():
+                self._place(c, c.x, c.y)
+                self.teams.setdefault(c.team, []).append(c)
+        for c in self._roster:
+            if c.is_alive():
+                self.cluster_count[id(c)] = self._count_near(c, c.x, c.y)
+        self.builds += 1
+        self.version += 1
+
+    def _patch(self, c, old, new):
+        ox, oy, _, _ = old
+        nx, ny, _, _ = new
+        was_alive = id(c) in self.cluster_count
+        alive = c.is_alive()
+        self._seen[id(c)] = new
+        if was_alive and ((ox, oy) != (nx, ny) or not alive):
+            self._unplace(c, ox, oy)
+            del self.cluster_count[id(c)]
+            if not alive:
+                self.teams[c.team].remove(c)
+        if alive and (not was_alive or (ox, oy) != (nx, ny)):
+            self._place(c, nx, ny)
+            if not was_alive:
+                self.teams.setdefault(c.team, []).append(c)  # Revived
+        if alive:
+            self.cluster_count[id(c)] = self._count_near(c, nx, ny)
+        if (ox, oy) != (nx, ny) or was_alive != alive:
+            # Only teammates around the old and new spot can have changed cluster size
+            for x, y in {(ox, oy), (nx, ny)}:
+                for other in self._near(x, y, CLUSTER_RADIUS):
+                    if other is not c and other.team == c.team:
+                        self.cluster_count[id(other)] = self._count_near(other, other.x, other.y)
+        self.patches += 1
+        self.version += 1
+
+    def _place(self, c, x, y):
+        key = self.cell(x, y)
+        self.buckets.setdefault(key, []).append(c)
+        team_map = self.threat_map.setdefault(c.team, {})
+        team_map[key] = team_map.get(key, 0.0) + self.threat.get(id(c), 0.0)
+
+    def _unplace(self, c, x, y):
+        key = self.cell(x, y)
+        cell = self.buckets.get(key)
+        if cell and c in cell:
+            cell.remove(c)
+            if not cell:
+                del self.buckets[key]
+        team_map = self.threat_map.get(c.team, {})
+        team_map[key] = team_map.get(key, 0.0) - self.threat.get(id(c), 0.0)
+        if team_map.get(key, 0.0) <= 1e-9:
+            team_map.pop(key, None)
+
+    def _near(self, x, y, radius):
+        """Alive combatants within `radius` tiles (Chebyshev), from the neighbouring buckets only."""
+        bx0, by0 = self.cell(x - radius, y - radius)
+        bx1, by1 = self.cell(x + radius, y + radius)
+        found = []
+        for bx in range(bx0, bx1 + 1):
+            for by in range(by0, by1 + 1):
+                for c in self.buckets.get((bx, by), ()):
+                    if abs(c.x - x) <= radius and abs(c.y - y) <= radius:
+                        found.append(c)
+        return found
+
+    def _count_near(self, c, x, y):
+        return sum(1 for o in self._near(x, y, CLUSTER_RADIUS) if o.team == c.team)
+
+    # === QUERIES ===
+
+    def _cached(self, kind, team, build):
+        hit = self._cache.get((kind, team))
+        if hit and hit[0] == self.version:
+            return hit[1]
+        value = build()
+        self._cache[(kind, team)] = (self.version, value)
+        return value
+
+    def enemies_of(self, team):
+        return [c for t, members in self.teams.items() if t != team for c in members]
+
+    def allies_of(self, team):
+        return self.teams.get(team, [])
+
+    def clusters(self, team):
+        """Enemy clusters as seen by `team`: [{"center", "count"}], biggest first."""
+        def build():
+            out = [{"center": c, "count": self.cluster_count[id(c)]}
+                   for c in self.enemies_of(team) if self.cluster_count.get(id(c), 0) > 1]
+            out.sort(key=lambda x: x["count"], reverse=True)
+            return out
+        return self._cached("clusters", team, build)
+
+    def focus_targets(self, team):
+        """Enemies of `team`, best focus-fire target first (most threat per HP left)."""
+        def build():
+            return sorted(self.enemies_of(team),
+                          key=lambda c: self.threat.get(id(c), 0.0) / max(c.hp, 1), reverse=True)
+        return self._cached("focus", team, build)
+
+    def threat_near(self, x, y, team, rings=1):
+        """Summed enemy threat (vs `team`) in the cells within `rings` cells of (x, y)."""
+        bx, by = self.cell(x, y)
+        total = 0.0
+        for t, cells in self.threat_map.items():
+            if t == team:
+                continue
+            for cx in range(bx - rings, bx + rings + 1):
+                for cy in range(by - rings, by + rings + 1):
+                    total += cells.get((cx, cy), 0.0)
+        return total
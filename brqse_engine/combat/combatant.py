@@ -9,6 +9,8 @@ class Combatant:
     Runtime wrapper for a Character in combat.
     Manages Position, Initiative, and tactical status (Elevation, Cover, Facing).
     """
+    rng = None  # RNGStreams of the owning engine; None = global random
+
     def __init__(self, character: Any, x: int = 0, y: int = 0, team: str = "Neutral"):
         self.character = character
         self.x = x
@@ -140,7 +142,7 @@ class Combatant:
         intuit = self.get_stat("Intuition")
         reflex = self.get_stat("Reflexes")
         alertness = intuit + reflex
-        roll, _, _ = Dice.roll("1d20")
+        roll, _, _ = Dice.roll("1d20", self.rng.initiative if self.rng else None)
         self.initiative = roll + alertness
         return self.initiative
 
@@ -0,0 +1,100 @@
+"""
+Prototype-based combatant factory.
+
+Combatant(data=...) normalizes stats, equips the loadout and runs
+ProgressionEngine.check_unlocks over the whole talent table. For enemies that
+all come from the same beast row or template that work is identical every
+time, so the factory does it once per key (the prototype, which also gets its
+hook table compiled) and stamps instances out of it by copying only what a
+fight writes: resources, position, status, effects, the stat/skill/trait
+containers, the equipped slots and the top level of the data dict. Item rows,
+nested data values and the compiled hook table are shared.
+
+    goblins = [factory.spawn_beast("BST_05", name=f"Goblin {i}") for i in range(30)]
+    # -> 1 Combatant build + 30 stamps
+
+Prototypes are never placed in an engine; only stamped copies are.
+"""
+from brqse_engine.abilities import engine_hooks
+from brqse_engine.combat.snapshot import clone_combatant
+
+
+class CombatantFactory:
+    def __init__(self, spawner=None):
+        self._spawner = spawner  # EnemySpawner; the module singleton when None
+        self._prototypes = {}    # key -> prototype Combatant
+        self.builds = 0          # Full Combatant constructions (for benchmarks / tests)
+        self.stamps = 0
+
+    @property
+    def spawner(self):
+        if self._spawner is None:
+            from brqse_engine.combat.enemy_spawner import spawner
+            self._spawner = spawner
+        return self._spawner
+
+    # === PROTOTYPES ===
+
+    def prototype(self, key, build_data):
+        """Cached prototype for `key`; build_data() -> Combatant data is only called on a miss."""
+        proto = self._prototypes.get(key)
+        if proto is None:
+            from brqse_engine.combat.mechanics import Combatant
+            proto = Combatant(data=build_data())
+            engine_hooks.get_hook_table(proto)  # Compile effects once, shared by every stamp
+            self._prototypes[key] = proto
+            self.builds += 1
+        return proto
+
+    def clear(self):
+        """Drops every prototype (call after editing beast / talent / item data at runtime)."""
+        self._prototypes.clear()
+
+    def __len__(self):
+        return len(self._prototypes)
+
+    # === STAMPING ===
+
+    def stamp(self, proto, name=None, team=None):
+        """Fresh combatant from a prototype: own mutable state, shared static data."""
+        c = clone_combatant(proto)  # Own stats, inventory and data (see clone_combatant)
+        # Containers other systems edit in place (buy_skill_rank, tests poking traits...).
+        # Written to the slots directly so the shared hook table stays valid.
+        c._skills = dict(proto._skills) if isinstance(proto._skills, dict) else list(proto._skills)
+        c._traits = list(proto._traits)
+        c._powers = list(proto._powers)
+        if name is not None:
+            c.name = name
+        if team is not None:
+            c.team = team
+        self.stamps += 1
+        return c
+
+    def from_data(self, data, key=None, name=None, team=None):
+        """
+        Combatant from a data dict. Without a key the dict itself is the key, so
+        pass the same (unmodified) dict for every copy of a unit.
+        """
+        if key is None:
+            key = ("data", id(data))  # The prototype keeps `data` alive, so the id can't be reused
+        return self.stamp(self.prototype(key, lambda: data), name, team)
+
+    def spawn_beast(self, beast_id=None, biome="DUNGEON", level=1, name=None, team=None):
+        """
+        Like EnemySpawner.spawn_beast, but returns a Combatant (no temp file).
+        Falls back to a freshly generated random enemy when no beast matches.
+        """
+        sp = self.spawner
+        selected = sp.select_beast(beast_id, biome, level)
+        if selected is None:
+            from brqse_engine.combat.mechanics import Combatant
+            c = Combatant(filepath=sp.generate())  # Random every time: nothing to reuse
+            if name is not None: c.name = name
+            if team is not None: c.team = team
+            return c
+        key = ("beast", selected.get("Entity_ID") or id(selected), level)
+        return self.stamp(self.prototype(key, lambda: sp.beast_to_data(selected, level)), name, team)
+
+
+# Singleton
+factory = CombatantFactory()
@@ -3,6 +3,8 @@ import sys
 import random
 import json
 
+from brqse_engine.core.data_registry import game_data
+
 # Paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "../../Data")
@@ -11,13 +13,9 @@ TEMP_DIR = os.path.join(BASE_DIR, "../../Saves/temp")
 # Ensure temp dir
 if not os.path.exists(TEMP_DIR): os.makedirs(TEMP_DIR)
 
-# --- DATA LOADER (Simplified from charcreate.py) ---
+# --- DATA LOADER (Shared registry, parsed once per process) ---
 def load_csv(path):
-    import csv
-    try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return list(csv.DictReader(f))
-    except: return []
+    return list(game_data.csv_rows(path))
 
 class EnemySpawner:
     def __init__(self):
@@ -44,18 +42,34 @@ class EnemySpawner:
         self.weapon_groups = load_csv(os.path.join(DATA_DIR, "Weapon_Groups.csv"))
         
         # --- NEW: BEAST DATA ---
-        beast_path = os.path.join(BASE_DIR, "../../Web_ui/public/data/Beast_Encounter.json")
-        try:
-            with open(beast_path, 'r') as f:
-                self.beast_data = json.load(f)
-        except:
-            self.beast_data = []
+        self.beast_data = game_data.json_data("Beast_Encounter.json", default=())
 
-    def spawn_beast(self, beast_id=None, biome="DUNGEON", level=1):
+    def spawn_beast(self, beast_id=None, biome="DUNGEON", level=1, out_dir=None):
         """
         Spawns a specific or random beast from the JSON encounter table.
+        The JSON is written to out_dir (default: Saves/temp).
+        """
+        data = self.build_beast_data(beast_id, biome, level)
+        if data is None: return self.generate(out_dir=out_dir) # Fallback
+        
+        # Save
+        filepath = os.path.join(out_dir or TEMP_DIR, f"{data['Name'].replace(' ', '_')}_{random.randint(100,999)}.json")
+        with open(filepath, "w") as f:
+            json.dump(data, f, indent=4)
+        return filepath
+
+    def build_beast_data(self, beast_id=None, biome="DUNGEON", level=1):
         """
-        if not self.beast_data: return self.generate() # Fallback
+        Combatant data dict for a beast (no file written), or None if no beast matches.
+        Used directly by headless tools (e.g. the battle simulator).
+        """
+        selected = self.select_beast(beast_id, biome, level)
+        if not selected: return None
+        return self.beast_to_data(selected, level)
+
+    def select_beast(self, beast_id=None, biome="DUNGEON", level=1):
+        """Beast_Encounter.json row: the given id, else a weighted pick for the biome. None if nothing fits."""
+        if not self.beast_data: return None
         
         selected = None
         if beast_id:
@@ -66,9 +80,10 @@ class EnemySpawner:
         if not selected:
             from brqse_engine.world.encounter_table import EncounterTable
             selected = EncounterTable.get_weighted_beast(self.beast_data, biome, level)
-            
-        if not selected: return self.generate()
+        return selected or None
 
+    def beast_to_data(self, selected, level=1):
+        """Combatant data dict for one Beast_Encounter.json row at `level`."""
         name = f"{selected.get('Family_Name')} {selected.get('Role')}"
         species = selected.get("Type", "Mammal")
         
@@ -107,16 +122,11 @@ class EnemySpawner:
             "Inventory": [],
             "AI": "Aggressive"
         }
-        
-        # Save
-        filepath = os.path.join(TEMP_DIR, f"{name.replace(' ', '_')}_{random.randint(100,999)}.json")
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=4)
-        return filepath
+        return data
 
-    def generate(self, ai_template="Aggressive"):
+    def generate(self, ai_template="Aggressive", out_dir=None):
         """
-        Generate a random enemy combatant and save to temp JSON.
+        Generate a random enemy combatant and save to temp JSON (in out_dir, default Saves/temp).
         Returns the path to the generated file.
         """
         name = f"Enemy_{random.randint(100, 999)}"
@@ -176,7 +186,7 @@ class EnemySpawner:
         }
         
         # Save
-        filepath = os.path.join(TEMP_DIR, f"{name}.json")
+        filepath = os.path.join(out_dir or TEMP_DIR, f"{name}.json")
         with open(filepath, "w") as f:
             json.dump(data, f, indent=4)
             
@@ -192,6 +202,7 @@ AI_TEMPLATES = {
     "Ranged": "Stay at max distance and use ranged attacks.",
     "Support": "Buff allies, avoid direct combat.",
     "Berserker": "Attack randomly, ignoring tactics.",
+    "Tactician": "Look ahead: score moves, attacks and powers by expected damage, kill chance and risk.",
 }
 
 def get_ai_templates():
@@ -0,0 +1,168 @@
+"""
+Group AI turns: plan every actor at once, commit in initiative order.
+
+1. Plan: every actor is planned by the LookaheadPlanner against the same
+   frozen state. With workers > 1 that state is exported and pickled once
+   (snapshot.export) and the actors are split into one task per worker, so
+   each worker receives the state once per batch, rebuilds it once, and
+   plans its share of the horde. With one worker the same plans are made
+   in-process, one after another. Either way a share splits one budget_ms
+   between its actors, so a batch takes about one turn's budget, however
+   big the horde.
+2. Commit: plans run on the real engine in initiative order. A plan made on
+   the frozen state is re-checked first; if an earlier commit invalidated it
+   (actor or target moved / died, path now blocked, target out of reach)
+   only that actor is re-planned, live, before it acts.
+
+Plans cross process boundaries as roster indexes, never as objects.
+
+The pool is sized once (workers, default one per CPU) and lives until close();
+the game loop closes it when combat ends.
+"""
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from brqse_engine.combat import snapshot
+from brqse_engine.combat.planner import LookaheadPlanner, Plan, DEFAULT_BUDGET_MS, MAX_DEPTH, POWER_RANGE
+
+
+# === WORKER SIDE ===
+
+_rebuilt = (None, None)  # (batch token, engine): one rebuild per worker per batch
+
+
+def _encode(plan, roster):
+    if plan is None:
+        return None
+    index = {id(c): i for i, c in enumerate(roster)}
+    power = (plan.power[0], index[id(plan.power[1])]) if plan.power else None
+    target = index[id(plan.target)] if plan.target is not None else None
+    return (list(plan.path), power, target, plan.score, plan.kill, plan.risk)
+
+
+def _decode(encoded, roster):
+    if encoded is None:
+        return None
+    path, power, target, score, kill, risk = encoded
+    return Plan([tuple(p) for p in path], (power[0], roster[power[1]]) if power else None,
+                roster[target] if target is not None else None, score, kill, risk)
+
+
+def _plan_share(planner, engine, actors, budget_ms, start):
+    """
+    Plans `actors` one after another within one budget: each gets an equal
+    slice of the time left, so the whole share ends by start + budget_ms.
+    """
+    deadline = start + budget_ms / 1000.0
+    plans = []
+    for k, actor in enumerate(actors):
+        left_ms = max(0.0, deadline - time.perf_counter()) * 1000.0
+        plans.append(planner.plan(actor, engine, budget_ms=left_ms / (len(actors) - k)))
+    return plans
+
+
+def _plan_task(args):
+    """Plans a worker's share of the batch: [encoded plan] in the order of `actor_indexes`."""
+    global _rebuilt
+    start = time.perf_counter()
+    token, blob, actor_indexes, budget_ms, max_depth = args
+    if _rebuilt[0] != token:
+        _rebuilt = (token, snapshot.rebuild(pickle.loads(blob)))
+    engine = _rebuilt[1]
+    planner = LookaheadPlanner(budget_ms, max_depth)
+    plans = _plan_share(planner, engine, [engine.combatants[i] for i in actor_indexes], budget_ms, start)
+    return [_encode(p, engine.combatants) for p in plans]
+
+
+# === PARENT SIDE ===
+
+class GroupPlanner:
+    def __init__(self, budget_ms=DEFAULT_BUDGET_MS, workers=None, max_depth=MAX_DEPTH):
+        self.budget_ms = budget_ms
+        self.workers = workers        # None: one per CPU; 1: in-process
+        self.planner = LookaheadPlanner(budget_ms, max_depth)
+        self._pool = None
+        self._batches = 0
+        self.replans = 0              # Plans invalidated by an earlier commit (for tests / benchmarks)
+
+    def _worker_count(self):
+        return max(1, self.workers or os.cpu_count() or 1)
+
+    def close(self):
+        """Shuts the worker pool down (it is started again on the next parallel batch)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def plan_all(self, engine, actors):
+        """{actor: Plan or None}, every plan made against the current state."""
+        actors = [a for a in actors if a.is_alive()]
+        workers = min(self._worker_count(), len(actors))
+        if workers <= 1:
+            start = time.perf_counter()
+            frozen = engine.fork()  # Same frozen state for everyone, as in the pool
+            index = {id(c): i for i, c in enumerate(engine.combatants)}
+            mine = [frozen.combatants[index[id(a)]] for a in actors]
+            plans = _plan_share(self.planner, frozen, mine, self.budget_ms, start)
+            return {a: _decode(_encode(p, frozen.combatants), engine.combatants)
+                    for a, p in zip(actors, plans)}
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._worker_count())
+        self._batches += 1
+        token = (os.getpid(), id(self), self._batches)
+        blob = pickle.dumps(snapshot.export(engine), pickle.HIGHEST_PROTOCOL)
+        shares = [actors[i::workers] for i in range(workers)]
+        tasks = [(token, blob, [engine.combatants.index(a) for a in share],
+                  self.budget_ms, self.planner.max_depth) for share in shares]
+        plans = {}
+        for share, encoded in zip(shares, self._pool.map(_plan_task, tasks)):
+            for a, r in zip(share, encoded):
+                plans[a] = _decode(r, engine.combatants)
+        return {a: plans[a] for a in actors}
+
+    def still_valid(self, engine, actor, plan, origin):
+        """Can `plan` (made with actor at `origin`) still run as made?"""
+        if not actor.is_alive() or (actor.x, actor.y) != origin:
+            return False
+        for x, y in plan.path:
+            other = engine.get_combatant_at(x, y)
+            if (other is not None and other is not actor) or (x, y) in engine.walls:
+                return False
+        x, y = plan.path[-1] if plan.path else origin
+        if plan.target is not None:
+            _, reach = engine.attack_reach(actor)
+            t = plan.target
+            if not t.is_alive() or max(abs(t.x - x), abs(t.y - y)) > reach:
+                return False
+        if plan.power:
+            t = plan.power[1]
+            if not t.is_alive() or max(abs(t.x - x), abs(t.y - y)) > POWER_RANGE:
+                return False
+        return True
+
+    def run(self, engine, actors):
+        """Plans `actors` together, then commits in initiative order. Returns the combined log."""
+        for a in actors:
+            a.movement_remaining = a.movement
+            a.action_used = False
+        origins = {id(a): (a.x, a.y) for a in actors}
+        plans = self.plan_all(engine, actors)
+
+        log = []
+        # Initiative order; ties keep the order actors were given in (sorted is stable)
+        for actor in sorted(plans, key=lambda c: -(c.initiative or 0)):
+            if not actor.is_alive():
+                continue
+            plan = plans[actor]
+            if plan is not None and not self.still_valid(engine, actor, plan, origins[id(actor)]):
+                self.replans += 1
+                plan = self.planner.plan(actor, engine)
+            if plan is None:
+                log.append(f"[AI] {actor.name} holds.")
+                continue
+            log.append(f"[AI] {actor.name}: {plan}")
+            self.planner.execute(actor, engine, plan, log)
+        return log
@@ -4,7 +4,7 @@ import os
 import random
 import math
 import sys
-import time
+from collections.abc import MutableSet
 
 # Add local directory to path for imports
 sys.path.append(os.path.dirname(__file__))
@@ -31,78 +31,82 @@ except ImportError:
 from brqse_engine.abilities import engine_hooks
 
 try:
-    from brqse_engine.core.constants import Stats, Conditions
+    from brqse_engine.core.constants import Stats, Conditions, condition_bit, condition_mask
     from brqse_engine.core.status_manager import StatusManager
 except ImportError as e:
     print(f"[Mechanics] Warning: Could not import Constants/StatusManager: {e}")
 
+from brqse_engine.core.data_registry import game_data
+from brqse_engine.combat.occupancy import OccupancyGrid
+from brqse_engine.combat.pathfinding import Pathfinder
+from brqse_engine.combat.battlefield import BattlefieldPicture
+from brqse_engine.combat.terrain_grid import (TerrainGrid, Tile, TERRAIN_DATA,
+                                             COVER_NONE, COVER_HALF, COVER_FULL, COVER_SHIFT)
+from brqse_engine.combat.turn_scheduler import TurnScheduler
+from brqse_engine.combat.replay import ReplayLog, ReplayWriter
+from brqse_engine.combat import snapshot
+from brqse_engine.combat.aoe import HazardIndex, tiles_in_template, combatants_in_template
+from brqse_engine.core.rng import RNGStreams
+from brqse_engine.core.dice import Dice, compile_dice
+from brqse_engine.core import probability
+
 # --- CONSTANTS ---
-STAT_BLOCK = ["Might", "Reflexes", "Endurance", "Vitality", "Fortitude", "Knowledge", "Logic", "Awareness", "Intuition", "Charm", "Willpower", "Finesse"]
+# Condition groups for the advantage/disadvantage checks (one AND against status.mask)
+ATTACK_ADVANTAGE = condition_mask(Conditions.BLESSED, Conditions.HASTED, Conditions.INVISIBLE)
+ATTACK_DISADVANTAGE = condition_mask(Conditions.STAGGERED, Conditions.WEAKENED, Conditions.POISONED,
+                                     Conditions.FRIGHTENED, Conditions.BLINDED)
+DEFENSE_ADVANTAGE = condition_mask(Conditions.BLESSED, Conditions.HASTED)
+DEFENSE_DISADVANTAGE = condition_mask(Conditions.STAGGERED, Conditions.SHAKEN)
+EXPOSED = condition_mask(Conditions.STUNNED, Conditions.RESTRAINED, Conditions.BLINDED, Conditions.PARALYZED)
+IMMOBILE = condition_mask(Conditions.GRAPPLED, Conditions.RESTRAINED, Conditions.STUNNED, Conditions.PARALYZED)
+INVISIBLE = condition_bit(Conditions.INVISIBLE)
 
-# --- TERRAIN DATA (synced with Data/Terrain_Types.csv) ---
-TERRAIN_DATA = {
-    "normal": {"move_cost": 1, "damage_type": None, "damage_dice": None},
-    "difficult": {"move_cost": 2, "damage_type": None, "damage_dice": None},
-    "water_shallow": {"move_cost": 2, "damage_type": None, "damage_dice": None, "effect": "fire_resistance"},
-    "water_deep": {"move_cost": 3, "damage_type": None, "damage_dice": None, "effect": "swim_required"},
-    "ice": {"move_cost": 1, "damage_type": None, "damage_dice": None, "effect": "slip_prone"},
-    "mud": {"move_cost": 2, "damage_type": None, "damage_dice": None, "effect": "grapple_disadvantage"},
-    "fire": {"move_cost": 2, "damage_type": "Fire", "damage_dice": "1d6"},
-    "acid": {"move_cost": 2, "damage_type": "Acid", "damage_dice": "1d8"},
-    "spikes": {"move_cost": 2, "damage_type": "Piercing", "damage_dice": "1d10"},
-    "darkness": {"move_cost": 1, "damage_type": None, "damage_dice": None, "effect": "blinded"},
-    "high_ground": {"move_cost": 1, "damage_type": None, "damage_dice": None, "effect": "ranged_advantage"},
-    "tree": {"move_cost": 99, "damage_type": None, "damage_dice": None, "effect": "cover"},
-    "rubble": {"move_cost": 2, "damage_type": None, "damage_dice": None},
-    "tall_grass": {"move_cost": 2, "damage_type": None, "damage_dice": None, "effect": "half_cover_prone"},
-    "lava": {"move_cost": 99, "damage_type": "Fire", "damage_dice": "4d10"},
-    "pit": {"move_cost": 1, "damage_type": "Bludgeoning", "damage_dice": "2d6", "effect": "fall"},
-}
-
-# Cover levels: 0=None, 1=Half, 2=Full
-COVER_NONE = 0
-COVER_HALF = 1
-COVER_FULL = 2
-
-class Tile:
-    """Represents a single tile on the combat grid."""
-    def __init__(self, terrain="normal", x=0, y=0):
-        self.x = x
-        self.y = y
-        self.terrain = terrain
-        
-        # Load terrain data
-        data = TERRAIN_DATA.get(terrain, TERRAIN_DATA["normal"])
-        self.move_cost = data.get("move_cost", 1)
-        self.damage_type = data.get("damage_type")
-        self.damage_dice = data.get("damage_dice")
-        self.effect = data.get("effect")
-        
-        # Directional cover (can be set by obstacles on edges)
-        self.cover_north = COVER_NONE
-        self.cover_south = COVER_NONE
-        self.cover_east = COVER_NONE
-        self.cover_west = COVER_NONE
-        
-        # Entity on this tile (if any)
-        self.occupant = None
-        
-    def get_cover_from_direction(self, direction):
-        """Get cover value from a cardinal direction (N/S/E/W)."""
-        if direction == "N": return self.cover_south  # Cover FROM north means wall on south side
-        if direction == "S": return self.cover_north
-        if direction == "E": return self.cover_west
-        if direction == "W": return self.cover_east
-        return COVER_NONE
+STAT_BLOCK = ["Might", "Reflexes", "Endurance", "Vitality", "Fortitude", "Knowledge", "Logic", "Awareness", "Intuition", "Charm", "Willpower", "Finesse"]
 
+def _build_weapon_damage_db():
+    """Maps weapon Name -> damage dice from the DMG: logic tag (default 1d4)."""
+    db = {}
+    for row in game_data.csv_rows("weapons_and_armor.csv"):
+        name = row.get("Name")
+        if not name: continue
+        dice = "1d4"
+        for t in (row.get("Logic_Tags") or "").split('|'):
+            if t.startswith("DMG:"):
+                sub = t.split(':')
+                if len(sub) > 1: dice = sub[1]
+                break
+        db[name] = dice
+    return db
 
 class Combatant:
+    # Every field is a slot: instances carry no __dict__. The few attributes other
+    # systems hang on a combatant are declared too (EXTRA_FIELDS: key drops, ASI
+    # brain); anything new has to be added here.
+    # Status flags are bits of self.status.mask, see the CONDITIONS section below.
+    EXTRA_FIELDS = ("has_key", "key_name", "ai_context")
+    __slots__ = (
+        "filepath", "data", "name", "_species", "stats", "derived", "_skills", "_traits", "_powers",
+        "inventory", "xp", "status", "taunted_by", "charmed_by", "active_effects", "is_dead", "ai",
+        "facing", "attacks_received_this_round",
+        "max_hp", "max_cmp", "max_sp", "max_fp", "hp", "cmp", "sp", "fp",
+        "base_movement", "movement", "movement_remaining",
+        "action_used", "bonus_action_used", "reaction_used",
+        "_x", "_y", "initiative", "team", "elevation", "is_behind_cover", "_hook_table",
+        "_occupancy",  # OccupancyGrid of the engine we're in (set by CombatEngine.add_combatant)
+        "rng",         # Engine's RNGStreams (set by CombatEngine); None = global random
+        "__weakref__",
+    ) + EXTRA_FIELDS
+
     def __init__(self, filepath=None, data=None):
         self.filepath = filepath
+        self._occupancy = None
+        self.rng = None
+        # Referenced, not copied: combat never writes to it (save_state does, on purpose)
         if data:
             self.data = data
         else:
             self.data = self._load_data(filepath)
+        self._hook_table = None
         
         self.name = self.data.get("Name", "Unknown")
         self.species = self.data.get("Species", "Unknown")
@@ -137,20 +141,6 @@ class Combatant:
             elif isinstance(p, str):
                 self.powers.append(p)
         
-        # Initialize Inventory Manager
-        # FIX: Ensure we use the class, not a raw list
-        if Inventory:
-            self.inventory = Inventory()
-            inv_data = self.data.get("Inventory", [])
-            if isinstance(inv_data, list):
-                for item_entry in inv_data:
-                    if isinstance(item_entry, dict):
-                        self.inventory.equip(item_entry.get("Name", "Unknown"))
-                    else:
-                        self.inventory.equip(item_entry)
-        else:
-            self.inventory = None
-            
         self.xp = self.data.get("XP", 0) # Load XP, default 0
         
         # STATUS MANAGER
@@ -159,7 +149,6 @@ class Combatant:
         else:
             self.status = None
             
-        self.taunted_by = None
         self.taunted_by = None
         self.charmed_by = None # Reference to the entity that charmed this combatant
         self.active_effects = [] # For temporary combat effects (e.g. from spells)
@@ -167,7 +156,7 @@ class Combatant:
         # FIX: Critical states
         self.is_dead = False          # True = permanently dead until revived
         
-        # INVENTORY SYSTEM
+        # INVENTORY SYSTEM (equips Inventory/Gear/Weapons/Armor/Equipment from data)
         self.inventory = Inventory() if Inventory else None
         self._init_loadout()
 
@@ -182,10 +171,6 @@ class Combatant:
                 # Just keeping them in self.traits is enough.
                 pass
         
-    def _init_loadout(self):
-        """Auto-equip items from data if Inventory exists"""
-        if not self.inventory: return
-        
     def _init_loadout(self):
         """Auto-equip items from data if Inventory exists"""
         if not self.inventory: return
@@ -216,63 +201,12 @@ class Combatant:
             if name and isinstance(name, str):
                 self.inventory.equip(name)
                 
-        # Status Flags Init
-        self.is_broken = False        # True = CMP at 0 (mental break)
-        self.is_exhausted = False     # True = SP at 0 (physical exhaustion)
-        self.is_drained = False       # True = FP at 0 (focus depleted)
-        
-        # === SIMPLIFIED STATUS FLAGS (Advantage/Disadvantage System) ===
-        # Tier 1: Action Modifiers
-        self.is_staggered = False     # Disadvantage on ALL action rolls
-        self.is_shaken = False        # Disadvantage on DEFENSE rolls only
-        self.is_weakened = False      # Disadvantage on ATTACK rolls only
-        self.is_blessed = False       # Advantage on ALL action rolls
-        self.is_hasted = False        # Advantage + Double Speed + Extra Action
-        
-        # Tier 2: Movement Modifiers
-        self.is_slowed = False        # Speed halved
-        self.is_grappled = False      # Speed = 0, Disadvantage on Reflex
-        self.is_restrained = False    # Speed = 0, Attacks vs you have Advantage
-        self.is_prone = False         # Melee Adv, Ranged Dis
-        
-        # === USER'S 3-TIER CONDITION SYSTEM ===
-        
-        # TIER 1: DISRUPT (Minor debuffs, clear quickly)
-        self.is_staggered = False     # Disadvantage on next action, clears after use
-        self.is_shaken = False        # Disadvantage on Mental/Social, can't approach fear source
-        self.is_sickened = False      # Disadvantage on Physical rolls (attacks, athletics, fortitude)
-        # self.is_prone already exists above
-        
-        # TIER 2: STOP (Severe debuffs)
-        self.is_blinded = False       # Disadvantage on everything, attacks vs you Advantage
-        self.is_stunned = False       # Turn skipped, auto-fail clashes
-        # self.is_restrained already exists above
-        self.is_charmed = False       # Cannot attack charmer
-        self.charmed_by = None        # Reference to the charmer
-        
-        # TIER 3: KILL (DoT / Death effects)
-        self.is_bleeding = False      # Take 1d4 at start of turn
-        self.is_burning = False       # Take 1d6 at start of turn
-        self.is_doomed = False        # Cannot heal, instant death at 0 HP
-        
-        # Legacy/Additional
-        self.is_paralyzed = False     # Cannot move or act, melee = auto-crit
-        self.is_petrified = False     # Turned to stone
-        self.is_poisoned = False      # Disadvantage + 1d4 damage per turn
-        self.is_frightened = False    # Disadvantage, cannot approach source
-        self.is_confused = False      # Random action each turn
-        self.is_taunted = False       # Must attack taunter
-        self.is_invisible = False     # Advantage on attacks, attacks vs you Disadvantage
-        self.is_disarmed = False      # Cannot use equipped weapon
+        # Status flags (is_prone, is_blessed, is_broken...) all start clear: status.mask == 0
         
         # === TACTICAL COMBAT STATE ===
         self.facing = "N"                     # Facing direction: N/S/E/W
         self.attacks_received_this_round = 0  # Tracks attacks for multi-attacker disadvantage
         
-        # Duration-based effects: list of {name, duration, on_expire}
-        # duration = rounds remaining (-1 = permanent until cleared)
-        self.active_effects = []
-        
         # Resources
         # Resources (Formula: Derived_Stats.csv)
         def get_score(name): return self.data.get("Stats", {}).get(name, 10) # default to 10 if missing
@@ -340,6 +274,10 @@ class Combatant:
         except Exception as e:
             print(f"Error saving character: {e}")
 
+    def dice(self, stream):
+        """Random source for this combatant's rolls: the engine's sub-stream, or global random outside an engine."""
+        return self.rng.stream(stream) if self.rng is not None else random
+
     def roll_initiative(self):
         # Use Alertness (Intuition + Reflexes) from CSV
         from brqse_engine.core.constants import Stats # Local import if needed or use existing
@@ -351,8 +289,9 @@ class Combatant:
         alertness = intuit + reflex
         
         # BURT'S UPDATE: Check for Talent Flags
-        roll1 = random.randint(1, 20)
-        roll2 = random.randint(1, 20)
+        dice = self.dice("initiative")
+        roll1 = dice.randint(1, 20)
+        roll2 = dice.randint(1, 20)
         
         if getattr(self, "initiative_advantage", False):
             roll = max(roll1, roll2)
@@ -412,8 +351,9 @@ class Combatant:
         Disadvantage: Roll 2d20, take lower.
         If both: They cancel out, roll normally.
         """
-        roll1 = random.randint(1, 20)
-        roll2 = random.randint(1, 20)
+        dice = self.dice("attacks")
+        roll1 = dice.randint(1, 20)
+        roll2 = dice.randint(1, 20)
         
         if has_advantage and has_disadvantage:
             return roll1  # Cancel out
@@ -424,35 +364,38 @@ class Combatant:
         else:
             return roll1
     
+    @property
+    def conditions(self):
+        """Bitmask of active conditions (constants.CONDITION_BITS)."""
+        return self.status.mask if self.status else 0
+
     def has_attack_advantage(self):
-        """Returns True if this combatant has advantage on attacks."""
-        return self.is_blessed or self.is_hasted or self.is_invisible
+        """Returns True if this combatant has advantage on attacks (Blessed, Hasted, Invisible)."""
+        return bool(self.conditions & ATTACK_ADVANTAGE)
     
     def has_attack_disadvantage(self):
-        """Returns True if this combatant has disadvantage on attacks."""
-        return (self.is_staggered or self.is_weakened or self.is_poisoned or 
-                self.is_frightened or self.is_blinded)
+        """Returns True if this combatant has disadvantage on attacks (Staggered, Weakened, Poisoned, Frightened, Blinded)."""
+        return bool(self.conditions & ATTACK_DISADVANTAGE)
     
     def has_defense_advantage(self):
-        """Returns True if this combatant has advantage on defense."""
-        return self.is_blessed or self.is_hasted
+        """Returns True if this combatant has advantage on defense (Blessed, Hasted)."""
+        return bool(self.conditions & DEFENSE_ADVANTAGE)
     
     def has_defense_disadvantage(self):
-        """Returns True if this combatant has disadvantage on defense."""
-        return self.is_staggered or self.is_shaken
+        """Returns True if this combatant has disadvantage on defense (Staggered, Shaken)."""
+        return bool(self.conditions & DEFENSE_DISADVANTAGE)
     
     def is_attack_target_advantaged(self, attacker):
         """Returns True if attacks against this combatant have advantage."""
-        return (self.is_stunned or self.is_restrained or self.is_blinded or 
-                self.is_paralyzed or attacker.is_invisible)
+        return bool(self.conditions & EXPOSED) or attacker.is_invisible
     
     def is_attack_target_disadvantaged(self, attacker):
         """Returns True if attacks against this combatant have disadvantage."""
-        return self.is_invisible
+        return bool(self.conditions & INVISIBLE)
     
     def get_effective_speed(self):
         """Returns current speed considering status effects."""
-        if self.is_grappled or self.is_restrained or self.is_stunned or self.is_paralyzed:
+        if self.conditions & IMMOBILE:
             return 0
         speed = self.base_movement
         if self.is_hasted:
@@ -537,108 +480,110 @@ class Combatant:
             "Intuition": "Intuition"
         }
         stat = stat_map.get(save_type, save_type)
-        nat_roll = random.randint(1, 20)
+        nat_roll = self.dice("effects").randint(1, 20)
         mod = self.get_stat_modifier(stat)
         return nat_roll + mod, nat_roll
 
-    # --- PROPERTIES FOR BACKWARD COMPATIBILITY ---
-    def _get_status(self, condition):
-        return self.status.has(condition) if self.status else False
-    def _set_status(self, condition, val):
-        if self.status:
-            if val: self.status.add_condition(condition)
-            else: self.status.remove_condition(condition)
-
-    @property
-    def is_prone(self): return self._get_status(Conditions.PRONE)
-    @is_prone.setter
-    def is_prone(self, val): self._set_status(Conditions.PRONE, val)
-
-    @property
-    def is_grappled(self): return self._get_status(Conditions.GRAPPLED)
-    @is_grappled.setter
-    def is_grappled(self, val): self._set_status(Conditions.GRAPPLED, val)
-
-    @property
-    def is_blinded(self): return self._get_status(Conditions.BLINDED)
-    @is_blinded.setter
-    def is_blinded(self, val): self._set_status(Conditions.BLINDED, val)
-
-    @property
-    def is_restrained(self): return self._get_status(Conditions.RESTRAINED)
-    @is_restrained.setter
-    def is_restrained(self, val): self._set_status(Conditions.RESTRAINED, val)
-
-    @property
-    def is_stunned(self): return self._get_status(Conditions.STUNNED)
-    @is_stunned.setter
-    def is_stunned(self, val): self._set_status(Conditions.STUNNED, val)
-
+    # --- POSITION (moves are reported to the engine's occupancy index) ---
     @property
-    def is_paralyzed(self): return self._get_status(Conditions.PARALYZED)
-    @is_paralyzed.setter
-    def is_paralyzed(self, val): self._set_status(Conditions.PARALYZED, val)
+    def x(self): return self._x
+    @x.setter
+    def x(self, val):
+        old = getattr(self, "_x", None)
+        self._x = val
+        if self._occupancy is not None and old is not None:
+            self._occupancy.relocate(self, (old, self._y), (val, self._y))
 
     @property
-    def is_poisoned(self): return self._get_status(Conditions.POISONED)
-    @is_poisoned.setter
-    def is_poisoned(self, val): self._set_status(Conditions.POISONED, val)
+    def y(self): return self._y
+    @y.setter
+    def y(self, val):
+        old = getattr(self, "_y", None)
+        self._y = val
+        if self._occupancy is not None and old is not None:
+            self._occupancy.relocate(self, (self._x, old), (self._x, val))
+
+    # --- EFFECT SOURCES (reassigning one drops the cached hook table) ---
+    def invalidate_hooks(self):
+        """Call after editing skills/traits/powers in place (e.g. traits.append)."""
+        self._hook_table = None
 
     @property
-    def is_frightened(self): return self._get_status(Conditions.FRIGHTENED)
-    @is_frightened.setter
-    def is_frightened(self, val): self._set_status(Conditions.FRIGHTENED, val)
+    def species(self): return self._species
+    @species.setter
+    def species(self, val): self._species = val; self._hook_table = None
 
     @property
-    def is_charmed(self): return self._get_status(Conditions.CHARMED)
-    @is_charmed.setter
-    def is_charmed(self, val): self._set_status(Conditions.CHARMED, val)
+    def skills(self): return self._skills
+    @skills.setter
+    def skills(self, val): self._skills = val; self._hook_table = None
 
     @property
-    def is_deafened(self): return self._get_status(Conditions.DEAFENED)
-    @is_deafened.setter
-    def is_deafened(self, val): self._set_status(Conditions.DEAFENED, val)
+    def traits(self): return self._traits
+    @traits.setter
+    def traits(self, val): self._traits = val; self._hook_table = None
 
     @property
-    def is_invisible(self): return self._get_status(Conditions.INVISIBLE)
-    @is_invisible.setter
-    def is_invisible(self, val): self._set_status(Conditions.INVISIBLE, val)
-
-    @property
-    def is_confused(self): return self._get_status(Conditions.CONFUSED)
-    @is_confused.setter
-    def is_confused(self, val): self._set_status(Conditions.CONFUSED, val)
-
-    @property
-    def is_berserk(self): return self._get_status(Conditions.BERSERK)
-    @is_berserk.setter
-    def is_berserk(self, val): self._set_status(Conditions.BERSERK, val)
-    
-    @property
-    def is_staggered(self): return self._get_status(Conditions.STAGGERED)
-    @is_staggered.setter
-    def is_staggered(self, val): self._set_status(Conditions.STAGGERED, val)
-
-    @property
-    def is_burning(self): return self._get_status(Conditions.BURNING)
-    @is_burning.setter
-    def is_burning(self, val): self._set_status(Conditions.BURNING, val)
-
-    @property
-    def is_bleeding(self): return self._get_status(Conditions.BLEEDING)
-    @is_bleeding.setter
-    def is_bleeding(self, val): self._set_status(Conditions.BLEEDING, val)
-
-    @property
-    def is_frozen(self): return self._get_status(Conditions.FROZEN)
-    @is_frozen.setter
-    def is_frozen(self, val): self._set_status(Conditions.FROZEN, val)
-
-    @property
-    def is_sanctuary(self): return self._get_status(Conditions.SANCTUARY)
-    @is_sanctuary.setter
-    def is_sanctuary(self, val): self._set_status(Conditions.SANCTUARY, val)
+    def powers(self): return self._powers
+    @powers.setter
+    def powers(self, val): self._powers = val; self._hook_table = None
 
+    # --- CONDITIONS (bits of self.status.mask; is_* properties kept for backward compatibility) ---
+    def _get_status(self, condition):
+        return self.status.has(condition) if self.status else False
+    def _set_status(self, condition, val):
+        if self.status:
+            if val: self.status.add_condition(condition)
+            else: self.status.remove_condition(condition)
+    def _set_flag(self, condition, val):
+        if self.status:
+            self.status.set_flag(condition, val)
+
+    def _condition_property(condition, timed=True):
+        """is_<condition> property. timed: setting it True applies a 1-round condition (ticks out)."""
+        bit = condition_bit(condition)
+        def getter(self):
+            status = self.status
+            return bool(status.mask & bit) if status else False
+        setter = ((lambda self, val: self._set_status(condition, val)) if timed
+                  else (lambda self, val: self._set_flag(condition, val)))
+        return property(getter, setter)
+
+    # Timed conditions (StatusManager durations)
+    is_prone = _condition_property(Conditions.PRONE)
+    is_grappled = _condition_property(Conditions.GRAPPLED)
+    is_blinded = _condition_property(Conditions.BLINDED)
+    is_restrained = _condition_property(Conditions.RESTRAINED)
+    is_stunned = _condition_property(Conditions.STUNNED)
+    is_paralyzed = _condition_property(Conditions.PARALYZED)
+    is_poisoned = _condition_property(Conditions.POISONED)
+    is_frightened = _condition_property(Conditions.FRIGHTENED)
+    is_charmed = _condition_property(Conditions.CHARMED)
+    is_deafened = _condition_property(Conditions.DEAFENED)
+    is_invisible = _condition_property(Conditions.INVISIBLE)
+    is_confused = _condition_property(Conditions.CONFUSED)
+    is_berserk = _condition_property(Conditions.BERSERK)
+    is_staggered = _condition_property(Conditions.STAGGERED)
+    is_burning = _condition_property(Conditions.BURNING)
+    is_bleeding = _condition_property(Conditions.BLEEDING)
+    is_frozen = _condition_property(Conditions.FROZEN)
+    is_sanctuary = _condition_property(Conditions.SANCTUARY)
+
+    # Untimed flags (stay until cleared)
+    is_broken = _condition_property(Conditions.BROKEN, timed=False)        # CMP at 0 (mental break)
+    is_exhausted = _condition_property(Conditions.EXHAUSTED, timed=False)  # SP at 0 (physical exhaustion)
+    is_drained = _condition_property(Conditions.DRAINED, timed=False)      # FP at 0 (focus depleted)
+    is_shaken = _condition_property(Conditions.SHAKEN, timed=False)        # Disadvantage on DEFENSE rolls
+    is_weakened = _condition_property(Conditions.WEAKENED, timed=False)    # Disadvantage on ATTACK rolls
+    is_sickened = _condition_property(Conditions.SICKENED, timed=False)    # Disadvantage on Physical rolls
+    is_blessed = _condition_property(Conditions.BLESSED, timed=False)      # Advantage on ALL action rolls
+    is_hasted = _condition_property(Conditions.HASTED, timed=False)        # Advantage + Double Speed
+    is_slowed = _condition_property(Conditions.SLOWED, timed=False)        # Speed halved
+    is_doomed = _condition_property(Conditions.DOOMED, timed=False)        # Cannot heal, instant death at 0 HP
+    is_petrified = _condition_property(Conditions.PETRIFIED, timed=False)  # Turned to stone
+    is_taunted = _condition_property(Conditions.TAUNTED, timed=False)      # Must attack taunter
+    is_disarmed = _condition_property(Conditions.DISARMED, timed=False)    # Cannot use equipped weapon
+    del _condition_property
 
     def apply_effect(self, effect_name, duration=1, on_expire=None):
         """
@@ -655,24 +600,120 @@ class Combatant:
             return self.status.tick()
         return []
 
+class WallSet(MutableSet):
+    """
+    Set of blocking (x, y) tiles stored in the grid's `blocked` layer (the walls
+    and the grid can't disagree). Tells its engine whenever it changes.
+    Out-of-map coordinates are kept aside so `in` still answers for them.
+    """
+    def __init__(self, grid, items=(), on_change=None):
+        self.grid = grid
+        self.outside = set()
+        self.count = 0
+        self.on_change = None
+        grid.blocked[:] = bytes(len(grid.blocked))
+        for pos in items:
+            self.add(pos)
+        self.on_change = on_change
+
+    def _index(self, pos):
+        x, y = pos
+        if 0 <= x < self.grid.cols and 0 <= y < self.grid.rows:
+            return y * self.grid.cols + x
+        return None
+
+    def __contains__(self, pos):
+        try:
+            i = self._index(pos)
+        except (TypeError, ValueError):
+            return False
+        return self.grid.blocked[i] == 1 if i is not None else pos in self.outside
+
+    def __iter__(self):
+        cols = self.grid.cols
+        blocked = self.grid.blocked
+        i = blocked.find(1)
+        while i != -1:
+            yield (i % cols, i // cols)
+            i = blocked.find(1, i + 1)
+        yield from list(self.outside)
+
+    def __len__(self):
+        return self.count + len(self.outside)
+
+    def __repr__(self):
+        return f"WallSet({set(self)!r})"
+
+    def add(self, pos):
+        i = self._index(pos)
+        if i is None:
+            if pos in self.outside: return
+            self.outside.add(pos)
+        else:
+            if self.grid.blocked[i]: return
+            self.grid.blocked[i] = 1
+            self.count += 1
+        if self.on_change: self.on_change()
+
+    def discard(self, pos):
+        i = self._index(pos)
+        if i is None:
+            if pos not in self.outside: return
+            self.outside.discard(pos)
+        else:
+            if not self.grid.blocked[i]: return
+            self.grid.blocked[i] = 0
+            self.count -= 1
+        if self.on_change: self.on_change()
+
+    def clear(self):
+        self.grid.blocked[:] = bytes(len(self.grid.blocked))
+        self.outside.clear()
+        self.count = 0
+        if self.on_change: self.on_change()
+
+    def copy_to(self, grid, on_change=None):
+        """Same walls over another grid whose blocked layer already matches (TerrainGrid.copy)."""
+        new = WallSet.__new__(WallSet)
+        new.grid = grid
+        new.outside = set(self.outside)
+        new.count = self.count
+        new.on_change = on_change
+        return new
+
+
 class CombatEngine:
-    def __init__(self, cols=12, rows=12):
+    # LOS results kept before the cache is flushed (tile pairs grow as (cols*rows)^2)
+    LOS_CACHE_LIMIT = 200000
+
+    def __init__(self, cols=12, rows=12, seed=None):
+        # Every roll draws from a named sub-stream of this (see core/rng.py); same seed = same battle
+        self.rng = RNGStreams(seed)
+        self.seed = self.rng.seed
+        # Visibility cache: (x0, y0, x1, y1) -> bool. Dropped whenever blocking geometry changes.
+        self._los_cache = {}
+        self.geometry_version = 0
+        self.occupancy = OccupancyGrid()  # Tile -> combatants (see occupancy.py)
+        self.scheduler = TurnScheduler()  # Initiative heap (see turn_scheduler.py)
         self.combatants = []
-        self.turn_order = []
         self.current_turn_index = 0
         self.round_counter = 1
         
-        # Map
+        # Map: parallel arrays for terrain / cost / cover / walls / occupant (see terrain_grid.py)
         self.cols = cols
         self.rows = rows
+        self.grid = TerrainGrid(cols, rows)
         self.walls = set()
-        self.hazards = []
+        self.hazards = HazardIndex()  # Hazard zones, indexed by tile (see aoe.py)
         self.aoe_templates = []
-        self.replay_log = []
+        self.replay_log = ReplayLog()  # Bounded ring; record_replay() streams the full log to disk
         self.pending_world_updates = [] # Buffer for world changes (walls, hazards)
         
-        # Tile Grid (for terrain and cover)
-        self.tiles = [[Tile("normal", x, y) for x in range(cols)] for y in range(rows)]
+        # tiles[y][x] -> Tile view over the grid (legacy access)
+        self.tiles = self.grid.rows_view()
+        self.occupancy.grid = self.grid  # Keeps the occupant layer in sync
+        self.pathfinder = Pathfinder(self)  # Shared distance fields for AI movement
+        self.battlefield = BattlefieldPicture(self)  # Round-shared AI tactical picture
         
         # Initialize AI Engine immediately if available
         self.ai = AIDecisionEngine() if AIDecisionEngine else None 
@@ -699,12 +740,12 @@ class CombatEngine:
         def_mod = target.get_stat_modifier(def_stat)
         
         # Roll d20 + mod
-        atk_roll = random.randint(1, 20)
+        atk_roll = self.rng.attacks.randint(1, 20)
         total_atk = atk_roll + atk_mod
         
         # Static Defense: 10 + Mod (or rolled defense?)
         # Let's use Rolled Defense (Clash Style)
-        def_roll = random.randint(1, 20)
+        def_roll = self.rng.attacks.randint(1, 20)
         total_def = def_roll + def_mod
         
         logs.append(f"{attacker.name} attacks! (Rolled {atk_roll}+{atk_mod}={total_atk} vs {total_def})")
@@ -712,7 +753,7 @@ class CombatEngine:
         if total_atk >= total_def:
             # Hit!
             # Damage Roll (Default 1d6 + Might for now)
-            dmg_roll = random.randint(1, 6)
+            dmg_roll = self.rng.attacks.randint(1, 6)
             dmg_mod = attacker.get_stat_modifier("Might")
             total_dmg = max(1, dmg_roll + dmg_mod)
             
@@ -729,30 +770,23 @@ class CombatEngine:
     # === TERRAIN & TILE METHODS ===
     
     def get_tile(self, x, y):
-        """Get the Tile object at coordinates."""
+        """Get a Tile view of the cell at coordinates."""
         if 0 <= x < self.cols and 0 <= y < self.rows:
-            return self.tiles[y][x]
+            return Tile(self.grid, x, y)
         return None
     
     def set_terrain(self, x, y, terrain_type):
-        """Set terrain type at coordinates."""
-        tile = self.get_tile(x, y)
-        if tile:
-            tile.terrain = terrain_type
-            data = TERRAIN_DATA.get(terrain_type, TERRAIN_DATA["normal"])
-            tile.move_cost = data.get("move_cost", 1)
-            tile.damage_type = data.get("damage_type")
-            tile.damage_dice = data.get("damage_dice")
-            tile.effect = data.get("effect")
+        """Set terrain type at coordinates (also sets the tile's move cost)."""
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            self.grid.set_terrain(x, y, terrain_type)
+            self.invalidate_visibility()
     
     def set_cover(self, x, y, direction, level):
         """Set cover on a tile edge. Direction: N/S/E/W. Level: 0=None, 1=Half, 2=Full."""
-        tile = self.get_tile(x, y)
-        if tile:
-            if direction == "N": tile.cover_north = level
-            elif direction == "S": tile.cover_south = level
-            elif direction == "E": tile.cover_east = level
-            elif direction == "W": tile.cover_west = level
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            if direction in COVER_SHIFT:
+                self.grid.set_cover(x, y, direction, level)
+            self.invalidate_visibility()
     
     # === TACTICAL CHECKS (REVISED) ===
     
@@ -770,10 +804,53 @@ class CombatEngine:
         if facing == "W" and dx > 0: return True   # Target faces W, attacker is East
         return False
     
+    # === VISIBILITY CACHE ===
+
+    @property
+    def walls(self):
+        return self._walls
+
+    @walls.setter
+    def walls(self, tiles):
+        self._walls = WallSet(self.grid, tiles, on_change=self.invalidate_visibility)
+        self.invalidate_visibility()
+
+    def invalidate_visibility(self):
+        """Drops cached LOS. Called automatically when walls/terrain/cover change."""
+        self._los_cache.clear()
+        self.geometry_version += 1
+
     def has_line_of_sight(self, attacker, target):
         """Returns True if clear LOS, False if blocked by walls or full cover."""
-        x0, y0 = attacker.x, attacker.y
-        x1, y1 = target.x, target.y
+        key = (attacker.x, attacker.y, target.x, target.y)
+        visible = self._los_cache.get(key)
+        if visible is None:
+            visible = self._trace_line_of_sight(*key)
+            if len(self._los_cache) >= self.LOS_CACHE_LIMIT:
+                self._los_cache.clear()
+            self._los_cache[key] = visible
+        return visible
+
+    def visibility_matrix(self, team):
+        """
+        All-pairs LOS for a team: {member: {other: bool}} for every living
+        member against every other living combatant. Uses (and fills) the LOS cache.
+        """
+        living = [c for c in self.combatants if c.is_alive()]
+        return {
+            me: {other: self.has_line_of_sight(me, other) for other in living if other is not me}
+            for me in living if getattr(me, "team", None) == team
+        }
+
+    def _trace_line_of_sight(self, x0, y0, x1, y1):
+        """
+        Bresenham walk from (x0, y0) to (x1, y1). Only walls block, so the result
+        depends on the two tiles alone - that's what makes it cacheable.
+        """
+        start = (x0, y0)
+        walls = self._walls
+        blocked = self.grid.blocked
+        cols, rows = self.cols, self.rows
         
         dx = abs(x1 - x0)
         dy = abs(y1 - y0)
@@ -783,15 +860,14 @@ class CombatEngine:
         
         while (x0, y0) != (x1, y1):
             # Skip attacker's tile
-            if (x0, y0) != (attacker.x, attacker.y):
+            if (x0, y0) != start:
                 # Check for wall
-                if (x0, y0) in self.walls:
+                if 0 <= x0 < cols and 0 <= y0 < rows:
+                    if blocked[y0 * cols + x0]:
+                        return False
+                elif (x0, y0) in walls.outside:
                     return False
-                # Check for full cover tile
-                tile = self.get_tile(x0, y0)
-                if tile and tile.occupant and tile.occupant != target:
-                    # Entity blocking? Optional: treat as half cover instead
-                    pass
+                # Entities don't block (could become half cover later)
             
             e2 = 2 * err
             if e2 > -dy:
@@ -809,8 +885,7 @@ class CombatEngine:
         if not self.has_line_of_sight(attacker, target):
             return COVER_FULL  # No LOS = Full Cover
         
-        tile = self.get_tile(target.x, target.y)
-        if not tile:
+        if not (0 <= target.x < self.cols and 0 <= target.y < self.rows):
             return COVER_NONE
         
         # Determine attack direction
@@ -819,15 +894,10 @@ class CombatEngine:
         
         # Get directional cover
         if abs(dx) >= abs(dy):
-            if dx > 0:
-                cover = tile.cover_west
-            else:
-                cover = tile.cover_east
+            edge = "W" if dx > 0 else "E"
         else:
-            if dy > 0:
-                cover = tile.cover_north
-            else:
-                cover = tile.cover_south
+            edge = "N" if dy > 0 else "S"
+        cover = self.grid.cover_at(target.x, target.y, edge)
         
         # Cap at COVER_FULL (2) - no 3/4 cover
         return min(cover, COVER_FULL)
@@ -845,11 +915,9 @@ class CombatEngine:
     def count_adjacent_enemies(self, target):
         """Returns count of enemies adjacent to target."""
         count = 0
-        for c in self.combatants:
-            if c.team != target.team and c.is_alive():
-                if abs(c.x - target.x) <= 1 and abs(c.y - target.y) <= 1:
-                    if c != target:
-                        count += 1
+        for c in self.occupancy.in_radius(target.x, target.y, 1):
+            if c.team != target.team and c != target:
+                count += 1
         return count
         
 
@@ -861,16 +929,63 @@ class CombatEngine:
         if 0 <= x < self.cols and 0 <= y < self.rows:
             self.walls.add((x, y))
             
+    def add_hazard(self, x, y, shape="burst", size=0, facing=None, duration=3,
+                   damage_type="Fire", damage_dice="1d6", name=None, owner=None):
+        """
+        Lays a hazard zone over an AoE template placed at x,y (see aoe.py).
+        Anyone starting their turn inside it takes damage_dice. Returns the hazard dict.
+        """
+        tiles = tiles_in_template(shape, size, x, y, facing, self.cols, self.rows)
+        return self.hazards.add({
+            "name": name or f"{damage_type or 'Hazard'} Zone",
+            "shape": shape, "size": size, "facing": facing, "origin": (x, y),
+            "duration": duration, "damage_type": damage_type, "damage_dice": damage_dice,
+            "owner": owner, "tiles": tiles
+        })
+
+    def hazards_at(self, x, y):
+        return self.hazards.at(x, y)
+
     def tick_hazards(self):
         """
         Call this at end of round to clean up expired zones.
         """
-        active = []
-        for h in self.hazards:
-            h["duration"] -= 1
-            if h["duration"] > 0:
-                active.append(h)
-        self.hazards = active
+        return self.hazards.tick()
+
+    # === SNAPSHOTS ===
+
+    def snapshot(self):
+        """Compact copy of the mutable combat state (see snapshot.py)."""
+        return snapshot.capture(self)
+
+    def restore(self, snap):
+        """Rewinds this engine to a snapshot() it produced."""
+        snapshot.restore(self, snap)
+
+    def fork(self):
+        """Independent engine + cloned combatants in the current state, for what-if play."""
+        return snapshot.fork(self)
+
+    # === REPLAY ===
+
+    def record_replay(self, path, keyframe_every=200):
+        """Streams every replay event to `path` (gzip JSONL, see replay.py) until close_replay()."""
+        writer = ReplayWriter(path, keyframe_every, snapshot=self._replay_keyframe,
+                              header={"seed": self.seed, "cols": self.cols, "rows": self.rows})
+        self.replay_log.stream_to(writer)
+        return writer
+
+    def close_replay(self):
+        self.replay_log.close()
+
+    def _replay_keyframe(self):
+        active = self.scheduler.current
+        return {
+            "round": self.round_counter,
+            "active": active.name if active else None,
+            "combatants": [[c.name, c.x, c.y, c.hp] for c in self.combatants],
+            "walls": sorted(self.walls)
+        }
 
     def log(self, message):
         """Logs a message using the callback if available."""
@@ -884,39 +999,20 @@ class CombatEngine:
         self.ai = AIDecisionEngine() if AIDecisionEngine else None
 
     def _load_weapon_db(self):
-        db = {}
-        # Path relative to brqse_engine/combat/mechanics.py -> ../../Data
-        csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../Data/weapons_and_armor.csv")
-        try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                header = f.readline()
-                for line in f:
-                    parts = line.strip().split(',')
-                    if len(parts) < 7: continue
-                    name = parts[0]
-                    tags = parts[6]
-                    dice = "1d4"
-                    if "DMG:" in tags:
-                        for t in tags.split('|'):
-                            if t.startswith("DMG:"):
-                                sub = t.split(':')
-                                if len(sub) > 1: dice = sub[1]
-                                break
-                    db[name] = dice
-        except: pass
-        return db
+        # Shared across engines: Name -> damage dice, built once per process
+        return game_data.derived("weapon_damage_dice", _build_weapon_damage_db)
         # 3. Get Weapon/Armor skill modifiers
         weapon_skill = attacker.get_weapon_skill() if hasattr(attacker, 'get_weapon_skill') else 0
         armor_skill = target.get_armor_skill() if hasattr(target, 'get_armor_skill') else 0
         
         # 4. CONTESTED ROLLS
         # ATTACK: d20 + Weapon Skill + Attack Stat
-        attack_roll = random.randint(1, 20)
+        attack_roll = self.rng.attacks.randint(1, 20)
         attack_bonus = attacker.get_stat(attack_stat) + weapon_skill
         attack_total = attack_roll + attack_bonus
         
         # DEFENSE: d20 + Armor Skill + Defense Stat (Reflexes)
-        defense_roll = random.randint(1, 20)
+        defense_roll = self.rng.attacks.randint(1, 20)
         defense_stat = "Reflexes"  # Default defense stat
         defense_bonus = target.get_stat(defense_stat) + armor_skill
         defense_total = defense_roll + defense_bonus
@@ -928,7 +1024,7 @@ class CombatEngine:
         if attack_total > defense_total:
             # HIT - Calculate damage
             dmg_die = wep.get("damage_dice", 6) if wep else 6
-            dmg = random.randint(1, dmg_die) + attacker.get_stat(attack_stat)
+            dmg = self.rng.attacks.randint(1, dmg_die) + attacker.get_stat(attack_stat)
             target.take_damage(dmg)
             log.append(f"HIT! {attacker.name} deals {dmg} damage to {target.name}!")
             
@@ -974,8 +1070,8 @@ class CombatEngine:
         log.append(f"=== PHYSICAL CLASH ({stat_used}) ===")
         
         # Clash Roll: d20 + Stat
-        attacker_roll = random.randint(1, 20) + attacker.get_stat(stat_used)
-        defender_roll = random.randint(1, 20) + target.get_stat(stat_used)
+        attacker_roll = self.rng.attacks.randint(1, 20) + attacker.get_stat(stat_used)
+        defender_roll = self.rng.attacks.randint(1, 20) + target.get_stat(stat_used)
         
         log.append(f"{attacker.name} clashes: {attacker_roll}")
         log.append(f"{target.name} clashes: {defender_roll}")
@@ -1054,8 +1150,8 @@ class CombatEngine:
             
         elif stat_upper == "CHARM":
             # PSYCHE: Choose where target moves (push in any direction)
-            loser.x = max(0, min(self.cols - 1, loser.x + random.choice([-1, 0, 1])))
-            loser.y = max(0, min(self.rows - 1, loser.y + random.choice([-1, 0, 1])))
+            loser.x = max(0, min(self.cols - 1, loser.x + self.rng.attacks.choice([-1, 0, 1])))
+            loser.y = max(0, min(self.rows - 1, loser.y + self.rng.attacks.choice([-1, 0, 1])))
             return f"PSYCHE! {winner.name} redirects {loser.name}'s momentum!"
         
         else:
@@ -1075,12 +1171,12 @@ class CombatEngine:
         log = []
         
         # Cast Roll
-        cast_roll = random.randint(1, 20)
+        cast_roll = self.rng.effects.randint(1, 20)
         cast_bonus = caster.get_stat(cast_stat)
         cast_total = cast_roll + cast_bonus
         
         # Save Roll
-        save_roll = random.randint(1, 20)
+        save_roll = self.rng.effects.randint(1, 20)
         save_bonus = target.get_stat(save_stat)
         save_total = save_roll + save_bonus
         
@@ -1138,8 +1234,8 @@ class CombatEngine:
             log.append(f"{target.name} pays 1 SP to resist!")
         
         # Clash Rolls
-        caster_roll = random.randint(1, 20) + caster.get_stat(cast_stat)
-        target_roll = random.randint(1, 20) + target.get_stat(cast_stat)
+        caster_roll = self.rng.effects.randint(1, 20) + caster.get_stat(cast_stat)
+        target_roll = self.rng.effects.randint(1, 20) + target.get_stat(cast_stat)
         
         log.append(f"{caster.name} channels: {caster_roll}")
         log.append(f"{target.name} resists: {target_roll}")
@@ -1199,7 +1295,7 @@ class CombatEngine:
             nearby = [c for c in self.combatants if c.is_alive() and c != original_target 
                      and max(abs(c.x - original_target.x), abs(c.y - original_target.y)) <= 2]
             if nearby:
-                new_t = random.choice(nearby)
+                new_t = self.rng.effects.choice(nearby)
                 return (new_t, f"CALCULATE! Spell redirects to {new_t.name}!")
             return (original_target, f"CALCULATE! No nearby targets - hits original!")
             
@@ -1208,7 +1304,7 @@ class CombatEngine:
             nearby = [c for c in self.combatants if c.is_alive() and c != loser 
                      and max(abs(c.x - loser.x), abs(c.y - loser.y)) <= 2]
             if nearby:
-                new_t = random.choice(nearby)
+                new_t = self.rng.effects.choice(nearby)
                 return (new_t, f"SPOT! Spell targets {new_t.name} near {loser.name}!")
             return (loser, f"SPOT! No nearby targets - hits {loser.name}!")
             
@@ -1217,7 +1313,7 @@ class CombatEngine:
             nearby = [c for c in self.combatants if c.is_alive() 
                      and max(abs(c.x - caster.x), abs(c.y - caster.y)) <= 6]
             if nearby:
-                new_t = random.choice(nearby)
+                new_t = self.rng.effects.choice(nearby)
                 return (new_t, f"DEFLECT! Spell wildly redirects to {new_t.name}!")
             return (original_target, f"DEFLECT! No targets in range!")
             
@@ -1233,32 +1329,79 @@ class CombatEngine:
         else:
             return (original_target, f"{winner.name} wins the magic clash!")
 
+    @property
+    def combatants(self):
+        return self._combatants
+
+    @combatants.setter
+    def combatants(self, roster):
+        # Replacing the roster (e.g. scene change) re-syncs the position index
+        self._combatants = roster
+        self.occupancy.rebuild(roster)
+        for c in roster:
+            c.rng = self.rng
+
+    @property
+    def turn_order(self):
+        """Roster in initiative order (built on demand; the scheduler owns the real queue)."""
+        return self.scheduler.order()
+
+    @turn_order.setter
+    def turn_order(self, order):
+        self.scheduler.start(order)
+        self.scheduler.advance()
+
+    @property
+    def current_turn_idx(self):
+        active = self.scheduler.current
+        return self.turn_order.index(active) if active in self.scheduler else 0
+
     def get_combatant_at(self, x, y):
         """Returns the living combatant at x,y or None."""
-        for c in self.combatants:
-            if c.x == x and c.y == y and c.hp > 0:
+        for c in self.occupancy.at(x, y, alive=False):
+            if c.hp > 0:
                 return c
         return None
 
+    def get_combatants_in_radius(self, x, y, radius, alive=True):
+        """Combatants within `radius` tiles of x,y (Chebyshev)."""
+        return self.occupancy.in_radius(x, y, radius, alive)
+
+    def get_combatants_in_template(self, shape, size, x, y, facing=None, alive=True):
+        """Combatants inside a burst/cone/line/wall template placed at x,y (see aoe.py)."""
+        return combatants_in_template(self, shape, size, x, y, facing, alive)
+
     def add_combatant(self, combatant, x, y):
         combatant.x = x
         combatant.y = y
         self.combatants.append(combatant)
+        self.occupancy.add(combatant)
+        combatant.rng = self.rng
+        if self.scheduler.current is not None:
+            # Mid-combat join (summons, reinforcements)
+            combatant.roll_initiative()
+            self.scheduler.add(combatant)
 
     def start_combat(self):
         for c in self.combatants: 
+             c.rng = self.rng  # Also covers units appended to the roster directly
              c.roll_initiative()
              c.movement_remaining = c.movement # Reset at start
              c.action_used = False
              c.bonus_action_used = False
-        self.combatants.sort(key=lambda c: c.initiative, reverse=True)
-        self.turn_order = self.combatants
-        self.current_turn_idx = 0
-        return [f"Combat Started! {self.turn_order[0].name}'s Turn."]
+        # Roster order is left alone; the scheduler keeps its own initiative heap
+        self.scheduler.start(self.combatants)
+        first, _ = self.scheduler.advance()
+        # Seed + order first, so the replay can be re-run exactly (CombatEngine(seed=...))
+        self.replay_log.append({
+            "type": "combat_start",
+            "seed": self.seed,
+            "initiative": [[c.name, c.initiative] for c in self.turn_order]
+        })
+        return [f"Combat Started! {first.name}'s Turn."] if first else ["Combat Started! Nobody can act."]
 
     def get_active_char(self):
-        if not self.turn_order: return None
-        return self.turn_order[self.current_turn_idx]
+        return self.scheduler.current
 
     def start_turn(self, combatant):
         """
@@ -1272,11 +1415,11 @@ class CombatEngine:
         
         # 0. TERRAIN DAMAGE - Check tile combatant is standing on
         if 0 <= combatant.x < self.cols and 0 <= combatant.y < self.rows:
-            tile = self.tiles[combatant.y][combatant.x]
-            terrain = tile.terrain.lower() if tile.terrain else "floor_stone"
+            terrain = self.grid.terrain_at(combatant.x, combatant.y)
+            terrain = terrain.lower() if terrain else "floor_stone"
             
             if terrain == "fire":
-                dmg = random.randint(1, 6)
+                dmg = self.rng.terrain.randint(1, 6)
                 combatant.take_damage(dmg)
                 log.append(f"{combatant.name} takes {dmg} Fire damage from standing in flames!")
                 self.replay_log.append({
@@ -1287,7 +1430,7 @@ class CombatEngine:
                     "description": f"Burned by fire tile!"
                 })
             elif terrain == "ice":
-                if random.random() < 0.3:  # 30% slip chance
+                if self.rng.terrain.random() < 0.3:  # 30% slip chance
                     log.append(f"{combatant.name} slips on the ice and loses half their movement!")
                     combatant.movement_remaining = max(0, combatant.movement_remaining // 2)
             elif terrain in ["water", "water_shallow"]:
@@ -1296,15 +1439,28 @@ class CombatEngine:
             elif terrain in ["mud", "difficult", "rubble"]:
                 log.append(f"{combatant.name} struggles through difficult terrain.")
                 combatant.movement_remaining = max(0, combatant.movement_remaining - 5)
+
+        # 0b. HAZARD ZONES - one dict lookup for the tile
+        for hazard in list(self.hazards.at(combatant.x, combatant.y)):
+            if not hazard.get("damage_dice"): continue
+            dmg, _, _ = Dice.roll(hazard["damage_dice"], rng=self.rng.terrain)
+            combatant.take_damage(dmg)
+            log.append(f"{combatant.name} takes {dmg} {hazard.get('damage_type') or ''} damage from {hazard['name']}!")
+            self.replay_log.append({
+                "type": "hazard_damage",
+                "actor": combatant.name,
+                "damage": dmg,
+                "hazard": hazard["name"]
+            })
         
         # 1. Tick Start-of-Turn Effects (KILL tier DoTs)
         if hasattr(combatant, 'is_burning') and combatant.is_burning:
-            dmg = random.randint(1, 6)  # BURN = 1d6
+            dmg = self.rng.effects.randint(1, 6)  # BURN = 1d6
             combatant.take_damage(dmg)
             log.append(f"{combatant.name} takes {dmg} BURN damage!")
             
         if hasattr(combatant, 'is_bleeding') and combatant.is_bleeding:
-            dmg = random.randint(1, 4)  # BLEED = 1d4
+            dmg = self.rng.effects.randint(1, 4)  # BLEED = 1d4
             combatant.take_damage(dmg)
             log.append(f"{combatant.name} takes {dmg} BLEED damage!")
 
@@ -1323,7 +1479,7 @@ class CombatEngine:
              
         if combatant.is_confused:
             # 50% chance to act normally
-            if random.random() < 0.5:
+            if self.rng.effects.random() < 0.5:
                  log.append(f"{combatant.name} is CONFUSED but maintains focus!")
             else:
                  log.append(f"{combatant.name} moves wildly in CONFUSION!")
@@ -1334,59 +1490,78 @@ class CombatEngine:
 
     def end_turn(self):
         # Tick effects on current character before ending
-        active = self.turn_order[self.current_turn_idx]
-        
-        # Tick End-of-Turn Effects (Buffs)
-        expired = active.tick_effects() # Renamed/Modified logic below? 
-        # For now, keep tick_effects as general ticker
-        
+        active = self.scheduler.current
         log = []
-        if expired:
-            log.append(f"Effects expired on {active.name}: {', '.join(expired)}")
-        
-        self.current_turn_idx = (self.current_turn_idx + 1) % len(self.turn_order)
-    
-        # Check Round Cycle
-        if self.current_turn_idx == 0:
-            self.round_counter += 1
-            self.tick_hazards()
-            if self.log_callback: self.log_callback(f"--- Round {self.round_counter} ---")
-
-        # Skip dead
-        start = self.current_turn_idx
-        while not self.turn_order[self.current_turn_idx].is_alive():
-            self.current_turn_idx = (self.current_turn_idx + 1) % len(self.turn_order)
-            if self.current_turn_idx == start: break # Everyone dead
-        
-        # Reset movement for new active char
-        new_active = self.turn_order[self.current_turn_idx]
-        new_active.movement_remaining = new_active.movement
-        # Reset Actions
-        new_active.action_used = False
-        new_active.bonus_action_used = False
-        new_active.reaction_used = False
-        
-        # TRIGGER START TURN logic for new active
-        can_act, start_log = self.start_turn(new_active)
-        log.extend(start_log)
-        
-        if not can_act:
-             # Recursively end turn if skipped? 
-             # Or just return log and let caller see they can't act.
-             # Better: automatically skip to next.
-             # CAUTION: Recursive loop if everyone stunning.
-             # For safety, just set their actions to used or invalid?
-             # Simple approach: If not can_act, we assume the UI/AI loop handles it.
-             # But since 'end_turn' is called by UI button...
-             # If I skip here, who updates UI?
-             # Let's just return the log saying they are stunned. 
-             # The UI should disable buttons if 'is_stunned'.
-             # Or better, we auto-end their turn? 
-             pass
+        if active is not None:
+            expired = active.tick_effects()
+            if expired:
+                log.append(f"Effects expired on {active.name}: {', '.join(expired)}")
+        return self._advance_turn(log)
+
+    def delay_turn(self, initiative=None):
+        """
+        Active combatant holds their turn and acts later this round
+        (at `initiative`, default: after everyone else). The new initiative sticks.
+        """
+        active = self.scheduler.current
+        if active is None: return []
+        if initiative is None:
+            initiative = min(c.initiative for c in self.scheduler.roster) - 1
+        if not self.scheduler.delay(active, initiative):
+            return [f"{active.name} can't delay to initiative {initiative}."]
+        self.replay_log.append({"type": "delay", "actor": active.name, "initiative": initiative})
+        return self._advance_turn([f"{active.name} delays (initiative {initiative})."])
+
+    def _advance_turn(self, log):
+        """
+        Hands the turn to the next combatant. Actors that can't act (Stunned, Frozen...)
+        have their turn pass automatically; no recursion, at most one lap of skips.
+        """
+        skips = 0
+        while True:
+            new_active, new_round = self.scheduler.advance()
+            if new_active is None:
+                log.append("Nobody is left standing.")
+                return log
+
+            # Check Round Cycle
+            if new_round:
+                self.round_counter += 1
+                self.tick_hazards()
+                if self.log_callback: self.log_callback(f"--- Round {self.round_counter} ---")
+
+            # Reset movement / actions for new active char
+            new_active.movement_remaining = new_active.movement
+            new_active.action_used = False
+            new_active.bonus_action_used = False
+            new_active.reaction_used = False
+
+            # TRIGGER START TURN logic for new active
+            can_act, start_log = self.start_turn(new_active)
+            log.extend(start_log)
+            if can_act or skips >= len(self.scheduler):
+                break
+
+            # Skipped: the turn ends on the spot (so 1-round stuns wear off)
+            skips += 1
+            expired = new_active.tick_effects()
+            if expired:
+                log.append(f"Effects expired on {new_active.name}: {', '.join(expired)}")
 
         log.append(f"{new_active.name}'s Turn. (Speed: {new_active.movement_remaining})")
         return log
 
+    def execute_group_turn(self, actors, planner=None):
+        """
+        Several AI units act together (hordes): every plan is made against the same
+        state, possibly in parallel, then committed in initiative order with
+        re-planning only where an earlier commit got in the way. See group_planner.py.
+        """
+        if planner is None:
+            from brqse_engine.combat.group_planner import GroupPlanner
+            planner = GroupPlanner(workers=1)
+        return planner.run(self, actors)
+
     def execute_ai_turn(self, ai_char):
         """
         Execute a turn for an AI-controlled character.
@@ -1430,16 +1605,18 @@ class CombatEngine:
         if ai_template == "Aggressive":
             # Charge and attack
             if dist_sq > 1:
-                # Move toward target
-                move_x = ai_char.x + (1 if target.x > ai_char.x else (-1 if target.x < ai_char.x else 0))
-                move_y = ai_char.y + (1 if target.y > ai_char.y else (-1 if target.y < ai_char.y else 0))
-                ok, msg = self.move_char(ai_char, move_x, move_y)
+                # Move toward target (around walls, preferring cheap terrain)
+                step = self.pathfinder.next_step_toward(ai_char, target)
+                if step:
+                    ok, msg = self.move_char(ai_char, *step)
+                else:
+                    ok, msg = False, "No path!"
                 log.append(f"[AI] Move: {msg}")
                 # Try again until in range or out of movement
-                while ai_char.movement_remaining >= 5 and max(abs(ai_char.x - target.x), abs(ai_char.y - target.y)) > 1:
-                    move_x = ai_char.x + (1 if target.x > ai_char.x else (-1 if target.x < ai_char.x else 0))
-                    move_y = ai_char.y + (1 if target.y > ai_char.y else (-1 if target.y < ai_char.y else 0))
-                    ok, msg = self.move_char(ai_char, move_x, move_y)
+                while ok and ai_char.movement_remaining >= 5 and max(abs(ai_char.x - target.x), abs(ai_char.y - target.y)) > 1:
+                    step = self.pathfinder.next_step_toward(ai_char, target)
+                    if not step: break
+                    ok, msg = self.move_char(ai_char, *step)
                     if not ok: break
             
             # Attack if adjacent
@@ -1472,9 +1649,8 @@ class CombatEngine:
             
             # If too far (> 5), move closer
             elif dist_sq > 5:
-                move_x = ai_char.x + (1 if target.x > ai_char.x else (-1 if target.x < ai_char.x else 0))
-                move_y = ai_char.y + (1 if target.y > ai_char.y else (-1 if target.y < ai_char.y else 0))
-                ok, msg = self.move_char(ai_char, move_x, move_y)
+                step = self.pathfinder.next_step_toward(ai_char, target)
+                ok, msg = self.move_char(ai_char, *step) if step else (False, "No path!")
                 log.append(f"[AI] Closing: {msg}")
                 
             # 2. ACTION (Cast or Attack)
@@ -1489,7 +1665,6 @@ class CombatEngine:
             casted = False
             # Fix: Check SP or FP (since we don't know which stat uses which yet, assume 2 is min cost)
             if ai_char.powers and (ai_char.sp >= 2 or ai_char.fp >= 2):
-                 import random
                  # Priority: Control if target free, then Damage
                  control_spells = [p for p in ai_char.powers if "Entangle" in p or "Sleep" in p or "Stun" in p or "Push" in p]
                  damage_spells = [p for p in ai_char.powers if p not in control_spells]
@@ -1499,13 +1674,13 @@ class CombatEngine:
                  is_controlled = target.is_restrained or target.is_stunned or target.is_grappled
                  
                  # Mix up strategy: 70% focus on control, 30% just blast 'em
-                 wants_control = (not is_controlled and control_spells and random.random() < 0.7)
+                 wants_control = (not is_controlled and control_spells and self.rng.ai.random() < 0.7)
                  
                  if wants_control:
-                     chosen_spell = random.choice(control_spells)
+                     chosen_spell = self.rng.ai.choice(control_spells)
                      log.append(f"[AI] Prioritizing Control: {chosen_spell}")
                  elif damage_spells:
-                     chosen_spell = random.choice(damage_spells)
+                     chosen_spell = self.rng.ai.choice(damage_spells)
                      msg = "Prioritizing Damage" if is_controlled else "Mixing it up (Damage)"
                      log.append(f"[AI] {msg}: {chosen_spell}")
                  
@@ -1524,9 +1699,8 @@ class CombatEngine:
             
         elif ai_template == "Berserker":
             # Random movement + attack
-            import random
-            move_x = ai_char.x + random.choice([-1, 0, 1])
-            move_y = ai_char.y + random.choice([-1, 0, 1])
+            move_x = ai_char.x + self.rng.ai.choice([-1, 0, 1])
+            move_y = ai_char.y + self.rng.ai.choice([-1, 0, 1])
             self.move_char(ai_char, move_x, move_y)
             if max(abs(ai_char.x - target.x), abs(ai_char.y - target.y)) <= 1:
                 log.extend(self.attack_target(ai_char, target))
@@ -1561,8 +1735,8 @@ class CombatEngine:
             return False, f"Not enough movement! ({char.movement_remaining} left)"
         
         # Check collision
-        for c in self.combatants:
-            if c.is_alive() and c != char and c.x == tx and c.y == ty:
+        for c in self.occupancy.at(tx, ty):
+            if c != char:
                 # BURT'S UPDATE: Collision Check with Talent Exception
                 can_pass = getattr(char, "can_move_through_enemies", False)
                 if not can_pass:
@@ -1587,24 +1761,106 @@ class CombatEngine:
             "type": "move",
             "actor": char.name,
             "pos_from": [old_x, old_y],
-            "pos_to": [tx, ty],
-            "timestamp": time.time()
+            "pos_to": [tx, ty]
         })
         # ---------------------------------
         
         return True, f"Moved to {tx},{ty}. ({char.movement_remaining} left)"
 
-    def attack_target(self, attacker, target):
-        # Range Check - supports both melee and ranged
-        dx = abs(attacker.x - target.x)
-        dy = abs(attacker.y - target.y)
-        dist_sq = max(dx, dy)  # Chebyshev distance in squares
-        
+    def attack_modifiers(self, attacker, target, incoming=None):
+        """
+        Everything that shapes the to-hit contest, without rolling or side effects
+        (attack_target rolls with it, attack_odds feeds it to core/probability.py).
+        incoming: attacks the target has taken this round counting this one
+        (2nd+ gives the defender disadvantage). Defaults to the next attack.
+        """
+        if incoming is None:
+            incoming = target.attacks_received_this_round + 1
+
+        # Attacker uses Might/Finesse + weapon skill vs Defender's armor stat + armor skill
+        attack_stat = "Might"
+        skill_rank = 0
+        if attacker.inventory:
+            attack_stat = attacker.inventory.get_weapon_main_stat()
+            # Get Skill Rank (e.g. "The Great Weapons")
+            wpn = attacker.inventory.equipped.get("Main Hand")
+            if wpn and hasattr(wpn, "family"):
+                 skill_rank = attacker.get_skill_rank(wpn.family)
+            if not wpn: # Unarmed
+                 skill_rank = attacker.get_skill_rank("The Fist")
+
+        def_stat_name = "Reflexes"
+        def_skill_rank = 0
+        if target.inventory:
+            def_stat_name = target.inventory.get_defense_stat()
+            armor = target.inventory.equipped.get("Armor")
+            if armor and hasattr(armor, "family"):
+                  def_skill_rank = target.get_skill_rank(armor.family)
+
+        # === ADVANTAGE/DISADVANTAGE ===
+        atk_adv = attacker.has_attack_advantage()
+        atk_dis = attacker.has_attack_disadvantage()
+        # Factor in target's state (being prone gives attacker advantage, etc)
+        if target.is_attack_target_advantaged(attacker):
+            atk_adv = True
+        if target.is_attack_target_disadvantaged(attacker):
+            atk_dis = True
+        # Prone attacking is disadvantage
+        if attacker.is_prone:
+            atk_dis = True
+
+        # === TACTICAL CHECKS ===
+        # Behind Attack: Advantage if attacker is in target's rear arc
+        behind = self.is_behind(attacker, target)
+        # 3+ Enemies: Advantage if target is engaged by 3+ enemies
+        surrounded = self.count_adjacent_enemies(target) >= 3
+        if behind or surrounded:
+            atk_adv = True
+        # High Ground: +2 bonus for ranged attacks
+        high_ground = self.has_high_ground(attacker, target)
+        # Half Cover = Defender gets Advantage
+        cover = self.get_cover_between(attacker, target)
+
+        return {
+            "attack_stat": attack_stat,
+            "hit_mod": attacker.get_stat_modifier(attack_stat) + skill_rank + (2 if high_ground else 0),
+            "atk_adv": atk_adv,
+            "atk_dis": atk_dis,
+            "def_stat": def_stat_name,
+            "def_mod": target.get_stat_modifier(def_stat_name) + def_skill_rank,
+            "def_adv": cover == COVER_HALF or target.has_defense_advantage(),
+            "def_dis": incoming >= 2 or target.has_defense_disadvantage(),
+            "behind": behind,
+            "surrounded": surrounded,
+            "high_ground": high_ground,
+            "cover": cover,
+        }
+
+    def attack_odds(self, attacker, target):
+        """
+        Exact outcome odds and expected damage of attacker -> target right now
+        (see core/probability.py). Nothing is rolled or changed.
+        """
+        mods = self.attack_modifiers(attacker, target)
+        dmg_dice = attacker.inventory.get_weapon_stats()[0] if attacker.inventory else "1d4"
+        if mods["cover"] == COVER_FULL:
+            return {"outcomes": {}, "expected": {"hp": 0.0, "cmp": 0.0, "self": 0.0,
+                                                 "hit_chance": 0.0, "clash_chance": 0.0},
+                    "damage_dice": dmg_dice, "modifiers": mods}
+        flags = (mods["hit_mod"], mods["def_mod"], mods["atk_adv"], mods["atk_dis"],
+                 mods["def_adv"], mods["def_dis"])
+        return {
+            "outcomes": probability.attack_outcomes(*flags),
+            "expected": probability.expected_damage(dmg_dice, *flags),
+            "damage_dice": dmg_dice,
+            "modifiers": mods,
+        }
+
+    def attack_reach(self, attacker):
+        """(is_ranged, max_range in squares) of the attacker's basic attack."""
         # Check if weapon is ranged
         is_ranged = False
         max_range = 1  # Default melee reach
-        weapon_name = "Unarmed"
-        armor_name = "Unarmored"
         
         if attacker.inventory:
             wpn = attacker.inventory.equipped.get("Main Hand")
@@ -1623,20 +1879,33 @@ class CombatEngine:
                         max_range = max(1, int(clean_val) // 5)
                     except:
                         max_range = 6  # Default fallback
-                
-                # Get name
-                weapon_name = getattr(wpn, "name", wpn) if hasattr(wpn, "name") else str(wpn)
-                    
-        if target.inventory:
-            arm = target.inventory.equipped.get("Armor")
-            if arm:
-                armor_name = getattr(arm, "name", arm) if hasattr(arm, "name") else str(arm)
         
         # Check for reach-extending effects (melee only)
         if not is_ranged:
             for eff in attacker.active_effects:
                 if "reach" in eff["name"].lower():
                     max_range = 2  # 10ft reach
+        return is_ranged, max_range
+
+    def attack_target(self, attacker, target):
+        # Range Check - supports both melee and ranged
+        dx = abs(attacker.x - target.x)
+        dy = abs(attacker.y - target.y)
+        dist_sq = max(dx, dy)  # Chebyshev distance in squares
+        
+        is_ranged, max_range = self.attack_reach(attacker)
+        weapon_name = "Unarmed"
+        armor_name = "Unarmored"
+        
+        if attacker.inventory:
+            wpn = attacker.inventory.equipped.get("Main Hand")
+            if wpn:
+                weapon_name = getattr(wpn, "name", wpn) if hasattr(wpn, "name") else str(wpn)
+                    
+        if target.inventory:
+            arm = target.inventory.equipped.get("Armor")
+            if arm:
+                armor_name = getattr(arm, "name", arm) if hasattr(arm, "name") else str(arm)
         
         if dist_sq > max_range:
             range_type = "Range" if is_ranged else "Reach"
@@ -1673,110 +1942,35 @@ class CombatEngine:
         if attacker.inventory:
             dmg_dice, damage_type, weapon_tags = attacker.inventory.get_weapon_stats()
             
-        # Parse Dice (e.g. "2d6")
-        if "d" in dmg_dice:
-            num, sides = map(int, dmg_dice.split("d"))
-            damage = sum(random.randint(1, sides) for _ in range(num))
-        else:
-            damage = int(dmg_dice)
+        # Dice (e.g. "2d6") are parsed once per expression and cached (see core/dice.py)
+        expr = compile_dice(dmg_dice)
+        damage = expr.roll(self.rng.attacks) if expr else 0
             
         # 2. To Hit Calculation (Resource Clash)
-        # Attacker uses Might/Finesse vs Defender's Armor Stat
-        def_stat_name = "Reflexes"
-        if target.inventory: 
-            def_stat_name = target.inventory.get_defense_stat()
-            
-        # USE MODIFIERS
-        attack_stat = "Might"
-        skill_rank = 0
-        
-        if attacker.inventory:
-            attack_stat = attacker.inventory.get_weapon_main_stat()
-            # Get Skill Rank (e.g. "The Great Weapons")
-            wpn = attacker.inventory.equipped.get("Main Hand")
-            if wpn and hasattr(wpn, "family"):
-                 skill_rank = attacker.get_skill_rank(wpn.family)
-            if not wpn: # Unarmed
-                 skill_rank = attacker.get_skill_rank("The Fist")
-            
-        hit_mod = attacker.get_stat_modifier(attack_stat) + skill_rank
-
-        # === NEW ADVANTAGE/DISADVANTAGE SYSTEM ===
-        # Determine attacker's advantage/disadvantage
-        atk_adv = attacker.has_attack_advantage()
-        atk_dis = attacker.has_attack_disadvantage()
-        
-        # Factor in target's state (being prone gives attacker advantage, etc)
-        if target.is_attack_target_advantaged(attacker):
-            atk_adv = True
-        if target.is_attack_target_disadvantaged(attacker):
-            atk_dis = True
-        
-        # Prone attacking is disadvantage
-        if attacker.is_prone:
-            atk_dis = True
-        
-        # === TACTICAL ADVANTAGE CHECKS (REVISED) ===
-
-        # === TACTICAL ADVANTAGE CHECKS ===
-        
         # Track attacks received for multi-attacker disadvantage
         target.attacks_received_this_round += 1
-        
-        # Defender Disadvantage: 2nd+ attack against them this round
-        defender_disadvantage = target.attacks_received_this_round >= 2
-        
-        # Behind Attack: Advantage if attacker is in target's rear arc
-        if self.is_behind(attacker, target):
-            atk_adv = True
-            log.append("(Rear Attack!)")
-        
-        # 3+ Enemies: Advantage if target is engaged by 3+ enemies
-        adj_enemies = self.count_adjacent_enemies(target)
-        if adj_enemies >= 3:
-            atk_adv = True
-            log.append("(Surrounded!)")
-        
-        # High Ground: +2 bonus for ranged attacks
-        high_ground_bonus = 0
-        if self.has_high_ground(attacker, target):
-            high_ground_bonus = 2
-            log.append("(High Ground +2)")
-        
+        mods = self.attack_modifiers(attacker, target, target.attacks_received_this_round)
+        attack_stat = mods["attack_stat"]
+        if mods["behind"]: log.append("(Rear Attack!)")
+        if mods["surrounded"]: log.append("(Surrounded!)")
+        if mods["high_ground"]: log.append("(High Ground +2)")
+
         # Cover: Only Half and Full
-        cover_level = self.get_cover_between(attacker, target)
-        if cover_level == COVER_FULL:
+        if mods["cover"] == COVER_FULL:
             return [f"{target.name} has Full Cover! Cannot target."]
-        # Half Cover = Defender gets Advantage (handled via defender_advantage below)
-        defender_advantage = cover_level == COVER_HALF
             
         # Roll with advantage/disadvantage
-        raw_d20 = attacker.roll_with_advantage(atk_adv, atk_dis)
-        hit_score = hit_mod + raw_d20 + high_ground_bonus
+        raw_d20 = attacker.roll_with_advantage(mods["atk_adv"], mods["atk_dis"])
+        hit_score = mods["hit_mod"] + raw_d20
         
         # Invisibility breaks on attack
         if attacker.is_invisible:
             attacker.is_invisible = False
             log.append(f"{attacker.name} appears from invisibility!")
         
-        # Defender uses AC (Base 10 + Dex/Armor Mod)
-        def_mod = target.get_stat_modifier(def_stat_name)
-        
-        # Add Defender Skill Rank (Armor)
-        def_skill_rank = 0
-        if target.inventory:
-             armor = target.inventory.equipped.get("Armor")
-             if armor and hasattr(armor, "family"):
-                  def_skill_rank = target.get_skill_rank(armor.family)
-        
         # User requested "Active Defense" with advantage/disadvantage.
-        # Defender also gets status-based advantage/disadvantage
-        def_adv = defender_advantage or target.has_defense_advantage()
-        def_dis = defender_disadvantage or target.has_defense_disadvantage()
-        
-        def_total_mod = def_mod + def_skill_rank
-        def_raw_d20 = target.roll_with_advantage(def_adv, def_dis)
-        def_roll = def_total_mod + def_raw_d20
+        def_raw_d20 = target.roll_with_advantage(mods["def_adv"], mods["def_dis"])
+        def_roll = mods["def_mod"] + def_raw_d20
         
         # --- [NEW] HOOKS: ON DEFEND ---
         engine_hooks.apply_hooks(target, "ON_DEFEND", context)
@@ -1800,7 +1994,10 @@ class CombatEngine:
             # POSITIVE MARGINS (Hits)
             if margin <= 4:
                 # GRAZE (+1 to +4)
-                logs.append(f"GRAZE! ({margin}). {target.name} takes {dmg_val} CMP damage.")
+                dmg_val = damage
+                target.cmp -= dmg_val
+                target.check_resources()
+                log.append(f"GRAZE! ({margin}). {target.name} takes {dmg_val} CMP damage.")
                 self.replay_log.append({
                     "type": "graze", 
                     "actor": attacker.name, 
@@ -1836,7 +2033,7 @@ class CombatEngine:
                 # Let's do Standard Damage + Injury
                 # Placeholder Injury
                 injuries = ["Broken Arm", "Concussion", "Bleeding Out", "Cracked Ribs"]
-                injury = random.choice(injuries)
+                injury = self.rng.attacks.choice(injuries)
                 target.apply_effect(injury, duration=-1) # Permanent
                 
                 # --- [NEW] HOOKS: ON CRIT / HIT ---
@@ -1890,7 +2087,7 @@ class CombatEngine:
                 # BOTCH (-11+)
                 # Trip and Damage
                 attacker.is_prone = True
-                self_dmg = random.randint(1, 4)
+                self_dmg = self.rng.attacks.randint(1, 4)
                 attacker.take_damage(self_dmg)
                 log.append(f"BOTCH! ({margin}). You trip and take {self_dmg} damage!")
                 self.replay_log.append({"type": "botch", "actor": attacker.name, "target": target.name, "margin": margin})
@@ -1922,8 +2119,7 @@ class CombatEngine:
         
         minion = Combatant(filepath=None, data=data)
         minion.name = f"{name}_{len(self.combatants)}" # Unique-ish ID
-        self.add_combatant(minion, x, y)
-        self.turn_order.append(minion) # Add to turn order immediately
+        self.add_combatant(minion, x, y)  # Joins the turn order at its initiative slot
         return minion
 
     def _get_ability_style(self, name):
@@ -1954,7 +2150,7 @@ class CombatEngine:
         start_hp = target.hp
 
         # Caster rolls d20 + Power Stat (Mod)
-        caster_roll = random.randint(1, 20)
+        caster_roll = self.rng.effects.randint(1, 20)
         caster_mod = caster.get_stat_modifier(power_stat)
         caster_total = caster_roll + caster_mod
         log.append(f"Caster Roll: {caster_total} ({caster_roll}+{caster_mod} {power_stat})")
@@ -2023,6 +2219,26 @@ class CombatEngine:
 
         return log
 
+    @staticmethod
+    def ability_cost(data_item):
+        """('SP' | 'FP', amount) an ability costs. data_item: engine_hooks.get_ability_data() row."""
+        physical_stats = ['Might', 'Reflexes', 'Finesse', 'Endurance', 'Vitality', 'Fortitude']
+        attr = data_item.get('Attribute', '')
+        
+        # Physical stats use SP, Mental stats use FP
+        res = 'SP' if attr in physical_stats else 'FP'
+        
+        # Cost = Tier for School abilities, else 2
+        tier = data_item.get('Tier')
+        if tier:
+            try:
+                val = int(tier)
+            except:
+                val = 2
+        else:
+            val = 2
+        return res, val
+
     def activate_ability(self, char, ability_name, target=None, **kwargs):
         destination_name = target.name if target else "Self/Area"
         log = [f"{char.name} uses {ability_name} on {destination_name}!"]
@@ -2052,21 +2268,7 @@ class CombatEngine:
             
             if data_item:
                 # 1. Determine Cost and Resource Type
-                physical_stats = ['Might', 'Reflexes', 'Finesse', 'Endurance', 'Vitality', 'Fortitude']
-                attr = data_item.get('Attribute', '')
-                
-                # Physical stats use SP, Mental stats use FP
-                res = 'SP' if attr in physical_stats else 'FP'
-                
-                # Cost = Tier for School abilities, else 2
-                tier = data_item.get('Tier')
-                if tier:
-                    try:
-                        val = int(tier)
-                    except:
-                        val = 2
-                else:
-                    val = 2
+                res, val = self.ability_cost(data_item)
                 
                 # Check affordability
                 curr = char.sp if res == 'SP' else char.fp
@@ -2105,8 +2307,7 @@ class CombatEngine:
                 "actor": char.name,
                 "ability": ability_name,
                 "pos_from": pos_from,
-                "pos_to": pos_to,
-                "timestamp": time.time()
+                "pos_to": pos_to
             })
             # --------------------
 
@@ -2156,10 +2357,8 @@ class CombatEngine:
                 dice = self.weapon_db[item]; w_name = item
                 break
         
-        try:
-            num, sides = map(int, dice.split('d'))
-            roll = sum(random.randint(1, sides) for _ in range(num))
-        except: roll = 1
+        expr = compile_dice(dice)
+        roll = expr.roll(self.rng.attacks) if expr else 1
             
         bonus = attacker.get_stat("Might")
         return max(1, roll + bonus), w_name
@@ -2170,8 +2369,8 @@ class CombatEngine:
         stat = self.clash_stat 
         
         # USE MODIFIERS
-        r1 = random.randint(1, 20) + p1.get_stat_modifier(stat)
-        r2 = random.randint(1, 20) + p2.get_stat_modifier(stat)
+        r1 = self.rng.attacks.randint(1, 20) + p1.get_stat_modifier(stat)
+        r2 = self.rng.attacks.randint(1, 20) + p2.get_stat_modifier(stat)
         
         log = [f"CLASH ROLL ({choice}): {p1.name}({r1}) vs {p2.name}({r2})"]
         
@@ -0,0 +1,129 @@
+"""
+Spatial occupancy index for the combat grid.
+
+Maps tile -> combatants so "who is at x,y" and "who is within N tiles"
+don't have to scan the whole roster. Combatants report their own moves
+(Combatant.x / .y setters call relocate), so pushes, teleports and swaps done
+by effect handlers keep the index correct without any extra bookkeeping.
+
+Dead combatants stay on their tile (bodies); queries skip them by default.
+"""
+
+
+class OccupancyGrid:
+    def __init__(self, grid=None):
+        self.cells = {}     # (x, y) -> [combatant, ...] (usually one)
+        self.loose = []     # Objects that can't report moves (mocks, other Combatant classes)
+        self.grid = grid    # Optional TerrainGrid whose occupant layer is kept in sync
+
+    @staticmethod
+    def _tracks_moves(c):
+        return isinstance(getattr(type(c), "x", None), property)
+
+    # === MEMBERSHIP ===
+
+    def add(self, c):
+        if not self._tracks_moves(c):
+            if c not in self.loose:
+                self.loose.append(c)
+            return
+        old = getattr(c, "_occupancy", None)
+        if old is self:
+            return
+        if old is not None:
+            old.remove(c)  # Moved to another engine
+        c._occupancy = self
+        self._insert(c, (c.x, c.y))
+
+    def remove(self, c):
+        if c in self.loose:
+            self.loose.remove(c)
+            return
+        if getattr(c, "_occupancy", None) is not self:
+            return
+        self._discard(c, (c.x, c.y))
+        c._occupancy = None
+
+    def rebuild(self, combatants):
+        """Re-syncs with a roster (used when the engine's list is replaced)."""
+        for cell in list(self.cells.values()):
+            for c in list(cell):
+                self.remove(c)
+        self.cells.clear()
+        self.loose = []
+        for c in combatants:
+            self.add(c)
+
+    def relocate(self, c, old, new):
+        """Called by Combatant position setters."""
+        if old == new:
+            return
+        self._discard(c, old)
+        self._insert(c, new)
+
+    def _insert(self, c, pos):
+        cell = self.cells.get(pos)
+        if cell is None:
+            self.cells[pos] = [c]
+        else:
+            cell.append(c)
+        self._sync_tile(pos)
+
+    def _discard(self, c, pos):
+        cell = self.cells.get(pos)
+        if cell and c in cell:
+            cell.remove(c)
+            if not cell:
+                del self.cells[pos]
+            self._sync_tile(pos)
+
+    def _sync_tile(self, pos):
+        grid = self.grid
+        if grid is None:
+            return
+        x, y = pos
+        if 0 <= x < grid.cols and 0 <= y < grid.rows:
+            cell = self.cells.get(pos)
+            grid.set_occupant(x, y, cell[0] if cell else None)
+
+    # === QUERIES ===
+
+    def at(self, x, y, alive=True):
+        """All combatants on a tile."""
+        found = list(self.cells.get((x, y), ()))
+        found += [c for c in self.loose if c.x == x and c.y == y]
+        if alive:
+            found = [c for c in found if c.is_alive()]
+        return found
+
+    def first_at(self, x, y, alive=True):
+        for c in self.cells.get((x, y), ()):
+            if not alive or c.is_alive():
+                return c
+        for c in self.loose:
+            if c.x == x and c.y == y and (not alive or c.is_alive()):
+                return c
+        return None
+
+    def in_radius(self, x, y, radius, alive=True):
+        """Combatants within `radius` tiles (Chebyshev, like every range check in the engine)."""
+        found = []
+        span = 2 * radius + 1
+        if span * span <= len(self.cells):
+            # Small area: probe the tiles
+            for ty in range(y - radius, y + radius + 1):
+                for tx in range(x - radius, x + radius + 1):
+                    found.extend(self.cells.get((tx, ty), ()))
+        else:
+            # Large area: walk the occupied tiles instead
+            for (tx, ty), cell in self.cells.items():
+                if abs(tx - x) <= radius and abs(ty - y) <= radius:
+                    found.extend(cell)
+        found += [c for c in self.loose if abs(c.x - x) <= radius and abs(c.y - y) <= radius]
+        if alive:
+            found = [c for c in found if c.is_alive()]
+        return found
+
+    def neighbours(self, x, y, alive=True):
+        """Combatants on the 8 tiles around x,y (not on x,y itself)."""
+        return [c for c in self.in_radius(x, y, 1, alive) if (c.x, c.y) != (x, y)]
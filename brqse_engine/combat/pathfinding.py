@@ -0,0 +1,186 @@
+"""
+Grid pathfinding for combat and exploration AI.
+
+- PathGrid: what the search sees (bounds, blocking tiles, per-tile entry cost).
+- DistanceField: one Dijkstra flood from a set of goal tiles. Every unit chasing
+  the same goal reads its next step from the same field (no search per unit).
+- find_path: A* for one-off start -> goal routes.
+- Pathfinder: per-CombatEngine service that caches fields per goal for the
+  current round and geometry (walls / terrain changes bump the engine's
+  geometry_version, which drops every field).
+
+Movement is 8-directional with diagonals costing the same as straight steps,
+matching the engine's Chebyshev ranges. Entering a tile costs its move cost (TerrainGrid.move_cost).
+"""
+import heapq
+
+NEIGHBOURS = ((0, -1), (1, 0), (0, 1), (-1, 0), (1, -1), (1, 1), (-1, 1), (-1, -1))
+
+
+class PathGrid:
+    def __init__(self, width, height, is_blocked, cost=None):
+        self.width = width
+        self.height = height
+        self.is_blocked = is_blocked          # (x, y) -> bool (walls etc.)
+        self.cost = cost or (lambda x, y: 1)  # (x, y) -> cost of stepping onto the tile
+
+    @classmethod
+    def from_engine(cls, engine):
+        # Reads the engine's TerrainGrid layers directly (callers check bounds first)
+        cols = engine.cols
+        blocked = engine.grid.blocked
+        move_cost = engine.grid.move_cost
+
+        def cost(x, y):
+            return max(1, move_cost[y * cols + x])
+
+        return cls(engine.cols, engine.rows, lambda x, y: blocked[y * cols + x] == 1, cost)
+
+    @classmethod
+    def from_tile_grid(cls, grid, wall=0):
+        """Exploration scene grid (rows of tile codes); `wall` marks impassable tiles."""
+        height = len(grid)
+        width = len(grid[0]) if height else 0
+        return cls(width, height, lambda x, y: grid[y][x] == wall)
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def open_neighbours(self, x, y):
+        for dx, dy in NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+            if self.in_bounds(nx, ny) and not self.is_blocked(nx, ny):
+                yield nx, ny
+
+
+class DistanceField:
+    """
+    dist[(x, y)] = cheapest cost from (x, y) to the nearest goal tile.
+    Occupants are NOT baked in (they move every turn); next_step skips occupied tiles instead.
+    """
+    def __init__(self, grid, goals):
+        self.grid = grid
+        self.dist = {}
+        heap = []
+        for g in goals:
+            if grid.in_bounds(*g) and not grid.is_blocked(*g) and g not in self.dist:
+                self.dist[g] = 0
+                heap.append((0, g))
+        heapq.heapify(heap)
+
+        while heap:
+            d, (x, y) = heapq.heappop(heap)
+            if d > self.dist[(x, y)]:
+                continue
+            # A unit standing on a neighbour pays our entry cost to step here
+            nd = d + grid.cost(x, y)
+            for n in grid.open_neighbours(x, y):
+                if nd < self.dist.get(n, float("inf")):
+                    self.dist[n] = nd
+                    heapq.heappush(heap, (nd, n))
+
+    def distance(self, x, y):
+        """Cost to reach a goal, or None if unreachable."""
+        return self.dist.get((x, y))
+
+    def next_step(self, x, y, occupied=None):
+        """
+        Best neighbouring tile that gets closer to a goal, or None
+        (already there, unreachable, or every useful tile is occupied).
+        """
+        here = self.dist.get((x, y))
+        if here is None or here == 0:
+            return None
+        best, best_score = None, None
+        for n in self.grid.open_neighbours(x, y):
+            d = self.dist.get(n)
+            if d is None or d >= here:
+                continue
+            if occupied and occupied(*n):
+                continue
+            score = (self.grid.cost(*n) + d, d)
+            if best_score is None or score < best_score:
+                best, best_score = n, score
+        return best
+
+
+def find_path(grid, start, goal, occupied=None):
+    """
+    A* from start to goal. Returns the list of tiles to walk (start excluded,
+    goal included) or None. `occupied(x, y)` tiles are avoided except the goal.
+    """
+    if start == goal:
+        return []
+    if not grid.in_bounds(*goal) or grid.is_blocked(*goal):
+        return None
+
+    def h(p):
+        return max(abs(p[0] - goal[0]), abs(p[1] - goal[1]))  # Every step costs >= 1
+
+    came_from = {start: None}
+    cost_so_far = {start: 0}
+    heap = [(h(start), 0, start)]
+    while heap:
+        _, g, current = heapq.heappop(heap)
+        if current == goal:
+            path = []
+            while current != start:
+                path.append(current)
+                current = came_from[current]
+            return path[::-1]
+        if g > cost_so_far[current]:
+            continue
+        for n in grid.open_neighbours(*current):
+            if occupied and n != goal and occupied(*n):
+                continue
+            ng = g + grid.cost(*n)
+            if ng < cost_so_far.get(n, float("inf")):
+                cost_so_far[n] = ng
+                came_from[n] = current
+                heapq.heappush(heap, (ng + h(n), ng, n))
+    return None
+
+
+class Pathfinder:
+    """Per-engine pathing with distance fields shared by every chaser of a goal this round."""
+    def __init__(self, engine):
+        self.engine = engine
+        self._fields = {}
+        self._stamp = None
+        self.fields_built = 0  # For tests / benchmarks
+
+    def _sync(self):
+        stamp = (self.engine.geometry_version, self.engine.round_counter, self.engine.cols, self.engine.rows)
+        if stamp != self._stamp:
+            self._stamp = stamp
+            self._fields.clear()
+            self._grid = PathGrid.from_engine(self.engine)
+        return self._grid
+
+    def field_to_adjacent(self, x, y):
+        """Distance field to the tiles around (x, y) - i.e. 'get into melee with whoever stands there'."""
+        grid = self._sync()
+        key = ("adjacent", x, y)
+        field = self._fields.get(key)
+        if field is None:
+            goals = [(x + dx, y + dy) for dx, dy in NEIGHBOURS]
+            field = DistanceField(grid, goals)
+            self._fields[key] = field
+            self.fields_built += 1
+        return field
+
+    def _occupied_by_other(self, mover):
+        engine = self.engine
+        def occupied(x, y):
+            c = engine.get_combatant_at(x, y)
+            return c is not None and c is not mover
+        return occupied
+
+    def next_step_toward(self, mover, target):
+        """Next tile for mover to get adjacent to target, or None."""
+        field = self.field_to_adjacent(target.x, target.y)
+        return field.next_step(mover.x, mover.y, self._occupied_by_other(mover))
+
+    def find_path(self, mover, goal):
+        """A* route for mover to goal tile, avoiding other combatants."""
+        return find_path(self._sync(), (mover.x, mover.y), goal, self._occupied_by_other(mover))
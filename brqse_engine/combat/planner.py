@@ -0,0 +1,329 @@
+"""
+Expected-value lookahead planner (the "Tactician" AI template).
+
+Works on a fork of the engine, so nothing it tries touches the real fight:
+
+1. Candidates: every tile the unit can walk to this turn, combined with the
+   best basic attack and the best offensive power usable from there.
+2. Score (analytic, nothing rolled for attacks - see core/probability.py):
+       expected HP damage + CMP_WEIGHT * expected CMP damage
+     + KILL_WEIGHT * kill chance - expected self damage (botches)
+     - RISK_WEIGHT * expected damage enemies can deal to that tile next turn
+   Tiles with no action score by how close they get to the nearest enemy.
+   Powers are tried once per target on the fork (snapshot / restore), so an
+   unaffordable or useless power is discovered without spending anything.
+3. Iterative deepening: the best BEAM candidates are re-scored with the
+   team's next 1, 2, ... turns played greedily on top of their expected
+   outcome (damage applied as its mean), so focus fire and kill setups win.
+   A depth only replaces the previous answer if it finished in time.
+
+Everything is bounded by a per-turn budget in milliseconds; when it runs out
+the best plan found so far is used, so a boss never stalls the caller.
+"""
+import time
+
+from brqse_engine.abilities import engine_hooks
+from brqse_engine.core import probability
+
+DEFAULT_BUDGET_MS = 30
+MAX_DEPTH = 4
+BEAM = 4               # Depth-1 candidates carried into deeper searches
+POWER_RANGE = 6        # Squares, same rule of thumb as AIDecisionEngine._try_use_ability
+
+KILL_WEIGHT = 8.0
+CMP_WEIGHT = 0.5
+SELF_WEIGHT = 1.0
+RISK_WEIGHT = 0.6
+APPROACH_WEIGHT = 1.0
+
+# activate_ability log lines meaning "nothing happened"
+POWER_FAILURES = ("Not enough", "No effect resolved", "data not found", "FAILED")
+
+
+class OutOfTime(Exception):
+    pass
+
+
+class Plan:
+    """One turn: walk `path`, use `power` ((name, target) or None), then attack `target` (or None)."""
+    __slots__ = ("path", "power", "target", "score", "kill", "risk", "effects")
+
+    def __init__(self, path, power=None, target=None, score=0.0, kill=0.0, risk=0.0, effects=()):
+        self.path = path
+        self.power = power
+        self.target = target
+        self.score = score
+        self.kill = kill
+        self.risk = risk
+        self.effects = effects  # ((combatant, hp loss, cmp loss), ...) expected, for deeper searches
+
+    @property
+    def tile(self):
+        return self.path[-1] if self.path else None
+
+    def __repr__(self):
+        power = self.power[0] if self.power else None
+        target = self.target.name if self.target else None
+        return f"Plan(to={self.tile}, power={power}, attack={target}, score={self.score:.2f})"
+
+
+def _dist(ax, ay, bx, by):
+    return max(abs(ax - bx), abs(ay - by))
+
+
+class LookaheadPlanner:
+    def __init__(self, budget_ms=DEFAULT_BUDGET_MS, max_depth=MAX_DEPTH, clock=time.perf_counter):
+        self.budget_ms = budget_ms
+        self.max_depth = max_depth
+        self.clock = clock
+        # Stats of the last plan() call (logs / benchmarks)
+        self.last_depth = 0
+        self.last_candidates = 0
+        self.last_ms = 0.0
+
+    # === SEARCH ===
+
+    def plan(self, me, engine, budget_ms=None):
+        """Best Plan for `me` this turn (combatants refer to `engine`), or None if nothing to do."""
+        start = self.clock()
+        budget = self.budget_ms if budget_ms is None else budget_ms
+        deadline = start + budget / 1000.0
+        self.last_depth, self.last_candidates = 0, 0
+
+        sim = engine.fork()
+        real = {id(f): c for f, c in zip(sim.combatants, engine.combatants)}
+        actor = sim.combatants[engine.combatants.index(me)]
+
+        plans = []
+        try:
+            self._candidates(actor, sim, deadline, plans)
+        except OutOfTime:
+            pass  # Anytime: whatever was scored so far still counts
+        self.last_candidates = len(plans)
+        if not plans:
+            self.last_ms = (self.clock() - start) * 1000
+            return None
+        best = max(plans, key=lambda p: p.score)
+        self.last_depth = 1
+
+        team = self._team_turns(actor, sim)
+        beam = sorted(plans, key=lambda p: p.score, reverse=True)[:BEAM]
+        for depth in range(2, self.max_depth + 1):
+            if depth - 1 > len(team) or len(beam) < 2:
+                break
+            try:
+                totals = [(self._rollout(actor, sim, p, team[:depth - 1], deadline), p) for p in beam]
+            except OutOfTime:
+                break
+            best = max(totals, key=lambda t: t[0])[1]
+            self.last_depth = depth
+
+        self.last_ms = (self.clock() - start) * 1000
+        return self._to_real(best, real)
+
+    def _rollout(self, actor, sim, plan, allies, deadline):
+        """plan's score plus the greedy scores of the next allied turns after it (mean outcomes)."""
+        snap = sim.snapshot()
+        try:
+            self._apply_expected(actor, plan)
+            total = plan.score
+            for ally in allies:
+                if not ally.is_alive():
+                    continue
+                ally.movement_remaining = ally.movement  # Their coming turn, not what's left of the last one
+                ally.action_used = False
+                options = []
+                self._candidates(ally, sim, deadline, options)
+                if options:
+                    step = max(options, key=lambda p: p.score)
+                    self._apply_expected(ally, step)
+                    total += step.score
+            return total
+        finally:
+            sim.restore(snap)
+
+    def _team_turns(self, actor, sim):
+        """Allies in the order they act next: the rest of this round, then the next one."""
+        seen, out = {id(actor)}, []
+        for c in sim.scheduler.upcoming() + sim.scheduler.order():
+            if c.team == actor.team and id(c) not in seen and c.is_alive():
+                seen.add(id(c))
+                out.append(c)
+        return out
+
+    # === CANDIDATES ===
+
+    def _candidates(self, actor, sim, deadline, out):
+        clock = self.clock
+        enemies = [c for c in sim.combatants if c.team != actor.team and c.is_alive()]
+        if not enemies:
+            return
+        tiles = self._reachable(actor, sim)
+        threats = self._threats(actor, sim, enemies)
+        powers = self._powers(actor, sim, enemies, deadline)
+        hp_pct = actor.hp / actor.max_hp if actor.max_hp else 1.0
+        risk_weight = RISK_WEIGHT * (2.0 - hp_pct)  # Hurt units care more about getting hit
+        _, reach = sim.attack_reach(actor)
+
+        home = (actor.x, actor.y)
+        try:
+            for i, (tile, path) in enumerate(tiles.items()):
+                if i and clock() > deadline:  # Staying put is always scored
+                    raise OutOfTime()
+                tx, ty = tile
+                actor.x, actor.y = tx, ty
+                risk = sum(t for e, t, r in threats if _dist(e.x, e.y, tx, ty) <= r)
+
+                attack, attack_val, kill, effects = None, 0.0, 0.0, ()
+                if not actor.action_used:
+                    for e in enemies:
+                        if _dist(e.x, e.y, tx, ty) > reach:
+                            continue
+                        if actor.is_charmed and actor.charmed_by == e.name:
+                            continue
+                        val, k, eff = self._attack_value(actor, e, sim)
+                        if val > attack_val:
+                            attack, attack_val, kill, effects = e, val, k, eff
+
+                power, power_val, power_effects = None, 0.0, ()
+                for (name, target), (val, eff) in powers.items():
+                    if val > power_val and _dist(target.x, target.y, tx, ty) <= POWER_RANGE:
+                        power, power_val, power_effects = (name, target), val, eff
+
+                score = attack_val + power_val - risk_weight * risk
+                if attack is None and power is None:
+                    gap = min(_dist(e.x, e.y, tx, ty) for e in enemies) - reach
+                    score -= APPROACH_WEIGHT * max(0, gap)
+                out.append(Plan(path, power, attack, score, kill, risk, effects + power_effects))
+        finally:
+            actor.x, actor.y = home
+
+    def _reachable(self, actor, sim):
+        """{tile: path} for every tile the actor can walk to, cheapest (fewest steps) first."""
+        start = (actor.x, actor.y)
+        tiles = {start: []}
+        if actor.is_restrained or actor.is_grappled:
+            return tiles
+        step_cost = 10 if actor.is_prone else 5  # move_char charges double while prone
+        steps = actor.movement_remaining // step_cost
+        cols, rows = sim.cols, sim.rows
+        blocked = sim.grid.blocked
+        phase = getattr(actor, "can_phase_walk", False)
+        frontier = [start]
+        for _ in range(steps):
+            nxt = []
+            for x, y in frontier:
+                path = tiles[(x, y)]
+                for dx in (-1, 0, 1):
+                    for dy in (-1, 0, 1):
+                        nx, ny = x + dx, y + dy
+                        if (nx, ny) in tiles or not (0 <= nx < cols and 0 <= ny < rows):
+                            continue
+                        if blocked[ny * cols + nx] and not phase:
+                            continue
+                        if sim.get_combatant_at(nx, ny) is not None:
+                            continue
+                        tiles[(nx, ny)] = path + [(nx, ny)]
+                        nxt.append((nx, ny))
+            frontier = nxt
+        return tiles
+
+    def _threats(self, actor, sim, enemies):
+        """(enemy, expected HP damage to actor, reach in squares next turn) for each enemy."""
+        out = []
+        for e in enemies:
+            odds = sim.attack_odds(e, actor)
+            _, reach = sim.attack_reach(e)
+            out.append((e, odds["expected"]["hp"], e.movement // 5 + reach))
+        return out
+
+    def _attack_value(self, actor, target, sim):
+        odds = sim.attack_odds(actor, target)
+        exp, mods = odds["expected"], odds["modifiers"]
+        if not exp["hit_chance"]:
+            return 0.0, 0.0, ()
+        kill = probability.kill_chance(odds["damage_dice"], target.hp, mods["hit_mod"], mods["def_mod"],
+                                       mods["atk_adv"], mods["atk_dis"], mods["def_adv"], mods["def_dis"])
+        value = exp["hp"] + CMP_WEIGHT * exp["cmp"] + KILL_WEIGHT * kill - SELF_WEIGHT * exp["self"]
+        return value, kill, ((target, exp["hp"], exp["cmp"]),)
+
+    def _powers(self, actor, sim, enemies, deadline):
+        """{(power, target): (value, effects)} for offensive powers that actually do something."""
+        out = {}
+        if not actor.powers or (actor.fp < 2 and actor.sp < 2):
+            return out
+        reach = actor.movement_remaining // 5 + POWER_RANGE
+        for name in actor.powers:
+            data = engine_hooks.get_ability_data(name)
+            if not data or (data.get("Type") or "").lower() != "offense":
+                continue
+            res, cost = sim.ability_cost(data)
+            if (actor.sp if res == "SP" else actor.fp) < cost:
+                continue
+            for target in enemies:
+                if _dist(actor.x, actor.y, target.x, target.y) > reach:
+                    continue
+                if self.clock() > deadline:
+                    return out
+                value, effects = self._try_power(actor, name, target, sim)
+                if value > 0:
+                    out[(name, target)] = (value, effects)
+        return out
+
+    def _try_power(self, actor, name, target, sim):
+        """Uses the power once on the fork and measures what changed (then rewinds)."""
+        snap = sim.snapshot()
+        before = [(c, c.hp, c.cmp) for c in sim.combatants]
+        try:
+            text = " ".join(str(line) for line in sim.activate_ability(actor, name, target))
+            if any(f in text for f in POWER_FAILURES):
+                return 0.0, ()
+            value, effects = 0.0, []
+            for c, hp, cmp in before:
+                lost_hp, lost_cmp = hp - c.hp, cmp - c.cmp
+                if not (lost_hp or lost_cmp) or c is actor:
+                    continue
+                sign = -1.0 if c.team == actor.team else 1.0  # Friendly fire counts against
+                value += sign * (lost_hp + CMP_WEIGHT * lost_cmp + (KILL_WEIGHT if hp > 0 >= c.hp else 0))
+                effects.append((c, lost_hp, lost_cmp))
+            return value, tuple(effects)
+        finally:
+            sim.restore(snap)
+
+    # === APPLY ===
+
+    def _apply_expected(self, actor, plan):
+        """Plays a plan on the fork with every random outcome replaced by its mean."""
+        if plan.path:
+            actor.x, actor.y = plan.path[-1]
+            actor.movement_remaining -= 5 * len(plan.path)
+        if plan.target is not None:
+            actor.action_used = True
+        for c, hp, cmp in plan.effects:
+            c.hp = max(0, c.hp - hp)
+            c.cmp = max(0, c.cmp - cmp)
+        if plan.target is not None and plan.kill >= 0.5:
+            plan.target.hp = 0
+
+    def _to_real(self, plan, real):
+        return Plan(plan.path,
+                    (plan.power[0], real[id(plan.power[1])]) if plan.power else None,
+                    real[id(plan.target)] if plan.target is not None else None,
+                    plan.score, plan.kill, plan.risk)
+
+    def execute(self, me, engine, plan, log):
+        """Carries out a plan from plan() on the real engine, step by step."""
+        for step in plan.path:
+            success, msg = engine.move_char(me, *step)
+            if not success:
+                log.append(f"[AI] Move blocked: {msg}")
+                break
+            log.append(f"[AI] Move: {msg}")
+        if plan.power:
+            name, target = plan.power
+            log.extend(engine.activate_ability(me, name, target))
+            log.append(f"[AI] Used {name}!")
+        if plan.target is not None and plan.target.is_alive():
+            log.extend(engine.attack_target(me, plan.target))
+        elif plan.power is None:
+            log.append("[AI] Advancing.")
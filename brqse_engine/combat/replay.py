@@ -0,0 +1,228 @@
+"""
+Streaming combat replay.
+
+CombatEngine.replay_log is a ReplayLog: a bounded ring of the latest events for
+the UI (same list-ish API as before: append / [-1] / iter / clear), plus an
+optional ReplayWriter that streams every event to disk as it happens.
+
+On-disk format (gzip JSONL, one JSON object per line):
+    {"k": "header", "v": 1, "seed": ...}
+    {"k": "key", "i": seq, "actors": [...], "state": {...}}   keyframe
+    {"k": "actor", "id": n, "name": "Goblin"}                 first use of a name
+    {"k": "ev", "i": seq, "type": "move", "actor": n, ...}    event, names interned
+
+Every keyframe starts a new gzip member and carries the full actor table, so
+a reader can seek straight to it (the .idx sidecar lists member offsets) and
+decode from there without the earlier segments. Memory stays flat: the writer
+only keeps the actor table, the ring keeps the last `limit` events.
+
+Exporters that need every event in memory (the per-request event list, the
+JSON replay export) wrap the play in `with replay_log.capture() as events:`;
+the ring's limit doesn't apply to a capture.
+"""
+import contextlib
+import gzip
+import json
+import os
+from collections import deque
+
+FORMAT_VERSION = 1
+RING_SIZE = 1000
+KEYFRAME_EVERY = 200
+INTERNED_KEYS = ("actor", "target")
+
+
+class ReplayWriter:
+    def __init__(self, path, keyframe_every=KEYFRAME_EVERY, snapshot=None, header=None):
+        """
+        path: output file (.jsonl.gz). snapshot: callable -> dict of the battle
+        state, stored in keyframes so viewers can jump there.
+        """
+        self.path = path
+        self.keyframe_every = keyframe_every
+        self.snapshot = snapshot
+        self.actor_ids = {}
+        self.seq = 0
+        self.keyframes = []  # [seq, round, byte offset]
+        self._raw = open(path, "wb")
+        self._gz = None
+        self._start_segment()
+        head = {"k": "header", "v": FORMAT_VERSION}
+        head.update(header or {})
+        self._write(head)
+        self.keyframe()
+
+    def _start_segment(self):
+        if self._gz is not None:
+            self._gz.close()  # Ends the gzip member; the raw file stays open
+        self._segment_offset = self._raw.tell()  # Before the new member's header
+        self._gz = gzip.GzipFile(fileobj=self._raw, mode="wb")
+
+    def _write(self, obj):
+        self._gz.write(json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8") + b"\n")
+
+    def _intern(self, name):
+        aid = self.actor_ids.get(name)
+        if aid is None:
+            aid = self.actor_ids[name] = len(self.actor_ids)
+            self._write({"k": "actor", "id": aid, "name": name})
+        return aid
+
+    def keyframe(self):
+        """Starts a new seekable segment with the actor table and a state snapshot."""
+        if self.seq:
+            self._start_segment()
+        state = self.snapshot() if self.snapshot else {}
+        self.keyframes.append([self.seq, state.get("round"), self._segment_offset])
+        self._write({"k": "key", "i": self.seq,
+                     "actors": sorted(self.actor_ids, key=self.actor_ids.get), "state": state})
+
+    def write(self, event):
+        if self._gz is None:
+            return
+        if self.seq and self.seq % self.keyframe_every == 0:
+            self.keyframe()
+        record = {"k": "ev", "i": self.seq}
+        for key, value in event.items():
+            if key in INTERNED_KEYS and isinstance(value, str):
+                value = self._intern(value)
+            record[key] = value
+        self._write(record)
+        self.seq += 1
+
+    def flush(self):
+        if self._gz is not None:
+            self._gz.flush()
+            self._raw.flush()
+
+    def close(self):
+        if self._gz is None:
+            return
+        self._gz.close()
+        self._gz = None
+        self._raw.close()
+        with open(self.path + ".idx", "w") as f:
+            json.dump({"v": FORMAT_VERSION, "events": self.seq, "keyframes": self.keyframes}, f)
+
+
+class ReplayLog:
+    """
+    Ring of the latest events (for the UI) that can also stream to a ReplayWriter.
+    clear() only empties the ring; the stream keeps everything.
+    """
+
+    def __init__(self, limit=RING_SIZE):
+        self.ring = deque(maxlen=limit)
+        self.writer = None
+        self.total = 0
+        self._captures = []  # Unbounded lists filled while a capture() is open
+
+    def append(self, event):
+        self.ring.append(event)
+        self.total += 1
+        for events in self._captures:
+            events.append(event)
+        if self.writer is not None:
+            self.writer.write(event)
+
+    @contextlib.contextmanager
+    def capture(self):
+        """Every event appended inside the block, in order, however many there are."""
+        events = []
+        self._captures.append(events)
+        try:
+            yield events
+        finally:
+            self._captures.remove(events)
+
+    def clear(self):
+        self.ring.clear()
+
+    def __len__(self):
+        return len(self.ring)
+
+    def __iter__(self):
+        return iter(self.ring)
+
+    def __getitem__(self, i):
+        return self.ring[i]
+
+    def __bool__(self):
+        return bool(self.ring)
+
+    def stream_to(self, writer):
+        if self.writer is not None:
+            self.writer.close()
+        self.writer = writer
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+class ReplayReader:
+    """Reads a ReplayWriter file back as plain event dicts (actor names restored)."""
+
+    def __init__(self, path):
+        self.path = path
+        self.header = {}
+        self.keyframes = self._load_index()
+        with gzip.open(self.path, "rb") as f:
+            first = f.readline()
+        if first:
+            self.header = json.loads(first)
+
+    def _load_index(self):
+        idx = self.path + ".idx"
+        if os.path.exists(idx):
+            with open(idx) as f:
+                return json.load(f)["keyframes"]
+        # Unfinished / crashed recording: only the start of the file is known
+        return [[0, None, 0]]
+
+    def _records(self, offset=0):
+        with open(self.path, "rb") as raw:
+            raw.seek(offset)
+            with gzip.GzipFile(fileobj=raw, mode="rb") as f:
+                try:
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+                except EOFError:
+                    return  # Truncated tail of a live / crashed recording
+
+    def keyframe_before(self, seq):
+        """[seq, round, offset] of the last keyframe at or before event `seq`."""
+        best = self.keyframes[0]
+        for kf in self.keyframes:
+            if kf[0] <= seq:
+                best = kf
+        return best
+
+    def state_at(self, seq):
+        """Snapshot stored in the keyframe covering event `seq`."""
+        for rec in self._records(self.keyframe_before(seq)[2]):
+            if rec["k"] == "key":
+                return rec.get("state", {})
+        return {}
+
+    def events(self, start=0):
+        """Yields events from index `start` on, seeking to the nearest keyframe first."""
+        names = []
+        for rec in self._records(self.keyframe_before(start)[2]):
+            kind = rec["k"]
+            if kind == "key":
+                names = list(rec.get("actors", ()))
+            elif kind == "actor":
+                names.extend([None] * (rec["id"] + 1 - len(names)))
+                names[rec["id"]] = rec["name"]
+            elif kind == "ev" and rec["i"] >= start:
+                event = {k: v for k, v in rec.items() if k not in ("k", "i")}
+                for key in INTERNED_KEYS:
+                    if isinstance(event.get(key), int):
+                        event[key] = names[event[key]]
+                yield event
+
+    def __iter__(self):
+        return self.events()
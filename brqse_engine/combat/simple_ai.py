@@ -1,6 +1,6 @@
 from brqse_engine.combat.combat_engine import CombatEngine
 from brqse_engine.combat.combatant import Combatant
-import random
+from brqse_engine.core.rng import stream_for
 
 class SimpleAI:
     """
@@ -53,7 +53,7 @@ class SimpleAI:
         dist, target = targets[0]
         
         # 5% Chance to Channel Chaos if in range (within 6 tiles)
-        if dist <= 6 and random.random() < 0.05:
+        if dist <= 6 and stream_for(engine, "ai").random() < 0.05:
             engine.channel_chaos(me, target)
             return
 
@@ -95,7 +95,7 @@ class SimpleAI:
     @staticmethod
     def _move_towards(me, target, engine, desired_range):
         candidates = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)]
-        random.shuffle(candidates)
+        stream_for(engine, "ai").shuffle(candidates)
         current_dist = max(abs(me.x - target.x), abs(me.y - target.y))
         
         for dx, dy in candidates:
@@ -108,7 +108,7 @@ class SimpleAI:
     @staticmethod
     def _move_away(me, target, engine):
         candidates = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (-1, -1), (1, -1), (-1, 1)]
-        random.shuffle(candidates)
+        stream_for(engine, "ai").shuffle(candidates)
         current_dist = max(abs(me.x - target.x), abs(me.y - target.y))
         
         for dx, dy in candidates:
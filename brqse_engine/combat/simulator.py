@@ -0,0 +1,176 @@
+"""
+Headless Monte Carlo battle simulator.
+
+Runs many seeded CombatEngine battles (AI vs AI) across a process pool with
+all console output suppressed, and aggregates win rates, battle length and
+damage so balance changes (Combat_Formula.csv, weapons, beasts...) can be
+checked before shipping.
+
+Matchup spec (dict or JSON file):
+    {
+        "name": "Tank vs Striker",
+        "side_a": ["save:Grazer_Tank_578"],          # Saves/**/Grazer_Tank_578.json
+        "side_b": ["beast:BST_01@2", {...raw data}],  # Beast_Encounter.json id (+ level)
+        "cols": 12, "rows": 12, "max_rounds": 30
+    }
+"""
+import contextlib
+import glob
+import os
+import statistics
+import time
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SAVES_DIR = os.path.join(BASE_DIR, "Saves")
+
+DEFAULT_MATCHUP = {"cols": 12, "rows": 12, "max_rounds": 30}
+
+
+# === UNIT SPECS ===
+
+def resolve_unit(spec):
+    """Turns a unit spec into Combatant data (dict)."""
+    if isinstance(spec, dict):
+        return dict(spec)
+    kind, _, ref = spec.partition(":")
+    if not ref:
+        kind, ref = "save", spec
+
+    if kind == "beast":
+        from brqse_engine.combat.enemy_spawner import spawner
+        beast_id, _, level = ref.partition("@")
+        if not any(b.get("Entity_ID") == beast_id for b in spawner.beast_data):
+            raise ValueError(f"Unknown beast '{beast_id}' in Beast_Encounter.json")
+        return spawner.build_beast_data(beast_id, level=int(level or 1))
+
+    if kind == "save":
+        name = ref if ref.endswith(".json") else f"{ref}.json"
+        matches = sorted(glob.glob(os.path.join(SAVES_DIR, "**", name), recursive=True))
+        if not matches:
+            raise ValueError(f"No save named '{name}' under {SAVES_DIR}")
+        with open(matches[0], "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    raise ValueError(f"Unknown unit spec '{spec}' (use save:<name>, beast:<id>[@level] or a dict)")
+
+
+def resolve_matchup(matchup):
+    """Fills defaults and resolves every unit once (in the parent process)."""
+    m = dict(DEFAULT_MATCHUP, **matchup)
+    m["side_a"] = [resolve_unit(u) for u in matchup["side_a"]]
+    m["side_b"] = [resolve_unit(u) for u in matchup["side_b"]]
+    m.setdefault("name", " + ".join(u.get("Name", "?") for u in m["side_a"]) + " vs " +
+                 " + ".join(u.get("Name", "?") for u in m["side_b"]))
+    return m
+
+
+# === ONE BATTLE ===
+
+def _deploy(engine, side, team, x):
+    from brqse_engine.combat.mechanics import Combatant
+    units = []
+    top = max(0, (engine.rows - len(side)) // 2)
+    for i, data in enumerate(side):
+        c = Combatant(data=json.loads(json.dumps(data)))  # Private copy: combat mutates data
+        c.team = team
+        engine.add_combatant(c, x, min(engine.rows - 1, top + i))
+        units.append(c)
+    return units
+
+
+def run_battle(matchup, seed):
+    """
+    Plays one resolved matchup to the end (or max_rounds). Returns a small result dict.
+    Deterministic for a given seed.
+    """
+    from brqse_engine.combat.mechanics import CombatEngine
+
+    result = {"seed": seed, "winner": None, "rounds": 0, "turns": 0,
+              "damage": {"A": 0, "B": 0}, "error": None}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            engine = CombatEngine(matchup["cols"], matchup["rows"], seed=seed)
+            team_a = _deploy(engine, matchup["side_a"], "A", 1)
+            team_b = _deploy(engine, matchup["side_b"], "B", matchup["cols"] - 2)
+            start_hp = {id(c): c.hp for c in team_a + team_b}
+            engine.start_combat()
+
+            while engine.round_counter <= matchup["max_rounds"]:
+                if not any(c.is_alive() for c in team_a) or not any(c.is_alive() for c in team_b):
+                    break
+                active = engine.get_active_char()
+                if active.is_alive():
+                    engine.execute_ai_turn(active)
+                engine.end_turn()
+                result["turns"] += 1
+
+            a_alive = any(c.is_alive() for c in team_a)
+            b_alive = any(c.is_alive() for c in team_b)
+            result["winner"] = "A" if a_alive and not b_alive else "B" if b_alive and not a_alive else "draw"
+            result["rounds"] = min(engine.round_counter, matchup["max_rounds"])
+            # Damage dealt by a side = HP its opponents lost
+            result["damage"]["A"] = sum(max(0, start_hp[id(c)] - max(c.hp, 0)) for c in team_b)
+            result["damage"]["B"] = sum(max(0, start_hp[id(c)] - max(c.hp, 0)) for c in team_a)
+        except Exception as e:
+            result["winner"] = "error"
+            result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _run_chunk(args):
+    matchup, seeds = args
+    return [run_battle(matchup, s) for s in seeds]
+
+
+# === BATCH ===
+
+def _percentiles(values):
+    if not values:
+        return {"mean": 0, "stdev": 0, "p10": 0, "p50": 0, "p90": 0, "max": 0}
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {"mean": round(statistics.fmean(ordered), 2),
+            "stdev": round(statistics.pstdev(ordered), 2),
+            "p10": pick(0.1), "p50": pick(0.5), "p90": pick(0.9), "max": ordered[-1]}
+
+
+def summarize(matchup, results, elapsed):
+    n = len(results)
+    count = lambda w: sum(1 for r in results if r["winner"] == w)
+    finished = [r for r in results if r["winner"] != "error"]
+    errors = {}
+    for r in results:
+        if r["error"]:
+            errors[r["error"]] = errors.get(r["error"], 0) + 1
+    return {
+        "matchup": matchup["name"],
+        "battles": n,
+        "win_rate": {w: round(count(w) / n, 4) if n else 0 for w in ("A", "B", "draw")},
+        "errors": errors,
+        "rounds": _percentiles([r["rounds"] for r in finished]),
+        "turns": _percentiles([r["turns"] for r in finished]),
+        "damage": {side: _percentiles([r["damage"][side] for r in finished]) for side in ("A", "B")},
+        "seconds": round(elapsed, 3),
+        "battles_per_second": round(n / elapsed, 1) if elapsed else 0,
+    }
+
+
+def simulate(matchup, battles=1000, workers=None, seed=0, chunk_size=25):
+    """
+    Runs `battles` seeded battles (seeds seed .. seed+battles-1) and returns
+    (summary, results). workers=1 runs in-process; None uses every CPU.
+    """
+    matchup = resolve_matchup(matchup)  # Idempotent: resolved units are plain dicts
+    seeds = list(range(seed, seed + battles))
+    chunks = [(matchup, seeds[i:i + chunk_size]) for i in range(0, len(seeds), chunk_size)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        results = [r for chunk in chunks for r in _run_chunk(chunk)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = [r for batch in pool.map(_run_chunk, chunks) for r in batch]
+    elapsed = time.perf_counter() - start
+    return summarize(matchup, results, elapsed), results
@@ -0,0 +1,342 @@
+"""
+Combat-state snapshots and forks (AI lookahead, Arena undo, branching sims).
+
+capture() records only what a fight changes: per-combatant resources, position,
+condition mask and timers, the turn queue, RNG stream states, hazards and the
+map layers. Everything else (character data, stats, skills, inventory, hook
+tables, the AI engine) is shared, never copied.
+
+Map layers are stored as bytes and reused between snapshots while the engine's
+geometry_version is unchanged, so a quiet turn costs no terrain copy at all.
+
+    snap = engine.snapshot()
+    ... try something ...
+    engine.restore(snap)           # rewind in place
+    what_if = engine.fork()        # independent engine + cloned combatants
+"""
+from array import array
+
+from brqse_engine.combat.aoe import HazardIndex
+from brqse_engine.combat.battlefield import BattlefieldPicture
+from brqse_engine.combat.occupancy import OccupancyGrid
+from brqse_engine.combat.pathfinding import Pathfinder
+from brqse_engine.combat.replay import ReplayLog
+from brqse_engine.combat.turn_scheduler import TurnScheduler
+from brqse_engine.core.rng import RNGStreams
+from brqse_engine.core.status_manager import StatusManager
+
+# Mutable per-combatant fields (x / y go through the setters so occupancy follows)
+COMBATANT_STATE = (
+    "x", "y", "hp", "cmp", "sp", "fp", "movement", "movement_remaining",
+    "action_used", "bonus_action_used", "reaction_used", "initiative", "facing",
+    "attacks_received_this_round", "is_dead", "team", "elevation", "is_behind_cover",
+    "taunted_by", "charmed_by",
+)
+
+
+class CombatSnapshot:
+    __slots__ = ("roster", "units", "round_counter", "turn", "layers", "geometry_version",
+                 "walls_outside", "hazards", "rng", "clash", "pending")
+
+
+# === CAPTURE / RESTORE ===
+
+def _extras(c):
+    """The combatant's ad-hoc attributes (Combatant.EXTRA_FIELDS that are set), or None."""
+    extra = {}
+    for name in getattr(type(c), "EXTRA_FIELDS", ()):
+        try:
+            extra[name] = getattr(c, name)
+        except AttributeError:
+            pass
+    return extra or None
+
+
+def _set_extras(c, extra):
+    extra = extra or {}
+    for name in getattr(type(c), "EXTRA_FIELDS", ()):
+        if name in extra:
+            setattr(c, name, extra[name])
+        else:
+            try:
+                delattr(c, name)
+            except AttributeError:
+                pass
+
+
+def _unit_state(c):
+    status = c.status
+    return (
+        tuple(getattr(c, f) for f in COMBATANT_STATE),
+        status.mask if status else 0,
+        tuple((e["name"], e["duration"], e["on_expire"]) for e in status.timed_effects) if status else (),
+        tuple(dict(e) for e in c.active_effects),
+        _extras(c),
+    )
+
+
+def _apply_unit_state(c, state):
+    fields, mask, timed, effects, extra = state
+    for name, value in zip(COMBATANT_STATE, fields):
+        setattr(c, name, value)
+    if c.status:
+        c.status.mask = mask
+        c.status.timed_effects = [{"name": n, "duration": d, "on_expire": cb} for n, d, cb in timed]
+    c.active_effects = [dict(e) for e in effects]
+    _set_extras(c, extra)
+
+
+def _layers(engine):
+    """Map layers as bytes, shared with the previous snapshot if geometry hasn't changed."""
+    cached = getattr(engine, "_snapshot_layers", None)
+    if cached and cached[0] == engine.geometry_version:
+        return cached[1]
+    g = engine.grid
+    layers = (g.terrain.tobytes(), g.move_cost.tobytes(), bytes(g.cover), bytes(g.blocked))
+    engine._snapshot_layers = (engine.geometry_version, layers)
+    return layers
+
+
+def capture(engine):
+    s = CombatSnapshot()
+    s.roster = tuple(engine.combatants)
+    s.units = tuple(_unit_state(c) for c in s.roster)
+    s.round_counter = engine.round_counter
+    sch = engine.scheduler
+    s.turn = (tuple(sch.queue), sch.current, tuple(sch.roster), dict(sch._seq), sch._next_seq)
+    s.layers = _layers(engine)
+    s.geometry_version = engine.geometry_version
+    s.walls_outside = frozenset(engine.walls.outside)
+    s.hazards = tuple(dict(h) for h in engine.hazards)
+    s.rng = tuple((name, r.getstate()) for name, r in engine.rng._streams.items())
+    s.clash = (engine.clash_active, engine.clash_participants, engine.clash_stat)
+    s.pending = tuple(engine.pending_world_updates)
+    return s
+
+
+def restore(engine, s):
+    """Rewinds `engine` to a snapshot taken from it (combatants keep their identity)."""
+    for c, state in zip(s.roster, s.units):
+        _apply_unit_state(c, state)
+    if list(s.roster) != engine.combatants:
+        engine.combatants = list(s.roster)  # Drops units spawned since (occupancy rebuild)
+
+    engine.round_counter = s.round_counter
+    queue, current, roster, seq, next_seq = s.turn
+    sch = engine.scheduler
+    sch.queue, sch.current, sch.roster = list(queue), current, list(roster)
+    sch._seq, sch._next_seq = dict(seq), next_seq
+
+    cached = getattr(engine, "_snapshot_layers", None)
+    if not (cached and cached[0] == engine.geometry_version and cached[1] is s.layers):
+        g = engine.grid
+        terrain, move_cost, cover, blocked = s.layers
+        g.terrain = array('H'); g.terrain.frombytes(terrain)
+        g.move_cost = array('H'); g.move_cost.frombytes(move_cost)
+        g.cover[:] = cover
+        g.blocked[:] = blocked
+        walls = engine.walls
+        walls.count = g.blocked.count(1)
+        walls.outside = set(s.walls_outside)
+        engine.invalidate_visibility()
+        engine._snapshot_layers = (engine.geometry_version, s.layers)
+
+    engine.hazards = HazardIndex()
+    for h in s.hazards:
+        engine.hazards.add(dict(h))
+
+    states = dict(s.rng)
+    for name in list(engine.rng._streams):
+        if name in states:
+            engine.rng._streams[name].setstate(states[name])
+        else:
+            del engine.rng._streams[name]  # Recreated from the seed on next use, as it was
+    engine.clash_active, engine.clash_participants, engine.clash_stat = s.clash
+    engine.pending_world_updates = list(s.pending)
+
+
+# === FORK ===
+
+def _copy_inventory(inv):
+    """Own item list and equipped slots; db / skill_map are shared read-only tables."""
+    new = object.__new__(type(inv))
+    new.__dict__.update(inv.__dict__)
+    new.items = list(inv.items)
+    new.equipped = dict(inv.equipped)
+    return new
+
+
+def clone_combatant(c):
+    """
+    Copy with its own state: resources, position, conditions, effects, stats,
+    inventory and the top level of data. Skills, traits, powers and nested
+    data values are shared (combat doesn't write them).
+    """
+    new = object.__new__(type(c))
+    for slot in type(c).__slots__:
+        if slot in ("__dict__", "__weakref__"):
+            continue
+        try:
+            object.__setattr__(new, slot, object.__getattribute__(c, slot))
+        except AttributeError:
+            pass
+    new._occupancy = None  # Joins the fork's grid via add()
+    if c.status:
+        new.status = StatusManager(new)
+        new.status.mask = c.status.mask
+        new.status.timed_effects = [dict(e) for e in c.status.timed_effects]
+    new.active_effects = [dict(e) for e in c.active_effects]
+    new.stats = dict(c.stats)
+    new.derived = dict(c.derived)
+    new.data = dict(c.data)  # Top level only: save_state / arena assign keys, they don't edit values
+    if c.data.get("Stats") is c.stats:
+        new.data["Stats"] = new.stats
+    if c.data.get("Derived") is c.derived:
+        new.data["Derived"] = new.derived
+    if c.inventory is not None:
+        new.inventory = _copy_inventory(c.inventory)
+    return new
+
+
+def fork(engine):
+    """Independent engine in the same state: cloned combatants, copied map, same RNG position."""
+    new = object.__new__(type(engine))
+    new.cols, new.rows = engine.cols, engine.rows
+    new.rng = RNGStreams(engine.seed)
+    for name, r in engine.rng._streams.items():
+        new.rng.stream(name).setstate(r.getstate())
+    new.seed = engine.seed
+    new._los_cache = {}
+    new.geometry_version = engine.geometry_version
+    new.round_counter = engine.round_counter
+    new.current_turn_index = engine.current_turn_index
+
+    # Map: copied layers, fresh occupant layer for the clones
+    new.grid = engine.grid.copy()
+    new.grid.occupant = array('i', [0]) * (new.cols * new.rows)
+    new.grid.actors, new.grid._handles = [None], {}
+    new.tiles = new.grid.rows_view()
+    new._walls = engine.walls.copy_to(new.grid, new.invalidate_visibility)
+    new.occupancy = OccupancyGrid(new.grid)
+
+    clones = {id(c): clone_combatant(c) for c in engine.combatants}
+    for c in engine.scheduler.roster:
+        if id(c) not in clones:
+            clones[id(c)] = clone_combatant(c)
+
+    def mapped(c):
+        return clones.get(id(c), c) if c is not None else None
+
+    new.scheduler = TurnScheduler()
+    new._combatants = []
+    for c in engine.combatants:
+        clone = clones[id(c)]
+        clone.rng = new.rng
+        new._combatants.append(clone)
+        new.occupancy.add(clone)
+    for c in new._combatants:
+        for attr in ("taunted_by", "charmed_by"):
+            setattr(c, attr, mapped(getattr(c, attr)))
+
+    sch, old = new.scheduler, engine.scheduler
+    sch.roster = [mapped(c) for c in old.roster]
+    sch._seq = {id(mapped(c)): old._seq[id(c)] for c in old.roster}
+    sch._next_seq = old._next_seq
+    sch.queue = [(k, seq, mapped(c)) for k, seq, c in old.queue]  # Same keys -> still a heap
+    sch.current = mapped(old.current)
+
+    new.hazards = HazardIndex()
+    for h in engine.hazards:
+        new.hazards.add(dict(h))
+    new.aoe_templates = list(engine.aoe_templates)
+    new.replay_log = ReplayLog()  # What-ifs don't write into the real replay
+    new.pending_world_updates = []
+    new.pathfinder = Pathfinder(new)
+    new.battlefield = BattlefieldPicture(new)
+    new.ai = type(engine.ai)() if engine.ai is not None else None
+    new.log_callback = None
+    new.clash_active = engine.clash_active
+    new.clash_participants = tuple(mapped(c) for c in engine.clash_participants)
+    new.clash_stat = engine.clash_stat
+    return new
+
+
+# === EXPORT (other processes) ===
+
+_PLAIN = (int, float, str, bool, type(None))
+
+
+def export(engine):
+    """
+    The fight as plain data (dicts, tuples, bytes) for another process; rebuild() reverses it.
+    Combatants go by roster index. Timed-effect callbacks and non-plain ad-hoc
+    attributes are dropped, so the rebuilt engine is for planning, not for play.
+    """
+    index = {id(c): i for i, c in enumerate(engine.combatants)}
+
+    def ref(c):
+        return index.get(id(c)) if c is not None else None
+
+    units = []
+    for c in engine.combatants:
+        fields, mask, timed, effects, extra = _unit_state(c)
+        fields = fields[:-2] + (ref(c.taunted_by), ref(c.charmed_by))  # COMBATANT_STATE ends with these
+        plain = {k: v for k, v in (extra or {}).items() if isinstance(v, _PLAIN)}
+        units.append((c.data, c.name, fields, mask, tuple((n, d) for n, d, _ in timed), effects, plain))
+
+    sch = engine.scheduler
+    listed = [c for c in sch.roster if id(c) in index]
+    return {
+        "cols": engine.cols, "rows": engine.rows, "seed": engine.seed,
+        "round": engine.round_counter,
+        "layers": _layers(engine),
+        "walls_outside": tuple(engine.walls.outside),
+        "units": tuple(units),
+        "turn": (tuple((k, seq, index[id(c)]) for k, seq, c in sch.queue if id(c) in index),
+                 ref(sch.current), tuple(index[id(c)] for c in listed),
+                 tuple((index[id(c)], sch._seq[id(c)]) for c in listed), sch._next_seq),
+        "hazards": tuple(dict(h, owner=getattr(h.get("owner"), "name", h.get("owner"))) for h in engine.hazards),
+        "rng": tuple((name, r.getstate()) for name, r in engine.rng._streams.items()),
+    }
+
+
+def rebuild(state):
+    """New CombatEngine from export() output (e.g. in a worker process)."""
+    from brqse_engine.combat.mechanics import CombatEngine, Combatant
+    engine = CombatEngine(state["cols"], state["rows"], seed=state["seed"])
+    engine.round_counter = state["round"]
+
+    g = engine.grid
+    terrain, move_cost, cover, blocked = state["layers"]
+    g.terrain = array('H'); g.terrain.frombytes(terrain)
+    g.move_cost = array('H'); g.move_cost.frombytes(move_cost)
+    g.cover[:] = cover
+    g.blocked[:] = blocked
+    engine.walls.count = g.blocked.count(1)
+    engine.walls.outside = set(state["walls_outside"])
+    engine.invalidate_visibility()
+
+    roster = []
+    for data, name, fields, mask, timed, effects, plain in state["units"]:
+        c = Combatant(data=data)
+        c.name = name
+        engine.add_combatant(c, fields[0], fields[1])
+        roster.append(c)
+    for c, unit in zip(roster, state["units"]):
+        _, _, fields, mask, timed, effects, plain = unit
+        fields = fields[:-2] + tuple(roster[i] if i is not None else None for i in fields[-2:])
+        _apply_unit_state(c, (fields, mask, tuple((n, d, None) for n, d in timed), effects, plain))
+
+    queue, current, listed, seq, next_seq = state["turn"]
+    sch = engine.scheduler
+    sch.roster = [roster[i] for i in listed]
+    sch._seq = {id(roster[i]): s for i, s in seq}
+    sch._next_seq = next_seq
+    sch.queue = [(k, s, roster[i]) for k, s, i in queue]
+    sch.current = roster[current] if current is not None else None
+
+    for h in state["hazards"]:
+        engine.hazards.add(dict(h))
+    for name, rng_state in state["rng"]:
+        engine.rng.stream(name).setstate(rng_state)
+    return engine
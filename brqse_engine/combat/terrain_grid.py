@@ -0,0 +1,223 @@
+"""
+Array-backed combat map layers.
+
+One flat array per layer instead of a Tile object per cell (index = y * cols + x):
+    terrain   array('H')  terrain id (TERRAIN_NAMES)
+    move_cost array('H')  cost of stepping onto the tile
+    cover     bytearray   2 bits per edge: N | S << 2 | E << 4 | W << 6 (COVER_* levels)
+    blocked   bytearray   1 = wall (blocks movement and LOS)
+    occupant  array('i')  0 = empty, else a handle into `actors`
+
+A 100x100 map is five allocations, and copy() is five buffer copies, so AI
+lookahead can fork the map cheaply. Tile is a thin view for code that still
+wants tile.terrain / tile.cover_north / tile.occupant.
+"""
+from array import array
+
+# --- TERRAIN DATA (synced with Data/Terrain_Types.csv) ---
+TERRAIN_DATA = {
+    "normal": {"move_cost": 1, "damage_type": None, "damage_dice": None},
+    "difficult": {"move_cost": 2, "damage_type": None, "damage_dice": None},
+    "water_shallow": {"move_cost": 2, "damage_type": None, "damage_dice": None, "effect": "fire_resistance"},
+    "water_deep": {"move_cost": 3, "damage_type": None, "damage_dice": None, "effect": "swim_required"},
+    "ice": {"move_cost": 1, "damage_type": None, "damage_dice": None, "effect": "slip_prone"},
+    "mud": {"move_cost": 2, "damage_type": None, "damage_dice": None, "effect": "grapple_disadvantage"},
+    "fire": {"move_cost": 2, "damage_type": "Fire", "damage_dice": "1d6"},
+    "acid": {"move_cost": 2, "damage_type": "Acid", "damage_dice": "1d8"},
+    "spikes": {"move_cost": 2, "damage_type": "Piercing", "damage_dice": "1d10"},
+    "darkness": {"move_cost": 1, "damage_type": None, "damage_dice": None, "effect": "blinded"},
+    "high_ground": {"move_cost": 1, "damage_type": None, "damage_dice": None, "effect": "ranged_advantage"},
+    "tree": {"move_cost": 99, "damage_type": None, "damage_dice": None, "effect": "cover"},
+    "rubble": {"move_cost": 2, "damage_type": None, "damage_dice": None},
+    "tall_grass": {"move_cost": 2, "damage_type": None, "damage_dice": None, "effect": "half_cover_prone"},
+    "lava": {"move_cost": 99, "damage_type": "Fire", "damage_dice": "4d10"},
+    "pit": {"move_cost": 1, "damage_type": "Bludgeoning", "damage_dice": "2d6", "effect": "fall"},
+}
+
+# Cover levels: 0=None, 1=Half, 2=Full
+COVER_NONE = 0
+COVER_HALF = 1
+COVER_FULL = 2
+COVER_SHIFT = {"N": 0, "S": 2, "E": 4, "W": 6}
+
+# Terrain ids. Names outside TERRAIN_DATA (wall_stone, floor_stone...) get an id on first
+# use and behave like "normal" - same as the old Tile fallback.
+TERRAIN_NAMES = list(TERRAIN_DATA)
+TERRAIN_IDS = {name: i for i, name in enumerate(TERRAIN_NAMES)}
+NORMAL = TERRAIN_IDS["normal"]
+
+
+def terrain_id(name):
+    tid = TERRAIN_IDS.get(name)
+    if tid is None:
+        tid = TERRAIN_IDS.setdefault(name, len(TERRAIN_NAMES))
+        if tid == len(TERRAIN_NAMES):
+            TERRAIN_NAMES.append(name)
+    return tid
+
+
+def terrain_data(name):
+    return TERRAIN_DATA.get(name, TERRAIN_DATA["normal"])
+
+
+class TerrainGrid:
+    def __init__(self, cols, rows):
+        self.cols = cols
+        self.rows = rows
+        n = cols * rows
+        self.terrain = array('H', [NORMAL]) * n
+        self.move_cost = array('H', [TERRAIN_DATA["normal"]["move_cost"]]) * n
+        self.cover = bytearray(n)
+        self.blocked = bytearray(n)
+        self.occupant = array('i', [0]) * n
+        self.actors = [None]  # handle -> combatant (handle 0 = empty)
+        self._handles = {}    # id(combatant) -> handle
+
+    def copy(self):
+        """Independent copy of every layer (occupant handles point at the same combatants)."""
+        new = TerrainGrid.__new__(TerrainGrid)
+        new.cols, new.rows = self.cols, self.rows
+        new.terrain = array('H', self.terrain)
+        new.move_cost = array('H', self.move_cost)
+        new.cover = bytearray(self.cover)
+        new.blocked = bytearray(self.blocked)
+        new.occupant = array('i', self.occupant)
+        new.actors = list(self.actors)
+        new._handles = dict(self._handles)
+        return new
+
+    # === CELLS ===
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.cols and 0 <= y < self.rows
+
+    def index(self, x, y):
+        return y * self.cols + x
+
+    def terrain_at(self, x, y):
+        return TERRAIN_NAMES[self.terrain[y * self.cols + x]]
+
+    def set_terrain(self, x, y, name):
+        i = y * self.cols + x
+        self.terrain[i] = terrain_id(name)
+        self.move_cost[i] = terrain_data(name).get("move_cost", 1)
+
+    def cover_at(self, x, y, direction):
+        return (self.cover[y * self.cols + x] >> COVER_SHIFT[direction]) & 3
+
+    def set_cover(self, x, y, direction, level):
+        i = y * self.cols + x
+        shift = COVER_SHIFT[direction]
+        self.cover[i] = (self.cover[i] & ~(3 << shift) & 0xFF) | ((min(level, 3) & 3) << shift)
+
+    def occupant_at(self, x, y):
+        return self.actors[self.occupant[y * self.cols + x]]
+
+    def set_occupant(self, x, y, c):
+        if c is None:
+            self.occupant[y * self.cols + x] = 0
+            return
+        handle = self._handles.get(id(c))
+        if handle is None or self.actors[handle] is not c:
+            handle = len(self.actors)
+            self.actors.append(c)
+            self._handles[id(c)] = handle
+        self.occupant[y * self.cols + x] = handle
+
+    # === VIEWS ===
+
+    def tile(self, x, y):
+        return Tile(self, x, y)
+
+    def rows_view(self):
+        return TileRows(self)
+
+
+class Tile:
+    """View of one cell of a TerrainGrid (reads and writes go to the arrays)."""
+    __slots__ = ("grid", "x", "y")
+
+    def __init__(self, grid, x, y):
+        self.grid = grid
+        self.x = x
+        self.y = y
+
+    @property
+    def terrain(self): return self.grid.terrain_at(self.x, self.y)
+    @terrain.setter
+    def terrain(self, name): self.grid.set_terrain(self.x, self.y, name)
+
+    @property
+    def move_cost(self): return self.grid.move_cost[self.grid.index(self.x, self.y)]
+    @move_cost.setter
+    def move_cost(self, val): self.grid.move_cost[self.grid.index(self.x, self.y)] = val
+
+    @property
+    def damage_type(self): return terrain_data(self.terrain).get("damage_type")
+    @property
+    def damage_dice(self): return terrain_data(self.terrain).get("damage_dice")
+    @property
+    def effect(self): return terrain_data(self.terrain).get("effect")
+
+    @property
+    def blocked(self): return bool(self.grid.blocked[self.grid.index(self.x, self.y)])
+
+    @property
+    def occupant(self): return self.grid.occupant_at(self.x, self.y)
+    @occupant.setter
+    def occupant(self, c): self.grid.set_occupant(self.x, self.y, c)
+
+    def _cover_property(direction):
+        return property(lambda self: self.grid.cover_at(self.x, self.y, direction),
+                        lambda self, level: self.grid.set_cover(self.x, self.y, direction, level))
+    cover_north = _cover_property("N")
+    cover_south = _cover_property("S")
+    cover_east = _cover_property("E")
+    cover_west = _cover_property("W")
+    del _cover_property
+
+    def get_cover_from_direction(self, direction):
+        """Get cover value from a cardinal direction (N/S/E/W)."""
+        if direction == "N": return self.cover_south  # Cover FROM north means wall on south side
+        if direction == "S": return self.cover_north
+        if direction == "E": return self.cover_west
+        if direction == "W": return self.cover_east
+        return COVER_NONE
+
+
+class TileRows:
+    """engine.tiles[y][x] -> Tile view (legacy row-of-objects access)."""
+    __slots__ = ("grid",)
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __len__(self):
+        return self.grid.rows
+
+    def __getitem__(self, y):
+        if not 0 <= y < self.grid.rows:
+            raise IndexError(y)
+        return _TileRow(self.grid, y)
+
+    def __iter__(self):
+        return (_TileRow(self.grid, y) for y in range(self.grid.rows))
+
+
+class _TileRow:
+    __slots__ = ("grid", "y")
+
+    def __init__(self, grid, y):
+        self.grid = grid
+        self.y = y
+
+    def __len__(self):
+        return self.grid.cols
+
+    def __getitem__(self, x):
+        if not 0 <= x < self.grid.cols:
+            raise IndexError(x)
+        return Tile(self.grid, x, self.y)
+
+    def __iter__(self):
+        return (Tile(self.grid, x, self.y) for x in range(self.grid.cols))
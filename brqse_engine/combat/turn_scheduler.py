@@ -0,0 +1,122 @@
+"""
+Initiative-ordered turn scheduler.
+
+Each round is a heap of (-initiative, join_seq) keys for the combatants that
+still have to act, so a turn change is one heappop (O(log n)) instead of a
+walk down the roster. Ties keep join order, same as the old stable sort.
+
+- Deaths / removals are dropped lazily when they reach the top of the heap.
+- Joins mid-round (spawn_minion) act this round if their slot is still ahead.
+- delay() re-queues the current actor at a lower initiative in the same round.
+- The next round's heap is heapify() over the living roster: O(n) once a round.
+
+The scheduler only orders turns; the engine decides what a turn does
+(start_turn, skipping incapacitated actors, round bookkeeping).
+"""
+import heapq
+
+
+class TurnScheduler:
+    def __init__(self):
+        self.roster = []    # Everyone scheduled, in join order
+        self.queue = []     # Heap of (-initiative, seq, combatant) still to act this round
+        self.current = None
+        self._seq = {}      # id(combatant) -> join sequence (tie-break)
+        self._next_seq = 0
+
+    def __len__(self):
+        return len(self.roster)
+
+    def __contains__(self, c):
+        return id(c) in self._seq
+
+    def _key(self, c):
+        return (-(getattr(c, "initiative", 0) or 0), self._seq[id(c)])
+
+    def _entry(self, c):
+        return self._key(c) + (c,)
+
+    # === ROSTER ===
+
+    def start(self, combatants):
+        """Fresh round 1 for a roster (initiative already rolled). Call advance() for the first actor."""
+        self.roster = []
+        self._seq = {}
+        self._next_seq = 0
+        self.current = None
+        for c in combatants:
+            self._register(c)
+        self.queue = [self._entry(c) for c in self.roster]
+        heapq.heapify(self.queue)
+
+    def _register(self, c):
+        if id(c) in self._seq:
+            return False
+        self._seq[id(c)] = self._next_seq
+        self._next_seq += 1
+        self.roster.append(c)
+        return True
+
+    def add(self, c):
+        """Joins mid-combat. Acts this round if its initiative slot hasn't come up yet."""
+        if not self._register(c):
+            return
+        if self.current is None or self._key(c) > self._key(self.current):
+            heapq.heappush(self.queue, self._entry(c))
+
+    def remove(self, c):
+        """Leaves combat for good (fled, dismissed). Queue entries are skipped lazily."""
+        if self._seq.pop(id(c), None) is None:
+            return
+        self.roster.remove(c)
+        if self.current is c:
+            self.current = None
+
+    def delay(self, c, initiative):
+        """
+        Current actor waits: acts again this round at `initiative` (kept for later rounds).
+        Returns False if that wouldn't be later than its current slot.
+        """
+        if c is not self.current or id(c) not in self._seq:
+            return False
+        old = self._key(c)
+        previous = c.initiative
+        c.initiative = initiative
+        if self._key(c) <= old:
+            c.initiative = previous
+            return False
+        heapq.heappush(self.queue, self._entry(c))
+        self.current = None
+        return True
+
+    # === TURNS ===
+
+    def advance(self):
+        """
+        Moves to the next living combatant.
+        Returns (combatant, new_round). (None, False) if nobody is left alive;
+        `current` is then left as it was.
+        """
+        new_round = False
+        for _ in range(2):
+            while self.queue:
+                _, seq, c = heapq.heappop(self.queue)
+                if self._seq.get(id(c)) == seq and c.is_alive():
+                    self.current = c
+                    return c, new_round
+            # Round over: everyone alive goes again
+            self.queue = [self._entry(c) for c in self.roster if c.is_alive()]
+            if not self.queue:
+                return None, False
+            heapq.heapify(self.queue)
+            new_round = True
+        return None, False
+
+    def order(self):
+        """Roster in initiative order (for UIs / legacy turn_order readers)."""
+        return sorted(self.roster, key=self._key)
+
+    def upcoming(self):
+        """Combatants still to act this round, in order."""
+        return [c for _, seq, c in sorted(self.queue, key=lambda e: e[:2])
+                if self._seq.get(id(c)) == seq and c.is_alive()]
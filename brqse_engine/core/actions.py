@@ -0,0 +1,72 @@
+"""
+Player action tables.
+
+Player actions are looked up by type in one table per mode (O(1), no if/elif
+chain). Handlers are GameLoopController methods registered with @action and
+called as handler(loop, action_type, x, y, **kwargs). They return a result
+dict; handle_action normalizes it to {"success", "action", "log" | "reason"}
+and times it per action (GameLoopController.action_timings).
+"""
+from typing import Dict
+
+
+class ActionSpec:
+    """
+    One registered action.
+    target: needs integer x, y inside the map. args: needs at least one of these kwargs.
+    locked: EXPLORE-only (refused in other states, turns the player to face x, y).
+    finish: runs the shared after-action phase (tension, enemy response, narrator):
+            True always, "success" only after a successful result, False never.
+    """
+    __slots__ = ("name", "handler", "target", "args", "locked", "finish")
+
+    def __init__(self, name, handler, target=False, args=(), locked=True, finish=True):
+        self.name = name
+        self.handler = handler
+        self.target = target
+        self.args = tuple(args)
+        self.locked = locked
+        self.finish = finish
+
+    def validate(self, x, y, kwargs, bounds=None):
+        """Why the request can't run, or None. bounds: (width, height) of the map, if known."""
+        if self.target:
+            if x is None or y is None:
+                return f"{self.name} needs a target tile."
+            if type(x) is not int or type(y) is not int:
+                return f"{self.name} needs integer tile coordinates."
+            if bounds is not None and not (0 <= x < bounds[0] and 0 <= y < bounds[1]):
+                return f"{self.name} target {x}, {y} is off the map."
+        if self.args and not any(kwargs.get(a) for a in self.args):
+            return f"{self.name} needs one of: {', '.join(self.args)}."
+        return None
+
+    def finishes(self, result):
+        """Does `result` go through the after-action phase?"""
+        if self.finish == "success":
+            return bool(result.get("success"))
+        return bool(self.finish)
+
+
+EXPLORE_ACTIONS: Dict[str, ActionSpec] = {}
+COMBAT_ACTIONS: Dict[str, ActionSpec] = {}
+
+
+def action(table, *names, **options):
+    """Registers the decorated handler in `table` under every name in `names`."""
+    def register(fn):
+        for name in names:
+            table[name] = ActionSpec(name, fn, **options)
+        return fn
+    return register
+
+
+def normalize_result(result, action_type):
+    """Every action result carries success, action, and a log (success) or a reason (failure)."""
+    result.setdefault("action", action_type)
+    result["success"] = bool(result.get("success"))
+    if result["success"]:
+        result.setdefault("log", "")
+    else:
+        result.setdefault("reason", result.get("log") or "Failed")
+    return result
@@ -1,8 +1,9 @@
-import csv
 import json
 import os
 import requests
 
+from brqse_engine.core.data_registry import game_data
+
 class Arbiter:
     """
     The Rules Lawyer. Intercepts player messages to determine if game mechanics (Skill Checks) are required.
@@ -16,20 +17,11 @@ class Arbiter:
         """Loads allowed skill names and their attributes from CSV."""
         skills = []
         skill_map = {}
-        # Path relative to engine root
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        path = os.path.join(base_dir, "Data", "Skills.csv")
-        
-        if os.path.exists(path):
-            try:
-                with open(path, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        s_name = row['Skill_Name']
-                        skills.append(s_name)
-                        skill_map[s_name] = row['Attribute']
-            except Exception as e:
-                print(f"[Arbiter] Failed to load skills: {e}")
+        for row in game_data.csv_rows("Skills.csv"):
+            s_name = row.get('Skill_Name')
+            if not s_name: continue
+            skills.append(s_name)
+            skill_map[s_name] = row.get('Attribute')
                 
         # Return loaded skills + map, or fallback
         if not skills:
@@ -1,3 +1,5 @@
+import threading
+
 class Stats:
     MIGHT = "Might"
     REFLEXES = "Reflexes"
@@ -45,3 +47,42 @@ class Conditions:
     BURNING = "Burning"      # Retaining earlier addition
     BLEEDING = "Bleeding"    # Retaining earlier addition
     FROZEN = "Frozen"        # Retaining earlier addition
+    # Flags set directly by combat rules (no duration, never tick out)
+    SHAKEN = "Shaken"
+    WEAKENED = "Weakened"
+    SICKENED = "Sickened"
+    BLESSED = "Blessed"
+    HASTED = "Hasted"
+    SLOWED = "Slowed"
+    DOOMED = "Doomed"
+    TAUNTED = "Taunted"
+    DISARMED = "Disarmed"
+    BROKEN = "Broken"        # CMP at 0
+    EXHAUSTED = "Exhausted"  # SP at 0
+    DRAINED = "Drained"      # FP at 0
+
+
+# === CONDITION BITS ===
+# Every condition is one bit of an int mask (StatusManager.mask), so "any of these?"
+# checks are a single AND. Conditions above get fixed bits in declaration order;
+# any other effect name ("Broken arm", "Diseased"...) is given the next free bit
+# the first time it is applied (process-local - don't persist raw masks).
+_BITS_LOCK = threading.Lock()
+CONDITION_BITS = {name: 1 << i for i, name in
+                  enumerate(v for k, v in vars(Conditions).items() if k.isupper())}
+
+
+def condition_bit(name):
+    """Bit for a (capitalized) condition name, registering unknown names."""
+    bit = CONDITION_BITS.get(name)
+    if bit is None:
+        with _BITS_LOCK:
+            bit = CONDITION_BITS.setdefault(name, 1 << len(CONDITION_BITS))
+    return bit
+
+
+def condition_mask(*names):
+    mask = 0
+    for name in names:
+        mask |= condition_bit(name)
+    return mask
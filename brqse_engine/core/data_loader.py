@@ -1,7 +1,8 @@
-import json
 import os
 from typing import Dict, List, Any, Optional
 
+from brqse_engine.core.data_registry import game_data
+
 class DataLoader:
     """
     Handles loading of static game data (Gear, Spells, etc.)
@@ -19,6 +20,7 @@ class DataLoader:
         
         self.gear_db: Dict[str, Dict] = {}
         self.spells_db: List[Dict] = []
+        self.spells_index: Dict[str, Dict] = {}
         
         self.load_all()
 
@@ -27,35 +29,25 @@ class DataLoader:
         self.load_spells()
 
     def load_gear(self):
-        if not os.path.exists(self.gear_path):
-            return
-        try:
-            with open(self.gear_path, 'r') as f:
-                data = json.load(f)
-                for item_data in data:
-                    name = item_data.get("Name")
-                    if name:
-                        self.gear_db[name] = item_data
-        except Exception as e:
-            print(f"[DataLoader] Error loading Gear: {e}")
+        # Shared read-only rows (parsed once per process by the registry)
+        for item_data in game_data.json_data(self.gear_path, default=()):
+            name = item_data.get("Name")
+            if name:
+                self.gear_db[name] = item_data
 
     def load_spells(self):
-        if not os.path.exists(self.spells_path):
-             return
-        try:
-            with open(self.spells_path, 'r') as f:
-                self.spells_db = json.load(f)
-        except Exception as e:
-            print(f"[DataLoader] Error loading Spells: {e}")
+        self.spells_db = list(game_data.json_data(self.spells_path, default=()))
+        self.spells_index = {}
+        for spell in self.spells_db:
+            name = spell.get("Name")
+            if name and name not in self.spells_index:  # First entry wins, like the old scan
+                self.spells_index[name] = spell
 
     def get_item_data(self, item_name: str) -> Optional[Dict]:
         return self.gear_db.get(item_name)
     
     def get_spell_data(self, spell_name: str) -> Optional[Dict]:
-        for s in self.spells_db:
-            if s.get("Name") == spell_name:
-                return s
-        return None
+        return self.spells_index.get(spell_name)
 
     def get_all_gear(self) -> List[Dict]:
         return list(self.gear_db.values())
@@ -0,0 +1,298 @@
+import csv
+import glob
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DATA_DIR = os.path.join(BASE_DIR, "Data")
+WEB_DATA_DIR = os.path.join(BASE_DIR, "Web_ui", "public", "data")
+
+# --- BINARY SNAPSHOT ---
+# Bump when the pickled layout (or row normalization) changes.
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PATH = os.path.join(DATA_DIR, ".cache", "game_data.snapshot")
+# Runtime state files living next to the static JSON - never snapshot these.
+SNAPSHOT_EXCLUDE = {"player_state.json", "last_battle_replay.json", "staged_battle.json"}
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict used for shared table rows.
+    Still a real dict, so json.dump / dict(row) / row.get() all keep working.
+    Copy it (dict(row)) if you need to edit a row.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Shared game data is read-only. Copy the row before editing it.")
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __hash__(self):
+        return id(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively converts dicts -> FrozenDict and lists -> tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class DataRegistry:
+    """
+    Process-wide cache of the static game data (Data/*.csv, Web_ui/public/data/*.json).
+    Every file is parsed once per process and shared by all consumers
+    (Inventory, ProgressionEngine, DataLoader, Arbiter, EnemySpawner, EventEngine...).
+
+    Tables are immutable: rows are FrozenDicts inside tuples.
+    Safe to call from multiple threads (API workers).
+    """
+    ENCODINGS = ['utf-8-sig', 'cp1252', 'latin-1']
+
+    def __init__(self, data_dir: Optional[str] = None, web_data_dir: Optional[str] = None,
+                 snapshot_path: Optional[str] = None):
+        self.data_dir = data_dir or DATA_DIR
+        self.web_data_dir = web_data_dir or WEB_DATA_DIR
+        self.snapshot_path = snapshot_path  # None = always parse the sources
+        self._snapshot_checked = False
+        self.snapshot_loaded = False
+        self._cache: Dict[Tuple, Any] = {}
+        self._lock = threading.RLock()
+        self.loads = 0  # Number of actual file parses (for tests / benchmarks)
+
+    # === PATHS ===
+
+    def resolve(self, name: str, json_file: bool = False) -> str:
+        """Bare filenames resolve into Data/ (CSV) or Web_ui/public/data/ (JSON)."""
+        if not os.path.isabs(name):
+            name = os.path.join(self.web_data_dir if json_file else self.data_dir, name)
+        return os.path.normpath(os.path.abspath(name))
+
+    def _cached(self, key: Tuple, builder):
+        # Fast path: no lock once loaded
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if not self._snapshot_checked:
+                self._snapshot_checked = True
+                if self.snapshot_path:
+                    self.load_snapshot(self.snapshot_path)
+            if key not in self._cache:
+                self._cache[key] = builder()
+            return self._cache[key]
+
+    # === CSV ===
+
+    def csv_rows(self, name: str, normalize: bool = False) -> Tuple[FrozenDict, ...]:
+        """
+        Returns all rows of a CSV as a tuple of FrozenDicts.
+        normalize=False: keys exactly as in the header (BOM stripped).
+        normalize=True: keys/values stripped and key spaces -> underscores (abilities DataLoader format).
+        """
+        path = self.resolve(name)
+        if normalize:
+            return self._cached(("csv_norm", path), lambda: self._normalize(self.csv_rows(path)))
+        return self._cached(("csv", path), lambda: self._read_csv(path))
+
+    def csv_index(self, name: str, column: str, normalize: bool = False) -> FrozenDict:
+        """Returns {row[column].strip(): row} for a CSV. Later rows win on duplicate keys."""
+        path = self.resolve(name)
+
+        def build():
+            index = {}
+            for row in self.csv_rows(path, normalize=normalize):
+                key = row.get(column)
+                if key:
+                    index[key.strip()] = row
+            return FrozenDict(index)
+
+        return self._cached(("csv_index", path, column, normalize), build)
+
+    def _read_csv(self, path: str) -> Tuple[FrozenDict, ...]:
+        if not os.path.exists(path):
+            print(f"[DataRegistry] Warning: File not found {path}")
+            return ()
+
+        rows = []
+        for encoding in self.ENCODINGS:
+            try:
+                with open(path, 'r', encoding=encoding, newline='') as f:
+                    rows = [FrozenDict(row) for row in csv.DictReader(f)]
+                break  # Success
+            except UnicodeDecodeError:
+                rows = []
+                continue  # Try next encoding
+            except Exception as e:
+                print(f"[DataRegistry] Error loading {path} with {encoding}: {e}")
+                rows = []
+                break
+        self.loads += 1
+        return tuple(rows)
+
+    @staticmethod
+    def _normalize(rows) -> Tuple[FrozenDict, ...]:
+        out = []
+        for row in rows:
+            out.append(FrozenDict(
+                (k.strip().replace(" ", "_"), v.strip() if isinstance(v, str) else v)
+                for k, v in row.items() if k
+            ))
+        return tuple(out)
+
+    # === JSON ===
+
+    def json_data(self, name: str, default: Any = None) -> Any:
+        """Returns a parsed (frozen) JSON file, or default if it is missing/broken."""
+        path = self.resolve(name, json_file=True)
+        data = self._cached(("json", path), lambda: self._read_json(path))
+        return default if data is None else data
+
+    def _read_json(self, path: str) -> Any:
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[DataRegistry] Error loading {path}: {e}")
+            return None
+        self.loads += 1
+        return freeze(data)
+
+    # === DERIVED TABLES ===
+
+    def derived(self, key: str, builder):
+        """
+        Memoizes a structure built from other tables (e.g. a lookup index).
+        builder() is called once per process; the result should be treated as read-only.
+        """
+        return self._cached(("derived", key), builder)
+
+    def clear(self):
+        """Drops every cached table (e.g. after editing Data/ at runtime)."""
+        with self._lock:
+            self._cache.clear()
+            self._snapshot_checked = False
+            self.snapshot_loaded = False
+
+    # === BINARY SNAPSHOT ===
+    # One pickle holding every static table, keyed by the sources' content hashes.
+    # Cold start = one file read + unpickle instead of ~90 CSV/JSON parses.
+
+    def source_files(self) -> List[Tuple[str, str]]:
+        """All snapshot-able sources as (kind, name) with kind 'csv' or 'json'."""
+        files = [("csv", os.path.basename(p)) for p in glob.glob(os.path.join(self.data_dir, "*.csv"))]
+        files += [("json", os.path.basename(p)) for p in glob.glob(os.path.join(self.web_data_dir, "*.json"))
+                  if os.path.basename(p) not in SNAPSHOT_EXCLUDE]
+        return sorted(files)
+
+    def _fingerprint(self, kind: str, name: str) -> Dict[str, Any]:
+        path = self.resolve(name, json_file=(kind == "json"))
+        st = os.stat(path)
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha1": digest}
+
+    def _manifest_is_current(self, manifest: Dict) -> bool:
+        sources = self.source_files()
+        if set(sources) != set(manifest.keys()):
+            return False  # Files added / removed
+        for kind, name in sources:
+            old = manifest[(kind, name)]
+            try:
+                st = os.stat(self.resolve(name, json_file=(kind == "json")))
+            except OSError:
+                return False
+            if st.st_size == old["size"] and st.st_mtime_ns == old["mtime_ns"]:
+                continue  # Untouched, skip hashing
+            if self._fingerprint(kind, name)["sha1"] != old["sha1"]:
+                return False
+        return True
+
+    def build_snapshot(self, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parses every source and writes the snapshot (atomically).
+        Returns a small report: {"path", "tables", "bytes", "seconds"}.
+        """
+        path = path or self.snapshot_path or SNAPSHOT_PATH
+        start = time.perf_counter()
+        manifest = {}
+        tables = {}
+        with self._lock:
+            self._snapshot_checked = True  # We are the snapshot; don't try to load one mid-build
+            for kind, name in self.source_files():
+                manifest[(kind, name)] = self._fingerprint(kind, name)
+                if kind == "csv":
+                    tables[("csv", name)] = self.csv_rows(name)
+                    tables[("csv_norm", name)] = self.csv_rows(name, normalize=True)
+                else:
+                    tables[("json", name)] = self.json_data(name)
+
+        payload = {"version": SNAPSHOT_VERSION, "manifest": manifest, "tables": tables}
+        blob = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(blob)
+        os.replace(tmp, path)
+        return {"path": path, "tables": len(tables), "bytes": len(blob),
+                "seconds": time.perf_counter() - start}
+
+    def load_snapshot(self, path: Optional[str] = None, rebuild: bool = True) -> bool:
+        """
+        Hydrates the cache from a snapshot. If it is missing, from another version,
+        or any source changed, it is rebuilt (rebuild=True) or ignored.
+        Returns True if the cache now holds snapshot data.
+        """
+        path = path or self.snapshot_path or SNAPSHOT_PATH
+        payload = None
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[DataRegistry] Ignoring unreadable snapshot {path}: {e}")
+
+        with self._lock:
+            if (not payload or payload.get("version") != SNAPSHOT_VERSION
+                    or not self._manifest_is_current(payload.get("manifest", {}))):
+                if not rebuild:
+                    return False
+                try:
+                    self.build_snapshot(path)
+                except OSError as e:
+                    # Read-only checkout etc. - the parsed tables are cached anyway
+                    print(f"[DataRegistry] Could not write snapshot {path}: {e}")
+                    return False
+                self.snapshot_loaded = True
+                return True
+
+            for (kind, name), data in payload["tables"].items():
+                abs_path = self.resolve(name, json_file=(kind == "json"))
+                self._cache.setdefault((kind, abs_path), data)
+            self.snapshot_loaded = True
+            return True
+
+
+# Global Instance (set BRQSE_DATA_SNAPSHOT=0 to always parse the sources)
+game_data = DataRegistry(
+    snapshot_path=None if os.environ.get("BRQSE_DATA_SNAPSHOT") == "0" else SNAPSHOT_PATH
+)
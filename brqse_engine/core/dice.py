@@ -1,61 +1,200 @@
 import random
 import re
+from functools import lru_cache
 from typing import Tuple, List, Dict
 
+# NumPy is optional: only DiceExpr.roll_many uses it (vectorized batches)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# --- COMPILED EXPRESSIONS ---
+# One term: [+-] N d S [kh K | kl K | k K] [!]  or a flat [+-] N
+TERM_RE = re.compile(r"([+-])?(?:(\d*)d(\d+)(?:(kh|kl|k)(\d+))?(!)?|(\d+))")
+EXPLODE_LIMIT = 10  # Extra rolls one exploding die may chain (keeps d1! / bad luck finite)
+
+
+class DiceTerm:
+    """N dice of S sides: keep > 0 keeps the highest `keep`, < 0 the lowest; explode rerolls max faces."""
+    __slots__ = ("count", "sides", "keep", "explode", "sign")
+
+    def __init__(self, count, sides, keep=0, explode=False, sign=1):
+        self.count = count
+        self.sides = sides
+        self.keep = keep if keep and abs(keep) < count else 0
+        self.explode = explode and sides > 1
+        self.sign = sign
+
+    @property
+    def simple(self):
+        return not self.keep and not self.explode
+
+    def roll_die(self, randrange):
+        # randrange(s) + 1 draws exactly what randint(1, s) would, minus the wrapper
+        value = randrange(self.sides) + 1
+        if self.explode:
+            last = value
+            for _ in range(EXPLODE_LIMIT):
+                if last != self.sides: break
+                last = randrange(self.sides) + 1
+                value += last
+        return value
+
+    def roll(self, randrange):
+        """(signed total, individual die results)."""
+        rolls = [self.roll_die(randrange) for _ in range(self.count)]
+        kept = rolls
+        if self.keep > 0:
+            kept = sorted(rolls)[-self.keep:]
+        elif self.keep < 0:
+            kept = sorted(rolls)[:-self.keep]
+        return self.sign * sum(kept), rolls
+
+
+class DiceExpr:
+    """A parsed dice expression. Build with compile_dice(); safe to share (immutable)."""
+    __slots__ = ("text", "terms", "flat")
+
+    def __init__(self, text, terms, flat):
+        self.text = text
+        self.terms = tuple(terms)
+        self.flat = flat
+
+    def __repr__(self):
+        return f"DiceExpr({self.text!r})"
+
+    def roll(self, rng=None) -> int:
+        """One total. rng: random.Random (engine sub-stream) or None for the global module."""
+        randrange = (rng or random).randrange
+        total = self.flat
+        for t in self.terms:
+            if t.simple:
+                sides = t.sides
+                total += t.sign * sum(randrange(sides) for _ in range(t.count)) + t.sign * t.count
+            else:
+                total += t.roll(randrange)[0]
+        return total
+
+    def roll_detail(self, rng=None) -> Tuple[int, List[int]]:
+        """(total, every die rolled) - what Dice.roll reports."""
+        randrange = (rng or random).randrange
+        total, rolls = self.flat, []
+        for t in self.terms:
+            value, dice = t.roll(randrange)
+            total += value
+            rolls.extend(dice)
+        return total, rolls
+
+    def roll_many(self, n, rng=None):
+        """
+        n independent totals in one call.
+        rng: a numpy Generator (np.random.default_rng(seed)) -> numpy int array, vectorized.
+        Without NumPy, or with a random.Random, falls back to a plain list.
+        """
+        if np is not None and (rng is None or hasattr(rng, "integers")):
+            return self._roll_many_numpy(n, rng if rng is not None else np.random.default_rng())
+        return [self.roll(rng) for _ in range(n)]
+
+    def _roll_many_numpy(self, n, gen):
+        total = np.full(n, self.flat, dtype=np.int64)
+        for t in self.terms:
+            dice = gen.integers(1, t.sides + 1, size=(n, t.count), dtype=np.int64)
+            if t.explode:
+                chain = dice == t.sides
+                for _ in range(EXPLODE_LIMIT):
+                    if not chain.any(): break
+                    extra = gen.integers(1, t.sides + 1, size=dice.shape, dtype=np.int64)
+                    dice += np.where(chain, extra, 0)
+                    chain &= extra == t.sides
+            if t.keep > 0:
+                dice = np.sort(dice, axis=1)[:, -t.keep:]
+            elif t.keep < 0:
+                dice = np.sort(dice, axis=1)[:, :-t.keep]
+            total += t.sign * dice.sum(axis=1)
+        return total
+
+
+@lru_cache(maxsize=4096)
+def compile_dice(expression):
+    """
+    Parses a dice expression once: "2d6+3", "1d8-1", "4d6kh3", "2d20kl1", "1d6!", "2d6+1d4+2", "5".
+    Trailing text is ignored ("1d6 Fire" -> 1d6), like the old Dice.roll.
+    Returns a cached DiceExpr, or None if nothing parses.
+    """
+    text = str(expression).lower().replace(" ", "")
+    terms, flat, pos = [], 0, 0
+    while pos < len(text):
+        m = TERM_RE.match(text, pos)
+        if not m or m.end() == pos or (pos and not m.group(1)):
+            break  # Garbage (or a term without +/-): stop here
+        sign = -1 if m.group(1) == "-" else 1
+        if m.group(3):
+            count = int(m.group(2) or 1)
+            keep = int(m.group(5) or 0) * (-1 if m.group(4) == "kl" else 1)
+            terms.append(DiceTerm(count, int(m.group(3)), keep, bool(m.group(6)), sign))
+        else:
+            flat += sign * int(m.group(7))
+        pos = m.end()
+    if pos == 0:
+        return None
+    return DiceExpr(text[:pos], terms, flat)
+
+
 class Dice:
     """
     Static utility class for dice rolling operations.
-    Supports standard notation (e.g., "1d20", "2d6+3", "1d8-1").
+    Supports standard notation (e.g., "1d20", "2d6+3", "1d8-1") plus keep/explode
+    ("4d6kh3", "1d6!") and sums of terms - see compile_dice().
     """
-    
+
     @staticmethod
-    def roll(expression: str) -> Tuple[int, List[int], str]:
+    def roll(expression: str, rng=None) -> Tuple[int, List[int], str]:
         """
         Rolls dice based on a string expression.
+        rng: optional random.Random (e.g. an engine sub-stream); defaults to the global random module.
         Returns: (Total, Individual Rolls as List, Breakdown String)
         Example: roll("2d6+3") -> (10, [3, 4], "2d6+3: [3, 4] + 3 = 10")
         """
-        expression = expression.lower().replace(" ", "")
-        
-        # Parse expression: XdY or XdY+Z or XdY-Z
-        match = re.match(r"(\d+)d(\d+)([\+\-]\d+)?", expression)
-        
-        if not match:
-            # Maybe it's just a flat number?
-            try:
-                val = int(expression)
-                return val, [], str(val)
-            except:
-                return 0, [], "Invalid Expression"
-        
-        count = int(match.group(1))
-        sides = int(match.group(2))
-        modifier = match.group(3)
-        mod_val = int(modifier) if modifier else 0
-        
-        rolls = [random.randint(1, sides) for _ in range(count)]
-        total = sum(rolls) + mod_val
-        
+        expr = compile_dice(expression)
+        if expr is None:
+            return 0, [], "Invalid Expression"
+        if not expr.terms:
+            # Just a flat number
+            return expr.flat, [], str(expr.flat)
+
+        total, rolls = expr.roll_detail(rng)
+
         # Format breakdown
         roll_str = f"[{', '.join(map(str, rolls))}]"
-        breakdown = f"{expression}: {roll_str}"
-        if mod_val != 0:
-            op = "+" if mod_val > 0 else ""
-            breakdown += f" {op}{mod_val}"
+        breakdown = f"{expr.text}: {roll_str}"
+        if expr.flat != 0:
+            op = "+" if expr.flat > 0 else ""
+            breakdown += f" {op}{expr.flat}"
         breakdown += f" = {total}"
-        
+
         return total, rolls, breakdown
 
     @staticmethod
-    def roll_advantage() -> Tuple[int, int, int]:
+    def roll_many(expression: str, n: int, rng=None):
+        """n totals of an expression at once (see DiceExpr.roll_many). Invalid -> zeros."""
+        expr = compile_dice(expression)
+        if expr is None:
+            return [0] * n
+        return expr.roll_many(n, rng)
+
+    @staticmethod
+    def roll_advantage(rng=None) -> Tuple[int, int, int]:
         """Rolls 2d20 and keeps higher. Returns (Result, Roll1, Roll2)"""
-        r1 = random.randint(1, 20)
-        r2 = random.randint(1, 20)
+        rng = rng or random
+        r1 = rng.randint(1, 20)
+        r2 = rng.randint(1, 20)
         return max(r1, r2), r1, r2
 
     @staticmethod
-    def roll_disadvantage() -> Tuple[int, int, int]:
+    def roll_disadvantage(rng=None) -> Tuple[int, int, int]:
         """Rolls 2d20 and keeps lower. Returns (Result, Roll1, Roll2)"""
-        r1 = random.randint(1, 20)
-        r2 = random.randint(1, 20)
+        rng = rng or random
+        r1 = rng.randint(1, 20)
+        r2 = rng.randint(1, 20)
         return min(r1, r2), r1, r2
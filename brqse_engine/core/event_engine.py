@@ -1,15 +1,17 @@
 import random
 import os
-import csv
 import json
 from typing import Dict, Any, List, Optional
 
+from brqse_engine.core.data_registry import game_data
+
 class EventEngine:
     """
     Handles the 5xD20 Modular Scenario generation and Instruction Interpretation.
     """
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, rng=None):
         self.data_dir = data_dir
+        self.rng = rng or random  # random.Random (e.g. GameLoopController events stream)
         self.tables: Dict[str, List[Dict]] = {}
         self._load_tables()
 
@@ -23,20 +25,16 @@ class EventEngine:
         }
         for key, filename in mapping.items():
             path = os.path.join(self.data_dir, filename)
-            if os.path.exists(path):
-                with open(path, 'r', encoding='utf-8') as f:
-                    self.tables[key] = list(csv.DictReader(f))
-            else:
-                self.tables[key] = []
+            self.tables[key] = list(game_data.csv_rows(path)) if os.path.exists(path) else []
 
     def generate_scenario(self, biome: str, sensory_layer=None) -> Dict[str, Any]:
         """Rolls 5xD20 and generates a Mock AI Scenario JSON."""
         rolls = {
-            "archetype": random.choice(self.tables["archetype"]),
-            "subject": random.choice(self.tables["subject"]),
-            "context": random.choice(self.tables["context"]),
-            "reward": random.choice(self.tables["reward"]),
-            "chaos": random.choice(self.tables["chaos"])
+            "archetype": self.rng.choice(self.tables["archetype"]),
+            "subject": self.rng.choice(self.tables["subject"]),
+            "context": self.rng.choice(self.tables["context"]),
+            "reward": self.rng.choice(self.tables["reward"]),
+            "chaos": self.rng.choice(self.tables["chaos"])
         }
 
         # AI Narrative Construction
@@ -103,7 +101,7 @@ class EventEngine:
         setup = []
         
         if "Hostile" in archetype:
-            setup.append({"type": "ENEMY_SPAWN", "count": random.randint(1, 3)})
+            setup.append({"type": "ENEMY_SPAWN", "count": self.rng.randint(1, 3)})
         elif "Social" in archetype:
             setup.append({"type": "NPC_SPAWN", "subtype": rolls["subject"]["Subject"]})
         elif "Puzzle" in archetype:
@@ -114,7 +112,7 @@ class EventEngine:
 
         # Context-sensitive spawns
         context_str = rolls["context"]["Context"].lower()
-        if "trapped" in context_str or "locked" in context_str or random.random() < 0.3:
+        if "trapped" in context_str or "locked" in context_str or self.rng.random() < 0.3:
              self._inject_lock_key_puzzle(setup, context_str)
         elif "trapped" in context_str:
              setup.append({"type": "OBJECT_SPAWN", "subtype": "Locked Cage", "tags": ["unlock", "inspect", "open"], "is_blocking": True})
@@ -126,7 +124,7 @@ class EventEngine:
 
     def _inject_lock_key_puzzle(self, setup: List[Dict], context: str):
         """Injects a Key and a Locked Object into the setup."""
-        key_id = f"key_{random.randint(100, 999)}"
+        key_id = f"key_{self.rng.randint(100, 999)}"
         
         # 1. Create the Key (add to existing container or new one)
         # Try to find a Loot Cache or Enemy to hold the key
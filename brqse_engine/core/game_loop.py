@@ -1,11 +1,15 @@
 from typing import Dict, Any, Tuple, List
-import random
 import math
 import math
 import traceback
+import time
 import json
 import os
+from collections import deque
 from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat.pathfinding import DistanceField, PathGrid, NEIGHBOURS
+from brqse_engine.core.rng import RNGStreams
+from brqse_engine.core.actions import ActionSpec, EXPLORE_ACTIONS, COMBAT_ACTIONS, action, normalize_result
 from brqse_engine.world.map_generator import MapGenerator, TILE_WALL, TILE_FLOOR, TILE_LOOT, TILE_HAZARD, TILE_DOOR, TILE_ENTRANCE, TILE_TREE, TILE_ENEMY
 from brqse_engine.world.world_system import SceneStack, ChaosManager, Scene
 from brqse_engine.abilities import engine_hooks
@@ -18,6 +22,27 @@ from brqse_engine.world.donjon_generator import DonjonGenerator, Cell
 from brqse_engine.world.story_director import StoryDirector
 from brqse_engine.world.narrator import Narrator
 
+# Stand-in stats for map-file entities until they reference real beasts
+SCENE_PLACEHOLDER_ENEMY = {
+    "Name": "Enemy",
+    "HP": 20, # Placeholder
+    "Stats": {"Might": 12, "Reflexes": 10},
+    "Sprite": "badger_front.png"
+}
+
+# Player actions dispatch through the tables in core/actions.py (@action below)
+
+# Time-consuming exploration actions roll tension afterwards
+TENSION_ACTIONS = frozenset(["search", "disarm", "solve", "smash", "push", "vault", "climb", "pull", "open", "rest", "wait"])
+# Actions the simplified enemy phase answers when an exploration action started a fight
+ENEMY_RESPONSE_ACTIONS = frozenset(["move", "attack", "wait", "rest", "defend"])
+
+class _PlayerActor:
+    """The player as InteractionEngine sees it (a name and, for interact, the bag as Entities)."""
+    def __init__(self, name="Player", inventory=None):
+        self.name = name
+        self.inventory = inventory if inventory is not None else []
+
 class GameLoopController:
     """
     Manages the active game session:
@@ -26,13 +51,18 @@ class GameLoopController:
     - Scene Transitions
     """
     
-    def __init__(self, chaos_manager: ChaosManager, game_state: Any = None, sensory_layer: Any = None):
+    def __init__(self, chaos_manager: ChaosManager, game_state: Any = None, sensory_layer: Any = None, seed: Any = None):
+        # Session RNG: sub-streams for terrain, events and the simplified enemy attacks.
+        # Each CombatEngine gets its own seed from the "combat" stream.
+        self.rng = RNGStreams(seed)
+        self.seed = self.rng.seed
         self.chaos = chaos_manager
         self.game_state = game_state
         self.sensory_layer = sensory_layer
         self.scene_stack = SceneStack(self.chaos)
-        self.map_gen = MapGenerator(self.chaos)
-        self.combat_engine = CombatEngine(20, 20)
+        self.map_gen = MapGenerator(self.chaos, rng=self.rng.terrain)
+        self.combat_engine = CombatEngine(20, 20, seed=self.rng.child_seed("combat"))
+        self.action_stats = {}  # "mode:action" -> calls / total_ms / max_ms (see action_timings)
         
         # Initialize Logger
         self.logger = CampaignLogger()
@@ -59,6 +89,7 @@ class GameLoopController:
                          check_log_list.append(f"[Map] {subtype.capitalize()} Hazard at {tx},{ty}.")
         
         self.combat_engine.pending_world_updates.clear()
+        self.combat_engine.invalidate_visibility()  # Blocking geometry may have changed
 
     def _initialize_game_state(self, sensory_layer):
         # Initialize Narrator (AI DM)
@@ -72,11 +103,11 @@ class GameLoopController:
         self.interactables = {}
         self.explored_tiles = set()
         self.current_event = "SCENE_STARTED"
-        self.dice_log = []
+        self.dice_log = deque(maxlen=50)  # Only the latest rolls are shown
         
         # v2 Event System initialization
         data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../Data")
-        self.event_engine = EventEngine(data_dir)
+        self.event_engine = EventEngine(data_dir, rng=self.rng.stream("events"))
         self.journal = Journal()
         self.active_scenario = None
         self.is_event_resolved = True # Start resolved for the very first room
@@ -112,7 +143,7 @@ class GameLoopController:
             # Ensure we have a valid generator or return dummy
             if not hasattr(self, "map_gen"):
                 from brqse_engine.world.map_generator import MapGenerator
-                self.map_gen = MapGenerator(self.chaos)
+                self.map_gen = MapGenerator(self.chaos, rng=self.rng.terrain)
                 
             grid = self.map_gen._generate_shape("DUNGEON")
             grid, interactables = self.map_gen._furnish_biome(grid, "DUNGEON", scene.encounter_type)
@@ -121,7 +152,7 @@ class GameLoopController:
             # Hydrate
             self.active_scene = scene
             rows, cols = len(scene.grid), len(scene.grid[0])
-            self.combat_engine = CombatEngine(cols, rows)
+            self.combat_engine = CombatEngine(cols, rows, seed=self.rng.child_seed("combat"))
             
             for y, row in enumerate(scene.grid):
                 for x, tile in enumerate(row):
@@ -134,6 +165,7 @@ class GameLoopController:
             self._update_visibility()
             self._trigger_scene_entry_event()
             
+            self._close_group_planner()  # A fight left behind on the old map is over
             self.state = "EXPLORE"
             self.current_event = "SCENE_STARTED"
             return scene
@@ -151,8 +183,8 @@ class GameLoopController:
                 # Assuming ent["type"] maps to a filename like "orc_jailer"
                 # TODO: Real loader. For now, hacky generic.
                 
-                # Try spawning it via spawner to get stats
-                from brqse_engine.combat.enemy_spawner import spawner
+                # Try spawning it via the factory to get stats
+                from brqse_engine.combat.combatant_factory import factory
                 try:
                     # Map ASI type to filename key
                     fname = ent["type"] # e.g. "orc_jailer" or "BST_01"
@@ -161,12 +193,8 @@ class GameLoopController:
                     if not beast_id and "orc" in fname: beast_id = "BST_05" # Fallback mapping if old types exist
                     
                     # Spawn specific beast if ID is known, otherwise random for biome
-                    path = spawner.spawn_beast(beast_id=beast_id, biome="DUNGEON", level=1)
-                    with open(path, 'r') as f: enemy_data = json.load(f)
-                    
-                    enemy = Combatant(data=enemy_data)
-                    enemy.name = ent["name"]
-                    enemy.team = ent.get("team", "Enemies")
+                    enemy = factory.spawn_beast(beast_id=beast_id, biome="DUNGEON", level=1,
+                                                name=ent["name"], team=ent.get("team", "Enemies"))
                     
                     # INJECT ASI BRAIN
                     if "ai_context" in ent:
@@ -196,6 +224,7 @@ class GameLoopController:
         # Trigger Entry Event
         self._trigger_scene_entry_event()
         
+        self._close_group_planner()  # A fight left behind on the old map is over
         self.state = "EXPLORE"
         self.current_event = "SCENE_STARTED"
         return scene
@@ -294,16 +323,10 @@ class GameLoopController:
         self.combat_engine.combatants = [c for c in self.combat_engine.combatants if c.team == "Players"] 
         for ent in map_data.get("entities", []):
             game_grid[ent["y"]][ent["x"]] = TILE_ENEMY
-            # Spawn...
-            from brqse_engine.combat.mechanics import Combatant
-            c_data = {
-                "Name": ent["name"],
-                "HP": 20, # Placeholder
-                "Stats": {"Might": 12, "Reflexes": 10}, 
-                "Sprite": "badger_front.png"
-            }
-            c = Combatant(data=c_data)
-            c.team = "Enemies"
+            # Spawn... (every placeholder is the same unit: one prototype, renamed stamps)
+            from brqse_engine.combat.combatant_factory import factory
+            c = factory.from_data(SCENE_PLACEHOLDER_ENEMY, key="scene_placeholder",
+                                  name=ent["name"], team="Enemies")
             c.ai_context = ent.get("ai_context")
             self.combat_engine.add_combatant(c, ent["x"], ent["y"])
             
@@ -422,15 +445,12 @@ class GameLoopController:
                 result["log"] += " (The conceptual weight of the event collapses. The path opens.)"
             return
 
-        sx, sy = random.choice(spots)
+        sx, sy = self.rng.stream("events").choice(spots)
 
         if etype == "ENEMY_SPAWN":
-            from brqse_engine.combat.enemy_spawner import spawner
+            from brqse_engine.combat.combatant_factory import factory
             
-            path = spawner.spawn_beast(biome=getattr(self.active_scene, 'biome', 'DUNGEON'), level=1)
-            with open(path, 'r') as f: enemy_data = json.load(f)
-            enemy = Combatant(data=enemy_data)
-            enemy.team = "Enemies"
+            enemy = factory.spawn_beast(biome=getattr(self.active_scene, 'biome', 'DUNGEON'), level=1, team="Enemies")
             # Propagate Key Data to Enemy
             if setup_item.get("has_key"):
                 enemy.has_key = setup_item["has_key"]
@@ -488,89 +508,73 @@ class GameLoopController:
             except Exception as e:
                  print(f"Error loading staged battle: {e}")
 
+    # === ACTION DISPATCH ===
+
     def handle_action(self, action_type: str, x: int, y: int, **kwargs) -> Dict[str, Any]:
-        """Generic handler for player intent."""
+        """Generic handler for player intent: one table lookup in the current mode's action table."""
         # Clear Replay Log for fresh events
+        replay = self.combat_engine.replay_log
+        replay.clear()
+        start = time.perf_counter()
+
+        # Capture every combat event of this action for animations (the ring alone may drop some)
+        with replay.capture() as events:
+            if self.state == "COMBAT":
+                mode, spec = "combat", COMBAT_ACTIONS.get(action_type, COMBAT_PASS)
+                result = self._handle_combat_action(spec, action_type, x, y, kwargs)
+            else:
+                mode, spec = "explore", EXPLORE_ACTIONS.get(action_type) or self._ability_spec(action_type)
+                result = self._handle_exploration_action(spec, action_type, x, y, kwargs)
+        result = normalize_result(result, action_type)
+
+        if self.combat_engine.replay_log is not replay:
+            events = list(self.combat_engine.replay_log)  # The action loaded a new scene / engine
+        if events:
+            result["events"] = events
         self.combat_engine.replay_log.clear()
 
-        if self.state == "COMBAT":
-            result = self._handle_combat_action(action_type, x, y)
-        else:
-            result = self._handle_exploration_action(action_type, x, y, **kwargs)
-        
-        # Capture Combat Events for Animations
-        if self.combat_engine.replay_log:
-            result["events"] = list(self.combat_engine.replay_log)
-            self.combat_engine.replay_log.clear()
-            
+        self._record_timing(f"{mode}:{spec.name if spec else 'unknown'}", time.perf_counter() - start)
         return result
 
-    def _handle_exploration_action(self, action_type: str, x: int, y: int, **kwargs) -> Dict[str, Any]:
-        """Original handle_action logic for EXPLORE mode, separated for clarity."""
-        if action_type in ["cast", "ability", "skill"]:
-            ability_name = kwargs.get("ability") or kwargs.get("name")
-            target_entity = None
-            if x is not None and y is not None:
-                # Resolve target at x,y
-                # Could be combatant or interactable
-                target_combatant = self.combat_engine.get_combatant_at(x, y)
-                # If target is combatant, use it. usage might trigger combat?
-                # For non-combat spells (Heal), it's fine.
-                if target_combatant:
-                    # Generic activate
-                    log = self.combat_engine.activate_ability(self.player_combatant, ability_name, target_combatant)
-                    self._process_world_updates(log)
-                    return {"success": True, "log": " ".join(log)}
-            
-            # If no target or self-cast
-            target_pos_kwargs = {}
-            if x is not None and y is not None:
-                target_pos_kwargs = {"target_pos": (x,y)}
-                
-            log = self.combat_engine.activate_ability(self.player_combatant, ability_name, None, **target_pos_kwargs)
-            self._process_world_updates(log)
-            return {"success": True, "log": " ".join(log)}
-
-        # [NEW] INVENTORY EQUIP
-        if action_type == "equip":
-            item_name = kwargs.get("item") or kwargs.get("name")
-            if not item_name and x is not None: item_name = str(x) # Fallback if passed as positional
-            
-            # Simple fuzzy finder or exact match from bag
-            found_in_bag = False
-            for item in self.inventory:
-                if item.get("name", "").lower() == item_name.lower():
-                    found_in_bag = True
-                    item_name = item["name"] # Use canonical name
-                    break
-            
-            # Allow equipping even if not in bag? (For testing/cheating). 
-            # Or strictly enforce bag? Let's check bag first.
-            # actually user might just say 'equip sword' and rely on auto-find.
-            
-            if self.player_combatant and self.player_combatant.inventory:
-                success = self.player_combatant.inventory.equip(item_name)
-                if success:
-                    # Determine what slot it went to for log
-                    slot = "Main Hand" # Default assumption
-                    item_obj = self.player_combatant.inventory.db.get(item_name)
-                    if item_obj and item_obj.get("Type") == "Armor": slot = "Armor"
-                    elif item_obj and "Shield" in item_obj.get("Logic_Tags", ""): slot = "Off Hand"
-                    
-                    # LOG DEFENSE CHANGE
-                    msg = f"Equipped {item_name} to {slot}."
-                    if slot == "Armor":
-                        def_stat = self.player_combatant.inventory.get_defense_stat()
-                        msg += f" Defense now uses {def_stat}."
-                        
-                    return {"success": True, "log": msg}
-                else:
-                    return {"success": False, "log": f"Could not equip '{item_name}'. (Item likely not in DB)"}
-            else:
-                 return {"success": False, "log": "Player has no Inventory System."}
+    def _record_timing(self, key, seconds):
+        stats = self.action_stats.get(key)
+        if stats is None:
+            stats = self.action_stats[key] = {"calls": 0, "total_ms": 0.0, "max_ms": 0.0}
+        ms = seconds * 1000
+        stats["calls"] += 1
+        stats["total_ms"] += ms
+        stats["max_ms"] = max(stats["max_ms"], ms)
+
+    def action_timings(self) -> List[Dict[str, Any]]:
+        """Per-action latency since start-up, the actions that cost the most in total first."""
+        rows = [{"action": key, "calls": s["calls"], "total_ms": round(s["total_ms"], 3),
+                 "mean_ms": round(s["total_ms"] / s["calls"], 3), "max_ms": round(s["max_ms"], 3)}
+                for key, s in self.action_stats.items()]
+        rows.sort(key=lambda r: r["total_ms"], reverse=True)
+        return rows
+
+    def _ability_spec(self, action_type):
+        """Spec for a power / skill the player knows, used as `action_type` directly ("mend")."""
+        character = getattr(self.player_combatant, "character", None)
+        if character is None:
+            return None
+        known = [a.lower() for a in character.powers] + [s.lower() for s in character.skills]
+        return KNOWN_ABILITY if action_type in known else None
+
+    def _handle_exploration_action(self, spec, action_type: str, x: int, y: int, kwargs) -> Dict[str, Any]:
+        """EXPLORE mode: lock / facing, the action's handler, then the shared after-action phase."""
+        if spec is not None and not spec.locked:
+            problem = spec.validate(x, y, kwargs, self._map_bounds())
+            if problem: return {"success": False, "reason": problem}
+            return spec.handler(self, action_type, x, y, **kwargs)
 
         if self.state != "EXPLORE": return {"success": False, "reason": "Locked"}
 
+        if spec is None:
+            return {"success": False, "reason": f"Unknown action: {action_type}"}
+        problem = spec.validate(x, y, kwargs, self._map_bounds())
+        if problem: return {"success": False, "reason": problem}
+
         # Update Facing for all actions (only if coords provided)
         if x is not None and y is not None:
             px, py = self.player_pos
@@ -579,409 +583,379 @@ class GameLoopController:
             elif y > py: self._set_facing("S")
             elif y < py: self._set_facing("N")
 
-        result = {"success": True, "action": action_type}
-        
-        # --- NEW: Inspector ---
-        if action_type == "debug_inspect":
-            self._debug_inspect_room(x, y)
-            return {"success": True, "log": "Inspector triggered. Check console."}
-
-        # --- NEW: Interaction Engine Integration ---
-        # Map specific actions to generic 'interact' or handle legacy logic via tags
-        
-        # Get target object (if any)
-        # Note: In new system, objects should be Entity instances. 
-        # For now, we wrap legacy dicts into Entity on the fly OR rely on InteractionEngine 
-        # to handle dicts if we updated it (we didn't, so let's stick to dicts for now 
-        # but the InteractionEngine expects objects with .has_tag).
-        
-        # BRIDGE: Convert dict object to Entity-like wrapper for InteractionEngine
-        obj_data = self.interactables.get((x, y))
-        obj = obj_data # [FIX] Alias for legacy code blocks using 'obj'
-        target_entity = None
-        if obj_data:
-            from brqse_engine.models.entity import Entity
-            target_entity = Entity(obj_data.get("name", "Unknown"), x, y)
-            # Hydrate tags
-            for tag in obj_data.get("tags", []): target_entity.add_tag(tag)
-            # Hydrate specific properties as data or tags
-            if obj_data.get("is_locked"): target_entity.add_tag("locked")
-            if obj_data.get("required_key"): 
-                target_entity.data["required_key"] = obj_data["required_key"]
-            if obj_data.get("has_key"):
-                target_entity.add_tag("pickup") # Or specific tag?
-                target_entity.data["pickup_item_id"] = obj_data["has_key"]
-                target_entity.data["pickup_item_name"] = obj_data["key_name"]
-
-        if action_type == "attack":
-             # Transition to Combat if target is enemy
-             target = self.combat_engine.get_combatant_at(x, y)
-             if target and target.team != "Player":
-                 self.state = "COMBAT"
-                 result["log"] = f"Combat Started! {target.name} engages."
-                 result["event"] = "COMBAT_STARTED"
-                 # Execute the attack immediately as opener?
-                 # No, let them have initiative roll or just start combat.
-                 # Actually user wants to attack. Let's make it an opener.
-                 log_lines = self.combat_engine.attack_target(self.player_combatant, target)
-                 result["log"] += " " + " ".join(log_lines)
-                 return result
-             else:
-                 return {"success": False, "reason": "Nothing to attack here."}
-
-        # [NEW] TALK
-        if action_type == "talk":
-             if target_entity:
-                 # Player Actor
-                 class ActorWrapper:
-                     def __init__(self, name): self.name = name
-                 actor = ActorWrapper(self.player_combatant.name if self.player_combatant else "Player")
-                 
-                 # Extract input text if any
-                 user_input = kwargs.get("input") or kwargs.get("text") or "Hello."
-                 
-                 log = self.interaction.talk(actor, target_entity, user_input)
-                 result["log"] = log
-                 
-                 # [NEW] Return structured Dialogue Data for UI
-                 result["dialogue"] = {
-                     "speaker": target_entity.name,
-                     "text": log,
-                     "archetype": target_entity.data.get("archetype", "Unknown")
-                 }
-                 
-                 # Check for critical events triggered by talking
-                 # e.g. "TALKED_TO_NPC" win condition
-                 if self.active_scenario and self.active_scenario["win_condition"]["type"] == "TALKED_TO_NPC":
-                     # Check if it's the RIGHT NPC?
-                     # For now, any social interaction counts if the condition is generic
-                     self._resolve_active_event("Negotiated")
-             else:
-                 result["log"] = "No one to talk to here."
-
-        # 1. MOVE
-        if action_type == "move":
-            move_res = self._process_move(x, y)
-            if not move_res.get("success"): return move_res
-            result.update(move_res)
-            if "log" not in result: result["log"] = f"Moved to {x}, {y}."
-            
-        # 2. INTERACT / USE / OPEN / GET
-        elif action_type in ["interact", "use", "open", "get", "pickup"]:
-            if target_entity:
-                # Wrap Player as Actor
-                # We need a dummy actor that has 'inventory'
-                class ActorWrapper:
-                    def __init__(self, inventory): self.inventory = inventory
-                
-                # Convert self.inventory (list of dicts) to list of Entities for consistency?
-                # InteractionEngine expects actors inventory to be objects with tags/data.
-                # Let's wrap the inventory items too.
-                actor_inv = []
-                for item in self.inventory:
-                     e = Entity(item["name"], 0, 0)
-                     e.data["id"] = item["id"]
-                     e.add_tag(item["id"]) # ID as tag for easy lookup
-                     actor_inv.append(e)
-                
-                actor = ActorWrapper(actor_inv)
-                
-                # PERFORM INTERACTION
-                log = self.interaction.interact(actor, target_entity)
-                result["log"] = log
-                
-                # SYNC BACK STATE
-                # If unlocked...
-                if not target_entity.has_tag("locked") and obj_data.get("is_locked"):
-                    obj_data["is_locked"] = False
-                    # Update tags in map data
-                    if "locked" in obj_data.get("tags", []): obj_data["tags"].remove("locked")
-                    
-                # If picked up...
-                if target_entity.has_tag("carried"):
-                    # Remove from world
-                    del self.interactables[(x, y)]
-                    self.active_scene.grid[y][x] = TILE_FLOOR
-                    # Add to real inventory
-                    if "pickup_item_id" in target_entity.data:
-                         self.inventory.append({
-                             "id": target_entity.data["pickup_item_id"],
-                             "name": target_entity.data["pickup_item_name"]
-                         })
-            else:
-                 result["log"] = "Nothing to interact with here."
-
-        # 3. EXAMINE (Narrative Detailed Look)
-        elif action_type == "examine":
-            if target_entity:
-                # 1. Get History Context
-                depth = getattr(self.active_scene, "depth", 1)
-                logs = self.logger.get_context(level=depth)
-                # 2. Consult InteractionEngine (which asks Oracle)
-                result["log"] = self.interaction.examine(target_entity, logs)
-            else:
-                 result["log"] = "You see nothing of interest here."
-
-        # 4. CONSULT (Chatbot)
-        elif action_type == "consult":
-             # Payload "query" should be in the kwargs or extra args, 
-             # but handle_action signature is (action, x, y). 
-             # We might need to assume 'consult' is triggered with a special x,y or just ignore them 
-             # and look for a way to pass query.
-             # Actually, let's assume the query is passed via a property on self temporarily set 
-             # or we change handle_action signature.
-             # Given constraints, let's assume we use a 'last_query' state or similar if inputs are restricted.
-             # OR: abuse X/Y or rely on a separate method. 
-             # BUT: The requirement was to add it to handle_action.
-             # Let's pivot: If action="consult", we expect the input string to be passed somehow.
-             # We will look for it in `self.game_state.last_chat_input` if we had one, or ...
-             # Hack: We'll allow the caller to pass it as 'x' if type is string? No 'x' is int tag.
-             pass # Placeholder until better input hook defined, handled separate loop usually.
-
-        # 5. INSPECT (Technical Tag Dump)
-        elif action_type == "inspect":
-            if target_entity:
-                tags = sorted(list(target_entity.tags))
-                result["log"] = f"[DEBUG] {target_entity.name} Tags: {tags}"
-            else:
-                 result["log"] = "An ordinary patch of ground."
-
+        result = spec.handler(self, action_type, x, y, **kwargs)
+        if spec.finishes(result):
+            self._finish_exploration_action(action_type, result)
+        return result
 
-        
+    def _map_bounds(self):
+        """(width, height) of the tiles actions may target: the scene grid, else the combat grid."""
+        grid = getattr(self.active_scene, "grid", None)
+        if grid:
+            return len(grid[0]), len(grid)
+        return self.combat_engine.cols, self.combat_engine.rows
 
+    def _target_at(self, x, y):
+        """(map dict, Entity wrapper) for the interactable at x,y, or (None, None)."""
+        # BRIDGE: InteractionEngine expects objects with .has_tag, map data is still plain dicts
+        obj_data = self.interactables.get((x, y))
+        if not obj_data:
+            return None, None
+        from brqse_engine.models.entity import Entity
+        target_entity = Entity(obj_data.get("name", "Unknown"), x, y)
+        # Hydrate tags
+        for tag in obj_data.get("tags", []): target_entity.add_tag(tag)
+        # Hydrate specific properties as data or tags
+        if obj_data.get("is_locked"): target_entity.add_tag("locked")
+        if obj_data.get("required_key"):
+            target_entity.data["required_key"] = obj_data["required_key"]
+        if obj_data.get("has_key"):
+            target_entity.add_tag("pickup") # Or specific tag?
+            target_entity.data["pickup_item_id"] = obj_data["has_key"]
+            target_entity.data["pickup_item_name"] = obj_data["key_name"]
+        return obj_data, target_entity
+
+    # === EXPLORATION ACTIONS ===
+
+    @action(EXPLORE_ACTIONS, "cast", "ability", "skill", args=("ability", "name"), locked=False, finish=False)
+    def _explore_cast(self, action_type, x, y, **kwargs):
+        ability_name = kwargs.get("ability") or kwargs.get("name")
+        if x is not None and y is not None:
+            # Resolve target at x,y. For non-combat spells (Heal) on a combatant, no combat starts.
+            target_combatant = self.combat_engine.get_combatant_at(x, y)
+            if target_combatant:
+                log = self.combat_engine.activate_ability(self.player_combatant, ability_name, target_combatant)
+                self._process_world_updates(log)
+                return {"success": True, "log": " ".join(log)}
+
+        # If no target or self-cast
+        target_pos_kwargs = {}
+        if x is not None and y is not None:
+            target_pos_kwargs = {"target_pos": (x,y)}
+
+        log = self.combat_engine.activate_ability(self.player_combatant, ability_name, None, **target_pos_kwargs)
+        self._process_world_updates(log)
+        return {"success": True, "log": " ".join(log)}
+
+    @action(EXPLORE_ACTIONS, "equip", locked=False, finish=False)
+    def _explore_equip(self, action_type, x, y, **kwargs):
+        item_name = kwargs.get("item") or kwargs.get("name")
+        if not item_name and x is not None: item_name = str(x) # Fallback if passed as positional
+        if not item_name:
+            return {"success": False, "reason": "equip needs one of: item, name."}
+
+        # Use the canonical name if the item is in the bag (equipping outside the bag is allowed)
+        for item in self.inventory:
+            if item.get("name", "").lower() == item_name.lower():
+                item_name = item["name"]
+                break
 
-        
+        if self.player_combatant and self.player_combatant.inventory:
+            success = self.player_combatant.inventory.equip(item_name)
+            if success:
+                # Determine what slot it went to for log
+                slot = "Main Hand" # Default assumption
+                item_obj = self.player_combatant.inventory.db.get(item_name)
+                if item_obj and item_obj.get("Type") == "Armor": slot = "Armor"
+                elif item_obj and "Shield" in item_obj.get("Logic_Tags", ""): slot = "Off Hand"
+
+                # LOG DEFENSE CHANGE
+                msg = f"Equipped {item_name} to {slot}."
+                if slot == "Armor":
+                    def_stat = self.player_combatant.inventory.get_defense_stat()
+                    msg += f" Defense now uses {def_stat}."
+
+                return {"success": True, "log": msg}
+            else:
+                return {"success": False, "log": f"Could not equip '{item_name}'. (Item likely not in DB)"}
+        else:
+             return {"success": False, "log": "Player has no Inventory System."}
 
+    @action(EXPLORE_ACTIONS, "attack", target=True, finish=False)
+    def _explore_attack(self, action_type, x, y, **kwargs):
+        # Transition to Combat if target is enemy; the attack itself is the opener
+        target = self.combat_engine.get_combatant_at(x, y)
+        if target and target.team != "Player":
+            self.state = "COMBAT"
+            result = {"success": True, "action": action_type, "event": "COMBAT_STARTED",
+                      "log": f"Combat Started! {target.name} engages."}
+            log_lines = self.combat_engine.attack_target(self.player_combatant, target)
+            result["log"] += " " + " ".join(log_lines)
+            return result
+        return {"success": False, "reason": "Nothing to attack here."}
+
+    @action(EXPLORE_ACTIONS, "move", target=True, finish="success")
+    def _explore_move(self, action_type, x, y, **kwargs):
+        move_res = self._process_move(x, y)
+        if not move_res.get("success"): return move_res
+        result = {"success": True, "action": action_type}
+        result.update(move_res)
+        if "log" not in result: result["log"] = f"Moved to {x}, {y}."
+        return result
 
+    @action(EXPLORE_ACTIONS, "interact", "use", "open", "get", "pickup", target=True)
+    def _explore_interact(self, action_type, x, y, **kwargs):
+        obj_data, target_entity = self._target_at(x, y)
+        if not target_entity:
+            return {"success": True, "action": action_type, "log": "Nothing to interact with here."}
+
+        # InteractionEngine expects inventory items as Entities with tags/data
+        from brqse_engine.models.entity import Entity
+        actor_inv = []
+        for item in self.inventory:
+             e = Entity(item["name"], 0, 0)
+             e.data["id"] = item["id"]
+             e.add_tag(item["id"]) # ID as tag for easy lookup
+             actor_inv.append(e)
+
+        log = self.interaction.interact(_PlayerActor(inventory=actor_inv), target_entity)
+        result = {"success": True, "action": action_type, "log": log}
+
+        # SYNC BACK STATE
+        # If unlocked...
+        if not target_entity.has_tag("locked") and obj_data.get("is_locked"):
+            obj_data["is_locked"] = False
+            # Update tags in map data
+            if "locked" in obj_data.get("tags", []): obj_data["tags"].remove("locked")
+
+        # If picked up...
+        if target_entity.has_tag("carried"):
+            # Remove from world
+            del self.interactables[(x, y)]
+            self.active_scene.grid[y][x] = TILE_FLOOR
+            # Add to real inventory
+            if "pickup_item_id" in target_entity.data:
+                 self.inventory.append({
+                     "id": target_entity.data["pickup_item_id"],
+                     "name": target_entity.data["pickup_item_name"]
+                 })
+        return result
 
+    @action(EXPLORE_ACTIONS, "talk", target=True)
+    def _explore_talk(self, action_type, x, y, **kwargs):
+        obj_data, target_entity = self._target_at(x, y)
+        if not obj_data or "talk" not in obj_data.get("tags", []):
+            return {"success": False, "reason": "Nobody to talk to"}
+
+        speaker = obj_data.get("name") or obj_data.get("type", "Stranger")
+        if target_entity.has_tag("npc"):
+            # Persona NPCs: InteractionEngine asks the Oracle to speak as them
+            actor = _PlayerActor(self.player_combatant.name if self.player_combatant else "Player")
+            user_input = kwargs.get("input") or kwargs.get("text") or "Hello."
+            text = self.interaction.talk(actor, target_entity, user_input)
+            log = text
+        elif self.sensory_layer:
+            # Scenario NPCs (NPC_SPAWN): SOCIAL narrative, steered by the quest's dialogue_context
+            ai_context = {
+                "actor_name": "Player",
+                "target_name": obj_data["type"],
+                "method": "Diplomacy",
+                "defense": "Unknown",
+                "result": "Success"
+            }
+            context_data = self.chaos.get_atmosphere()
+            context_data["inventory"] = [i["name"] for i in self.inventory]
+
+            narrative = self.sensory_layer.generate_narrative(
+                context=context_data,
+                event_type="SOCIAL",
+                combat_data=ai_context,
+                quest_context=obj_data.get("dialogue_context")
+            )
+            if isinstance(narrative, dict) and "narrative" in narrative:
+                text = narrative["narrative"]
+                log = f"Dialogue: {text}"
+            else:
+                text = "We must survive."
+                log = f"The {obj_data['type']} speaks: '{text}'"
+        else:
+            text = "Fortune favors the bold!"
+            log = f"The {obj_data['type']} speaks: '{text}'"
+
+        result = {
+            "success": True, "action": action_type, "log": log,
+            # Structured Dialogue Data for UI
+            "dialogue": {
+                "speaker": speaker,
+                "text": text,
+                "archetype": obj_data.get("archetype") or target_entity.data.get("archetype", "Unknown")
+            }
+        }
 
+        # Any social interaction counts if the win condition is generic
+        if self.active_scenario and self.active_scenario["win_condition"]["type"] == "TALKED_TO_NPC":
+            self._resolve_active_event("Negotiated")
+        return result
 
+    @action(EXPLORE_ACTIONS, "examine")
+    def _explore_examine(self, action_type, x, y, **kwargs):
+        # Narrative detailed look: InteractionEngine asks the Oracle, with this level's history
+        _, target_entity = self._target_at(x, y)
+        if not target_entity:
+            return {"success": True, "action": action_type, "log": "You see nothing of interest here."}
+        depth = getattr(self.active_scene, "depth", 1)
+        logs = self.logger.get_context(level=depth)
+        return {"success": True, "action": action_type, "log": self.interaction.examine(target_entity, logs)}
+
+    @action(EXPLORE_ACTIONS, "consult")
+    def _explore_consult(self, action_type, x, y, **kwargs):
+        # Chatbot: the query goes through its own endpoint, nothing to do on the map
+        return {"success": True, "action": action_type}
+
+    @action(EXPLORE_ACTIONS, "inspect")
+    def _explore_inspect(self, action_type, x, y, **kwargs):
+        # Technical tag dump
+        _, target_entity = self._target_at(x, y)
+        if not target_entity:
+            return {"success": True, "action": action_type, "log": "An ordinary patch of ground."}
+        tags = sorted(list(target_entity.tags))
+        return {"success": True, "action": action_type, "log": f"[DEBUG] {target_entity.name} Tags: {tags}"}
+
+    @action(EXPLORE_ACTIONS, "solve", target=True)
+    def _explore_solve(self, action_type, x, y, **kwargs):
+        obj = self.interactables.get((x, y))
+        if not (obj and "solve" in obj.get("tags", [])):
+            return {"success": False, "reason": "Nothing to solve"}
+        result = {"success": True, "action": action_type,
+                  "log": f"You concentrate and solve the {obj['type']}! A mechanism clicks."}
+        if self.active_scenario and self.active_scenario["win_condition"]["type"] == "PUZZLE_SOLVED":
+            self._resolve_active_event("Solved")
+        del self.interactables[x, y]
+        self.active_scene.grid[y][x] = TILE_FLOOR
+        return result
 
-        # 3. EXAMINE (Narrative detailed look)
-        elif action_type == "examine":
-            if target_entity:
-                # 1. Get History Context
-                depth = getattr(self.active_scene, "depth", 1)
-                logs = self.logger.get_context(level=depth)
-                # 2. Consult InteractionEngine (which asks Oracle)
-                result["log"] = self.interaction.examine(target_entity, logs)
-            else:
-                 result["log"] = "You see nothing of interest here."
-        
-        # 4. CONSULT (Chatbot)
-        elif action_type == "consult":
-             # Placeholder until better input hook defined
-             pass 
+    @action(EXPLORE_ACTIONS, "smash", target=True)
+    def _explore_smash(self, action_type, x, y, **kwargs):
+        obj = self.interactables.get((x, y))
+        if not (obj and "smash" in obj.get("tags", [])):
+            return {"success": False, "reason": "Fail"}
+        self.active_scene.grid[y][x] = TILE_FLOOR
+        del self.interactables[x,y]
+        return {"success": True, "action": action_type, "log": f"Smashed {obj['type']}!"}
+
+    @action(EXPLORE_ACTIONS, "push", target=True)
+    def _explore_push(self, action_type, x, y, **kwargs):
+        obj = self.interactables.get((x, y))
+        if not (obj and "push" in obj.get("tags", [])):
+            return {"success": False, "reason": "Cannot push this"}
+        px, py = self.player_pos
+        tx, ty = x + (x - px), y + (y - py)
+        # Check landing spot
+        if not (0 <= tx < 20 and 0 <= ty < 20 and self.active_scene.grid[ty][tx] == TILE_FLOOR and (tx, ty) not in self.interactables):
+            return {"success": False, "reason": "Blocked"}
+        # Move the object
+        self.interactables[tx, ty] = obj
+        del self.interactables[x, y]
+        obj["x"], obj["y"] = tx, ty
+        # Update grid representation
+        self.active_scene.grid[y][x] = TILE_FLOOR
+        self.active_scene.grid[ty][tx] = TILE_LOOT
+        return {"success": True, "action": action_type, "log": f"Pushed the {obj['type']} forward."}
+
+    @action(EXPLORE_ACTIONS, "vault", target=True)
+    def _explore_vault(self, action_type, x, y, **kwargs):
+        obj = self.interactables.get((x, y))
+        if not (obj and "vault" in obj.get("tags", [])):
+            return {"success": False, "reason": "Cannot vault this"}
+        px, py = self.player_pos
+        tx, ty = x + (x - px), y + (y - py)
+        # Check landing spot past the object
+        if not (0 <= tx < 20 and 0 <= ty < 20 and self.active_scene.grid[ty][tx] == TILE_FLOOR and (tx, ty) not in self.interactables):
+            return {"success": False, "reason": "No landing space"}
+        self.player_pos = (tx, ty)
+        if self.player_combatant: self.player_combatant.elevation = 0
+        self._update_visibility()
+        return {"success": True, "action": action_type, "log": f"Vaulted over the {obj['type']}!"}
 
-        elif action_type == "track":
-             result = self._handle_track_action(x, y)
-             
-        elif action_type == "solve":
-            if obj and "solve" in obj.get("tags", []):
-                result["log"] = f"You concentrate and solve the {obj['type']}! A mechanism clicks."
-                if self.active_scenario and self.active_scenario["win_condition"]["type"] == "PUZZLE_SOLVED":
-                    self._resolve_active_event("Solved")
-                del self.interactables[x, y]
-                self.active_scene.grid[y][x] = TILE_FLOOR
-            else: result = {"success": False, "reason": "Nothing to solve"}
-
-        elif action_type == "smash":
-            if obj and "smash" in obj.get("tags", []):
-                result["log"] = f"Smashed {obj['type']}!"
-                self.active_scene.grid[y][x] = TILE_FLOOR
-                del self.interactables[x,y]
-            else: result = {"success": False, "reason": "Fail"}
-            
-        elif action_type == "push":
-            if obj and "push" in obj.get("tags", []):
-                dx, dy = x - px, y - py
-                tx, ty = x + dx, y + dy
-                # Check landing spot
-                if 0 <= tx < 20 and 0 <= ty < 20 and self.active_scene.grid[ty][tx] == TILE_FLOOR and (tx, ty) not in self.interactables:
-                    # Move the object
-                    self.interactables[tx, ty] = obj
-                    del self.interactables[x, y]
-                    obj["x"], obj["y"] = tx, ty
-                    # Update grid representation
-                    self.active_scene.grid[y][x] = TILE_FLOOR
-                    self.active_scene.grid[ty][tx] = TILE_LOOT
-                    result["log"] = f"Pushed the {obj['type']} forward."
-                else:
-                    result = {"success": False, "reason": "Blocked"}
-            else: result = {"success": False, "reason": "Cannot push this"}
-
-        elif action_type == "vault":
-            if obj and "vault" in obj.get("tags", []):
-                dx, dy = x - px, y - py
-                tx, ty = x + dx, y + dy
-                # Check landing spot past the object
-                if 0 <= tx < 20 and 0 <= ty < 20 and self.active_scene.grid[ty][tx] == TILE_FLOOR and (tx, ty) not in self.interactables:
-                    self.player_pos = (tx, ty)
-                    if self.player_combatant: self.player_combatant.elevation = 0
-                    result["log"] = f"Vaulted over the {obj['type']}!"
-                    self._update_visibility()
-                else:
-                    result = {"success": False, "reason": "No landing space"}
-            else: result = {"success": False, "reason": "Cannot vault this"}
-
-        elif action_type in ["climb", "pull", "flip", "open"]:
-            if obj and action_type in obj.get("tags", []):
-                result["log"] = f"{action_type.capitalize()}ed the {obj['type']}."
-                if action_type == "climb" and "elevation" in obj.get("tags", []):
-                    self.player_pos = (x, y)
-                    if self.player_combatant: self.player_combatant.elevation = 1
-                    self._update_visibility()
-                
-                elif action_type == "unlock":
-                    if obj.get("required_key"):
-                         has_key = any(k["id"] == obj["required_key"] for k in self.inventory)
-                         if has_key:
-                             result["log"] = f"You unlock the {obj['type']}."
-                             obj["is_locked"] = False
-                             if obj.get("is_blocking"): obj["is_blocking"] = False
-                         else:
-                             result["log"] = "It won't budge. You need a key."
-                    elif obj["type"] == "Cage":
-                        result["log"] = "You free a traveler! They reward you with a scrap of map."
-                        del self.interactables[x,y]
-                        self.active_scene.grid[y][x] = TILE_FLOOR
-
-                        self.active_scene.grid[y][x] = TILE_FLOOR
-
-        elif action_type == "use":
-            # Map generic use to contextual actions
-            if not obj:
-                 result = {"success": False, "reason": "Nothing to use"}
-            else:
-                tags = obj.get("tags", [])
-                if "solve" in tags:
-                    return self.handle_action("solve", x, y)
-                elif "open" in tags:
-                     return self.handle_action("open", x, y)
-                elif "unlock" in tags:
-                     return self.handle_action("unlock", x, y)
-                elif "talk" in tags:
-                     return self.handle_action("talk", x, y)
-                else:
-                     result = {"success": False, "reason": "Can't use this."}
-
-        elif action_type == "talk":
-            if obj and "talk" in obj.get("tags", []):
-                if self.sensory_layer:
-                    # AI Dialogue Generation
-                    ai_context = {
-                        "actor_name": "Player",
-                        "target_name": obj['type'],
-                        "method": "Diplomacy",
-                        "defense": "Unknown",
-                        "result": "Success"
-                    }
-                    context_data = self.chaos.get_atmosphere()
-                    context_data["inventory"] = [i["name"] for i in self.inventory]
-                    
-                    narrative = self.sensory_layer.generate_narrative(
-                        context=context_data, 
-                        event_type="SOCIAL", 
-                        combat_data=ai_context,
-                        quest_context=obj.get("dialogue_context")
-                    )
-                    if "narrative" in narrative:
-                         result["log"] = f"Dialogue: {narrative['narrative']}"
-                    else:
-                         result["log"] = f"The {obj['type']} speaks: 'We must survive.'"
-                else:
-                    result["log"] = f"The {obj['type']} speaks: 'Fortune favors the bold!'"
+    @action(EXPLORE_ACTIONS, "climb", "pull", "flip", target=True)
+    def _explore_manipulate(self, action_type, x, y, **kwargs):
+        result = {"success": True, "action": action_type}
+        obj = self.interactables.get((x, y))
+        if obj and action_type in obj.get("tags", []):
+            result["log"] = f"{action_type.capitalize()}ed the {obj['type']}."
+            if action_type == "climb" and "elevation" in obj.get("tags", []):
+                self.player_pos = (x, y)
+                if self.player_combatant: self.player_combatant.elevation = 1
+                self._update_visibility()
+        return result
 
-                if self.active_scenario and self.active_scenario["win_condition"]["type"] == "TALKED_TO_NPC":
-                    self._resolve_active_event("Negotiated/Contacted")
-            else: result = {"success": False, "reason": "Nobody to talk to"}
-        
-        elif action_type == "wait" or action_type == "rest":
-            result["log"] = "You take a moment to steady your breath."
+    @action(EXPLORE_ACTIONS, "wait", "rest")
+    def _explore_rest(self, action_type, x, y, **kwargs):
+        if self.player_combatant:
+            self.player_combatant.hp = min(self.player_combatant.hp + 1, self.player_combatant.max_hp)
+        return {"success": True, "action": action_type, "log": "You take a moment to steady your breath."}
+
+    @action(EXPLORE_ACTIONS, "channel")
+    def _explore_channel(self, action_type, x, y, **kwargs):
+        # CHAOS CHANNELING (Separate Mechanic)
+        if not self.chaos:
+            return {"success": False, "reason": "No Chaos Manager"}
+        # Roll d10 vs Chaos Level (Design Bible IV)
+        roll = self.rng.stream("events").randint(1, 10)
+        level = self.chaos.chaos_level
+        result = {"success": True, "action": action_type, "log": f"Channeling Chaos... Rolled {roll} vs Level {level}."}
+
+        # Roll > Level (High Roll vs Difficulty)
+        if roll > level:
+            # Success: Manifest Effect
+            # TODO: Add specific spell selection? For now, just a generic blast or mana restore
+            result["log"] += " SUCCESS! Pure chaos energy surges under your control."
             if self.player_combatant:
-                self.player_combatant.hp = min(self.player_combatant.hp + 1, self.player_combatant.max_hp)
-
-        elif action_type == "channel":
-            # CHAOS CHANNELING (Separate Mechanic)
-            if not self.chaos:
-                result = {"success": False, "reason": "No Chaos Manager"}
-            else:
-                # Roll d10 vs Chaos Level (Design Bible IV)
-                roll = random.randint(1, 10)
-                level = self.chaos.chaos_level
-                
-                result["log"] = f"Channeling Chaos... Rolled {roll} vs Level {level}."
-                
-                # Logic Fix: Roll > Level (High Roll vs Difficulty)
-                if roll > level:
-                    # Success: Manifest Effect
-                    # TODO: Add specific spell selection? For now, just a generic blast or mana restore
-                    result["log"] += " SUCCESS! Pure chaos energy surges under your control."
-                    if self.player_combatant:
-                        self.player_combatant.fp = self.player_combatant.max_fp # Refill Focus
-                else:
-                    # Failure: Backfire (Roll <= Level)
-                    result["log"] += " BACKFIRE! The energy writhes uncontrollably."
-                    self.chaos.chaos_clock += 1 # Advance Clock
-                    if self.player_combatant:
-                        # Damage = Amount failed by? Or just flat? Design Bible implies severity.
-                        dmg = (level - roll) + 1
-                        self.player_combatant.take_damage(dmg) 
-                        result["log"] += f" You take {dmg} damage!"
-
-        # Catch-all for Spell/Skill usage
+                self.player_combatant.fp = self.player_combatant.max_fp # Refill Focus
         else:
-            known_abilities = []
+            # Failure: Backfire (Roll <= Level)
+            result["log"] += " BACKFIRE! The energy writhes uncontrollably."
+            self.chaos.chaos_clock += 1 # Advance Clock
             if self.player_combatant:
-                known_abilities = [a.lower() for a in self.player_combatant.character.powers] + [s.lower() for s in self.player_combatant.character.skills]
-            
-            if action_type in known_abilities:
-                # 1. Get Ability Data (Description/Effects) from loader
-                ability_data = engine_hooks.get_ability_data(action_type)
-                if ability_data:
-                    desc = ability_data.get("Description") or ability_data.get("Effect") or ability_data.get("Effect Description")
-                    
-                    # 2. Build Context for EffectRegistry
-                    log_messages = []
-                    ctx = {
-                        "attacker": self.player_combatant,
-                        "engine": self,
-                        "log": log_messages,
-                        "state": self.state # Exploration or Combat
-                    }
-                    
-                    # 3. Resolve Mechanics using Central Registry
-                    try:
-                        registry.resolve(desc, ctx)
-                        result["success"] = True
-                        if log_messages:
-                            result["log"] = " ".join(log_messages)
-                        else:
-                            result["log"] = f"You use {action_type}."
-                    except Exception as e:
-                        result["success"] = False
-                        result["reason"] = str(e)
-                else:
-                    # Fallback if no specific data found but known (e.g. built-in string)
-                    if "wait" in action_type or "rest" in action_type:
-                        registry.resolve("Rest", {"attacker": self.player_combatant, "log": result.setdefault("log_list", [])})
-                        result["log"] = " ".join(result.pop("log_list", ["You rest."]))
-                    else:
-                        result["log"] = f"You use {action_type}."
+                dmg = (level - roll) + 1
+                self.player_combatant.take_damage(dmg)
+                result["log"] += f" You take {dmg} damage!"
+        return result
+
+    def _explore_known_ability(self, action_type, x, y, **kwargs):
+        """A power / skill the player knows, resolved through the effects registry (see _ability_spec)."""
+        result = {"success": True, "action": action_type}
+        # 1. Get Ability Data (Description/Effects) from loader
+        ability_data = engine_hooks.get_ability_data(action_type)
+        if ability_data:
+            desc = ability_data.get("Description") or ability_data.get("Effect") or ability_data.get("Effect Description")
+
+            # 2. Build Context for EffectRegistry
+            log_messages = []
+            ctx = {
+                "attacker": self.player_combatant,
+                "engine": self,
+                "log": log_messages,
+                "state": self.state # Exploration or Combat
+            }
+
+            # 3. Resolve Mechanics using Central Registry
+            try:
+                registry.resolve(desc, ctx)
+                result["log"] = " ".join(log_messages) if log_messages else f"You use {action_type}."
+            except Exception as e:
+                result["success"] = False
+                result["reason"] = str(e)
+        else:
+            # Fallback if no specific data found but known (e.g. built-in string)
+            if "wait" in action_type or "rest" in action_type:
+                registry.resolve("Rest", {"attacker": self.player_combatant, "log": result.setdefault("log_list", [])})
+                result["log"] = " ".join(result.pop("log_list", ["You rest."]))
             else:
-                return {"success": False, "reason": f"Unknown action: {action_type}"}
-                
+                result["log"] = f"You use {action_type}."
+        return result
+
+    def _finish_exploration_action(self, action_type, result):
+        """After-action phase shared by exploration actions: tension, the enemy response, narration."""
         if not self.player_combatant:
             self.load_player()
             if not self.player_combatant:
                 self.player_combatant = Combatant(data={"Name": "Player"})
 
         self._update_tactical_status()
-        
-        self._update_tactical_status()
-        
+
         # Tension Rules: Only in EXPLORE mode, and only on time-consuming actions
-        if self.chaos and self.state == "EXPLORE" and action_type in ["search", "disarm", "solve", "smash", "push", "vault", "climb", "pull", "open", "rest", "wait"]:
+        if self.chaos and self.state == "EXPLORE" and action_type in TENSION_ACTIONS:
             t_res = self.chaos.roll_tension()
             result["tension"] = t_res
             if t_res == "EVENT":
@@ -993,10 +967,6 @@ class GameLoopController:
                 if event_res.get("event") == "EVENT_TRIGGERED":
                     self.active_event_data = event_res.get("data")
                     self.is_event_resolved = False
-                # Store event data for frontend modal
-                if event_res.get("event") == "EVENT_TRIGGERED":
-                    self.active_event_data = event_res.get("data")
-                    self.is_event_resolved = False
             elif t_res == "CHAOS_EVENT":
                 from brqse_engine.world.encounter_table import EncounterTable
                 twist = EncounterTable.get_chaos_twist()
@@ -1004,10 +974,10 @@ class GameLoopController:
                 if "log" in result: result["log"] += f" {msg}"
                 else: result["log"] = msg
                 # Trigger a specific Hazard/Scenario on surge
-                event_res = self.trigger_event() # Could refine this to force Hazard 
+                event_res = self.trigger_event() # Could refine this to force Hazard
                 if "log" in result: result["log"] += " " + event_res["log"]
             elif t_res == "SAFE":
-                if random.random() < 0.2:
+                if self.rng.stream("events").random() < 0.2:
                     atm = self.chaos.get_atmosphere()
                     if "log" in result: result["log"] += f" {atm['descriptor']}"
                     else: result["log"] = atm["descriptor"]
@@ -1016,88 +986,78 @@ class GameLoopController:
                 else:
                     result["log"] = "Tension grows with every step."
 
-        # === ENEMY TURN (SIMPLIFIED) ===
-        if self.state == "COMBAT" and action_type in ["move", "attack", "wait", "rest", "defend"] and not result.get("event") == "COMBAT_STARTED":
-            try:
-                # 0. Check for Dead Enemies & Drops
-                # print(f"DEBUG: Checking {len(self.combat_engine.combatants)} combatants for death/drops")
-                dead_enemies = [c for c in self.combat_engine.combatants if c.team != "Player" and c.is_dead]
-                for dead in dead_enemies:
-                    # print(f"DEBUG: Found dead enemy {dead}. has_key? {getattr(dead, 'has_key', 'NoAttr')}")
-                    if hasattr(dead, "has_key") and dead.has_key:
-                        # Drop Key
-                        self.inventory.append({"id": dead.has_key, "name": dead.key_name})
-                        if "log" in result: result["log"] += f" The enemy dropped a {dead.key_name}!"
-                        else: result["log"] = f"The enemy dropped a {dead.key_name}!"
-                        # Prevent double drop
-                        dead.has_key = None
-                
-                # Simple AI: Move closer, Attack if adjacent
-                if not "log" in result: result["log"] = ""
-                
-                enemies_acted = 0
-                # Get enemy combatants from combat engine
-                for c in self.combat_engine.combatants:
-                    # Check if combatant is valid
-                    if not c or not hasattr(c, "team"): continue
-                    
-                    if c.team != "Player" and not c.is_dead:
-                        # Force Reset Action Economy for AI (simplification for this loop style)
-                        c.action_used = False
-                        
-                        enemies_acted += 1
-                        # SAFETY CHECK: positions
-                        if c.x is None or c.y is None or self.player_combatant.x is None or self.player_combatant.y is None:
-                            continue
-                            
-                        dist = abs(c.x - self.player_combatant.x) + abs(c.y - self.player_combatant.y)
-                        
-                        if dist <= 1:
-                            # Attack!
-                            # Check clash
-                            clash_roll = random.randint(1, 20)
-                            player_defence = random.randint(1, 20) + self.player_combatant.get_stat_modifier("Reflexes")
-                            
-                            if clash_roll > player_defence:
-                                dmg = random.randint(1, 6)
-                                self.player_combatant.take_damage(dmg)
-                                result["log"] += f" {c.name} attacks you for {dmg} damage!"
-                            else:
-                                 result["log"] += f" {c.name} attacks but you dodge!"
-                                 
-                        elif dist > 1:
-                             # Move closer
-                             dx = 1 if self.player_combatant.x > c.x else -1 if self.player_combatant.x < c.x else 0
-                             dy = 1 if self.player_combatant.y > c.y else -1 if self.player_combatant.y < c.y else 0
-                             
-                             # Check walls? For now, ghost movement to ensure they are scary
-                             c.x += dx
-                             c.y += dy
-                             result["log"] += f" {c.name} advances."
-            except Exception as e:
-                print(f"[GameLoop] Enemy Turn Error: {e}")
-                # traceback.print_exc()
-                result["log"] += f" [Enemy AI Error: {str(e)}]"
-            
-            # === END OF TURN RESET ===
-            # Since we use a Phase system (Player Action -> Enemy Reponse), we must reset the player for the next request.
-            if self.player_combatant:
-                self.player_combatant.action_used = False
-                self.player_combatant.bonus_action_used = False
-                self.player_combatant.reaction_used = False
+        # The action itself may have started a fight (move into an ambush)
+        if self.state == "COMBAT" and action_type in ENEMY_RESPONSE_ACTIONS and not result.get("event") == "COMBAT_STARTED":
+            self._simple_enemy_response(result)
 
-        # --- NEW: AI Narrator Hook (Exploration/Events) ---
+        # AI Narrator Hook (Exploration/Events)
         if self.narrator and result.get("success"):
-            # If we have an active scene, pass its context
             context = self.active_scene.biome if self.active_scene else "dungeon"
-            
             # Narrate significant events (Discovery, Tension, etc.)
             flavor = self.narrator.narrate(result, state_context=context)
             if flavor:
                 # Override the mechanical log
                 result["log"] = flavor
 
-        return result
+    def _simple_enemy_response(self, result):
+        """Simplified enemy turn after an exploration action: move closer, attack if adjacent."""
+        try:
+            # 0. Check for Dead Enemies & Drops
+            dead_enemies = [c for c in self.combat_engine.combatants if c.team != "Player" and c.is_dead]
+            for dead in dead_enemies:
+                if hasattr(dead, "has_key") and dead.has_key:
+                    # Drop Key
+                    self.inventory.append({"id": dead.has_key, "name": dead.key_name})
+                    if "log" in result: result["log"] += f" The enemy dropped a {dead.key_name}!"
+                    else: result["log"] = f"The enemy dropped a {dead.key_name}!"
+                    # Prevent double drop
+                    dead.has_key = None
+
+            if not "log" in result: result["log"] = ""
+
+            for c in self.combat_engine.combatants:
+                # Check if combatant is valid
+                if not c or not hasattr(c, "team"): continue
+
+                if c.team != "Player" and not c.is_dead:
+                    # Force Reset Action Economy for AI (simplification for this loop style)
+                    c.action_used = False
+
+                    # SAFETY CHECK: positions
+                    if c.x is None or c.y is None or self.player_combatant.x is None or self.player_combatant.y is None:
+                        continue
+
+                    dist = abs(c.x - self.player_combatant.x) + abs(c.y - self.player_combatant.y)
+
+                    if dist <= 1:
+                        # Attack! Clash vs the player's Reflexes
+                        clash_roll = self.rng.attacks.randint(1, 20)
+                        player_defence = self.rng.attacks.randint(1, 20) + self.player_combatant.get_stat_modifier("Reflexes")
+
+                        if clash_roll > player_defence:
+                            dmg = self.rng.attacks.randint(1, 6)
+                            self.player_combatant.take_damage(dmg)
+                            result["log"] += f" {c.name} attacks you for {dmg} damage!"
+                        else:
+                             result["log"] += f" {c.name} attacks but you dodge!"
+
+                    else:
+                         # Move closer (ghost movement, walls ignored so they stay scary)
+                         dx = 1 if self.player_combatant.x > c.x else -1 if self.player_combatant.x < c.x else 0
+                         dy = 1 if self.player_combatant.y > c.y else -1 if self.player_combatant.y < c.y else 0
+                         c.x += dx
+                         c.y += dy
+                         result["log"] += f" {c.name} advances."
+        except Exception as e:
+            print(f"[GameLoop] Enemy Turn Error: {e}")
+            result["log"] += f" [Enemy AI Error: {str(e)}]"
+
+        # === END OF TURN RESET ===
+        # Phase system (Player Action -> Enemy Response): reset the player for the next request.
+        if self.player_combatant:
+            self.player_combatant.action_used = False
+            self.player_combatant.bonus_action_used = False
+            self.player_combatant.reaction_used = False
 
     def _set_facing(self, direction: str):
         if self.player_combatant:
@@ -1261,8 +1221,8 @@ class GameLoopController:
              self.active_scenario = {"win_condition": {"type": "ENEMIES_KILLED"}, "narrative": "Forced Battle"}
         return res
 
-    def _handle_combat_action(self, action: str, x: int, y: int) -> Dict[str, Any]:
-        """Turn-based combat logic."""
+    def _handle_combat_action(self, spec, action: str, x: int, y: int, kwargs) -> Dict[str, Any]:
+        """Turn-based combat: the player's action, then the enemy turns."""
         try:
             # RESET ACTION ECONOMY FLAGS at start of input processing
             # This logic assumes "One Click = One Action Opportunity" for the player in this game loop model
@@ -1271,114 +1231,103 @@ class GameLoopController:
                 self.player_combatant.bonus_action_used = False
                 self.player_combatant.reaction_used = False
 
-            res = {"success": True, "action": action}
-            
             # 0. Check for Dead Enemies & Drops (Before new actions)
-            dead_enemies = [c for c in self.combat_engine.combatants if c.team != "Player" and c.is_dead]
-            for dead in dead_enemies:
-                if hasattr(dead, "has_key") and dead.has_key:
-                    # Drop Key
+            drops = []
+            for dead in self.combat_engine.combatants:
+                if dead.team != "Player" and dead.is_dead and getattr(dead, "has_key", None):
                     self.inventory.append({"id": dead.has_key, "name": dead.key_name})
-                    if "log" in res: res["log"] += f" The enemy dropped a {dead.key_name}!"
-                    else: res["log"] = f"The enemy dropped a {dead.key_name}!"
-                    # Prevent double drop
-                    dead.has_key = None
-            
+                    drops.append(f"The enemy dropped a {dead.key_name}!")
+                    dead.has_key = None # Prevent double drop
+
             # 1. Player Turn
-            if action in ["move", "attack"]:
-                # Check if clicking on an enemy -> Attack
-                target = self.combat_engine.get_combatant_at(x, y)
-                if target and target.team != "Player":
-                    # Synchorize play pos just in case
-                    px, py = self.player_pos
-                    self.player_combatant.x, self.player_combatant.y = px, py
-                    
-                    # Check range (assume melee 1.5 tiles (diagonals ok) for now)
-                    dist = math.hypot(x - px, y - py)
-                    if dist <= 1.5:
-                        # Use mechanics.py attack method
-                        log_lines = self.combat_engine.attack_target(self.player_combatant, target)
-                        res["log"] = " ".join(log_lines)
-                        
-                        # Extract details from replay log for Dice Log
-                        if self.combat_engine.replay_log:
-                            last_entry = self.combat_engine.replay_log[-1]
-                            # Format based on entry type
-                            if last_entry.get("type") in ["attack", "clash"]:
-                                self.dice_log.append({
-                                    "source": "Player",
-                                    "action": last_entry.get("type", "Action").capitalize(),
-                                    "roll": last_entry.get("attack_roll", 0),
-                                    "details": last_entry.get("description", str(log_lines)),
-                                    "result": last_entry.get("result", "INFO").upper()
-                                })
-                    else: 
-                         return {"success": False, "reason": "Too far to attack"}
-                
-                elif action == "attack":
-                     # Explicit attack on empty/friendly tile -> Fail
-                     return {"success": False, "reason": "Nothing to attack here"}
+            problem = spec.validate(x, y, kwargs, self._map_bounds())
+            if problem: return {"success": False, "reason": problem}
+            res = spec.handler(self, action, x, y, **kwargs)
+            if not res.get("success"): return res
+            if drops:
+                res["log"] = " ".join(drops + ([res["log"]] if res.get("log") else []))
 
-                else:
-                    # Move logic (mechanics.py might not have move validation exposed same way, using existing _process_move)
-                    dist = abs(x - self.player_pos[0]) + abs(y - self.player_pos[1])
-                    # Combatant from mechanics uses data.get("Stats") dict directly
-                    stats = getattr(self.player_combatant, 'stats', {})
-                    # Mechanics combatant calculates base_movement in init
-                    speed = getattr(self.player_combatant, "base_movement", 6)
-                    
-                    if dist * 5 > speed * 5: # mechanics uses ft? No, grid units usually. Let's assume tiles.
-                        # mechanics.py base_movement is usually 25+ (ft). 5 ft per tile.
-                        # So speed in tiles = base_movement / 5
-                        speed_tiles = speed / 5
-                        if dist > speed_tiles:
-                             return {"success": False, "reason": "Too far"}
-                    
-                    move_res = self._process_move(x, y) 
-                    if not move_res["success"]: return move_res
-                    
-                    res["log"] = f"Moved to {x}, {y}."
-            
-            elif action in ["wait", "rest"]:
-                 res["log"] = "You hold your ground."
-                 if self.player_combatant:
-                     heal = max(1, int(self.player_combatant.max_hp * 0.05))
-                     self.player_combatant.hp = min(self.player_combatant.hp + heal, self.player_combatant.max_hp)
-                     res["log"] += f" (+{heal} HP)"
-            
-            elif action == "Attack": 
-                 res["log"] = "Select a target."
-                 return {"success": False, "reason": "Select target"}
-    
             # 2. Enemy Turn
             self._process_enemy_turns(res)
-            
+
             # 3. Check State
             self._check_combat_end()
-            
-            # --- NEW: AI Narrator Hook ---
+
+            # AI Narrator Hook
             if self.narrator and res.get("success"):
                 context = self.active_scene.biome if self.active_scene else "dungeon"
                 flavor = self.narrator.narrate(res, state_context=context)
                 if flavor: res["log"] = flavor
-            
+
             return res
-            
+
         except Exception as e:
             traceback.print_exc()
             return {"success": False, "reason": f"Combat Error: {str(e)}", "log": f"System Error: {str(e)}"}
 
-    def _handle_combat_action(self, action, x, y):
-        # Oops, previous code snippet seemed to be inside _handle_combat_action?
-        # No, wait. I need to be careful. The VIEW showed lines 1080+ which seemed to be inside _handle_combat_action based on 'res' variable.
-        # But my previous edit replaced lines in 'handle_action' (generic).
-        # Let's look at where I am. 
-        # Line 413 calls self._handle_combat_action(action_type, x, y)
-        # So I should probably put the Narrator hook inside _handle_combat_action too OR just wrapper handle_action?
-        # The prompt "AI DM" implies *all* actions.
-        # My previous edit was likely trying to edit _handle_combat_action but I treated it as handle_action?
-        # Let's revert to a safe state where I wrap the RETURN of handle_action.
-        pass
+    # === COMBAT ACTIONS ===
+
+    @action(COMBAT_ACTIONS, "move", "attack", target=True)
+    def _combat_move_or_attack(self, action, x, y, **kwargs):
+        res = {"success": True, "action": action}
+        # Clicking on an enemy attacks it, with either action
+        target = self.combat_engine.get_combatant_at(x, y)
+        if target and target.team != "Player":
+            # Synchronize play pos just in case
+            px, py = self.player_pos
+            self.player_combatant.x, self.player_combatant.y = px, py
+
+            # Check range (assume melee 1.5 tiles (diagonals ok) for now)
+            if math.hypot(x - px, y - py) > 1.5:
+                return {"success": False, "reason": "Too far to attack"}
+            log_lines = self.combat_engine.attack_target(self.player_combatant, target)
+            res["log"] = " ".join(log_lines)
+
+            # Extract details from replay log for Dice Log
+            if self.combat_engine.replay_log:
+                last_entry = self.combat_engine.replay_log[-1]
+                if last_entry.get("type") in ["attack", "clash"]:
+                    self.dice_log.append({
+                        "source": "Player",
+                        "action": last_entry.get("type", "Action").capitalize(),
+                        "roll": last_entry.get("attack_roll", 0),
+                        "details": last_entry.get("description", str(log_lines)),
+                        "result": last_entry.get("result", "INFO").upper()
+                    })
+            return res
+
+        if action == "attack":
+            # Explicit attack on empty/friendly tile -> Fail
+            return {"success": False, "reason": "Nothing to attack here"}
+
+        # Loose reach check; _process_move does the collision work
+        dist = abs(x - self.player_pos[0]) + abs(y - self.player_pos[1])
+        speed = getattr(self.player_combatant, "base_movement", 6)
+        if dist > speed:
+            return {"success": False, "reason": "Too far"}
+
+        move_res = self._process_move(x, y)
+        if not move_res["success"]: return move_res
+        res["log"] = f"Moved to {x}, {y}."
+        return res
+
+    @action(COMBAT_ACTIONS, "wait", "rest")
+    def _combat_rest(self, action, x, y, **kwargs):
+        res = {"success": True, "action": action, "log": "You hold your ground."}
+        if self.player_combatant:
+            heal = max(1, int(self.player_combatant.max_hp * 0.05))
+            self.player_combatant.hp = min(self.player_combatant.hp + heal, self.player_combatant.max_hp)
+            res["log"] += f" (+{heal} HP)"
+        return res
+
+    @action(COMBAT_ACTIONS, "Attack")
+    def _combat_select_target(self, action, x, y, **kwargs):
+        # The UI's Attack button: nothing happens until a target is clicked
+        return {"success": False, "reason": "Select target"}
+
+    def _combat_pass(self, action, x, y, **kwargs):
+        """Any other action in combat just hands the turn to the enemies."""
+        return {"success": True, "action": action}
 
     def _process_enemy_turns(self, result_log):
         """Simple enemy AI."""
@@ -1386,12 +1335,24 @@ class GameLoopController:
         if not enemies: return
         
         log_entries = []
+        # Tacticians plan together (in parallel when there are several) and commit in initiative order
+        tacticians = [e for e in enemies if e.data.get("AI") == "Tactician"]
+        if tacticians:
+            if getattr(self, "group_planner", None) is None:
+                from brqse_engine.combat.group_planner import GroupPlanner
+                self.group_planner = GroupPlanner()  # One worker per CPU; a lone Tactician plans in-process
+            log_entries.extend(self.group_planner.run(self.combat_engine, tacticians))
+            enemies = [e for e in enemies if e.data.get("AI") != "Tactician"]
+
+        # One distance field to the player's surroundings, shared by every enemy this turn
+        px, py = self.player_pos
+        chase_field = DistanceField(PathGrid.from_tile_grid(self.active_scene.grid, wall=0),
+                                    [(px + dx, py + dy) for dx, dy in NEIGHBOURS])
         for e in enemies:
             # Force Reset Action Economy for AI
             e.action_used = False
             
             # Simple AI: Move to player
-            px, py = self.player_pos
             dist = math.hypot(px - e.x, py - e.y)
             
             if dist <= 1.5: # Adjacent-ish
@@ -1400,23 +1361,12 @@ class GameLoopController:
                 log_lines = self.combat_engine.attack_target(e, self.player_combatant)
                 log_entries.extend(log_lines)
             else:
-                # Move towards player
-                # Basic pathfinding towards player
-                dx = 1 if px > e.x else -1 if px < e.x else 0
-                dy = 1 if py > e.y else -1 if py < e.y else 0
-                
-                # Desired new pos
-                nx, ny = e.x + dx, e.y + dy
-                
-                # Check collision (Walls, Player, Other Enemies)
-                is_blocked = False
-                if not (0 <= nx < 20 and 0 <= ny < 20): is_blocked = True
-                elif self.active_scene.grid[ny][nx] == 0: is_blocked = True # Wall
-                elif (nx, ny) == (px, py): is_blocked = True # Player
-                elif self.combat_engine.get_combatant_at(nx, ny): is_blocked = True # Other enemy
-                
-                if not is_blocked:
-                     e.x, e.y = nx, ny
+                # Move towards player along the shared distance field (walls handled by the field)
+                step = chase_field.next_step(
+                    e.x, e.y,
+                    occupied=lambda x, y: (x, y) == (px, py) or self.combat_engine.get_combatant_at(x, y))
+                if step:
+                     e.x, e.y = step
         
         if log_entries:
             combined_log = " ".join(log_entries)
@@ -1435,9 +1385,15 @@ class GameLoopController:
         enemies_alive = [c for c in self.combat_engine.combatants if c.team == "Enemies" and c.hp > 0]
         if not enemies_alive:
             self.state = "EXPLORE"
+            self._close_group_planner()
             if self.active_scenario and self.active_scenario["win_condition"]["type"] == "ENEMIES_KILLED":
                  self._resolve_active_event("Victory")
 
+    def _close_group_planner(self):
+        """Combat is over: stop the Tactician planning pool until the next fight needs it."""
+        if getattr(self, "group_planner", None) is not None:
+            self.group_planner.close()
+
     def save_session(self) -> Dict[str, Any]:
         """Serializes current world and campaign state."""
         return {
@@ -1512,7 +1468,7 @@ class GameLoopController:
             "is_event_resolved": self.is_event_resolved,
             "active_scenario": self.active_scenario,
             "journal": self.journal.get_summary(),
-            "dice_log": self.dice_log[-50:], # Return last 50 logs
+            "dice_log": list(self.dice_log), # Last 50 logs
             # V2: Return combatants for rendering
             "combatants": [
                 {
@@ -1528,3 +1484,8 @@ class GameLoopController:
                 for c in self.combat_engine.combatants if c.hp > 0
             ]
         }
+
+
+# Fallback specs (not in the tables): known powers / skills, and idle actions in combat
+KNOWN_ABILITY = ActionSpec("known_ability", GameLoopController._explore_known_ability)
+COMBAT_PASS = ActionSpec("pass", GameLoopController._combat_pass)
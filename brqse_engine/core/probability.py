@@ -0,0 +1,198 @@
+"""
+Exact dice odds, no rolling.
+
+PMFs are built by convolving integer outcome counts, so every probability is
+count / total with no sampling noise. All entry points are memoized on their
+argument tuple; results are read-only (FrozenDict).
+
+Attack outcomes follow CombatEngine.attack_target:
+    margin = (d20 + hit_mod) - (d20 + def_mod)
+    0 clash | 1..4 graze (CMP) | 5..10 hit | 11+ crit (double damage + injury)
+    -1..-5 miss | -6..-10 whiff (Staggered) | -11 or worse botch (1d4 to self)
+"""
+import itertools
+from functools import lru_cache
+
+from brqse_engine.core.data_registry import FrozenDict
+from brqse_engine.core.dice import compile_dice, EXPLODE_LIMIT
+
+OUTCOMES = ("crit", "hit", "graze", "clash", "miss", "whiff", "botch")
+
+
+# === PMF ===
+
+def _convolve(a, b):
+    out = {}
+    for va, ca in a.items():
+        for vb, cb in b.items():
+            out[va + vb] = out.get(va + vb, 0) + ca * cb
+    return out
+
+
+@lru_cache(maxsize=None)
+def _dice_counts(count, sides):
+    """{total: ways} for `count` dice with `sides` faces (doubling, so O(log count) convolutions)."""
+    result = {0: 1}
+    die = {v: 1 for v in range(1, sides + 1)}
+    while count:
+        if count & 1:
+            result = _convolve(result, die)
+        count >>= 1
+        if count:
+            die = _convolve(die, die)
+    return result
+
+
+def _die_counts(sides, explode):
+    """{face total: ways} for one die, scaled to a common denominator when it explodes."""
+    if not explode:
+        return {v: 1 for v in range(1, sides + 1)}
+    # Same cap as the roller: after EXPLODE_LIMIT rerolls the last face just counts
+    depth = EXPLODE_LIMIT
+    counts = {}
+    for k in range(depth + 1):
+        weight = sides ** (depth - k)  # P = (1/s)^(k+1), over a common s^(depth+1)
+        faces = range(1, sides + 1) if k == depth else range(1, sides)
+        for r in faces:
+            counts[k * sides + r] = counts.get(k * sides + r, 0) + weight
+    return counts
+
+
+@lru_cache(maxsize=None)
+def _term_counts(count, sides, keep, explode):
+    if not keep:
+        if not explode:
+            return _dice_counts(count, sides)
+        result, die = {0: 1}, _die_counts(sides, True)
+        for _ in range(count):
+            result = _convolve(result, die)
+        return result
+    # Keep highest/lowest: enumerate the sorted outcomes (small pools only)
+    die = _die_counts(sides, explode)
+    if len(die) ** count > 2000000:
+        raise ValueError(f"Too many outcomes to enumerate: {count}d{sides}k{keep}")
+    counts = {}
+    for combo in itertools.product(die.items(), repeat=count):
+        values = sorted(v for v, _ in combo)
+        kept = values[-keep:] if keep > 0 else values[:-keep]
+        ways = 1
+        for _, c in combo:
+            ways *= c
+        total = sum(kept)
+        counts[total] = counts.get(total, 0) + ways
+    return counts
+
+
+@lru_cache(maxsize=4096)
+def pmf(expression):
+    """Exact distribution of a dice expression (Dice grammar): FrozenDict {total: probability}."""
+    expr = compile_dice(expression)
+    if expr is None:
+        raise ValueError(f"Bad dice expression: {expression}")
+    counts = {expr.flat: 1}
+    for t in expr.terms:
+        part = _term_counts(t.count, t.sides, t.keep, t.explode)
+        if t.sign < 0:
+            part = {-v: c for v, c in part.items()}
+        counts = _convolve(counts, part)
+    total = sum(counts.values())
+    return FrozenDict((v, counts[v] / total) for v in sorted(counts))
+
+
+def mean(dist):
+    return sum(v * p for v, p in dist.items())
+
+
+def expected(expression):
+    return mean(pmf(expression))
+
+
+@lru_cache(maxsize=None)
+def d20(advantage=False, disadvantage=False):
+    """d20 with advantage (max of 2), disadvantage (min of 2); both cancel."""
+    if advantage and disadvantage:
+        advantage = disadvantage = False
+    if advantage:
+        return FrozenDict((v, (2 * v - 1) / 400) for v in range(1, 21))
+    if disadvantage:
+        return FrozenDict((v, (41 - 2 * v) / 400) for v in range(1, 21))
+    return FrozenDict((v, 1 / 20) for v in range(1, 21))
+
+
+# === CONTESTED ATTACKS ===
+
+@lru_cache(maxsize=65536)
+def margin_pmf(hit_mod, def_mod, atk_adv=False, atk_dis=False, def_adv=False, def_dis=False):
+    """Distribution of attack margin (attacker total - defender total)."""
+    atk = d20(atk_adv, atk_dis)
+    dfn = d20(def_adv, def_dis)
+    out = {}
+    offset = hit_mod - def_mod
+    for a, pa in atk.items():
+        for d, pd in dfn.items():
+            m = a - d + offset
+            out[m] = out.get(m, 0.0) + pa * pd
+    return FrozenDict((m, out[m]) for m in sorted(out))
+
+
+def band(margin):
+    """Outcome name for a margin (see module docstring)."""
+    if margin == 0: return "clash"
+    if margin >= 11: return "crit"
+    if margin >= 5: return "hit"
+    if margin >= 1: return "graze"
+    if margin >= -5: return "miss"
+    if margin >= -10: return "whiff"
+    return "botch"
+
+
+@lru_cache(maxsize=65536)
+def attack_outcomes(hit_mod, def_mod, atk_adv=False, atk_dis=False, def_adv=False, def_dis=False):
+    """{outcome: probability} for every band in OUTCOMES."""
+    out = dict.fromkeys(OUTCOMES, 0.0)
+    for m, p in margin_pmf(hit_mod, def_mod, atk_adv, atk_dis, def_adv, def_dis).items():
+        out[band(m)] += p
+    return FrozenDict(out)
+
+
+def hit_probability(hit_mod, def_mod, *flags):
+    """Chance the attack lands at all (graze, hit or crit)."""
+    o = attack_outcomes(hit_mod, def_mod, *flags)
+    return o["graze"] + o["hit"] + o["crit"]
+
+
+@lru_cache(maxsize=65536)
+def expected_damage(damage_dice, hit_mod, def_mod, atk_adv=False, atk_dis=False,
+                    def_adv=False, def_dis=False):
+    """
+    Expected damage of one attack.
+    hp: HP damage to the target (hit + double on crit), cmp: CMP damage from grazes,
+    self: HP the attacker loses to botches. Clashes count as no damage.
+    """
+    o = attack_outcomes(hit_mod, def_mod, atk_adv, atk_dis, def_adv, def_dis)
+    dmg = expected(damage_dice)
+    return FrozenDict({
+        "hp": o["hit"] * dmg + o["crit"] * 2 * dmg,
+        "cmp": o["graze"] * dmg,
+        "self": o["botch"] * expected("1d4"),
+        "hit_chance": o["graze"] + o["hit"] + o["crit"],
+        "clash_chance": o["clash"],
+    })
+
+
+@lru_cache(maxsize=65536)
+def kill_chance(damage_dice, hp, hit_mod, def_mod, atk_adv=False, atk_dis=False,
+                def_adv=False, def_dis=False):
+    """Chance one attack takes a target at `hp` to 0 (hit: dice >= hp, crit: 2x dice >= hp)."""
+    if hp <= 0:
+        return 1.0
+    o = attack_outcomes(hit_mod, def_mod, atk_adv, atk_dis, def_adv, def_dis)
+    dist = pmf(damage_dice)
+    hit = sum(p for v, p in dist.items() if v >= hp)
+    crit = sum(p for v, p in dist.items() if 2 * v >= hp)
+    return o["hit"] * hit + o["crit"] * crit
+
+
+def balance_table(damage_dice, hit_mods=range(-2, 9), def_mods=range(-2, 9)):
+    """{(hit_mod, def_mod): expected HP damage} grid for designers."""
+    return {(h, d): expected_damage(damage_dice, h, d)["hp"] for h in hit_mods for d in def_mods}
@@ -0,0 +1,57 @@
+"""
+Seeded random streams for reproducible combat.
+
+Each CombatEngine / GameLoopController owns one RNGStreams. Every roll site
+draws from a named sub-stream (initiative, attacks, ai, terrain, effects...),
+so the same seed always replays the same battle - in any process, next to any
+other battle - and an extra AI roll never shifts the attack dice.
+
+    rng = RNGStreams(1234)
+    rng.attacks.randint(1, 20)
+    rng.stream("loot").choice(table)
+
+Sub-stream seeds come from sha256(seed:name), not hash(), so they are stable
+across processes and PYTHONHASHSEED.
+"""
+import hashlib
+import random
+
+STREAMS = ("initiative", "attacks", "effects", "ai", "terrain")
+
+
+class RNGStreams:
+    def __init__(self, seed=None):
+        # No seed: draw one from the global generator so legacy random.seed() callers stay reproducible
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self._streams = {}
+
+    def stream(self, name):
+        """The random.Random for a named sub-stream (created on first use)."""
+        s = self._streams.get(name)
+        if s is None:
+            digest = hashlib.sha256(f"{self.seed}:{name}".encode("utf-8")).digest()
+            s = self._streams[name] = random.Random(int.from_bytes(digest[:8], "big"))
+        return s
+
+    def __getattr__(self, name):
+        if name in STREAMS:
+            return self.stream(name)
+        raise AttributeError(name)
+
+    def child_seed(self, name):
+        """Next seed for a sub-system (e.g. a fresh CombatEngine per scene)."""
+        return self.stream(name).randrange(2 ** 32)
+
+    def __repr__(self):
+        return f"RNGStreams(seed={self.seed!r})"
+
+
+def stream_for(source, name):
+    """
+    Sub-stream of an engine (or of the engine in an effect context dict).
+    Falls back to the global random module, which has the same randint/choice/random API.
+    """
+    if isinstance(source, dict):
+        source = source.get("engine") or source.get("combat_engine")
+    rng = getattr(source, "rng", None)
+    return rng.stream(name) if rng is not None else random
@@ -1,24 +1,37 @@
 try:
-    from .constants import Conditions
+    from .constants import Conditions, CONDITION_BITS, condition_bit
 except ImportError:
     # Fallback if run as script or path issue
-    from brqse_engine.core.constants import Conditions
+    from brqse_engine.core.constants import Conditions, CONDITION_BITS, condition_bit
 
 class StatusManager:
+    __slots__ = ("owner", "mask", "timed_effects")
+
     def __init__(self, owner):
         self.owner = owner
-        # Set for fast lookups: {"prone", "blinded"}
-        self._active_conditions = set()
+        # Bitmask of active conditions (see constants.CONDITION_BITS): has() is one AND
+        self.mask = 0
         # List for tracking durations: [{"name": "Prone", "duration": 1, "on_expire": None}]
         self.timed_effects = []
 
+    @staticmethod
+    def _bit(name):
+        # Constants are already capitalized - skip the string work for them.
+        # Lookup only: a name that was never applied has no bit (0).
+        return CONDITION_BITS.get(name) or CONDITION_BITS.get(name.capitalize(), 0)
+
+    @property
+    def _active_conditions(self):
+        """Names of the active conditions (legacy set view, read-only)."""
+        return {name for name, bit in list(CONDITION_BITS.items()) if self.mask & bit}
+
     def add_condition(self, name, duration=1, on_expire=None):
         """
         Apply a condition. If it exists, refresh duration to the max.
         duration: -1 for permanent, else rounds.
         """
         clean_name = name.capitalize()
-        
+
         # Check if we update existing
         for eff in self.timed_effects:
             if eff["name"] == clean_name:
@@ -34,25 +47,38 @@ class StatusManager:
             "duration": duration,
             "on_expire": on_expire
         })
-        self._active_conditions.add(clean_name)
+        self.mask |= condition_bit(clean_name)
         # Log if possible
         # print(f"Applied {clean_name} to {self.owner.name}")
 
     def remove_condition(self, name):
-        clean_name = name.capitalize()
-        if clean_name in self._active_conditions:
-            self._active_conditions.remove(clean_name)
+        bit = self._bit(name)
+        if self.mask & bit:
+            self.mask &= ~bit
             # Remove from timed list
-            self.timed_effects = [e for e in self.timed_effects if e["name"] != clean_name]
+            clean_name = name.capitalize()
+            if self.timed_effects:
+                self.timed_effects = [e for e in self.timed_effects if e["name"] != clean_name]
+
+    def set_flag(self, name, on):
+        """Untimed condition (Blessed, Broken...): just the bit, no duration entry."""
+        if on:
+            self.mask |= condition_bit(name.capitalize())
+        else:
+            self.remove_condition(name)
 
     def has(self, name):
         """Check if condition is active. Case insensitive-ish."""
-        return name.capitalize() in self._active_conditions
+        return bool(self.mask & self._bit(name))
+
+    def has_any(self, mask):
+        """True if any condition in `mask` (constants.condition_mask(...)) is active."""
+        return bool(self.mask & mask)
 
     def clear_all(self):
-        self._active_conditions.clear()
+        self.mask = 0
         self.timed_effects.clear()
-        
+
     def add_timed_effect(self, name, duration, on_expire=None):
         """Alias for add_condition to match legacy API expectations if needed"""
         self.add_condition(name, duration, on_expire)
@@ -73,8 +99,8 @@ class StatusManager:
             eff["duration"] -= 1
             if eff["duration"] <= 0:
                 expired.append(eff["name"])
-                self._active_conditions.discard(eff["name"])
-                
+                self.mask &= ~condition_bit(eff["name"])
+
                 # Handle callbacks if you have them implemented later
                 if eff["on_expire"] and hasattr(self.owner, eff["on_expire"]):
                      # If method, call it. If property, do nothing (removed from set).
@@ -82,6 +108,6 @@ class StatusManager:
                      if callable(cb): cb()
             else:
                 remaining.append(eff)
-        
+
         self.timed_effects = remaining
         return expired
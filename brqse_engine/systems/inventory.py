@@ -1,8 +1,9 @@
 
-import csv
 import os
 import random
 
+from brqse_engine.core.data_registry import game_data, FrozenDict
+
 class Item:
     def __init__(self, data):
         self.name = data.get("Name", "Unknown")
@@ -33,6 +34,21 @@ class Item:
         return tags
 
 class Inventory:
+    # Shared read-only tables (class level: one copy for every combatant's inventory)
+    armor_stats = FrozenDict({
+        "Heavy": "Endurance",
+        "Natural": "Vitality",
+        "Light": "Reflexes",
+        "Cloth": "Knowledge",
+        "Medium": "Willpower",
+        "Utility": "Intuition"
+    })
+    # Aliases for mismatched data (CSV vs CSV) - Now using canonical names from Skills.csv
+    skill_aliases = FrozenDict({
+        # Weapons: Small, Medium, Large, Great, Exotic, Fist, Thrown, Ballistics, Blast, Long Shot, Simple
+        # Armor: Cloth, Light, Medium, Heavy, Natural, Utility
+    })
+
     def __init__(self):
         self.items = []
         self.equipped = {
@@ -41,82 +57,32 @@ class Inventory:
             "Armor": None
         }
         self.db = self._load_db()
-        self.armor_stats = {
-            "Heavy": "Endurance",
-            "Natural": "Vitality",
-            "Light": "Reflexes",
-            "Cloth": "Knowledge",
-            "Medium": "Willpower",
-            "Utility": "Intuition"
-        }
         self.skill_map = self._load_skills()
-        # Aliases for mismatched data (CSV vs CSV) - Now using canonical names from Skills.csv
-        self.skill_aliases = {
-            # Weapons: Small, Medium, Large, Great, Exotic, Fist, Thrown, Ballistics, Blast, Long Shot, Simple
-            # Armor: Cloth, Light, Medium, Heavy, Natural, Utility
-        }
 
     def _load_skills(self):
-        """Loads Skills.csv to map Skill Name -> Attribute"""
+        """Maps Skill Name -> Attribute (built once per process from the shared registry)"""
+        return game_data.derived("inventory_skill_map", self._build_skill_map)
+
+    @staticmethod
+    def _build_skill_map():
         s_map = {}
-        try:
-            # Try multiple paths similar to _load_db
-            paths = [
-                os.path.join(os.path.dirname(__file__), "../Data/Skills.csv"),
-                "C:/Users/krazy/Desktop/BRQSE/Data/Skills.csv"
-            ]
-            target_path = next((p for p in paths if os.path.exists(p)), None)
-            
-            if target_path:
-                with open(target_path, 'r', encoding='utf-8-sig') as f: # Handle SIG for BOM
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Map "Great Weapons" -> "MIGHT"
-                        s_name = row.get("Skill Name", "").strip()
-                        attr = row.get("Attribute", "").strip()
-                        if s_name and attr:
-                            s_map[s_name] = attr
-                            
-                            # Also handle "The X" variants just in case
-                            if not s_name.startswith("The ") and " " in s_name:
-                                s_map[f"The {s_name}"] = attr
-        except Exception as e:
-            print(f"[Inventory] Error loading Skills: {e}")
-        return s_map
+        for row in game_data.csv_rows("Skills.csv"):
+            # Map "Great Weapons" -> "MIGHT"
+            s_name = (row.get("Skill Name") or "").strip()
+            attr = (row.get("Attribute") or "").strip()
+            if s_name and attr:
+                s_map[s_name] = attr
+
+                # Also handle "The X" variants just in case
+                if not s_name.startswith("The ") and " " in s_name:
+                    s_map[f"The {s_name}"] = attr
+        return FrozenDict(s_map)
 
     def _load_db(self):
-        """Loads weapons_and_armor.csv"""
-        db = {}
-        try:
-            # Assume script is in combat simulator/
-            # Try multiple paths
-            paths = [
-                os.path.join(os.path.dirname(__file__), "../Data/weapons_and_armor.csv"),
-                os.path.join(os.path.dirname(__file__), "../../Data/weapons_and_armor.csv"),
-                "C:/Users/krazy/Desktop/BRQSE/Data/weapons_and_armor.csv" # Hard fallback
-            ]
-            
-            target_path = None
-            for p in paths:
-                if os.path.exists(p):
-                    target_path = p
-                    break
-            
-            if not target_path:
-                print(f"[Inventory] Warning: DB not found. Checked: {paths}")
-                return db
-                
-            with open(target_path, 'r', encoding='utf-8-sig') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if "Name" in row:
-                        db[row["Name"].strip()] = row
-                    elif "\ufeffName" in row: # Handle explicit BOM if sig fails
-                        db[row["\ufeffName"].strip()] = row
-                    elif list(row.keys())[0].strip() == "Name": # Fallback
-                        db[row[list(row.keys())[0]]] = row
-        except Exception as e:
-            print(f"[Inventory] Error loading DB: {e}")
+        """weapons_and_armor.csv keyed by Name (shared, parsed once per process)"""
+        db = game_data.csv_index("weapons_and_armor.csv", "Name")
+        if not db:
+            print(f"[Inventory] Warning: DB not found in {game_data.data_dir}")
         return db
 
     def equip(self, item_name, slot="Main Hand"):
@@ -9,8 +9,14 @@ XP_COST_SKILL_BASE = 10  # Cost = Next Rank * 10
 XP_COST_ATTR_BASE = 50   # Cost = Next Score * 50 (Attributes are expensive!)
 
 class ProgressionEngine:
+    # One loader per process: every Combatant builds a ProgressionEngine,
+    # so re-hydrating ~20 tables each time was the bulk of spawn cost.
+    _shared_loader = None
+
     def __init__(self):
-        self.loader = DataLoader()
+        if ProgressionEngine._shared_loader is None:
+            ProgressionEngine._shared_loader = DataLoader()
+        self.loader = ProgressionEngine._shared_loader
         if not self.loader.talents:
             self.loader.reload_all()
 
@@ -33,6 +39,8 @@ class ProgressionEngine:
         # Transaction
         combatant.xp -= cost
         combatant.skills[skill_name] = current_rank + 1
+        if hasattr(combatant, 'invalidate_hooks'):
+            combatant.invalidate_hooks()  # Skill effects changed
         
         # Check for new Talents immediately
         new_talents = self.check_unlocks(combatant)
@@ -110,6 +118,8 @@ class ProgressionEngine:
                 new_unlocks.append(t_name)
                 
         if new_unlocks:
+             if hasattr(combatant, 'invalidate_hooks'):
+                combatant.invalidate_hooks()
              if hasattr(combatant, 'save_state'):
                 combatant.save_state()
             
@@ -27,7 +27,7 @@ class Cell(IntFlag):
 class DonjonGenerator:
     def __init__(self, seed=None):
         self.seed = seed if seed else random.randint(0, 999999)
-        random.seed(self.seed)
+        self.rng = random.Random(self.seed)  # Own stream: don't reseed the global generator
         self.grid = []
         self.rooms = {} 
         self.cols = 0
@@ -66,7 +66,7 @@ class DonjonGenerator:
                     if neighbors == 1:
                         dead_ends.append((c,r))
         
-        random.shuffle(dead_ends)
+        self.rng.shuffle(dead_ends)
         
         # Place Down Stair (Exit)
         if dead_ends:
@@ -74,7 +74,7 @@ class DonjonGenerator:
             self.grid[r][c] |= Cell.STAIR_DN
         else:
             # Fallback: Random Room center
-            rid = random.choice(list(self.rooms.keys()))
+            rid = self.rng.choice(list(self.rooms.keys()))
             c, r = self.rooms[rid]["center"]
             self.grid[r][c] |= Cell.STAIR_DN
 
@@ -84,7 +84,7 @@ class DonjonGenerator:
             self.grid[r][c] |= Cell.STAIR_UP
         else:
             # Fallback
-            rid = random.choice(list(self.rooms.keys()))
+            rid = self.rng.choice(list(self.rooms.keys()))
             c, r = self.rooms[rid]["center"]
             self.grid[r][c] |= Cell.STAIR_UP
 
@@ -92,11 +92,11 @@ class DonjonGenerator:
         # Density: 1 room per 100 tiles roughly
         n_rooms = (self.cols * self.rows) // 100
         for _ in range(n_rooms):
-            w = random.randint(3, 9)
-            h = random.randint(3, 9)
+            w = self.rng.randint(3, 9)
+            h = self.rng.randint(3, 9)
             # Force odd coords
-            x = random.randint(0, (self.cols - w) // 2) * 2 + 1
-            y = random.randint(0, (self.rows - h) // 2) * 2 + 1
+            x = self.rng.randint(0, (self.cols - w) // 2) * 2 + 1
+            y = self.rng.randint(0, (self.rows - h) // 2) * 2 + 1
             
             if not self._check_collision(x, y, w, h):
                 room_id = len(self.rooms) + 1
@@ -129,8 +129,8 @@ class DonjonGenerator:
 
     def _tunnel(self, x, y, last_dir=None):
         dirs = [(0, -1), (0, 1), (-1, 0), (1, 0)]
-        random.shuffle(dirs)
-        if last_dir and random.randint(0, 100) < 50: dirs.insert(0, last_dir) # Straightness bias
+        self.rng.shuffle(dirs)
+        if last_dir and self.rng.randint(0, 100) < 50: dirs.insert(0, last_dir) # Straightness bias
         
         for dx, dy in dirs:
             nx, ny = x + dx*2, y + dy*2
@@ -157,7 +157,7 @@ class DonjonGenerator:
                 door_count = max(1, int(math.sqrt(w*h)//4))
                 for _ in range(door_count):
                     if not sills: break
-                    ds = sills.pop(random.randint(0, len(sills)-1))
+                    ds = sills.pop(self.rng.randint(0, len(sills)-1))
                     
                     # Determine Door Type
                     dtype = self._door_type()
@@ -167,7 +167,7 @@ class DonjonGenerator:
     def _door_type(self):
         # Ported from donjonsdungeongen.pl
         # 15% Arch, 45% Door, 15% Locked, 15% Trapped, 10% Secret, Rest Portcullis
-        r = random.randint(0, 109)
+        r = self.rng.randint(0, 109)
         if r < 15: return Cell.ARCH
         elif r < 60: return Cell.DOOR
         elif r < 75: return Cell.LOCKED
@@ -13,8 +13,9 @@ class MapGenerator:
     Generates map layouts with diverse objects and tags.
     """
 
-    def __init__(self, chaos_manager=None):
+    def __init__(self, chaos_manager=None, rng=None):
         self.chaos = chaos_manager
+        self.rng = rng or random  # random.Random (e.g. GameLoopController terrain stream)
 
     def furnish_biome(self, grid: List[List[int]], biome: str, enc_type: str = "EMPTY") -> List[Dict]:
         """
@@ -59,11 +60,11 @@ class MapGenerator:
                 if (cell_val & Cell.ROOM) and not (cell_val & (Cell.DOORSPACE | Cell.STAIR_DN | Cell.STAIR_UP | Cell.BLOCKED)):
                     
                     # Density Check (approx 5% chance per tile)
-                    r = random.random()
+                    r = self.rng.random()
                     
                     # Place Specials (Rare: 0.5% chance)
                     if specials and r > 0.995:
-                        obj_type = random.choice(list(specials.keys()))
+                        obj_type = self.rng.choice(list(specials.keys()))
                         interactables.append({
                             "type": obj_type, 
                             "name": obj_type,
@@ -76,7 +77,7 @@ class MapGenerator:
                         
                     # Place Standard (Common: 3% chance)
                     elif r > 0.97:
-                        obj_type = random.choice(object_types)
+                        obj_type = self.rng.choice(object_types)
                         interactables.append({
                             "type": obj_type, 
                             "name": obj_type,
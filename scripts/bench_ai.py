@@ -0,0 +1,62 @@
+"""
+AI decision benchmark: seeded AI-vs-AI scenarios on the real CombatEngine
+(see brqse_engine/combat/ai_benchmark.py for the scenario list).
+
+Examples:
+  python scripts/bench_ai.py --json bench/ai_baseline.json
+  python scripts/bench_ai.py --compare bench/ai_baseline.json --tolerance 0.3
+  python scripts/bench_ai.py --scenario skirmish_10v10 --template Tactician
+
+Exits with 1 when --compare finds a regression.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from brqse_engine.combat import ai_benchmark
+
+def print_report(report):
+    print(f"=== AI BENCHMARK (seeds {report['meta']['seeds']}, template {report['meta']['template'] or 'as authored'}) ===")
+    print(f"{'scenario':<16}{'decisions':>10}{'dec/s':>10}{'p50 ms':>9}{'p99 ms':>9}"
+          f"{'ability/d':>11}{'move/d':>8}{'los/d':>9}{'errors':>8}")
+    for name, s in report["scenarios"].items():
+        per = s["calls_per_decision"]
+        print(f"{name:<16}{s['decisions']:>10}{s['decisions_per_second']:>10}{s['p50_ms']:>9}{s['p99_ms']:>9}"
+              f"{per['activate_ability']:>11}{per['move_char']:>8}{per['has_line_of_sight']:>9}{s['errors']:>8}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Seeded AI decision throughput benchmark")
+    parser.add_argument("--scenario", action="append", choices=sorted(ai_benchmark.SCENARIOS),
+                        help="Run only these scenarios (repeatable, default: all)")
+    parser.add_argument("--seeds", type=int, default=3, help="Battles per scenario (seeds 0..n-1)")
+    parser.add_argument("--template", help="Force one AI template on every unit (e.g. Tactician)")
+    parser.add_argument("--json", help="Write the report here (use as a baseline later)")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown before it counts (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    report = ai_benchmark.run_all(args.scenario, range(args.seeds), args.template)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        lines, regressed = ai_benchmark.compare(report, baseline, args.tolerance)
+        print(f"\n=== VS {args.compare} (tolerance {args.tolerance:.0%}) ===")
+        for line in lines:
+            print(line)
+        if regressed:
+            print("REGRESSION")
+            sys.exit(1)
+        print("OK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Spawn-rate benchmark: building every enemy with Combatant(data=...) vs. one
+prototype per beast plus cheap stamps (CombatantFactory).
+
+Usage: python scripts/bench_spawn.py [count]
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from brqse_engine.combat.combatant_factory import CombatantFactory
+from brqse_engine.combat.enemy_spawner import spawner
+from brqse_engine.combat.mechanics import Combatant
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    beast_id = spawner.beast_data[0]["Entity_ID"]
+    Combatant(data=spawner.build_beast_data(beast_id))  # Warm the shared tables first
+
+    start = time.perf_counter()
+    scratch = [Combatant(data=spawner.build_beast_data(beast_id)) for _ in range(count)]
+    old = time.perf_counter() - start
+
+    factory = CombatantFactory()
+    start = time.perf_counter()
+    stamped = [factory.spawn_beast(beast_id, name=f"Goblin {i}") for i in range(count)]
+    new = time.perf_counter() - start
+
+    start = time.perf_counter()
+    more = [factory.spawn_beast(beast_id) for _ in range(count)]
+    warm = time.perf_counter() - start
+
+    assert len(scratch) == len(stamped) == len(more) and factory.builds == 1
+
+    print(f"=== SPAWN BENCHMARK ({count} x {beast_id}) ===")
+    print(f"From scratch:        {old * 1000:8.2f}ms  ({count / old:8.0f}/s)")
+    print(f"Prototype + stamps:  {new * 1000:8.2f}ms  ({count / new:8.0f}/s, {old / new:.1f}x)")
+    print(f"Stamps only (warm):  {warm * 1000:8.2f}ms  ({count / warm:8.0f}/s, {old / warm:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Startup benchmark: cold boot with every table parsed from CSV/JSON
+vs. cold boot from the binary snapshot.
+
+Each measurement runs in a fresh interpreter so nothing is warm in memory.
+Usage: python scripts/bench_startup.py [runs]
+"""
+import os
+import subprocess
+import sys
+import statistics
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+# 1) Load every table the engine knows about  2) boot the headless combat stack
+PROBE = r'''
+import time, sys
+t0 = time.perf_counter()
+from brqse_engine.core.data_registry import game_data
+for kind, name in game_data.source_files():
+    if kind == "csv":
+        game_data.csv_rows(name); game_data.csv_rows(name, normalize=True)
+    else:
+        game_data.json_data(name)
+t1 = time.perf_counter()
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat.enemy_spawner import spawner
+eng = CombatEngine(20, 20)
+for i in range(10):
+    eng.add_combatant(Combatant(data={"Name": f"Goblin {i}"}), i, 0)
+t2 = time.perf_counter()
+print(f"{(t1 - t0) * 1000:.3f} {(t2 - t0) * 1000:.3f} {int(game_data.snapshot_loaded)}")
+'''
+
+def run(snapshot, runs):
+    env = dict(os.environ, BRQSE_DATA_SNAPSHOT="1" if snapshot else "0")
+    tables, boots = [], []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=env,
+                             capture_output=True, text=True, check=True).stdout.strip().splitlines()[-1]
+        t, b, _ = out.split()
+        tables.append(float(t)); boots.append(float(b))
+    return statistics.median(tables), statistics.median(boots)
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    from brqse_engine.core.data_registry import DataRegistry, SNAPSHOT_PATH
+    DataRegistry(snapshot_path=SNAPSHOT_PATH).build_snapshot()
+
+    parse_t, parse_b = run(False, runs)
+    snap_t, snap_b = run(True, runs)
+    print(f"=== STARTUP BENCHMARK (median of {runs} cold runs) ===")
+    print(f"{'':22}{'all tables':>12}{'engine boot':>14}")
+    print(f"{'Parse CSV/JSON':22}{parse_t:>10.1f}ms{parse_b:>12.1f}ms")
+    print(f"{'Binary snapshot':22}{snap_t:>10.1f}ms{snap_b:>12.1f}ms")
+    if snap_t > 0:
+        print(f"Table load speedup: {parse_t / snap_t:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Build step: compiles every static table (Data/*.csv, Web_ui/public/data/*.json)
+into one versioned binary snapshot (Data/.cache/game_data.snapshot).
+
+The engine also rebuilds it automatically when a source file changes,
+so running this is optional - it just moves the cost out of the first boot.
+
+Usage: python scripts/build_data_snapshot.py [--check]
+"""
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from brqse_engine.core.data_registry import DataRegistry, SNAPSHOT_PATH
+
+def main():
+    reg = DataRegistry(snapshot_path=SNAPSHOT_PATH)
+    if "--check" in sys.argv:
+        ok = reg.load_snapshot(rebuild=False)
+        print(f"Snapshot {'is current' if ok else 'is STALE or missing'}: {SNAPSHOT_PATH}")
+        sys.exit(0 if ok else 1)
+
+    report = reg.build_snapshot()
+    print(f"Compiled {report['tables']} tables ({report['bytes'] / 1024:.0f} KB) "
+          f"in {report['seconds'] * 1000:.1f}ms -> {report['path']}")
+
+if __name__ == "__main__":
+    main()
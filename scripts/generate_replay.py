@@ -86,43 +86,45 @@ def generate_replay():
         c_enemy = Combatant(enemy, x=3, y=6, team="Red") 
         engine.add_combatant(c_enemy)
 
-    # 4. Start Combat
-    engine.start_combat()
+    # Every event from combat_start on (the engine's replay_log only keeps the latest ones)
+    with engine.replay_log.capture() as replay_events:
+        # 4. Start Combat
+        engine.start_combat()
     
-    # CAPTURE INITIAL STATE
-    initial_combatants = []
-    for c in engine.combatants:
-        initial_combatants.append({
-            "name": c.name,
-            "max_hp": c.max_hp,
-            "hp": c.current_hp,
-            "team": c.team,
-            "x": c.x,
-            "y": c.y,
-            "sprite": c.sprite or "wolf"
-        })
+        # CAPTURE INITIAL STATE
+        initial_combatants = []
+        for c in engine.combatants:
+            initial_combatants.append({
+                "name": c.name,
+                "max_hp": c.max_hp,
+                "hp": c.current_hp,
+                "team": c.team,
+                "x": c.x,
+                "y": c.y,
+                "sprite": c.sprite or "wolf"
+            })
     
-    # 5. Simulation Loop
-    MAX_ROUNDS = 20
-    round_count = 0
+        # 5. Simulation Loop
+        MAX_ROUNDS = 20
+        round_count = 0
     
-    while round_count < MAX_ROUNDS:
-        active = engine.get_active_char()
+        while round_count < MAX_ROUNDS:
+            active = engine.get_active_char()
         
-        # Check Win Condition
-        blue_alive = any(c.is_alive for c in engine.combatants if c.team == "Blue")
-        red_alive = any(c.is_alive for c in engine.combatants if c.team == "Red")
+            # Check Win Condition
+            blue_alive = any(c.is_alive for c in engine.combatants if c.team == "Blue")
+            red_alive = any(c.is_alive for c in engine.combatants if c.team == "Red")
         
-        if not blue_alive or not red_alive:
-            break
+            if not blue_alive or not red_alive:
+                break
 
-        # AI Turn Execution
-        if getattr(active, "is_alive", True): # Check if active is alive
-            SimpleAI.execute_turn(active, engine)
+            # AI Turn Execution
+            if getattr(active, "is_alive", True): # Check if active is alive
+                SimpleAI.execute_turn(active, engine)
         
-        engine.end_turn()
-        if engine.current_turn_index == 0:
-            round_count += 1
+            engine.end_turn()
+            if engine.current_turn_index == 0:
+                round_count += 1
 
     # 6. Export Replay
     output_path = game_state.get_replay_path()
@@ -149,7 +151,7 @@ def generate_replay():
 
     final_data = {
         "combatants": combatant_data,
-        "log": engine.replay_log,
+        "log": replay_events,
         "map": map_tiles,
         "winner": winner
     }
@@ -174,8 +174,9 @@ def game_action():
         print(f"[API] Incoming Action: {json.dumps(data)}") # VERBOSE LOGGING
         action = data.get('action') # 'move', 'search', 'smash', etc.
         x, y = data.get('x'), data.get('y')
+        extra = {k: v for k, v in data.items() if k not in ('action', 'x', 'y')} # Per-action args (item, ability, input...)
         
-        result = GAME_LOOP.handle_action(action, x, y, **data)
+        result = GAME_LOOP.handle_action(action, x, y, **extra)
         
         return jsonify({
             "result": result,
@@ -197,6 +198,11 @@ def game_action():
             }
         })
 
+@app.route('/api/game/action_stats', methods=['GET'])
+def game_action_stats():
+    """Per-action latency since start-up, most expensive first."""
+    return jsonify(GAME_LOOP.action_timings())
+
 @app.route('/api/character/save', methods=['POST'])
 def save_character():
     data = request.get_json()
@@ -0,0 +1,64 @@
+"""
+Batch battle simulator (headless, multi-process).
+
+Examples:
+  python scripts/simulate_battles.py --a save:Grazer_Tank_578 --b beast:BST_01 -n 2000
+  python scripts/simulate_battles.py --matchups balance/matchups.json --workers 8 --json report.json
+
+A matchups file is a JSON list of specs (see brqse_engine/combat/simulator.py).
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from brqse_engine.combat.simulator import simulate
+
+def print_report(s):
+    print(f"\n=== {s['matchup']} ({s['battles']} battles) ===")
+    wr = s["win_rate"]
+    print(f"Win rate   A {wr['A']:.1%}   B {wr['B']:.1%}   Draw {wr['draw']:.1%}")
+    r = s["rounds"]
+    print(f"Rounds     mean {r['mean']}  p10 {r['p10']}  p50 {r['p50']}  p90 {r['p90']}  max {r['max']}")
+    for side in ("A", "B"):
+        d = s["damage"][side]
+        print(f"Damage {side}   mean {d['mean']} (sd {d['stdev']})  p10 {d['p10']}  p50 {d['p50']}  p90 {d['p90']}")
+    for err, n in s["errors"].items():
+        print(f"ERROR x{n}: {err}")
+    print(f"Throughput {s['battles_per_second']} battles/s ({s['seconds']}s)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless Monte Carlo battle simulator")
+    parser.add_argument("--a", action="append", default=[], help="Side A unit (save:<name>, beast:<id>[@lvl])")
+    parser.add_argument("--b", action="append", default=[], help="Side B unit")
+    parser.add_argument("--matchups", help="JSON file with a list of matchup specs")
+    parser.add_argument("-n", "--battles", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all CPUs, 1 = in-process)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-rounds", type=int, default=30)
+    parser.add_argument("--json", help="Write the summaries to this file")
+    args = parser.parse_args()
+
+    if args.matchups:
+        with open(args.matchups, "r", encoding="utf-8") as f:
+            matchups = json.load(f)
+    elif args.a and args.b:
+        matchups = [{"side_a": args.a, "side_b": args.b, "max_rounds": args.max_rounds}]
+    else:
+        parser.error("Give --a and --b units, or --matchups")
+
+    summaries = []
+    for m in matchups:
+        summary, _ = simulate(m, battles=args.battles, workers=args.workers, seed=args.seed)
+        print_report(summary)
+        summaries.append(summary)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summaries, f, indent=2)
+        print(f"\nSaved {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.abilities import engine_hooks
+from brqse_engine.core.data_loader import DataLoader
+
+def test_case_insensitive_lookup():
+    print("--- Testing Ability Lookup Indexes ---")
+    loader = engine_hooks.loader
+    school = loader.schools[0]
+    assert engine_hooks.get_ability_data(school["Name"]) is school
+    assert engine_hooks.get_ability_data(school["Name"].upper()) is school
+    assert engine_hooks.get_ability_data("Definitely Not A Power") is None
+    print(f"PASS: Found '{school['Name']}' case-insensitively.")
+
+def test_index_sees_appended_rows():
+    loader = engine_hooks.loader
+    mock = {"Talent_Name": "Lookup Test Talent", "Type": "Offense", "Effect": "Deal 1d4 damage"}
+    loader.talents.append(mock)
+    try:
+        assert engine_hooks.get_ability_data("lookup test talent") is mock, "FAIL: Index is stale"
+
+        class Dummy: pass
+        d = Dummy()
+        d.species, d.skills, d.powers, d.traits = "Mammal", {}, [], ["Lookup Test Talent"]
+        assert engine_hooks.get_entity_effects(d) == ["Deal 1d4 damage"]
+    finally:
+        loader.talents.remove(mock)
+    assert engine_hooks.get_ability_data("lookup test talent") is None
+    print("PASS: Appended rows are indexed.")
+
+def test_spell_index():
+    dl = DataLoader()
+    first = dl.spells_db[0]
+    assert dl.get_spell_data(first["Name"]) is first
+    assert dl.get_spell_data("No Such Spell") is None
+
+if __name__ == "__main__":
+    test_case_insensitive_lookup()
+    test_index_sees_appended_rows()
+    test_spell_index()
@@ -0,0 +1,68 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+from unittest.mock import MagicMock
+
+# map_generator doesn't export the tile ids game_loop imports (same patch as the dialogue tests)
+import brqse_engine.world.map_generator as map_generator
+for _name, _value in (("TILE_WALL", 0), ("TILE_FLOOR", 1), ("TILE_TREE", 2), ("TILE_ENEMY", 3), ("TILE_DOOR", 4),
+                      ("TILE_LOOT", 6), ("TILE_ENTRANCE", 7), ("TILE_HAZARD", 8)):
+    if not hasattr(map_generator, _name):
+        setattr(map_generator, _name, _value)
+
+from brqse_engine.core.actions import EXPLORE_ACTIONS, COMBAT_ACTIONS
+from brqse_engine.core.game_loop import GameLoopController, COMBAT_PASS
+
+def make_loop():
+    chaos = MagicMock()
+    chaos.chaos_level = 1
+    loop = GameLoopController(chaos, seed=3)
+    scene = MagicMock()
+    scene.grid = [[1 for _ in range(20)] for _ in range(20)]
+    loop.active_scene = scene
+    loop.player_pos = (5, 5)
+    loop.narrator = None
+    loop._finish_exploration_action = MagicMock()
+    return loop
+
+def test_aliases_route_to_one_handler():
+    print("--- Testing Action Dispatch ---")
+    assert EXPLORE_ACTIONS["use"].handler is EXPLORE_ACTIONS["interact"].handler
+    assert EXPLORE_ACTIONS["skill"].handler is EXPLORE_ACTIONS["cast"].handler
+    assert COMBAT_ACTIONS["attack"].handler is COMBAT_ACTIONS["move"].handler
+    loop = make_loop()
+    res = loop.handle_action("use", 6, 5)
+    assert res["success"] and res["action"] == "use"
+    assert "explore:use" in {r["action"] for r in loop.action_timings()}
+    print("PASS: Aliases dispatch to the shared handler, timed under their own name.")
+
+def test_unknown_action_fallback():
+    loop = make_loop()
+    res = loop.handle_action("dance", 6, 5)
+    assert not res["success"] and res["reason"] == "Unknown action: dance"
+    assert "explore:unknown" in {r["action"] for r in loop.action_timings()}
+    assert COMBAT_ACTIONS.get("dance", COMBAT_PASS) is COMBAT_PASS
+    print("PASS: Unknown exploration actions fail cleanly.")
+
+def test_target_validation():
+    loop = make_loop()
+    assert "integer" in loop.handle_action("move", "6", 5)["reason"]
+    assert "off the map" in loop.handle_action("move", 25, 5)["reason"]
+    assert not loop._finish_exploration_action.called
+
+def test_failed_move_skips_finish():
+    loop = make_loop()
+    loop._process_move = MagicMock(return_value={"success": False, "reason": "Blocked"})
+    res = loop.handle_action("move", 6, 5)
+    assert not res["success"]
+    assert not loop._finish_exploration_action.called, "FAIL: A failed move must not roll tension / enemies"
+    loop._process_move = MagicMock(return_value={"success": True})
+    assert loop.handle_action("move", 6, 5)["success"]
+    assert loop._finish_exploration_action.called
+    print("PASS: Only successful moves run the after-action phase.")
+
+if __name__ == "__main__":
+    test_aliases_route_to_one_handler()
+    test_unknown_action_fallback()
+    test_target_validation()
+    test_failed_move_skips_finish()
@@ -0,0 +1,58 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.core.actions import ActionSpec, action, normalize_result
+
+def handler(loop, action_type, x, y, **kwargs):
+    return {"success": True}
+
+def test_table_lookup_and_aliases():
+    print("--- Testing Action Tables ---")
+    table = {}
+    action(table, "interact", "use", "open", target=True)(handler)
+    assert set(table) == {"interact", "use", "open"}
+    assert all(spec.handler is handler for spec in table.values()), "FAIL: Aliases should share the handler"
+    assert table["use"].name == "use" and table["use"].target
+    assert table.get("dance") is None
+    print("PASS: Every alias is its own table entry for one handler.")
+
+def test_validate_target():
+    spec = ActionSpec("move", handler, target=True)
+    assert spec.validate(3, 4, {}, (10, 10)) is None
+    assert "needs a target" in spec.validate(None, 4, {})
+    assert "integer" in spec.validate("3", 4, {})
+    assert "integer" in spec.validate(3.0, 4, {})
+    assert "integer" in spec.validate(True, 4, {})
+    assert "off the map" in spec.validate(10, 4, {}, (10, 10))
+    assert "off the map" in spec.validate(2, -1, {}, (10, 10))
+    assert spec.validate(50, 50, {}) is None  # No bounds known: only the type is checked
+    print("PASS: Targets must be integer tiles inside the map.")
+
+def test_validate_args():
+    spec = ActionSpec("cast", handler, args=("ability", "name"))
+    assert spec.validate(None, None, {"name": "Mend"}) is None
+    assert "ability, name" in spec.validate(None, None, {})
+
+def test_finishes():
+    assert ActionSpec("search", handler).finishes({"success": False})
+    assert not ActionSpec("equip", handler, finish=False).finishes({"success": True})
+    move = ActionSpec("move", handler, finish="success")
+    assert move.finishes({"success": True}) and not move.finishes({"success": False})
+
+def test_normalize_result():
+    ok = normalize_result({"success": 1}, "wait")
+    assert ok == {"success": True, "action": "wait", "log": ""}
+    bad = normalize_result({"log": "Blocked."}, "move")
+    assert bad["success"] is False and bad["reason"] == "Blocked." and bad["action"] == "move"
+    assert normalize_result({}, "smash")["reason"] == "Failed"
+    kept = normalize_result({"success": True, "action": "use", "log": "Opened."}, "interact")
+    assert kept["action"] == "use" and kept["log"] == "Opened."
+    print("PASS: Results always carry success, action and log / reason.")
+
+if __name__ == "__main__":
+    test_table_lookup_and_aliases()
+    test_validate_target()
+    test_validate_args()
+    test_finishes()
+    test_normalize_result()
@@ -0,0 +1,38 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat import ai_benchmark
+from brqse_engine.combat.mechanics import CombatEngine
+
+def test_scenarios_run_and_count():
+    print("--- Testing AI Benchmark ---")
+    original = CombatEngine.move_char
+    report = ai_benchmark.run_all(["duel_melee", "caster_teams"], seeds=(0,))
+    assert CombatEngine.move_char is original, "FAIL: Call counters left installed"
+    for name, s in report["scenarios"].items():
+        assert s["decisions"] > 0 and s["errors"] == 0, f"FAIL: {name} {s}"
+        assert s["p99_ms"] >= s["p50_ms"] > 0
+        assert set(s["calls"]) == set(ai_benchmark.COUNTED)
+    assert report["scenarios"]["caster_teams"]["calls"]["activate_ability"] > 0, "FAIL: Casters never cast"
+    print("PASS: Scenarios ran")
+
+def test_counts_are_seeded():
+    a = ai_benchmark.run_scenario("kiting_ranged", seeds=(3,))
+    b = ai_benchmark.run_scenario("kiting_ranged", seeds=(3,))
+    assert a["decisions"] == b["decisions"] and a["calls"] == b["calls"], "FAIL: Same seed, different fight"
+
+def test_compare_flags_slowdowns():
+    report = ai_benchmark.run_all(["duel_melee"], seeds=(0,))
+    lines, regressed = ai_benchmark.compare(report, report)
+    assert not regressed
+    slow = {"scenarios": {"duel_melee": dict(report["scenarios"]["duel_melee"],
+                                             p99_ms=report["scenarios"]["duel_melee"]["p99_ms"] / 10)}}
+    lines, regressed = ai_benchmark.compare(report, slow, tolerance=0.25)
+    assert regressed and any("REGRESSION" in l for l in lines)
+    print("PASS: Baseline compare")
+
+if __name__ == "__main__":
+    test_scenarios_run_and_count()
+    test_counts_are_seeded()
+    test_compare_flags_slowdowns()
@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat import aoe
+
+def make(name, hp=50):
+    c = Combatant(data={"Name": name, "Stats": {}})
+    c.hp = c.max_hp = hp
+    return c
+
+def test_template_shapes():
+    print("--- Testing AoE Templates ---")
+    assert len(aoe.offsets("burst", 2)) == 25 and (0, 0) in aoe.offset_set("burst", 2)
+    assert aoe.offsets("line", 3, "E") == ((1, 0), (2, 0), (3, 0))
+    assert aoe.offsets("wall", 3, "N") == ((-1, 0), (0, 0), (1, 0))
+    cone = aoe.offset_set("cone", 2, "E")
+    assert (1, 0) in cone and (2, 2) in cone and (1, 2) not in cone and (0, 0) not in cone
+    assert aoe.offsets("cone", 4, "E") is aoe.offsets("cone", 4, "E"), "FAIL: Templates should be cached"
+    assert aoe.facing_toward(0, 0, 5, -5) == "NE" and aoe.facing_toward(3, 3, 3, 9) == "S"
+    assert aoe.tiles_in_template("burst", 1, 0, 0, cols=5, rows=5) == [(0, 0), (1, 0), (0, 1), (1, 1)]
+    print("PASS: burst / cone / line / wall offsets.")
+
+def test_power_shapes_map_to_templates():
+    assert aoe.power_shape_template("Blast") == ("burst", 4)
+    assert aoe.power_shape_template("Cone") == ("cone", 4)
+    assert aoe.power_shape_template("Line") == ("line", 6)
+    assert aoe.power_shape_template("Wall") == ("wall", 10)
+    assert aoe.power_shape_template("Chain") is None
+
+def test_combatants_in_template():
+    eng = CombatEngine(10, 10)
+    a, b, c = make("A"), make("B"), make("C")
+    eng.add_combatant(a, 2, 5)
+    eng.add_combatant(b, 4, 5)
+    eng.add_combatant(c, 4, 8)
+    hit = eng.get_combatants_in_template("cone", 3, 2, 5, "E")
+    assert hit == [b], f"FAIL: Cone caught {[x.name for x in hit]}"
+    big = eng.get_combatants_in_template("burst", 6, 4, 5)
+    assert set(big) == {a, b, c}
+    c.hp = 0
+    assert c not in eng.get_combatants_in_template("burst", 6, 4, 5)
+
+def test_hazard_index():
+    eng = CombatEngine(8, 8, seed=3)
+    victim = make("Victim")
+    eng.add_combatant(victim, 3, 3)
+    zone = eng.add_hazard(3, 2, shape="burst", size=1, duration=2, damage_dice="2d4")
+    assert eng.hazards_at(3, 3) == [zone] and not eng.hazards_at(5, 5) and len(eng.hazards) == 1
+    ok, log = eng.start_turn(victim)
+    assert victim.hp < 50 and any("Fire Zone" in line for line in log)
+    assert eng.tick_hazards() == [] and eng.tick_hazards() == [zone]
+    assert not eng.hazards_at(3, 3) and len(eng.hazards) == 0
+    print("PASS: Hazards indexed by tile and expire in place.")
+
+if __name__ == "__main__":
+    test_template_shapes()
+    test_power_shapes_map_to_templates()
+    test_combatants_in_template()
+    test_hazard_index()
@@ -0,0 +1,82 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat.ai_engine import AIDecisionEngine
+
+def brute_clusters(me, engine):
+    """The old O(n^2) search, for comparison."""
+    enemies = [c for c in engine.combatants if c.is_alive() and c.team != me.team]
+    out = {}
+    for e in enemies:
+        count = sum(1 for o in enemies if max(abs(e.x - o.x), abs(e.y - o.y)) <= 2 and o.team == e.team)
+        if count > 1:
+            out[e.name] = count
+    return out
+
+def setup(n, size, seed):
+    eng = CombatEngine(size, size, seed=seed)
+    rng = random.Random(seed)
+    free = [(x, y) for x in range(size) for y in range(size)]
+    rng.shuffle(free)
+    for i in range(n):
+        c = Combatant(data={"Name": f"U{i}", "Stats": {"Might": 12}})
+        c.team = "ABC"[i % 3]
+        eng.add_combatant(c, *free.pop())
+    eng.start_combat()
+    return eng, rng, free
+
+def test_patches_match_full_scan():
+    print("--- Testing Battlefield Picture ---")
+    eng, rng, free = setup(40, 16, 4)
+    ai = AIDecisionEngine()
+    for step in range(300):
+        c = rng.choice(eng.combatants)
+        if rng.random() < 0.1:
+            c.hp = 0
+        elif free:
+            free.append((c.x, c.y))
+            c.x, c.y = free.pop(rng.randrange(len(free) - 1))
+        me = rng.choice([u for u in eng.combatants if u.is_alive()])
+        ctx = ai.analyze_battlefield(me, eng)
+        got = {d["center"].name: d["count"] for d in ctx["clusters"]}
+        assert got == brute_clusters(me, eng), f"FAIL: Clusters drifted at step {step}"
+        alive = {u.name for u in eng.combatants if u.is_alive() and u.team != me.team}
+        assert {d["obj"].name for d in ctx["enemies"]} == alive
+        assert [d["dist"] for d in ctx["enemies"]] == sorted(d["dist"] for d in ctx["enemies"])
+    assert eng.battlefield.builds == 1, "FAIL: Moves and deaths should patch, not rebuild"
+    eng.round_counter += 1
+    ai.analyze_battlefield(me, eng)
+    assert eng.battlefield.builds == 2
+    print(f"PASS: 300 moves/deaths patched ({eng.battlefield.patches} patches, 1 build).")
+
+def test_focus_and_threat():
+    eng, _, _ = setup(6, 8, 1)
+    ai = AIDecisionEngine()
+    me = eng.combatants[0]
+    victim = [c for c in eng.combatants if c.team != me.team][0]
+    victim.hp = 1
+    ctx = ai.analyze_battlefield(me, eng)
+    assert ctx["focus"][0] is victim, "FAIL: Nearly dead enemy should be the focus target"
+    assert ctx["threat"] > 0
+
+def test_large_groups_scale():
+    timings = []
+    for n in (100, 400):
+        eng, _, _ = setup(n, 60, 2)
+        ai = AIDecisionEngine()
+        start = time.perf_counter()
+        for c in eng.combatants:
+            ai.analyze_battlefield(c, eng)
+        timings.append((time.perf_counter() - start) / n)
+    # 4x the units: per-turn cost should grow ~linearly (old search: ~16x)
+    assert timings[1] < timings[0] * 8, f"FAIL: per-turn {timings[0]*1e6:.0f}us -> {timings[1]*1e6:.0f}us"
+    print(f"PASS: per AI turn {timings[0]*1e6:.0f}us (100 units) -> {timings[1]*1e6:.0f}us (400 units).")
+
+if __name__ == "__main__":
+    test_patches_match_full_scan()
+    test_focus_and_threat()
+    test_large_groups_scale()
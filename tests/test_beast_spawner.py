@@ -1,6 +1,7 @@
 import sys
 import os
 import json
+import tempfile
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "c:/Users/krazy/Desktop/BRQSE"))
@@ -8,14 +9,15 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "c:/Users/krazy/Desktop/
 from brqse_engine.combat.enemy_spawner import spawner
 from brqse_engine.world.encounter_table import EncounterTable
 
-def test_spawner():
+def test_spawner(tmp_path=None):
     print("--- Testing Beast Spawner ---")
+    out_dir = str(tmp_path or tempfile.mkdtemp())  # Keep Saves/temp clean
     
     # Test Biome Filtering
     biomes = ["DUNGEON", "CAVE", "FOREST"]
     for b in biomes:
         print(f"\nRolling for Biome: {b}")
-        path = spawner.spawn_beast(biome=b, level=1)
+        path = spawner.spawn_beast(biome=b, level=1, out_dir=out_dir)
         with open(path, 'r') as f:
             data = json.load(f)
         print(f"Spawned: {data['Name']} (Species: {data['Species']})")
@@ -24,8 +26,8 @@ def test_spawner():
 
     # Test Level Scaling
     print("\n--- Testing Level Scaling ---")
-    path_l1 = spawner.spawn_beast(biome="DUNGEON", level=1)
-    path_l5 = spawner.spawn_beast(biome="DUNGEON", level=5)
+    path_l1 = spawner.spawn_beast(biome="DUNGEON", level=1, out_dir=out_dir)
+    path_l5 = spawner.spawn_beast(biome="DUNGEON", level=5, out_dir=out_dir)
     
     with open(path_l1, 'r') as f: d1 = json.load(f)
     with open(path_l5, 'r') as f: d5 = json.load(f)
@@ -0,0 +1,53 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.abilities import engine_hooks
+from brqse_engine.combat.combatant_factory import CombatantFactory
+from brqse_engine.combat.enemy_spawner import spawner
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+
+def fields(c):
+    return (c.species, c.stats, c.derived, dict(c.skills), c.traits, c.powers, c.max_hp, c.hp,
+            c.max_cmp, c.max_sp, c.max_fp, c.movement, c.team,
+            {k: v and v.name for k, v in c.inventory.equipped.items()})
+
+def test_stamp_matches_full_build():
+    print("--- Testing Combatant Factory ---")
+    beast_id = spawner.beast_data[0]["Entity_ID"]
+    factory = CombatantFactory()
+    goblins = [factory.spawn_beast(beast_id, name=f"Goblin {i}", team="Enemies") for i in range(30)]
+    assert factory.builds == 1 and factory.stamps == 30, "FAIL: Expected one prototype build"
+
+    fresh = Combatant(data=spawner.build_beast_data(beast_id))
+    fresh.team = "Enemies"
+    assert fields(goblins[0]) == fields(fresh), "FAIL: Stamp differs from a full build"
+    assert goblins[3].name == "Goblin 3"
+    assert engine_hooks.get_hook_table(goblins[0]) is engine_hooks.get_hook_table(goblins[1])
+    print("PASS: 30 spawns = 1 build + 30 stamps, identical to Combatant(data=...).")
+
+def test_stamps_are_independent():
+    factory = CombatantFactory()
+    data = {"Name": "Dummy", "Stats": {"Might": 14}, "Skills": ["Guard"], "Inventory": ["Rapier"]}
+    a, b = factory.from_data(data), factory.from_data(data, name="Other")
+    eng = CombatEngine(6, 6, seed=3)
+    eng.add_combatant(a, 1, 1)
+    eng.add_combatant(b, 2, 1)
+    a.hp -= 5
+    a.is_prone = True
+    a.stats["Might"] = 30
+    a.traits.append("Extra")
+    a.inventory.equipped["Main Hand"] = None
+    assert b.hp == b.max_hp and not b.is_prone and b.stats["Might"] == 14
+    assert "Extra" not in b.traits and b.name == "Other"
+    assert b.inventory.equipped["Main Hand"].name == "Rapier"
+    a.data["AI"] = "Coward"  # What arena / save_state do to a unit's data
+    a.data["XP"] = 99
+    assert "AI" not in b.data and "XP" not in data, "FAIL: Stamps must not share the data dict"
+    assert a.data["Stats"] is a.stats and data["Stats"]["Might"] == 14
+    assert factory.prototype(("data", id(data)), dict).x == 0, "FAIL: Prototype must stay off the map"
+    assert factory.builds == 1
+
+if __name__ == "__main__":
+    test_stamp_matches_full_build()
+    test_stamps_are_independent()
@@ -0,0 +1,68 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import Combatant
+from brqse_engine.core.constants import Conditions, CONDITION_BITS, condition_bit
+
+def make(name="Test"):
+    return Combatant(data={"Name": name, "Stats": {"Might": 12, "Reflexes": 12}})
+
+def test_flags_are_mask_bits():
+    print("--- Testing Condition Bitmask ---")
+    c = make()
+    assert c.conditions == 0
+    c.is_blessed = True
+    c.is_prone = True
+    assert c.conditions == condition_bit(Conditions.BLESSED) | condition_bit(Conditions.PRONE)
+    assert c.status.has("prone") and c.status.has(Conditions.BLESSED)
+    c.is_blessed = False
+    assert not c.is_blessed and c.is_prone
+    print("PASS: is_* flags read/write single bits.")
+
+def test_timed_vs_untimed():
+    c = make()
+    c.is_staggered = True   # Timed condition: 1 round
+    c.is_hasted = True      # Untimed flag
+    expired = c.tick_effects()
+    assert expired == ["Staggered"] and not c.is_staggered
+    assert c.is_hasted, "FAIL: Untimed flags must not tick out"
+
+def test_advantage_checks():
+    a, b = make("A"), make("B")
+    assert not a.has_attack_advantage() and not a.has_attack_disadvantage()
+    a.is_invisible = True
+    assert a.has_attack_advantage() and b.is_attack_target_advantaged(a)
+    assert a.is_attack_target_disadvantaged(b)
+    b.is_shaken = True
+    assert b.has_defense_disadvantage() and not b.has_defense_advantage()
+    b.is_grappled = True
+    assert b.get_effective_speed() == 0
+
+def test_unknown_effects_get_bits():
+    c = make()
+    c.apply_effect("Broken Arm", duration=-1)
+    assert c.status.has("Broken Arm") and "Broken arm" in CONDITION_BITS
+    assert "Broken arm" in c.status._active_conditions
+    assert not make().status.has("Broken Arm")
+
+def test_compact_instance():
+    data = {"Name": "Slim", "Stats": {}}
+    c = Combatant(data=data)
+    assert c.data is data, "FAIL: Source data should be referenced, not copied"
+    assert not hasattr(c, "__dict__"), "FAIL: Combatant should not carry a __dict__"
+    c.has_key = "KEY_1"  # Declared extras still work
+    assert c.has_key == "KEY_1"
+    try:
+        c.not_a_field = 1
+        assert False, "FAIL: Undeclared attributes should be rejected"
+    except AttributeError:
+        pass
+    print("PASS: Slotted combatant, shared data.")
+
+if __name__ == "__main__":
+    test_flags_are_mask_bits()
+    test_timed_vs_untimed()
+    test_advantage_checks()
+    test_unknown_effects_get_bits()
+    test_compact_instance()
@@ -0,0 +1,98 @@
+import sys
+import os
+import shutil
+import tempfile
+import threading
+sys.path.append(os.getcwd())
+
+from brqse_engine.core.data_registry import DataRegistry, FrozenDict, game_data
+from brqse_engine.combat.mechanics import Combatant
+from brqse_engine.systems.inventory import Inventory
+
+def test_tables_parsed_once():
+    print("--- Testing Shared Data Registry ---")
+    reg = DataRegistry()
+    first = reg.csv_rows("Skills.csv")
+    loads = reg.loads
+    second = reg.csv_rows("Skills.csv")
+    assert first is second, "FAIL: Table should be cached"
+    assert reg.loads == loads, "FAIL: Second call should not touch disk"
+    assert first and isinstance(first[0], FrozenDict)
+    print(f"PASS: {len(first)} skills parsed once.")
+
+def test_rows_are_read_only():
+    rows = game_data.csv_rows("Talents.csv")
+    try:
+        rows[0]["Talent_Name"] = "Hacked"
+        assert False, "FAIL: Shared rows must be read-only"
+    except TypeError:
+        pass
+    # Copies are editable
+    copy = dict(rows[0])
+    copy["Talent_Name"] = "Edited"
+    assert rows[0]["Talent_Name"] != "Edited"
+    print("PASS: Rows are immutable.")
+
+def test_normalized_view():
+    raw = game_data.csv_rows("Mammal_Skills.csv")
+    norm = game_data.csv_rows("Mammal_Skills.csv", normalize=True)
+    assert "Skill Name" in raw[0]
+    assert "Skill_Name" in norm[0]
+    assert len(raw) == len(norm)
+
+def test_threaded_first_load():
+    reg = DataRegistry()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(reg.csv_rows("Talents.csv"))) for _ in range(8)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert all(r is results[0] for r in results), "FAIL: Threads saw different tables"
+    assert reg.loads == 1
+
+def test_combatants_share_tables():
+    Combatant(data={"Name": "Warmup"})
+    loads = game_data.loads
+    for i in range(30):
+        Combatant(data={"Name": f"Goblin {i}", "Inventory": ["Greatsword"]})
+    assert game_data.loads == loads, "FAIL: Spawning combatants re-read data files"
+    assert Inventory().db is Inventory().db
+    print("PASS: 30 spawns, zero file reads.")
+
+def test_snapshot_round_trip():
+    tmp = tempfile.mkdtemp()
+    try:
+        data_dir = os.path.join(tmp, "Data")
+        web_dir = os.path.join(tmp, "web")
+        os.makedirs(data_dir); os.makedirs(web_dir)
+        shutil.copy(os.path.join("Data", "Skills.csv"), data_dir)
+        with open(os.path.join(web_dir, "Gear.json"), "w") as f:
+            f.write('{"Rope": {"Cost": 1}}')
+        snap = os.path.join(tmp, "cache", "game_data.snapshot")
+
+        DataRegistry(data_dir, web_dir, snapshot_path=snap).build_snapshot()
+
+        # Fresh process-equivalent: everything comes from the snapshot
+        reg = DataRegistry(data_dir, web_dir, snapshot_path=snap)
+        skills = reg.csv_rows("Skills.csv")
+        assert reg.snapshot_loaded and reg.loads == 0, "FAIL: Snapshot should skip parsing"
+        assert skills == game_data.csv_rows("Skills.csv")
+        assert reg.json_data("Gear.json")["Rope"]["Cost"] == 1
+
+        # Editing a source invalidates the snapshot -> rebuilt on next boot
+        with open(os.path.join(web_dir, "Gear.json"), "w") as f:
+            f.write('{"Rope": {"Cost": 2}}')
+        assert not DataRegistry(data_dir, web_dir, snapshot_path=snap).load_snapshot(rebuild=False)
+        reg = DataRegistry(data_dir, web_dir, snapshot_path=snap)
+        assert reg.json_data("Gear.json")["Rope"]["Cost"] == 2
+        assert DataRegistry(data_dir, web_dir, snapshot_path=snap).load_snapshot(rebuild=False)
+        print("PASS: Snapshot round trip + rebuild on change.")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+if __name__ == "__main__":
+    test_tables_parsed_once()
+    test_rows_are_read_only()
+    test_normalized_view()
+    test_threaded_first_load()
+    test_combatants_share_tables()
+    test_snapshot_round_trip()
@@ -0,0 +1,52 @@
+import sys
+import os
+import random
+sys.path.append(os.getcwd())
+
+from brqse_engine.core import dice as dice_mod
+from brqse_engine.core.dice import Dice, compile_dice
+from brqse_engine.core.probability import expected
+
+def test_compile_once():
+    print("--- Testing Dice Compiler ---")
+    assert compile_dice("2d6 + 3") is compile_dice("2d6 + 3"), "FAIL: Expressions should be cached"
+    expr = compile_dice("4d6kh3+1d4-2")
+    assert [(t.count, t.sides, t.keep) for t in expr.terms] == [(4, 6, 3), (1, 4, 0)] and expr.flat == -2
+    assert compile_dice("2d20kl1").terms[0].keep == -1 and compile_dice("1d6!").terms[0].explode
+    assert compile_dice("1d6 Fire").text == "1d6" and compile_dice("Fire") is None
+    assert Dice.roll("7") == (7, [], "7") and Dice.roll("nope")[2] == "Invalid Expression"
+    print("PASS: keep / explode / multi-term parsed once.")
+
+def test_same_draws_as_randint():
+    # Compiled rolls must replay seeds recorded before the compiler existed
+    a, b = random.Random(5), random.Random(5)
+    old = [sum(a.randint(1, 6) for _ in range(2)) + 3 for _ in range(50)]
+    assert [compile_dice("2d6+3").roll(b) for _ in range(50)] == old
+    total, rolls, text = Dice.roll("2d6+3", random.Random(9))
+    assert total == sum(rolls) + 3 and text.startswith("2d6+3: [")
+
+def test_ranges_and_means():
+    rng = random.Random(1)
+    for expr, lo, hi in (("4d6kh3", 3, 18), ("2d20kl1", 1, 20), ("1d4!", 1, 4 * 11)):
+        rolls = compile_dice(expr).roll_many(20000, rng)
+        assert min(rolls) >= lo and max(rolls) <= hi
+        mean = sum(rolls) / len(rolls)
+        assert abs(mean - expected(expr)) < 0.15, f"FAIL: {expr} mean {mean:.2f} vs {expected(expr):.2f}"
+
+def test_batch_rolls():
+    assert len(Dice.roll_many("1d20", 100, random.Random(3))) == 100
+    if dice_mod.np is None:
+        print("SKIP: NumPy not installed, vectorized path not exercised.")
+        return
+    np = dice_mod.np
+    a = compile_dice("3d6!+2").roll_many(100000, np.random.default_rng(4))
+    b = compile_dice("3d6!+2").roll_many(100000, np.random.default_rng(4))
+    assert (a == b).all() and a.min() >= 5
+    assert abs(a.mean() - expected("3d6!+2")) < 0.1
+    print("PASS: Vectorized batch is seeded and matches the exact mean.")
+
+if __name__ == "__main__":
+    test_compile_once()
+    test_same_draws_as_randint()
+    test_ranges_and_means()
+    test_batch_rolls()
@@ -0,0 +1,48 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.abilities.effects_registry import EffectRegistry
+from brqse_engine.core.data_registry import game_data
+
+def test_plan_cached_and_invalidated():
+    print("--- Testing Effect Plan Cache ---")
+    reg = EffectRegistry()
+    calls = []
+    reg.register_pattern(r"Plan Test (\d+)", lambda m, ctx: calls.append(m.group(1)))
+
+    assert reg.resolve("Plan Test 7", {}) is True
+    assert reg.resolve("Plan Test 7", {}) is True
+    assert calls == ["7", "7"], "FAIL: Cached plan must still run the handler"
+    assert reg.plan_misses == 1 and reg.plan_hits == 1
+
+    # New pattern at runtime -> old plans dropped
+    reg.register_pattern(r"Plan Test", lambda m, ctx: calls.append("extra"))
+    reg.resolve("Plan Test 7", {})
+    assert calls[-2:] == ["7", "extra"], "FAIL: Stale plan after register_pattern"
+    assert reg.plan_misses == 2
+    print(f"PASS: {reg.plan_cache_stats()}")
+
+def test_plan_cache_is_bounded():
+    reg = EffectRegistry()
+    reg.PLAN_CACHE_SIZE = 10
+    for i in range(50):
+        reg.compile_plan(f"Stun {i}")
+    assert reg.plan_cache_stats()["size"] == 10
+
+def _key(plan):
+    return [(h, m.span(), m.groups()) for h, m in plan]
+
+def test_prefilter_matches_full_scan():
+    reg = EffectRegistry()
+    descs = [r["Description"] for r in game_data.csv_rows("Schools of Power.csv")]
+    descs += [r["Effect"] for r in game_data.csv_rows("Mammal_Skills.csv")]
+    descs += ["Deal 2d6 Fire Damage and Stun", "Cure Poison", "PUSH 10ft", "Résist Fire", ""]
+    for d in descs:
+        assert _key(reg.compile_plan(d)) == _key(reg.scan_all(d)), f"FAIL: Prefilter changed plan for {d!r}"
+    print(f"PASS: {len(descs)} descriptions resolve identically.")
+
+if __name__ == "__main__":
+    test_plan_cached_and_invalidated()
+    test_plan_cache_is_bounded()
+    test_prefilter_matches_full_scan()
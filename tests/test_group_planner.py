@@ -0,0 +1,112 @@
+import sys
+import os
+import pickle
+import time
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat import snapshot
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat import group_planner
+from brqse_engine.combat.group_planner import GroupPlanner
+from brqse_engine.combat.planner import LookaheadPlanner
+
+def make(name, team, ai="Tactician"):
+    c = Combatant(data={"Name": name, "Stats": {"Might": 14, "Reflexes": 12}, "AI": ai,
+                        "Inventory": ["Greatsword"]})
+    c.team = team
+    return c
+
+def setup(horde=8):
+    eng = CombatEngine(16, 16, seed=8)
+    for i in range(horde):
+        eng.add_combatant(make(f"M{i}", "Enemies"), 2 + i % 6, 2 + i // 6)
+    for i in range(2):
+        eng.add_combatant(make(f"P{i}", "Players", "Aggressive"), 6 + i, 7)
+    eng.create_wall(4, 5)
+    eng.start_combat()
+    return eng
+
+def state(eng):
+    return [(c.name, c.x, c.y, c.hp, c.cmp, c.conditions) for c in eng.combatants]
+
+def test_export_rebuild():
+    print("--- Testing Group Planning ---")
+    eng = setup()
+    eng.combatants[1].is_prone = True
+    eng.combatants[2].has_key, eng.combatants[2].key_name = "KEY_GOLD", "gold"
+    copy = snapshot.rebuild(pickle.loads(pickle.dumps(snapshot.export(eng))))
+    assert copy.combatants[2].has_key == "KEY_GOLD" and copy.combatants[2].key_name == "gold", \
+        "FAIL: Plain extras (key drops) must survive export / rebuild"
+    assert not hasattr(copy.combatants[3], "has_key")
+    assert state(copy) == state(eng) and sorted(copy.walls) == sorted(eng.walls)
+    assert copy.get_active_char().name == eng.get_active_char().name
+    assert [c.name for c in copy.scheduler.upcoming()] == [c.name for c in eng.scheduler.upcoming()]
+
+def test_commit_in_initiative_order():
+    eng = setup()
+    horde = [c for c in eng.combatants if c.team == "Enemies"]
+    gp = GroupPlanner(budget_ms=10000, workers=1, max_depth=1)
+    log = gp.run(eng, horde)
+    names = {c.name for c in horde}
+    acted = [line[5:].split(":")[0] for line in log if line[5:].split(":")[0] in names]
+    order = [c.name for c in sorted(horde, key=lambda c: -c.initiative)]
+    assert acted == order, "FAIL: Commits must follow initiative order"
+    tiles = [(c.x, c.y) for c in eng.combatants]
+    assert len(set(tiles)) == len(tiles), "FAIL: Two units ended on one tile"
+    print(f"PASS: {len(horde)} plans committed in order, {gp.replans} re-planned.")
+
+def test_pool_matches_in_process():
+    results = []
+    for workers in (1, 2):
+        eng = setup(6)
+        gp = GroupPlanner(budget_ms=10000, workers=workers, max_depth=1)
+        gp.run(eng, [c for c in eng.combatants if c.team == "Enemies"])
+        gp.close()
+        results.append(state(eng))
+    assert results[0] == results[1], "FAIL: Parallel planning must commit exactly like serial"
+    print("PASS: Process pool and in-process planning give the same turn.")
+
+def test_pool_sized_by_workers_not_first_batch():
+    eng = setup(6)
+    horde = [c for c in eng.combatants if c.team == "Enemies"]
+    gp = GroupPlanner(budget_ms=10000, workers=3, max_depth=1)
+    gp.plan_all(eng, horde[:2])
+    plans = gp.plan_all(eng, horde)
+    assert gp._pool._max_workers == 3, "FAIL: Pool size must not follow the first batch"
+    assert list(plans) == horde, "FAIL: Every actor should get its plan back, in order"
+    gp.close()
+    assert gp._pool is None
+    print("PASS: Pool sized by workers, shut down by close().")
+
+class FullBudgetPlanner(LookaheadPlanner):
+    """Searches until its budget runs out, every time (a worst-case horde turn)."""
+    def plan(self, me, engine, budget_ms=None):
+        time.sleep((self.budget_ms if budget_ms is None else budget_ms) / 1000.0)
+        return None
+
+def test_horde_stays_within_budget():
+    budget_ms = 200
+    original = group_planner.LookaheadPlanner
+    group_planner.LookaheadPlanner = FullBudgetPlanner  # Forked workers inherit it too
+    try:
+        for workers in (1, 2):
+            eng = setup(8)
+            horde = [c for c in eng.combatants if c.team == "Enemies"]
+            gp = GroupPlanner(budget_ms=budget_ms, workers=workers)
+            gp.plan_all(eng, horde[:2])  # Warm up the pool
+            start = time.perf_counter()
+            gp.plan_all(eng, horde)
+            took_ms = (time.perf_counter() - start) * 1000
+            gp.close()
+            assert took_ms < 2 * budget_ms, \
+                f"FAIL: {len(horde)} plans on {workers} worker(s) took {took_ms:.0f} ms for a {budget_ms} ms budget"
+    finally:
+        group_planner.LookaheadPlanner = original
+    print(f"PASS: A horde bigger than the pool plans within one {budget_ms} ms budget.")
+
+if __name__ == "__main__":
+    test_export_rebuild()
+    test_commit_in_initiative_order()
+    test_pool_matches_in_process()
+    test_pool_sized_by_workers_not_first_batch()
+    test_horde_stays_within_budget()
@@ -0,0 +1,62 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.abilities import engine_hooks
+from brqse_engine.abilities.effects_registry import registry
+from brqse_engine.combat.mechanics import Combatant
+
+def _effects(c, hook_type):
+    table = engine_hooks.get_hook_table(c)
+    return [eff for eff, _ in table.get(hook_type, table[None])]
+
+def test_table_bucketed_and_cached():
+    print("--- Testing Hook Tables ---")
+    original = engine_hooks.get_entity_effects
+    calls = []
+    def fake_effects(c):
+        calls.append(c.name)
+        return ["Deal 5 Fire Damage", "Resistance to Cold", "Gibberish with no pattern"]
+    engine_hooks.get_entity_effects = fake_effects
+    try:
+        c = Combatant(data={"Name": "Hooked"})
+        assert _effects(c, "ON_ATTACK") == ["Deal 5 Fire Damage"], "FAIL: ON_ATTACK keyword bucket"
+        assert _effects(c, "ON_DEFEND") == ["Deal 5 Fire Damage", "Resistance to Cold"]
+        assert _effects(c, "ON_SOMETHING_NEW") == _effects(c, "ON_HIT")
+        assert calls == ["Hooked"], "FAIL: Table should be built once"
+
+        # Reassigning an effect source rebuilds
+        c.powers = ["Fireball"]
+        engine_hooks.get_hook_table(c)
+        assert len(calls) == 2
+
+        # In-place edits need the explicit hook
+        c.traits.append("Something")
+        engine_hooks.get_hook_table(c)
+        assert len(calls) == 2
+        c.invalidate_hooks()
+        engine_hooks.get_hook_table(c)
+        assert len(calls) == 3
+
+        # Runtime pattern registration invalidates every table
+        registry.invalidate_plans()
+        engine_hooks.get_hook_table(c)
+        assert len(calls) == 4
+    finally:
+        engine_hooks.get_entity_effects = original
+    print("PASS: Hook table rebuilt only on change.")
+
+def test_apply_hooks_runs_handlers():
+    original = engine_hooks.get_entity_effects
+    engine_hooks.get_entity_effects = lambda c: ["Resistance to Fire"]
+    try:
+        c = Combatant(data={"Name": "Defender"})
+        ctx = {"attacker": c, "target": c, "log": []}
+        engine_hooks.apply_hooks(c, "ON_DEFEND", ctx)
+        assert ctx["log"] == ["Defender gains Resistance to Fire."], "FAIL: Handler did not run"
+    finally:
+        engine_hooks.get_entity_effects = original
+
+if __name__ == "__main__":
+    test_table_bucketed_and_cached()
+    test_apply_hooks_runs_handlers()
@@ -0,0 +1,68 @@
+import sys
+import os
+import random
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import Combatant, CombatEngine
+
+def _unit(name, team):
+    c = Combatant(data={"Name": name})
+    c.team = team
+    return c
+
+def test_index_follows_moves():
+    print("--- Testing Occupancy Index ---")
+    eng = CombatEngine(10, 10)
+    a, b = _unit("A", "Player"), _unit("B", "Enemy")
+    eng.add_combatant(a, 1, 1)
+    eng.add_combatant(b, 2, 1)
+    assert eng.get_combatant_at(2, 1) is b
+    assert eng.tiles[1][2].occupant is b
+
+    ok, msg = eng.move_char(a, 2, 1)
+    assert not ok and msg == "Blocked!"
+
+    # Direct writes (push / teleport handlers) are tracked too
+    b.x, b.y = 5, 5
+    assert eng.get_combatant_at(2, 1) is None
+    assert eng.get_combatant_at(5, 5) is b
+    assert eng.tiles[1][2].occupant is None
+    assert eng.move_char(a, 2, 1)[0]
+
+    # Dead units are ignored by living queries
+    b.hp = 0
+    assert eng.get_combatant_at(5, 5) is None
+    assert eng.get_combatants_in_radius(5, 5, 1) == []
+    assert eng.get_combatants_in_radius(5, 5, 1, alive=False) == [b]
+    print("PASS: Index tracks moves and deaths.")
+
+def test_roster_replacement_resyncs():
+    eng = CombatEngine(10, 10)
+    a, b = _unit("A", "Player"), _unit("B", "Enemy")
+    eng.add_combatant(a, 0, 0)
+    eng.add_combatant(b, 3, 3)
+    eng.combatants = [c for c in eng.combatants if c.team == "Player"]
+    assert eng.get_combatant_at(3, 3) is None
+    assert eng.get_combatant_at(0, 0) is a
+
+def test_matches_linear_scan():
+    random.seed(7)
+    eng = CombatEngine(40, 40)
+    for i in range(60):
+        eng.add_combatant(_unit(f"U{i}", random.choice(["Player", "Enemy"])),
+                          random.randrange(40), random.randrange(40))
+    for _ in range(200):
+        c = random.choice(eng.combatants)
+        c.x, c.y = random.randrange(40), random.randrange(40)
+    for c in eng.combatants:
+        expected = sum(1 for o in eng.combatants if o.team != c.team and o.is_alive()
+                       and abs(o.x - c.x) <= 1 and abs(o.y - c.y) <= 1 and o != c)
+        assert eng.count_adjacent_enemies(c) == expected
+        near = {o.name for o in eng.get_combatants_in_radius(c.x, c.y, 6)}
+        assert near == {o.name for o in eng.combatants if max(abs(o.x - c.x), abs(o.y - c.y)) <= 6}
+    print("PASS: Index agrees with a full scan on a 40x40 map with 60 units.")
+
+if __name__ == "__main__":
+    test_index_follows_moves()
+    test_roster_replacement_resyncs()
+    test_matches_linear_scan()
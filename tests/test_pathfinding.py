@@ -0,0 +1,64 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import Combatant, CombatEngine
+from brqse_engine.combat.pathfinding import PathGrid, DistanceField, find_path
+
+def _unit(name, team, eng, x, y):
+    c = Combatant(data={"Name": name})
+    c.team = team
+    eng.add_combatant(c, x, y)
+    return c
+
+def test_astar_goes_around_walls_and_mud():
+    print("--- Testing Pathfinding ---")
+    eng = CombatEngine(10, 10)
+    for y in range(0, 8):
+        eng.create_wall(5, y)  # Wall with a gap at the bottom
+    grid = PathGrid.from_engine(eng)
+    path = find_path(grid, (2, 2), (8, 2))
+    assert path and path[-1] == (8, 2)
+    assert all(p not in eng.walls for p in path)
+    assert any(y >= 8 for _, y in path), "FAIL: Path should use the gap"
+
+    # Cheap detour beats expensive mud
+    open_eng = CombatEngine(10, 3)
+    for x in range(1, 9):
+        open_eng.set_terrain(x, 1, "water_deep")
+    route = find_path(PathGrid.from_engine(open_eng), (0, 1), (9, 1))
+    assert all(y != 1 for _, y in route[:-1]), "FAIL: Path should avoid deep water"
+    print(f"PASS: {len(path)}-step path around the wall.")
+
+def test_chasers_share_one_field():
+    eng = CombatEngine(20, 20)
+    for y in range(3, 17):
+        eng.create_wall(10, y)
+    hero = _unit("Hero", "Player", eng, 15, 10)
+    goblins = [_unit(f"Goblin {i}", "Enemy", eng, 2, 4 + i) for i in range(6)]
+    before = eng.pathfinder.fields_built
+    for g in goblins:
+        for _ in range(30):
+            step = eng.pathfinder.next_step_toward(g, hero)
+            if not step: break
+            g.x, g.y = step
+    assert eng.pathfinder.fields_built - before == 1, "FAIL: Field should be shared"
+    reached = [g for g in goblins if max(abs(g.x - hero.x), abs(g.y - hero.y)) <= 1]
+    assert reached, "FAIL: Nobody got around the wall"
+    assert len({(g.x, g.y) for g in goblins}) == len(goblins), "FAIL: Units stacked"
+
+    eng.create_wall(0, 0)  # Geometry change drops cached fields
+    eng.pathfinder.next_step_toward(goblins[0], hero)
+    assert eng.pathfinder.fields_built - before == 2
+    print(f"PASS: {len(reached)} goblins reached the hero with one shared field.")
+
+def test_unreachable():
+    grid = PathGrid.from_tile_grid([[1, 0, 1], [1, 0, 1], [1, 0, 1]], wall=0)
+    assert find_path(grid, (0, 0), (2, 2)) is None
+    field = DistanceField(grid, [(2, 1)])
+    assert field.distance(0, 0) is None and field.next_step(0, 0) is None
+
+if __name__ == "__main__":
+    test_astar_goes_around_walls_and_mud()
+    test_chasers_share_one_field()
+    test_unreachable()
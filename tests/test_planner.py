@@ -0,0 +1,54 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat.planner import LookaheadPlanner
+
+def make(name, team, ai="Aggressive"):
+    c = Combatant(data={"Name": name, "Stats": {"Might": 14, "Reflexes": 12}, "AI": ai,
+                        "Inventory": ["Greatsword"]})
+    c.team = team
+    return c
+
+def setup():
+    eng = CombatEngine(12, 12, seed=21)
+    boss = make("Boss", "B", "Tactician")
+    eng.add_combatant(boss, 5, 5)
+    eng.add_combatant(make("Tank", "A"), 5, 6)
+    eng.add_combatant(make("Mage", "A"), 7, 5)
+    eng.start_combat()
+    eng.combatants[2].hp = 3  # One good hit finishes the Mage
+    return eng, boss
+
+def state(eng):
+    return [(c.name, c.x, c.y, c.hp, c.cmp, c.sp, c.fp, c.action_used, c.movement_remaining)
+            for c in eng.combatants], len(eng.replay_log)
+
+def test_plan_goes_for_the_kill():
+    print("--- Testing Lookahead Planner ---")
+    eng, boss = setup()
+    before = state(eng)
+    plan = LookaheadPlanner(budget_ms=200).plan(boss, eng)
+    assert state(eng) == before, "FAIL: Planning changed the real fight"
+    assert plan.target is eng.combatants[2], f"FAIL: Expected to finish the Mage, got {plan}"
+    assert plan.kill > 0.2
+    print(f"PASS: {plan}")
+
+def test_budget_is_anytime():
+    eng, boss = setup()
+    planner = LookaheadPlanner(budget_ms=0)
+    plan = planner.plan(boss, eng)
+    assert plan is not None and planner.last_depth == 1, "FAIL: No answer under a zero budget"
+
+def test_tactician_template_acts():
+    eng, boss = setup()
+    eng.scheduler.current = boss
+    log = eng.execute_ai_turn(boss)
+    assert any("[AI] Plan:" in line for line in log)
+    assert boss.action_used, "FAIL: Tactician should have attacked"
+
+if __name__ == "__main__":
+    test_plan_goes_for_the_kill()
+    test_budget_is_anytime()
+    test_tactician_template_acts()
@@ -0,0 +1,63 @@
+import sys
+import os
+import itertools
+sys.path.append(os.getcwd())
+
+from brqse_engine.core import probability as prob
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+
+def close(a, b):
+    return abs(a - b) < 1e-9
+
+def test_dice_pmf():
+    print("--- Testing Dice Probability ---")
+    two_d6 = prob.pmf("2d6")
+    assert close(two_d6[7], 6 / 36) and close(sum(two_d6.values()), 1.0)
+    assert min(two_d6) == 2 and max(two_d6) == 12
+    assert close(prob.expected("1d8-1"), 3.5) and close(prob.expected("2d6+1d4+3"), 12.5)
+    assert prob.pmf("5") == {5: 1.0}
+    assert prob.pmf("3d6") is prob.pmf("3d6"), "FAIL: PMFs should be memoized"
+    assert close(prob.mean(prob.d20(advantage=True)), 13.825)
+    assert prob.d20(True, True) == prob.d20()
+    print("PASS: Exact PMFs for XdY+Z and sums of terms.")
+
+def test_outcomes_match_enumeration():
+    for hit_mod, def_mod, adv in ((3, 1, False), (0, 4, True), (-2, -2, False)):
+        counts = dict.fromkeys(prob.OUTCOMES, 0)
+        total = 0
+        for a1, a2, d in itertools.product(range(1, 21), range(1, 21), range(1, 21)):
+            atk = max(a1, a2) if adv else a1
+            counts[prob.band(atk + hit_mod - d - def_mod)] += 1
+            total += 1
+        odds = prob.attack_outcomes(hit_mod, def_mod, adv)
+        for name in prob.OUTCOMES:
+            assert close(odds[name], counts[name] / total), f"FAIL: {name} for {hit_mod} vs {def_mod}"
+    assert close(prob.hit_probability(20, 0), 1.0)
+
+def test_expected_damage_and_engine_odds():
+    ev = prob.expected_damage("2d6", 2, 0)
+    o = prob.attack_outcomes(2, 0)
+    assert close(ev["hp"], 7 * o["hit"] + 14 * o["crit"]) and close(ev["cmp"], 7 * o["graze"])
+    eng = CombatEngine(6, 6)
+    a = Combatant(data={"Name": "A", "Stats": {"Might": 16}})
+    b = Combatant(data={"Name": "B", "Stats": {"Reflexes": 12}})
+    eng.add_combatant(a, 1, 1)
+    eng.add_combatant(b, 2, 1)
+    odds = eng.attack_odds(a, b)
+    mods = odds["modifiers"]
+    assert odds["outcomes"] == prob.attack_outcomes(mods["hit_mod"], mods["def_mod"], mods["atk_adv"],
+                                                    mods["atk_dis"], mods["def_adv"], mods["def_dis"])
+    assert close(sum(odds["outcomes"].values()), 1.0) and b.attacks_received_this_round == 0
+    print(f"PASS: A hits B {odds['expected']['hit_chance']:.1%}, EV {odds['expected']['hp']:.2f} HP.")
+
+def test_kill_chance():
+    o = prob.attack_outcomes(3, 1)
+    # 1d6 vs 4 HP: a hit needs 4+ (1/2), a crit needs 2+ (5/6)
+    assert close(prob.kill_chance("1d6", 4, 3, 1), o["hit"] / 2 + o["crit"] * 5 / 6)
+    assert prob.kill_chance("1d6", 0, 3, 1) == 1.0 and prob.kill_chance("1d6", 13, 3, 1) == 0.0
+
+if __name__ == "__main__":
+    test_dice_pmf()
+    test_outcomes_match_enumeration()
+    test_expected_damage_and_engine_odds()
+    test_kill_chance()
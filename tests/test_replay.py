@@ -0,0 +1,69 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat.replay import ReplayLog, ReplayReader
+
+def play(path, keyframe_every=10):
+    eng = CombatEngine(8, 8, seed=21)
+    eng.replay_log = ReplayLog(limit=10000)  # Keep everything in memory too, to compare
+    a = Combatant(data={"Name": "Alpha", "Stats": {"Might": 14}})
+    b = Combatant(data={"Name": "Beta", "Stats": {"Might": 14}})
+    eng.add_combatant(a, 1, 1)
+    eng.add_combatant(b, 2, 1)
+    eng.record_replay(path, keyframe_every)
+    eng.start_combat()
+    for _ in range(40):
+        if not (a.is_alive() and b.is_alive()): break
+        active = eng.get_active_char()
+        eng.attack_target(active, b if active is a else a)
+        eng.end_turn()
+    eng.close_replay()
+    return eng
+
+def test_round_trip_and_seek():
+    print("--- Testing Replay Stream ---")
+    path = os.path.join(tempfile.mkdtemp(), "battle.jsonl.gz")
+    eng = play(path)
+    written = list(eng.replay_log)
+    reader = ReplayReader(path)
+    assert reader.header["seed"] == 21
+    assert list(reader) == written, "FAIL: Stream does not round-trip"
+    assert len(reader.keyframes) > 2
+    start = len(written) - 5
+    assert list(reader.events(start)) == written[start:], "FAIL: Seek via keyframe"
+    state = reader.state_at(start)
+    assert {row[0] for row in state["combatants"]} == {"Alpha", "Beta"}
+    print(f"PASS: {len(written)} events, {len(reader.keyframes)} keyframes, seek ok.")
+
+def test_ring_is_bounded():
+    log = ReplayLog(limit=3)
+    for i in range(10):
+        log.append({"type": "tick", "i": i})
+    assert len(log) == 3 and log[-1]["i"] == 9 and log[0]["i"] == 7 and log.total == 10
+    log.clear()
+    assert not log and log.total == 10
+
+def test_capture_keeps_everything():
+    eng = CombatEngine(8, 8, seed=5)
+    eng.replay_log = ReplayLog(limit=3)
+    eng.add_combatant(Combatant(data={"Name": "Alpha", "Stats": {"Might": 14}}), 1, 1)
+    eng.add_combatant(Combatant(data={"Name": "Beta", "Stats": {"Might": 14}}), 2, 1)
+    with eng.replay_log.capture() as events:
+        eng.start_combat()
+        for _ in range(10):
+            a, b = eng.combatants
+            active = eng.get_active_char()
+            eng.attack_target(active, b if active is a else a)
+            eng.end_turn()
+    assert len(eng.replay_log) == 3 and len(events) > 3
+    assert events[0]["type"] == "combat_start" and events[0]["seed"] == 5, "FAIL: Header lost"
+    eng.replay_log.append({"type": "after"})
+    assert events[-1]["type"] != "after"
+
+if __name__ == "__main__":
+    test_round_trip_and_seek()
+    test_ring_is_bounded()
+    test_capture_keeps_everything()
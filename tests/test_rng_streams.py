@@ -0,0 +1,68 @@
+import sys
+import os
+import random
+sys.path.append(os.getcwd())
+
+from brqse_engine.core.rng import RNGStreams
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+from brqse_engine.combat.simulator import simulate, run_battle, resolve_matchup
+from brqse_engine.world.donjon_generator import DonjonGenerator
+from brqse_engine.core.event_engine import EventEngine
+
+MATCHUP = {"side_a": ["save:Grazer_Tank_578"], "side_b": ["beast:BST_01"], "max_rounds": 10}
+
+def test_streams_are_independent():
+    print("--- Testing RNG Streams ---")
+    a, b = RNGStreams(99), RNGStreams(99)
+    b.ai.random(); b.ai.random()  # Extra AI rolls must not shift the attack dice
+    assert [a.attacks.randint(1, 20) for _ in range(20)] == [b.attacks.randint(1, 20) for _ in range(20)]
+    assert RNGStreams(99).initiative.random() != RNGStreams(100).initiative.random()
+    assert RNGStreams(99).attacks.random() != RNGStreams(99).initiative.random()
+    print("PASS: Named streams replay and don't interfere.")
+
+def test_engine_ignores_global_random():
+    matchup = resolve_matchup(MATCHUP)
+    random.seed(1)
+    first = run_battle(matchup, 7)
+    random.seed(2)
+    for _ in range(50): random.random()
+    assert run_battle(matchup, 7) == first, "FAIL: Global random leaked into a seeded battle"
+    print(f"PASS: Seed 7 -> {first['winner']} in {first['rounds']} rounds, twice.")
+
+def test_seed_recorded_in_replay():
+    eng = CombatEngine(6, 6, seed=1234)
+    eng.add_combatant(Combatant(data={"Name": "A", "Stats": {}}), 0, 0)
+    eng.add_combatant(Combatant(data={"Name": "B", "Stats": {}}), 3, 3)
+    eng.start_combat()
+    start = eng.replay_log[0]
+    assert start["type"] == "combat_start" and start["seed"] == 1234
+    assert CombatEngine(seed=5).seed == 5 and CombatEngine().seed is not None
+
+def test_donjon_leaves_global_random_alone():
+    random.seed(3)
+    expected = random.random()
+    random.seed(3)
+    DonjonGenerator(seed=12345).generate(21, 21)
+    assert random.random() == expected, "FAIL: Generator reseeded / consumed the global RNG"
+
+def test_event_engine_uses_its_stream():
+    data_dir = os.path.join(os.getcwd(), "Data")
+    random.seed(1)
+    first = EventEngine(data_dir, rng=RNGStreams(5).stream("events")).generate_scenario("DUNGEON")
+    random.seed(2)
+    second = EventEngine(data_dir, rng=RNGStreams(5).stream("events")).generate_scenario("DUNGEON")
+    assert first == second, "FAIL: Scenario rolls should come from the seeded stream"
+
+def test_process_pool_matches_single_process():
+    _, single = simulate(MATCHUP, battles=6, workers=1, seed=11, chunk_size=2)
+    _, pooled = simulate(MATCHUP, battles=6, workers=3, seed=11, chunk_size=2)
+    assert single == pooled, "FAIL: Worker count changed outcomes"
+    print("PASS: 1 process == 3 processes, per seed.")
+
+if __name__ == "__main__":
+    test_streams_are_independent()
+    test_engine_ignores_global_random()
+    test_seed_recorded_in_replay()
+    test_donjon_leaves_global_random_alone()
+    test_event_engine_uses_its_stream()
+    test_process_pool_matches_single_process()
@@ -0,0 +1,29 @@
+import sys
+import os
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.simulator import simulate, resolve_unit
+
+MATCHUP = {"side_a": ["save:Grazer_Tank_578"], "side_b": ["beast:BST_01"], "max_rounds": 10}
+
+def test_seeded_batch_is_reproducible():
+    print("--- Testing Battle Simulator ---")
+    summary, results = simulate(MATCHUP, battles=6, workers=1, seed=42)
+    again, results_again = simulate(MATCHUP, battles=6, workers=1, seed=42)
+    assert results == results_again, "FAIL: Same seeds must replay identically"
+    assert summary["battles"] == 6 and not summary["errors"], summary["errors"]
+    assert abs(sum(summary["win_rate"].values()) - 1) < 1e-6
+    assert all(1 <= r["rounds"] <= 10 for r in results)
+    print(f"PASS: {summary['win_rate']}")
+
+def test_unknown_units_rejected():
+    for spec in ("beast:NOPE_99", "save:Nobody_Here", "npc:Bob"):
+        try:
+            resolve_unit(spec)
+            assert False, f"FAIL: {spec} should not resolve"
+        except ValueError:
+            pass
+
+if __name__ == "__main__":
+    test_seeded_batch_is_reproducible()
+    test_unknown_units_rejected()
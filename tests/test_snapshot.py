@@ -0,0 +1,88 @@
+import sys
+import os
+import time
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+
+def make(name, team):
+    c = Combatant(data={"Name": name, "Stats": {"Might": 14, "Reflexes": 12}})
+    c.team = team
+    return c
+
+def setup():
+    eng = CombatEngine(10, 10, seed=77)
+    a, b, c = make("Ann", "A"), make("Bo", "B"), make("Cy", "B")
+    eng.add_combatant(a, 2, 2)
+    eng.add_combatant(b, 3, 2)
+    eng.add_combatant(c, 6, 6)
+    eng.create_wall(5, 5)
+    eng.start_combat()
+    return eng
+
+def play(eng, turns=6):
+    """Everyone swings at the nearest enemy; returns what happened."""
+    out = []
+    for _ in range(turns):
+        actor = eng.get_active_char()
+        foes = [c for c in eng.combatants if c.team != actor.team and c.is_alive()]
+        if foes and actor.is_alive():
+            out.extend(eng.attack_target(actor, min(foes, key=lambda f: abs(f.x - actor.x) + abs(f.y - actor.y))))
+        out.extend(eng.end_turn())
+    return out
+
+def state(eng):
+    return [(c.name, c.x, c.y, c.hp, c.cmp, c.conditions, c.action_used) for c in eng.combatants], \
+           eng.round_counter, eng.get_active_char().name, sorted(eng.walls), eng.grid.terrain_at(1, 1)
+
+def test_restore_rewinds_everything():
+    print("--- Testing Snapshot / Fork ---")
+    eng = setup()
+    before = state(eng)
+    snap = eng.snapshot()
+    first = play(eng)
+    eng.spawn_minion("Imp", 8, 8)
+    eng.set_terrain(1, 1, "fire")
+    eng.walls.add((0, 9))
+    eng.combatants[1].is_prone = True
+    eng.restore(snap)
+    assert state(eng) == before, "FAIL: Restore left changes behind"
+    assert eng.get_combatant_at(8, 8) is None and (0, 9) not in eng.walls
+    assert eng.grid.occupant_at(2, 2) is eng.combatants[0]
+    assert play(eng) == first, "FAIL: RNG state was not rewound"
+    print("PASS: Restore rewinds units, turn, map and dice.")
+
+def test_fork_is_independent():
+    eng = setup()
+    what_if = eng.fork()
+    assert what_if.combatants[0] is not eng.combatants[0]
+    clone, original = what_if.combatants[0], eng.combatants[0]
+    clone.data["AI"] = "Coward"
+    clone.stats["Might"] = 30
+    clone.inventory.items.append("Club")
+    assert "AI" not in original.data and original.stats["Might"] == 14, "FAIL: Fork shares data / stats"
+    assert "Club" not in original.inventory.items, "FAIL: Fork shares the inventory"
+    assert clone.data["Stats"] is clone.stats
+    clone.stats["Might"] = 14
+    before = state(eng)
+    forked = play(what_if)
+    assert state(eng) == before, "FAIL: Playing the fork changed the original"
+    assert play(eng) == forked, "FAIL: Fork should play out exactly like the original"
+    assert what_if.get_combatant_at(6, 6) is what_if.combatants[2]
+
+def test_snapshot_is_cheap():
+    eng = CombatEngine(40, 40, seed=1)
+    for i in range(30):
+        eng.add_combatant(make(f"U{i}", "AB"[i % 2]), i, i % 7)
+    eng.start_combat()
+    start = time.perf_counter()
+    for _ in range(200):
+        eng.restore(eng.snapshot())
+    per = (time.perf_counter() - start) / 200
+    assert per < 0.002, f"FAIL: snapshot+restore took {per * 1e6:.0f} us"
+    print(f"PASS: snapshot+restore of 30 units in {per * 1e6:.0f} us.")
+
+if __name__ == "__main__":
+    test_restore_rewinds_everything()
+    test_fork_is_independent()
+    test_snapshot_is_cheap()
@@ -0,0 +1,60 @@
+import sys
+import os
+import time
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant, COVER_FULL, COVER_HALF
+from brqse_engine.combat.terrain_grid import TERRAIN_DATA
+
+def test_tile_views_write_through():
+    print("--- Testing Terrain Grid ---")
+    eng = CombatEngine(8, 8)
+    eng.set_terrain(2, 3, "mud")
+    eng.set_cover(2, 3, "W", COVER_FULL)
+    eng.set_cover(2, 3, "N", COVER_HALF)
+    tile = eng.get_tile(2, 3)
+    assert tile.terrain == "mud" and tile.move_cost == TERRAIN_DATA["mud"]["move_cost"]
+    assert tile.effect == "grapple_disadvantage"
+    assert (tile.cover_west, tile.cover_north, tile.cover_east) == (COVER_FULL, COVER_HALF, 0)
+    assert eng.tiles[3][2].terrain == "mud"
+    assert eng.get_tile(8, 0) is None
+
+    eng.set_terrain(0, 0, "wall_stone")  # Unknown names behave like normal ground
+    assert eng.tiles[0][0].terrain == "wall_stone" and eng.tiles[0][0].move_cost == 1
+    print("PASS: get_tile / set_terrain / set_cover are views over the arrays.")
+
+def test_walls_are_the_blocked_layer():
+    eng = CombatEngine(6, 6)
+    eng.create_wall(1, 1)
+    eng.walls.add((4, 2))
+    assert eng.grid.blocked[1 * 6 + 1] == 1 and eng.get_tile(4, 2).blocked
+    assert set(eng.walls) == {(1, 1), (4, 2)} and len(eng.walls) == 2
+    eng.walls.discard((1, 1))
+    assert eng.grid.blocked[1 * 6 + 1] == 0 and (1, 1) not in eng.walls
+    eng.walls = {(0, 5)}
+    assert set(eng.walls) == {(0, 5)} and sum(eng.grid.blocked) == 1
+
+def test_occupant_layer_and_copy():
+    eng = CombatEngine(6, 6)
+    c = Combatant(data={"Name": "Scout"})
+    eng.add_combatant(c, 2, 2)
+    assert eng.grid.occupant_at(2, 2) is c
+    snap = eng.grid.copy()
+    c.x = 3
+    eng.set_terrain(0, 0, "fire")
+    assert eng.grid.occupant_at(3, 2) is c and eng.grid.occupant_at(2, 2) is None
+    assert snap.occupant_at(2, 2) is c and snap.terrain_at(0, 0) == "normal"
+
+def test_large_maps_build_fast():
+    start = time.perf_counter()
+    eng = CombatEngine(200, 200)
+    eng.grid.copy()
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.05, f"FAIL: 200x200 build+copy took {elapsed:.3f}s"
+    print(f"PASS: 200x200 built and copied in {elapsed * 1000:.1f} ms.")
+
+if __name__ == "__main__":
+    test_tile_views_write_through()
+    test_walls_are_the_blocked_layer()
+    test_occupant_layer_and_copy()
+    test_large_maps_build_fast()
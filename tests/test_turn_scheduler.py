@@ -0,0 +1,76 @@
+import sys
+import os
+import time
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import CombatEngine, Combatant
+
+def setup(inits, cols=30, rows=30):
+    eng = CombatEngine(cols, rows, seed=1)
+    units = []
+    for i, init in enumerate(inits):
+        c = Combatant(data={"Name": f"U{i}", "Stats": {}})
+        eng.add_combatant(c, i % cols, i // cols)
+        units.append(c)
+    eng.start_combat()
+    # Pin initiative so the order is known
+    for c, init in zip(units, inits):
+        c.initiative = init
+    eng.turn_order = units
+    return eng, units
+
+def turns(eng, n):
+    seen = []
+    for _ in range(n):
+        seen.append(eng.get_active_char().name)
+        eng.end_turn()
+    return seen
+
+def test_initiative_order_and_rounds():
+    print("--- Testing Turn Scheduler ---")
+    eng, units = setup([5, 20, 12, 12])
+    assert [c.name for c in eng.turn_order] == ["U1", "U2", "U3", "U0"]
+    assert eng.combatants == units, "FAIL: start_combat should not reorder the roster"
+    assert turns(eng, 5) == ["U1", "U2", "U3", "U0", "U1"]
+    assert eng.round_counter == 2 and eng.current_turn_idx == 1
+    print("PASS: Initiative order, ties keep join order.")
+
+def test_dead_and_incapacitated_are_skipped():
+    eng, (a, b, c) = setup([15, 10, 5])
+    b.hp = 0
+    c.apply_effect("Stunned", 1)
+    log = eng.end_turn()
+    assert eng.get_active_char() is a and eng.round_counter == 2
+    assert any("STUNNED" in line for line in log) and not c.is_stunned
+    assert turns(eng, 2) == ["U0", "U2"]
+
+def test_join_and_delay():
+    eng, (a, b) = setup([20, 10])
+    minion = eng.spawn_minion("Imp", 5, 5)
+    minion.initiative = 15  # Pin it between U0 and U1 and re-queue
+    eng.scheduler.remove(minion)
+    eng.scheduler.add(minion)
+    assert turns(eng, 3) == ["U0", "Imp_2", "U1"]
+    assert eng.get_active_char() is a
+    log = eng.delay_turn()
+    assert "delays" in log[0] and eng.get_active_char() is minion
+    assert turns(eng, 3) == ["Imp_2", "U1", "U0"] and eng.round_counter == 3
+    assert eng.get_active_char() is minion, "FAIL: Delayed initiative should stick"
+    assert eng.delay_turn(99)[0].endswith("can't delay to initiative 99.")
+
+def test_large_skirmish_steady_cost():
+    eng, units = setup(list(range(200)))
+    for c in units[::2]:
+        c.hp = 0
+    start = time.perf_counter()
+    for _ in range(1000):
+        eng.scheduler.advance()
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.2, f"FAIL: 1000 turn changes took {elapsed:.3f}s"
+    print(f"PASS: 1000 turn changes over 200 combatants in {elapsed * 1000:.1f} ms.")
+
+if __name__ == "__main__":
+    test_initiative_order_and_rounds()
+    test_dead_and_incapacitated_are_skipped()
+    test_join_and_delay()
+    test_large_skirmish_steady_cost()
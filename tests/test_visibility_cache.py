@@ -0,0 +1,50 @@
+import sys
+import os
+import random
+sys.path.append(os.getcwd())
+
+from brqse_engine.combat.mechanics import Combatant, CombatEngine
+
+def _unit(name, team, eng, x, y):
+    c = Combatant(data={"Name": name})
+    c.team = team
+    eng.add_combatant(c, x, y)
+    return c
+
+def test_los_cache_invalidated_by_walls():
+    print("--- Testing Visibility Cache ---")
+    eng = CombatEngine(10, 10)
+    a = _unit("Archer", "Player", eng, 0, 0)
+    b = _unit("Goblin", "Enemy", eng, 6, 0)
+    assert eng.has_line_of_sight(a, b)
+    assert len(eng._los_cache) == 1
+
+    eng.create_wall(3, 0)
+    assert not eng._los_cache, "FAIL: create_wall must drop cached LOS"
+    assert not eng.has_line_of_sight(a, b)
+
+    eng.walls.discard((3, 0))
+    assert eng.has_line_of_sight(a, b)
+
+    eng.set_terrain(5, 5, "normal")
+    assert not eng._los_cache
+    print("PASS: Walls invalidate cached LOS.")
+
+def test_cached_matches_trace():
+    random.seed(3)
+    eng = CombatEngine(20, 20)
+    for _ in range(40):
+        eng.create_wall(random.randrange(20), random.randrange(20))
+    units = [_unit(f"U{i}", "Player" if i % 2 else "Enemy", eng, random.randrange(20), random.randrange(20))
+             for i in range(12)]
+    matrix = eng.visibility_matrix("Player")
+    assert set(matrix) == {u for u in units if u.team == "Player"}
+    for me, row in matrix.items():
+        assert len(row) == len(units) - 1
+        for other, seen in row.items():
+            assert seen == eng._trace_line_of_sight(me.x, me.y, other.x, other.y)
+    print(f"PASS: Team matrix ({len(matrix)}x{len(units) - 1}) matches a fresh trace.")
+
+if __name__ == "__main__":
+    test_los_cache_invalidated_by_walls()
+    test_cached_matches_trace()